@@ -5,8 +5,8 @@ from django.db.models.signals import post_save
 from django.dispatch import receiver
 from django.utils import timezone
 
+from nautobot.dcim.cable_tracing import retrace_cable_paths
 from nautobot.dcim.models import CablePath
-from nautobot.dcim.signals import create_cablepath
 
 from .choices import CircuitTerminationSideChoices
 from .models import CircuitTermination
@@ -28,10 +28,7 @@ def rebuild_paths_circuits(obj):
     # pylint: enable=unsupported-binary-operation
 
     with transaction.atomic():
-        for cp in cable_paths:
-            cp.delete()
-            # Prevent looping back to rebuild_paths during the atomic transaction.
-            create_cablepath(cp.origin, rebuild=False)
+        retrace_cable_paths(cable_paths)
 
 
 @receiver(post_save, sender=CircuitTermination)
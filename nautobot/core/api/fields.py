@@ -1,9 +1,14 @@
 from collections import OrderedDict
 import logging
+from uuid import UUID
 
-from django.core.exceptions import ObjectDoesNotExist
+from django.core.exceptions import (
+    FieldDoesNotExist,
+    ObjectDoesNotExist,
+    ValidationError as DjangoValidationError,
+)
 from django.core.validators import URLValidator
-from django.db.models import Model
+from django.db.models import Model, Q
 from drf_spectacular.utils import extend_schema_field
 from rest_framework import serializers
 from rest_framework.exceptions import ValidationError
@@ -164,6 +169,9 @@ class NautobotHyperlinkedRelatedField(WritableSerializerMixin, serializers.Hyper
     Extend HyperlinkedRelatedField to include URL namespace-awareness, add 'object_type' field, and read composite-keys.
     """
 
+    # Maximum number of distinct lookups to combine into a single query in `bulk_lookup()`
+    BULK_LOOKUP_CHUNK_SIZE = 500
+
     def __init__(self, *args, **kwargs):
         """Override DRF's namespace-unaware default view_name logic for HyperlinkedRelatedField.
 
@@ -217,6 +225,131 @@ class NautobotHyperlinkedRelatedField(WritableSerializerMixin, serializers.Hyper
                 data = {"name": deconstruct_composite_key(data)}
         return super().to_internal_value(data)
 
+    def bulk_lookup(self, values):
+        """
+        Look up the related objects referenced by the given values with a few database queries, rather than with one
+        query per value as `to_internal_value()` does.
+
+        Only references by ID, by composite-key, or by a dictionary of attributes of the related object itself are
+        looked up. Other references, and references that don't match exactly one object, are left to
+        `to_internal_value()`, which reports them as errors as appropriate.
+
+        Args:
+            values (list): Values as they would be passed to `to_internal_value()`.
+
+        Returns:
+            (list): The object referenced by each of the given values, or None if it wasn't looked up.
+        """
+        objects = [None] * len(values)
+        if (
+            self.queryset is None
+            or type(self).to_internal_value is not NautobotHyperlinkedRelatedField.to_internal_value
+            or type(self).get_object is not WritableSerializerMixin.get_object
+        ):
+            # Subclasses may resolve values differently
+            return objects
+
+        # {lookup field names: {lookup values: [indices of the values using these lookups]}}
+        lookups = {}
+        for index, value in enumerate(values):
+            filter_params = self._get_bulk_lookup_params(value)
+            if filter_params:
+                keys = tuple(sorted(filter_params))
+                lookups.setdefault(keys, {}).setdefault(tuple(filter_params[key] for key in keys), []).append(index)
+
+        for keys, indices_by_lookup in lookups.items():
+            for lookup, obj in self._bulk_lookup_by_fields(keys, list(indices_by_lookup)).items():
+                for index in indices_by_lookup[lookup]:
+                    objects[index] = obj
+        return objects
+
+    def _get_bulk_lookup_params(self, data):
+        """Get the filter parameters that `to_internal_value()` would look up the given value with, if supported."""
+        if isinstance(data, dict):
+            if "url" in data:
+                return None
+            data = data.get("id", data)
+        if isinstance(data, str) and not is_uuid(data):
+            if is_url(data) or not hasattr(self._related_model, "natural_key_args_to_kwargs"):
+                return None
+            try:
+                data = self._related_model.natural_key_args_to_kwargs(deconstruct_composite_key(data))
+            except ValueError:
+                return None
+        try:
+            filter_params = self.get_queryset_filter_params(data=data, queryset=self.queryset)
+        except ValidationError:
+            return None
+        if not all(value is None or isinstance(value, (str, int, UUID)) for value in filter_params.values()):
+            return None
+        return filter_params
+
+    def _bulk_lookup_by_fields(self, keys, lookups):
+        """
+        Look up the objects matching each of the given tuples of values of the given lookup fields.
+
+        Returns:
+            (dict): `{lookup: object}` for each lookup that matches exactly one object.
+        """
+        queryset = self.queryset.all()
+        if keys == ("pk",):
+            return {(obj.pk,): obj for obj in queryset.filter(pk__in=[lookup[0] for lookup in lookups])}
+
+        # Only lookups of concrete fields of the related object, or of objects it has a foreign key to, are supported
+        model_fields = []
+        for key in keys:
+            model = queryset.model
+            try:
+                path = key.split("__")
+                for name in path[:-1]:
+                    field = model._meta.get_field(name)
+                    if not (field.is_relation and field.concrete and (field.many_to_one or field.one_to_one)):
+                        return {}
+                    model = field.related_model
+                field = model._meta.get_field(path[-1])
+            except FieldDoesNotExist:
+                return {}
+            if field.is_relation or not field.concrete:
+                return {}
+            model_fields.append(field)
+
+        def normalize(values, casefold=False):
+            if casefold:
+                # Databases may compare strings case-insensitively and ignoring trailing whitespace
+                return tuple(value.casefold().rstrip() if isinstance(value, str) else value for value in values)
+            return tuple(
+                value if value is None else field.to_python(value) for field, value in zip(model_fields, values)
+            )
+
+        matches = {}
+        for start in range(0, len(lookups), self.BULK_LOOKUP_CHUNK_SIZE):
+            chunk = {}
+            for lookup in lookups[start : start + self.BULK_LOOKUP_CHUNK_SIZE]:
+                try:
+                    chunk[lookup] = normalize(lookup)
+                except DjangoValidationError:
+                    continue
+            if not chunk:
+                continue
+
+            query = Q()
+            for values in chunk.values():
+                query |= Q(**dict(zip(keys, values)))
+            pks_by_values = {}
+            pks_by_casefolded_values = {}
+            for pk, *values in queryset.filter(query).values_list("pk", *keys):
+                pks_by_values.setdefault(tuple(values), set()).add(pk)
+                pks_by_casefolded_values.setdefault(normalize(values, casefold=True), set()).add(pk)
+
+            pks_by_lookup = {}
+            for lookup, values in chunk.items():
+                pks = pks_by_values.get(values, set())
+                if len(pks) == 1 and pks_by_casefolded_values.get(normalize(values, casefold=True)) == pks:
+                    pks_by_lookup[lookup] = next(iter(pks))
+            objects = queryset.in_bulk(set(pks_by_lookup.values()))
+            matches.update({lookup: objects[pk] for lookup, pk in pks_by_lookup.items() if pk in objects})
+        return matches
+
     def to_representation(self, value):
         """Convert URL representation to a brief nested representation."""
         url = super().to_representation(value)
@@ -90,6 +90,12 @@ class WritableSerializerMixin:
         Retrieve an unique object based on a dictionary of data attributes and raise errors accordingly if the object is not found.
         """
         filter_params = self.get_queryset_filter_params(data=data, queryset=queryset)
+        if list(filter_params) == ["pk"] and self.context.get("related_objects"):
+            # The object may have been looked up in advance, see `bulk_lookup_related_objects()`
+            field_name = self.field_name or getattr(self.parent, "field_name", None)
+            obj = self.context["related_objects"].get(field_name, {}).get(filter_params["pk"])
+            if obj is not None:
+                return obj
         try:
             return queryset.get(**filter_params)
         except ObjectDoesNotExist as e:
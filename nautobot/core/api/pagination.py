@@ -1,5 +1,10 @@
+from django.core.exceptions import ValidationError
+from django.db.models import QuerySet
+from rest_framework.exceptions import NotFound
 from rest_framework.pagination import LimitOffsetPagination
+from rest_framework.utils.urls import remove_query_param, replace_query_param
 
+from nautobot.core.models.querysets import get_count
 from nautobot.core.utils.config import get_settings_or_config
 
 
@@ -8,13 +13,31 @@ class OptionalLimitOffsetPagination(LimitOffsetPagination):
     Override the stock paginator to allow setting limit=0 to disable pagination for a request. This returns all objects
     matching a query, but retains the same format as a paginated request. The limit can only be disabled if
     MAX_PAGE_SIZE has been set to 0 or None.
+
+    Also supports an opt-in keyset ("cursor") pagination mode, selected by the presence of the `cursor` query parameter
+    (which is empty for the first page). In this mode, objects are ordered by primary key and each page is retrieved by
+    filtering on the last primary key of the previous page, rather than with an OFFSET, and the total count of objects
+    isn't calculated, so that the cost of retrieving a page doesn't grow with its position in the table.
     """
 
+    cursor_query_param = "cursor"
+    cursor_query_description = (
+        "Opt in to keyset pagination by primary key, which is efficient for retrieving all objects from large tables. "
+        "Leave empty to retrieve the first page, then follow the `next` link to retrieve subsequent pages. "
+        "Custom sorting, `offset`, and `count` are not supported in this mode."
+    )
+    invalid_cursor_message = "Invalid cursor"
+
     def paginate_queryset(self, queryset, request, view=None):
         # No pagination when rendering to CSV
         if "text/csv" in request.accepted_media_type:
             return None
 
+        self.cursor = None
+        if self.cursor_query_param in request.query_params:
+            return self.paginate_queryset_by_cursor(queryset, request)
+
+        self.count_is_approximate = False
         self.count = self.get_count(queryset)
         self.limit = self.get_limit(request)
         self.offset = self.get_offset(request)
@@ -23,6 +46,10 @@ class OptionalLimitOffsetPagination(LimitOffsetPagination):
         if self.limit and self.count > self.limit and self.template is not None:
             self.display_page_controls = True
 
+        if self.count_is_approximate:
+            # The count may be too low or too high, so it can't be used to determine whether a page exists
+            return self._paginate_queryset_with_approximate_count(queryset)
+
         if self.count == 0 or self.offset > self.count:
             return []
 
@@ -31,6 +58,52 @@ class OptionalLimitOffsetPagination(LimitOffsetPagination):
         else:
             return list(queryset[self.offset :])
 
+    def _paginate_queryset_with_approximate_count(self, queryset):
+        """Retrieve the requested page, and determine whether there is a next page, without relying on the count."""
+        self.has_next = False
+        if not self.limit:
+            return list(queryset[self.offset :])
+        # Fetch one more object than needed to find out whether there's a next page
+        results = list(queryset[self.offset : self.offset + self.limit + 1])
+        if len(results) > self.limit:
+            results = results[: self.limit]
+            self.has_next = True
+        return results
+
+    def paginate_queryset_by_cursor(self, queryset, request):
+        """Retrieve the page of objects following the primary key given as the `cursor` query parameter."""
+        self.count = None
+        self.limit = self.get_limit(request)
+        self.offset = 0
+        self.request = request
+        self.next_cursor = None
+
+        queryset = queryset.order_by("pk")
+        cursor = request.query_params[self.cursor_query_param]
+        if cursor:
+            try:
+                self.cursor = queryset.model._meta.pk.to_python(cursor)
+            except ValidationError:
+                raise NotFound(self.invalid_cursor_message)
+            queryset = queryset.filter(pk__gt=self.cursor)
+
+        if not self.limit:
+            return list(queryset)
+
+        # Fetch one more object than needed to find out whether there's a next page
+        results = list(queryset[: self.limit + 1])
+        if len(results) > self.limit:
+            results = results[: self.limit]
+            self.next_cursor = results[-1].pk
+        return results
+
+    def get_count(self, queryset):
+        """Determine the total number of objects, as per the configured count strategy (see `get_count()`)."""
+        if isinstance(queryset, QuerySet):
+            count, self.count_is_approximate = get_count(queryset)
+            return count
+        return super().get_count(queryset)
+
     def get_limit(self, request):
         if self.limit_query_param:
             try:
@@ -55,6 +128,19 @@ class OptionalLimitOffsetPagination(LimitOffsetPagination):
         if not self.limit:
             return None
 
+        if self.count is None:
+            # Cursor pagination
+            if self.next_cursor is None:
+                return None
+            url = remove_query_param(self.request.build_absolute_uri(), self.offset_query_param)
+            return replace_query_param(url, self.cursor_query_param, str(self.next_cursor))
+
+        if self.count_is_approximate:
+            if not self.has_next:
+                return None
+            url = replace_query_param(self.request.build_absolute_uri(), self.limit_query_param, self.limit)
+            return replace_query_param(url, self.offset_query_param, self.offset + self.limit)
+
         return super().get_next_link()
 
     def get_previous_link(self):
@@ -62,4 +148,27 @@ class OptionalLimitOffsetPagination(LimitOffsetPagination):
         if not self.limit:
             return None
 
+        # Cursor pagination only supports moving forward
+        if self.count is None:
+            return None
+
         return super().get_previous_link()
+
+    def get_paginated_response_schema(self, schema):
+        response_schema = super().get_paginated_response_schema(schema)
+        # `count` is null when using cursor pagination
+        response_schema["properties"]["count"]["nullable"] = True
+        return response_schema
+
+    def get_schema_operation_parameters(self, view):
+        parameters = super().get_schema_operation_parameters(view)
+        parameters.append(
+            {
+                "name": self.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": self.cursor_query_description,
+                "schema": {"type": "string"},
+            }
+        )
+        return parameters
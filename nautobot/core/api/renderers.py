@@ -1,5 +1,6 @@
 import csv
 from io import StringIO
+from itertools import islice
 import json
 import logging
 
@@ -8,6 +9,7 @@ from rest_framework.renderers import BaseRenderer, BrowsableAPIRenderer, JSONRen
 
 from nautobot.core.celery import NautobotKombuJSONEncoder
 from nautobot.core.constants import COMPOSITE_KEY_SEPARATOR
+from nautobot.extras.api.customfields import CustomFieldsDataField
 
 logger = logging.getLogger(__name__)
 
@@ -53,11 +55,15 @@ class NautobotCSVRenderer(BaseRenderer):
         if not data:
             return ""
 
+        # The serializer (if any) that produced this data
+        serializer = getattr(data, "serializer", None)
+        serializer = getattr(serializer, "child", serializer)
+
         # TODO need to handle rendering of exceptions (e.g. not authenticated) as those have a different data dict.
         if isinstance(data, dict):
             data = [data]
 
-        headers = self.get_headers(data)
+        headers = self.get_headers(data, serializer=serializer)
 
         buffer = StringIO()
         writer = csv.writer(buffer)
@@ -72,11 +78,81 @@ class NautobotCSVRenderer(BaseRenderer):
 
         return buffer.getvalue()
 
+    def render_queryset(self, queryset, serializer_class, *, context=None, chunk_size=1000):
+        """
+        Render the given queryset to CSV format incrementally, yielding the CSV text one chunk of records at a time.
+
+        Unlike `render()`, this never holds more than `chunk_size` records (serialized or otherwise) in memory at once,
+        making it suitable for exporting very large querysets to a file or a `StreamingHttpResponse`.
+
+        Args:
+            queryset (QuerySet): Objects to render.
+            serializer_class (BaseModelSerializer): Serializer class to use for each chunk of objects.
+            context (dict): Serializer context, such as `{"request": request}`.
+            chunk_size (int): Number of records to serialize at a time.
+        """
+        context = context or {"request": None}
+        headers = self.get_headers_from_serializer(serializer_class(context=context, force_csv=True))
+
+        buffer = StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(headers)
+        yield buffer.getvalue()
+
+        # Retrieve the records in their requested order, one chunk at a time; only the primary keys are
+        # retrieved up front, using a server-side cursor where the database supports it.
+        pk_iterator = queryset.values_list("pk", flat=True).iterator(chunk_size=chunk_size)
+        while pks := list(islice(pk_iterator, chunk_size)):
+            serializer = serializer_class(queryset.filter(pk__in=pks), many=True, context=context, force_csv=True)
+            buffer.seek(0)
+            buffer.truncate()
+            for record in serializer.data:
+                writer.writerow(self.object_to_row_elements(record, headers=headers))
+            yield buffer.getvalue()
+
     @classmethod
-    def get_headers(cls, data):
-        """Identify the appropriate CSV headers corresponding to the given data."""
+    def get_headers(cls, data, serializer=None):
+        """Identify the appropriate CSV headers corresponding to the given data, as produced by the given serializer."""
         base_headers = list(data[0].keys())
 
+        # Add individual headers for each relevant custom field
+        if "custom_fields" in data[0] and isinstance(
+            getattr(serializer, "fields", {}).get("custom_fields"), CustomFieldsDataField
+        ):
+            # All custom fields of the model are included in each record, so there's no need to inspect the data
+            cf_headers = [f"cf_{key}" for key in serializer.fields["custom_fields"].custom_field_keys]
+        # Otherwise, since we know there are cases where custom field data may be missing from a given instance,
+        # we iterate over *all* instances in the data set to be safe.
+        elif "custom_fields" in data[0]:
+            cf_headers = set()
+            for record in data:
+                cf_headers |= {f"cf_{key}" for key in record["custom_fields"]}
+        else:
+            cf_headers = []
+
+        return cls._finalize_headers(base_headers, cf_headers)
+
+    @classmethod
+    def get_headers_from_serializer(cls, serializer):
+        """
+        Identify the appropriate CSV headers corresponding to the data of the given model serializer.
+
+        Unlike `get_headers()`, this is based on the serializer's fields and the defined custom fields, rather than on
+        the serialized data, so it doesn't require iterating over all of the data first.
+        """
+        base_headers = serializer.get_csv_field_names()
+        if isinstance(serializer.fields.get("custom_fields"), CustomFieldsDataField):
+            cf_headers = [f"cf_{key}" for key in serializer.fields["custom_fields"].custom_field_keys]
+        else:
+            cf_headers = []
+
+        return cls._finalize_headers(base_headers, cf_headers)
+
+    @staticmethod
+    def _finalize_headers(base_headers, cf_headers):
+        """Combine the given base and custom-field headers into the final list of CSV headers."""
+        base_headers = list(base_headers)
+
         # Remove specific headers that we know are irrelevant
         for undesired_header in [
             "computed_fields",
@@ -88,20 +164,9 @@ class NautobotCSVRenderer(BaseRenderer):
             if undesired_header in base_headers:
                 base_headers.remove(undesired_header)
 
-        # Add individual headers for each relevant custom field
-        # Since we know there are cases where custom field data may be missing from a given instance,
-        # we iterate over *all* instances in the data set to be safe.
-        if "custom_fields" in data[0]:
-            cf_headers = set()
-            for record in data:
-                cf_headers |= {f"cf_{key}" for key in record["custom_fields"]}
-            cf_headers = sorted(cf_headers)
-        else:
-            cf_headers = []
-
         # TODO: relationships? computed fields?
 
-        headers = base_headers + cf_headers
+        headers = base_headers + sorted(cf_headers)
 
         # Coerce important fields, if present, to the front of the list
         for priority_header in ["id", "composite_key", "display", "name"]:
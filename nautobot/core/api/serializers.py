@@ -3,6 +3,7 @@ from copy import deepcopy
 import logging
 import uuid
 
+from django.conf import settings
 from django.contrib.contenttypes.fields import GenericRel
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import (
@@ -41,7 +42,7 @@ from nautobot.core.utils.requests import normalize_querydict
 from nautobot.extras.api.customfields import CustomFieldDefaultValues, CustomFieldsDataField
 from nautobot.extras.api.relationships import RelationshipsDataField
 from nautobot.extras.choices import RelationshipSideChoices
-from nautobot.extras.models import RelationshipAssociation, Tag
+from nautobot.extras.models import ComputedField, RelationshipAssociation, Tag
 from nautobot.ipam.fields import VarbinaryIPField
 
 logger = logging.getLogger(__name__)
@@ -139,6 +140,7 @@ class BaseModelSerializer(OptInFieldsMixin, serializers.HyperlinkedModelSerializ
     object_type = ObjectTypeField()
     # composite_key = serializers.SerializerMethodField()  # TODO: Revisit if we reintroduce composite keys
     natural_keys_values = None
+    _natural_keys_values_by_pk = None
     natural_slug = serializers.SerializerMethodField()
 
     def __init__(self, *args, force_csv=False, **kwargs):
@@ -285,6 +287,24 @@ class BaseModelSerializer(OptInFieldsMixin, serializers.HyperlinkedModelSerializ
                 )
         return field_lookups
 
+    def get_csv_field_names(self):
+        """
+        Get the keys of the CSV representation of this serializer's objects, without needing to serialize any objects.
+
+        When rendering to CSV, each related-object field with natural-key lookups is represented by those lookups
+        (for example `location__name`, `location__parent__name`) rather than by the field name itself.
+        """
+        field_names = list(self.fields)
+        if not self._is_csv_request():
+            return field_names
+
+        natural_key_field_lookups = self._get_related_fields_natural_key_field_lookups()
+        csv_field_names = []
+        for field_name in field_names:
+            lookups = [lookup for lookup in natural_key_field_lookups if lookup.startswith(f"{field_name}__")]
+            csv_field_names.extend(lookups or [field_name])
+        return csv_field_names
+
     def _is_csv_request(self):
         """Return True if this a CSV export request"""
         if self._force_csv:
@@ -686,8 +706,10 @@ class BaseModelSerializer(OptInFieldsMixin, serializers.HyperlinkedModelSerializ
         altered_data = {}
 
         if self._is_csv_request() and self.natural_keys_values is not None:
-            if natural_key_field_instance := [item for item in self.natural_keys_values if item["pk"] == instance.pk]:
-                cleaned_natural_key_field_instance = natural_key_field_instance[0]
+            if self._natural_keys_values_by_pk is None:
+                # Index the natural key values by pk, rather than searching them for each instance
+                self._natural_keys_values_by_pk = {item["pk"]: item for item in self.natural_keys_values}
+            if cleaned_natural_key_field_instance := self._natural_keys_values_by_pk.get(instance.pk):
                 for key, value in data.items():
                     # FK field with natural_field_lookups
                     if natural_key_field_lookups_for_field := self._get_natural_key_lookups_value_for_field(
@@ -919,8 +941,19 @@ class CustomFieldModelSerializerMixin(ValidatedModelSerializer):
         default=CreateOnlyDefault(CustomFieldDefaultValues()),
     )
 
+    _computed_fields_by_pk = None
+
     @extend_schema_field(OpenApiTypes.OBJECT)
     def get_computed_fields(self, obj):
+        if isinstance(self.instance, (list, tuple, models.QuerySet)):
+            # When serializing a list of objects (`many=True`), this is the child serializer of the list, and its
+            # `instance` is the entire list; render the computed fields of all of its objects in one pass.
+            if self._computed_fields_by_pk is None:
+                self._computed_fields_by_pk = ComputedField.objects.render_for_objects(
+                    self.instance, workers=settings.COMPUTED_FIELD_RENDER_WORKERS
+                )
+            if obj.pk in self._computed_fields_by_pk:
+                return self._computed_fields_by_pk[obj.pk]
         return obj.get_computed_fields()
 
     def get_field_names(self, declared_fields, info):
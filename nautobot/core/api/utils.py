@@ -49,6 +49,50 @@ def dict_to_filter_params(d, prefix=""):
     return params
 
 
+def bulk_lookup_related_objects(serializer, data):
+    """
+    Look up in bulk the related objects referenced by the given rows of data, such as those of a CSV import.
+
+    For each related field of the serializer that supports it (see `NautobotHyperlinkedRelatedField.bulk_lookup()`),
+    the references in all rows are looked up with a few database queries, and are replaced in the rows by the IDs of
+    the objects found. Passing the returned objects to the serializer as its `related_objects` context then avoids
+    looking up each of these objects again when deserializing each row.
+
+    Args:
+        serializer (Serializer): Instance of the serializer class that the rows will be deserialized with.
+        data (list): Rows of data, as dicts, which are updated in place.
+
+    Returns:
+        (dict): `{field_name: {pk: object}}` of the objects found.
+    """
+    related_objects = {}
+    for field_name, field in serializer.fields.items():
+        if field.read_only:
+            continue
+        many = isinstance(field, serializers.ManyRelatedField)
+        relation = field.child_relation if many else field
+        if not hasattr(relation, "bulk_lookup"):
+            continue
+
+        # (container, key) of each reference, so that it can be replaced by the ID of the object found
+        references = []
+        for entry in data:
+            value = entry.get(field_name)
+            if many and isinstance(value, list):
+                references.extend((value, index) for index in range(len(value)))
+            elif not many and value is not None:
+                references.append((entry, field_name))
+        if not references:
+            continue
+
+        objects = relation.bulk_lookup([container[key] for container, key in references])
+        for (container, key), obj in zip(references, objects):
+            if obj is not None:
+                container[key] = str(obj.pk)
+                related_objects.setdefault(field_name, {})[obj.pk] = obj
+    return related_objects
+
+
 def dynamic_import(name):
     """
     Dynamically import a class from an absolute path string
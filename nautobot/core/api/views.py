@@ -3,6 +3,7 @@ import itertools
 import logging
 import os
 import platform
+import time
 
 from django import __version__ as DJANGO_VERSION, forms
 from django.apps import apps
@@ -20,7 +21,7 @@ from drf_spectacular.utils import extend_schema
 from drf_spectacular.views import SpectacularRedocView, SpectacularSwaggerView
 from graphene_django.settings import graphene_settings
 from graphene_django.views import GraphQLView, HttpError, instantiate_middleware
-from graphql import get_default_backend
+from graphql import GraphQLError
 from graphql.execution import ExecutionResult
 from graphql.execution.middleware import MiddlewareManager
 from graphql.type.schema import GraphQLSchema
@@ -39,6 +40,8 @@ from nautobot.core.api.exceptions import SerializerNotFound
 from nautobot.core.api.utils import get_serializer_for_model
 from nautobot.core.celery import app as celery_app
 from nautobot.core.exceptions import FilterSetFieldNotFound
+from nautobot.core.graphql.caching import execute_document, get_graphql_backend
+from nautobot.core.graphql.cost import check_query_cost
 from nautobot.core.utils.data import is_uuid
 from nautobot.core.utils.filtering import get_all_lookup_expr_for_field, get_filterset_parameter_form_field
 from nautobot.core.utils.lookup import get_form_for_model, get_route_for_model
@@ -296,6 +299,9 @@ class ModelViewSet(
 
     logger = logging.getLogger(__name__ + ".ModelViewSet")
 
+    # List of objects updated by perform_update() during a perform_bulk_update(), pending validation
+    _bulk_updated_objects = None
+
     def _validate_objects(self, instance):
         """
         Check that the provided instance or list of instances are matched by the current queryset. This confirms that
@@ -330,10 +336,28 @@ class ModelViewSet(
         try:
             with transaction.atomic():
                 instance = serializer.save()
-                self._validate_objects(instance)
+                if self._bulk_updated_objects is not None:
+                    # Defer to perform_bulk_update(), which validates all of the updated objects at once
+                    self._bulk_updated_objects.append(instance)
+                else:
+                    self._validate_objects(instance)
         except ObjectDoesNotExist:
             raise PermissionDenied()
 
+    def perform_bulk_update(self, objects, update_data, partial):
+        self._bulk_updated_objects = []
+        try:
+            with transaction.atomic():
+                data_list = super().perform_bulk_update(objects, update_data, partial)
+                # Enforce object-level permissions on all of the updated objects with a single query
+                try:
+                    self._validate_objects(self._bulk_updated_objects)
+                except ObjectDoesNotExist:
+                    raise PermissionDenied()
+        finally:
+            self._bulk_updated_objects = None
+        return data_list
+
     def perform_destroy(self, instance):
         model = self.queryset.model
         self.logger.info(f"Deleting {model._meta.verbose_name} {instance} (PK: {instance.pk})")
@@ -623,7 +647,7 @@ class GraphQLDRFAPIView(NautobotAPIVersionMixin, APIView):
             self.schema = graphene_settings.SCHEMA
 
         if self.backend is None:
-            self.backend = get_default_backend()
+            self.backend = get_graphql_backend()
 
         self.graphql_schema = self.graphql_schema or self.schema
 
@@ -724,6 +748,12 @@ class GraphQLDRFAPIView(NautobotAPIVersionMixin, APIView):
                 HttpResponseBadRequest(f"'{operation_type}' is not a supported operation, Only query are supported.")
             )
 
+        # Reject queries that are too expensive before executing them
+        try:
+            cost = check_query_cost(self.graphql_schema, document.document_ast, variables, operation_name)
+        except GraphQLError as e:
+            return ExecutionResult(errors=[e], invalid=True)
+
         try:
             extra_options = {}
             if self.executor:
@@ -740,8 +770,14 @@ class GraphQLDRFAPIView(NautobotAPIVersionMixin, APIView):
             }
             options.update(extra_options)
 
-            operation_type = document.get_operation_type(operation_name)
-            return document.execute(**options)
+            start_time = time.monotonic()
+            result = execute_document(document, request.user, **options)
+            logger.info(
+                "Executed GraphQL query with an estimated cost of %d in %.3f seconds",
+                cost,
+                time.monotonic() - start_time,
+            )
+            return result
         except Exception as e:
             return ExecutionResult(errors=[e], invalid=True)
 
@@ -7,8 +7,10 @@ from django.contrib.auth.backends import (
     RemoteUserBackend as _RemoteUserBackend,
 )
 from django.contrib.auth.models import Group
+from django.core.cache import cache
 from django.db.models import Q
 
+from nautobot.core.utils.cache import get_cache_generation, invalidate_cache_generations
 from nautobot.core.utils.permissions import (
     permission_is_exempt,
     qs_filter_from_constraints,
@@ -19,18 +21,50 @@ from nautobot.users.models import ObjectPermission
 
 logger = logging.getLogger(__name__)
 
+OBJECT_PERMISSIONS_CACHE_KEY_PREFIX = "nautobot.core.authentication.object_permissions"
+
+
+def get_object_permissions_cache_generation():
+    """
+    Get the current generation of the cross-request cache of users' ObjectPermissions.
+
+    Cached permissions are keyed by the generation, so starting a new generation (see
+    `invalidate_object_permissions_cache()`) invalidates the cached permissions of all users at once.
+    """
+    return get_cache_generation(f"{OBJECT_PERMISSIONS_CACHE_KEY_PREFIX}.generation")
+
+
+def invalidate_object_permissions_cache():
+    """Invalidate the cached ObjectPermissions of all users, by starting a new cache generation."""
+    invalidate_cache_generations([f"{OBJECT_PERMISSIONS_CACHE_KEY_PREFIX}.generation"])
+
 
 class ObjectPermissionBackend(ModelBackend):
     def get_all_permissions(self, user_obj, obj=None):
         if not user_obj.is_active or user_obj.is_anonymous:
             return {}
         if not hasattr(user_obj, "_object_perm_cache"):
-            user_obj._object_perm_cache = self.get_object_permissions(user_obj)
+            timeout = settings.OBJECT_PERMISSION_CACHE_TIMEOUT
+            if timeout:
+                cache_key = (
+                    f"{OBJECT_PERMISSIONS_CACHE_KEY_PREFIX}.{get_object_permissions_cache_generation()}.{user_obj.pk}"
+                )
+                perms = cache.get(cache_key)
+                if perms is None:
+                    perms = self.get_object_permissions(user_obj)
+                    cache.set(cache_key, perms, timeout)
+            else:
+                perms = self.get_object_permissions(user_obj)
+            user_obj._object_perm_cache = perms
         return user_obj._object_perm_cache
 
     def get_object_permissions(self, user_obj):
         """
         Return all permissions granted to the user by an ObjectPermission.
+
+        Returns:
+            (dict): `{perm_name: [constraints, ...]}`. If any ObjectPermission grants the permission without
+                constraints, the list of constraints is just `[None]`; otherwise duplicate constraints are removed.
         """
         # Retrieve all assigned and enabled ObjectPermissions
         object_permissions = ObjectPermission.objects.filter(
@@ -45,6 +79,18 @@ class ObjectPermissionBackend(ModelBackend):
                     perm_name = f"{object_type.app_label}.{action}_{object_type.model}"
                     perms[perm_name].extend(obj_perm.list_constraints())
 
+        # Simplify the constraints to minimize the work needed to construct query filters from them later
+        for perm_name, constraints in perms.items():
+            if not all(constraints):
+                # Unconstrained permission to all objects makes any other constraints redundant
+                perms[perm_name] = [None]
+            else:
+                unique_constraints = []
+                for constraint in constraints:
+                    if constraint not in unique_constraints:
+                        unique_constraints.append(constraint)
+                perms[perm_name] = unique_constraints
+
         return perms
 
     def has_perm(self, user_obj, perm, obj=None):
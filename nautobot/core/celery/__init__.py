@@ -16,7 +16,7 @@ from prometheus_client import CollectorRegistry, multiprocess, start_http_server
 
 from nautobot.core.celery.control import discard_git_repository, refresh_git_repository  # noqa: F401  # unused-import
 from nautobot.core.celery.encoders import NautobotKombuJSONEncoder
-from nautobot.core.celery.log import NautobotDatabaseHandler
+from nautobot.core.celery.log import flush_job_logs, NautobotDatabaseHandler
 from nautobot.core.utils.module_loading import import_modules_privately
 from nautobot.extras.registry import registry
 
@@ -145,6 +145,12 @@ def setup_nautobot_job_logging(sender, instance, conf, **kwargs):
         add_nautobot_log_handler(redirect_logger)
 
 
+@signals.task_postrun.connect
+def save_nautobot_job_logs(sender=None, task_id=None, **kwargs):
+    """Save any log entries of a task that are still buffered by the nautobot database logging handler."""
+    flush_job_logs(task_id)
+
+
 @signals.worker_ready.connect
 def setup_prometheus(**kwargs):
     """This sets up an HTTP server to serve prometheus metrics from the celery workers."""
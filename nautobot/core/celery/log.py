@@ -1,11 +1,37 @@
 import logging
+import threading
+import time
+import weakref
 
 from celery import current_task
+from django.conf import settings
 from django.core.exceptions import ValidationError
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+# All NautobotDatabaseHandler instances, so that their buffered log entries can be saved when a task ends
+_handlers = weakref.WeakSet()
 
 
 class NautobotDatabaseHandler(logging.Handler):
-    """Custom logging handler to log messages to JobLogEntry database entries."""
+    """
+    Custom logging handler to log messages to JobLogEntry database entries.
+
+    Rather than saving each entry to the database as it's logged, entries are buffered in memory and saved in bulk
+    once `settings.JOB_LOG_BUFFER_SIZE` entries are buffered, once `settings.JOB_LOG_FLUSH_INTERVAL` seconds have passed
+    since entries were last saved (by a timer, if nothing else is logged meanwhile), as soon as an entry of WARNING or
+    higher level is logged, and when the task ends (see `flush_job_logs()`).
+    """
+
+    def __init__(self, level=logging.NOTSET):
+        super().__init__(level)
+        self.buffer = []
+        self.last_flush = time.monotonic()
+        self.flush_timer = None
+        # {task_id: JobResult or None}, so that the JobResult is only retrieved once per task
+        self.job_results = {}
+        _handlers.add(self)
 
     def emit(self, record):
         if current_task is None:
@@ -15,24 +41,92 @@ class NautobotDatabaseHandler(logging.Handler):
         if getattr(record, "skip_db_logging", False):
             return
 
-        from nautobot.extras.models.jobs import JobResult
-
         try:
             self.format(record)
 
+            job_result = self.get_job_result(record.task_id)
+            if job_result is None:
+                return
+
+            self.buffer.append(
+                (
+                    job_result.log_database,
+                    job_result.build_log_entry(
+                        message=record.message,
+                        level_choice=record.levelname.lower(),
+                        obj=getattr(record, "object", None),
+                        grouping=getattr(record, "grouping", record.funcName),
+                    ),
+                )
+            )
+            if (
+                record.levelno >= logging.WARNING
+                or len(self.buffer) >= settings.JOB_LOG_BUFFER_SIZE
+                or time.monotonic() - self.last_flush >= settings.JOB_LOG_FLUSH_INTERVAL
+            ):
+                self.flush()
+            elif self.flush_timer is None:
+                # Make sure the entry is saved within the flush interval even if nothing else is logged meanwhile
+                interval = settings.JOB_LOG_FLUSH_INTERVAL - (time.monotonic() - self.last_flush)
+                self.flush_timer = threading.Timer(interval, self.timed_flush)
+                self.flush_timer.daemon = True
+                self.flush_timer.start()
+        except Exception:
+            self.handleError(record)
+
+    def get_job_result(self, task_id):
+        """Get the JobResult of the given task, or None if there isn't one."""
+        from nautobot.extras.models.jobs import JobResult
+
+        if task_id not in self.job_results:
             try:
-                job_result = JobResult.objects.get(id=record.task_id)
+                self.job_results[task_id] = JobResult.objects.get(id=task_id)
             except (ValidationError, JobResult.DoesNotExist):
                 # Both of these cases are very rare
                 # ValidationError - because the task_id might not a valid UUID
                 # JobResult.DoesNotExist - because we might not have a JobResult with that ID
-                return
+                self.job_results[task_id] = None
+        return self.job_results[task_id]
 
-            job_result.log(
-                message=record.message,
-                level_choice=record.levelname.lower(),
-                obj=getattr(record, "object", None),
-                grouping=getattr(record, "grouping", record.funcName),
-            )
+    def flush(self):
+        """Save all buffered log entries to the database, with one query per database."""
+        with self.lock:
+            buffer, self.buffer = self.buffer, []
+            self.last_flush = time.monotonic()
+            if self.flush_timer is not None:
+                self.flush_timer.cancel()
+                self.flush_timer = None
+        if not buffer:
+            return
+
+        from nautobot.extras.models.jobs import JobLogEntry
+
+        entries_by_database = {}
+        for database, entry in buffer:
+            entries_by_database.setdefault(database, []).append(entry)
+        for database, entries in entries_by_database.items():
+            JobLogEntry.objects.using(database).bulk_create(entries)
+
+    def timed_flush(self):
+        """Save all buffered log entries from the flush timer's thread, which has its own database connection."""
+        try:
+            self.flush()
         except Exception:
-            self.handleError(record)
+            logger.exception("Failed to save buffered log entries")
+        finally:
+            connections.close_all()
+
+    def end_task(self, task_id):
+        """Save all buffered log entries, and forget the JobResult of the given task, which has ended."""
+        self.flush()
+        with self.lock:
+            self.job_results.pop(task_id, None)
+
+
+def flush_job_logs(task_id=None):
+    """Save the log entries buffered by all `NautobotDatabaseHandler` instances, such as when a task ends."""
+    for handler in list(_handlers):
+        try:
+            handler.end_task(task_id)
+        except Exception:
+            logger.exception("Failed to save buffered log entries of task %s", task_id)
@@ -174,12 +174,14 @@ GLOBAL_SEARCH_EXCLUDE_LIST = [
     "rearporttemplate",
     "relationship",
     "relationshipassociation",
+    "renderedconfigcontext",
     "rir",
     "role",
     "routetarget",
     "savedview",
     "scheduledjob",
     "scheduledjobs",
+    "searchindexentry",
     "secret",
     "secretsgroup",
     "secretsgroupassociation",
@@ -1,9 +1,9 @@
 from django.test.client import RequestFactory
 from graphene.types import Scalar
 from graphene_django.settings import graphene_settings
-from graphql import get_default_backend
 from graphql.language import ast
 
+from nautobot.core.graphql.caching import get_graphql_backend
 from nautobot.extras.models import GraphQLQuery
 
 
@@ -24,7 +24,7 @@ def execute_query(query, variables=None, request=None, user=None):
     if not request:
         request = RequestFactory().post("/graphql/")
         request.user = user
-    backend = get_default_backend()
+    backend = get_graphql_backend()
     schema = graphene_settings.SCHEMA
     document = backend.document_from_string(schema, query)
     if variables:
@@ -0,0 +1,295 @@
+"""Caching of parsed and validated GraphQL documents ("persisted queries") and, optionally, of GraphQL query results."""
+
+from collections import OrderedDict
+from functools import lru_cache, partial
+import hashlib
+import json
+import threading
+
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models.constants import LOOKUP_SEP
+from graphql.backend.base import GraphQLDocument
+from graphql.backend.core import GraphQLCoreBackend
+from graphql.execution import execute, ExecutionResult
+from graphql.language.parser import parse
+from graphql.validation import validate
+from prometheus_client import Counter
+
+from nautobot.core.authentication import get_object_permissions_cache_generation
+from nautobot.core.filters import MappedPredicatesFilterMixin
+from nautobot.core.graphql.cost import get_query_types
+from nautobot.core.utils.cache import get_cache_generations, invalidate_cache_generations
+
+RESULT_CACHE_KEY_PREFIX = "nautobot.core.graphql.results"
+
+GRAPHQL_RESULT_CACHE_METRIC = Counter(
+    "nautobot_graphql_result_cache_lookups",
+    "Lookups of GraphQL query results in the result cache, by result",
+    ["result"],
+)
+
+
+def get_query_hash(query):
+    """Get the hash identifying a GraphQL query string."""
+    return hashlib.sha256(query.encode("utf-8")).hexdigest()
+
+
+class PersistedQueryBackend(GraphQLCoreBackend):
+    """
+    GraphQL backend that keeps the parsed and validated documents of queries in a per-process LRU cache.
+
+    Documents are kept for up to `settings.GRAPHQL_DOCUMENT_CACHE_SIZE` queries, keyed by a hash of the query, so that
+    repeatedly executing the same query (for example, a saved `GraphQLQuery`) only parses and validates it once.
+    Invalid queries aren't cached; executing their document reports their validation errors as usual.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._documents = OrderedDict()
+        self._lock = threading.Lock()
+
+    def document_from_string(self, schema, document_string):
+        max_size = settings.GRAPHQL_DOCUMENT_CACHE_SIZE
+        if max_size <= 0 or not isinstance(document_string, str):
+            return super().document_from_string(schema, document_string)
+
+        key = get_query_hash(document_string)
+        with self._lock:
+            document = self._documents.get(key)
+            if document is not None:
+                self._documents.move_to_end(key)
+        # The schema may have been rebuilt since the document was cached
+        if document is not None and document.schema is schema:
+            return document
+
+        # Parse and validate outside of the lock; in the worst case two threads both do so for the same query
+        document_ast = parse(document_string)
+        if validate(schema, document_ast):
+            return super().document_from_string(schema, document_string)
+        document = GraphQLDocument(
+            schema=schema,
+            document_string=document_string,
+            document_ast=document_ast,
+            # Execute without validating the document again
+            execute=partial(execute, schema, document_ast, **self.execute_params),
+        )
+        with self._lock:
+            self._documents[key] = document
+            self._documents.move_to_end(key)
+            while len(self._documents) > max_size:
+                self._documents.popitem(last=False)
+        return document
+
+    def clear(self):
+        """Discard all cached documents."""
+        with self._lock:
+            self._documents.clear()
+
+
+_backend = PersistedQueryBackend()
+
+
+def get_graphql_backend():
+    """Get the GraphQL backend used to parse and validate GraphQL queries, see `PersistedQueryBackend`."""
+    return _backend
+
+
+def get_result_cache_generations(models):
+    """
+    Get the current generation of the GraphQL result cache, overall and for each of the given models.
+
+    Cached results are keyed by the generations of the models they were queried from, so starting a new generation
+    (see `invalidate_graphql_result_cache()`) invalidates all cached results involving those models at once.
+
+    Returns:
+        (dict): `{cache_key: generation}` for the overall generation and each of the models.
+    """
+    cache_keys = [f"{RESULT_CACHE_KEY_PREFIX}.generation"]
+    cache_keys += sorted(f"{RESULT_CACHE_KEY_PREFIX}.generation.{model._meta.label_lower}" for model in models)
+    return get_cache_generations(cache_keys)
+
+
+def invalidate_graphql_result_cache(*models):
+    """
+    Invalidate the cached results of GraphQL queries involving any of the given models, by starting a new generation.
+
+    If no models are given, invalidate all cached results.
+    """
+    if models:
+        cache_keys = {f"{RESULT_CACHE_KEY_PREFIX}.generation.{model._meta.label_lower}" for model in models}
+    else:
+        cache_keys = {f"{RESULT_CACHE_KEY_PREFIX}.generation"}
+    invalidate_cache_generations(cache_keys)
+
+
+# Arguments of list fields that paginate their results rather than filter them
+PAGINATION_ARGUMENTS = ("limit", "offset")
+
+
+def _get_lookup_models(model, lookup):
+    """Get the models related to `model` that an ORM lookup such as `location__parent__name` traverses."""
+    models = set()
+    for part in lookup.split(LOOKUP_SEP):
+        try:
+            field = model._meta.get_field(part)
+        except FieldDoesNotExist:
+            break
+        if not field.is_relation or field.related_model is None:
+            break
+        model = field.related_model
+        models.add(model)
+    return models
+
+
+def _get_filter_models(model, filterset_class, argument_name):
+    """
+    Get the models whose objects can affect which objects a GraphQL filter argument of a list field matches.
+
+    Returns:
+        (set): Models traversed by the filter, or `None` if they can't be determined, such as for filters implemented
+            by a `method`.
+    """
+    if argument_name in PAGINATION_ARGUMENTS or argument_name.startswith("cf_"):
+        return set()
+    if filterset_class is None:
+        return None
+    if argument_name == "_type":
+        argument_name = "type"
+    filter_field = filterset_class.base_filters.get(argument_name)
+    if filter_field is None or filter_field.method is not None:
+        return None
+
+    if isinstance(filter_field, MappedPredicatesFilterMixin):
+        lookups = filter_field.filter_predicates.keys()
+    else:
+        lookups = [filter_field.field_name]
+    models = set()
+    for lookup in lookups:
+        models.update(_get_lookup_models(model, lookup))
+    queryset = getattr(filter_field, "queryset", None)
+    if queryset is not None:
+        models.add(queryset.model)
+    return models
+
+
+def _get_permission_constraint_models(user, model):
+    """Get the models related to `model` that the constraints of the user's permission to view it traverse."""
+    if user is None or not user.is_authenticated or user.is_superuser:
+        return set()
+    models = set()
+    user.get_all_permissions()
+    permission = f"{model._meta.app_label}.view_{model._meta.model_name}"
+    for constraints in getattr(user, "_object_perm_cache", {}).get(permission, []):
+        for lookup in constraints or {}:
+            models.update(_get_lookup_models(model, lookup))
+    return models
+
+
+@lru_cache(maxsize=None)
+def get_through_related_models(model):
+    """
+    Get the models on either side of the many-to-many relations that `model` is the explicit through model of.
+
+    Objects of explicit through models (such as `IPAddressToInterface`) may be created, changed and deleted directly,
+    without sending `m2m_changed`, so their changes must also invalidate the results involving those related models.
+
+    Returns:
+        (frozenset): Related models, or an empty set if `model` isn't an explicit through model.
+    """
+    is_through_model = any(
+        field.many_to_many and field.concrete and field.remote_field.through is model and not model._meta.auto_created
+        for other_model in apps.get_models()
+        for field in other_model._meta.get_fields()
+    )
+    if not is_through_model:
+        return frozenset()
+    return frozenset(
+        field.related_model
+        for field in model._meta.get_fields()
+        if field.many_to_one and field.concrete and field.related_model is not None
+    )
+
+
+def get_result_cache_key(document, user, variables=None, operation_name=None):
+    """
+    Get the key under which to cache the result of executing a GraphQL document as the given user.
+
+    The key includes the generations of the models that the query selects fields from, and of the related models that
+    its filter arguments and the user's permission constraints traverse, such as `Location` for
+    `devices(location: "Location-1") { name }`.
+
+    Returns:
+        (str): Cache key, or `None` if the result isn't cacheable because the models that its filter arguments depend on
+            can't be determined.
+    """
+    models = set()
+    for query_type, argument_names in get_query_types(
+        document.schema, document.document_ast, variables, operation_name
+    ).items():
+        graphene_meta = getattr(getattr(query_type, "graphene_type", None), "_meta", None)
+        model = getattr(graphene_meta, "model", None)
+        if model is None:
+            if set(argument_names) - set(PAGINATION_ARGUMENTS):
+                return None
+            continue
+        models.add(model)
+        models.update(_get_permission_constraint_models(user, model))
+        filterset_class = getattr(graphene_meta, "filterset_class", None)
+        for argument_name in argument_names:
+            filter_models = _get_filter_models(model, filterset_class, argument_name)
+            if filter_models is None:
+                return None
+            models.update(filter_models)
+
+    key_data = {
+        "query": get_query_hash(document.document_string),
+        "variables": variables,
+        "operation_name": operation_name,
+        "user": str(user.pk) if user is not None and user.is_authenticated else None,
+        "is_superuser": getattr(user, "is_superuser", False),
+        "permissions": get_object_permissions_cache_generation(),
+        "generations": get_result_cache_generations(models),
+    }
+    key_hash = hashlib.sha256(json.dumps(key_data, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+    return f"{RESULT_CACHE_KEY_PREFIX}.{key_hash}"
+
+
+def execute_document(document, user, **options):
+    """
+    Execute a parsed GraphQL document, using the GraphQL result cache if `settings.GRAPHQL_RESULT_CACHE_TIMEOUT` is set.
+
+    Successful query results are cached per user, and are invalidated when the permissions of any user change, or when
+    an object of any of the models that the query selects fields from, filters on, or is constrained by the user's
+    permissions on is changed (see `get_result_cache_key()`). Queries using filters whose models can't be determined
+    are never cached. Changes to other objects that `display`, `config_context`, or computed field values happen to
+    depend on, such as a related object accessed by a computed field template, don't invalidate cached results.
+
+    Args:
+        document (GraphQLDocument): Document to execute.
+        user (User): User the document is executed as.
+        **options: Keyword arguments of `document.execute()`, such as `context_value` and `variable_values`.
+
+    Returns:
+        (ExecutionResult): Result of the execution.
+    """
+    timeout = settings.GRAPHQL_RESULT_CACHE_TIMEOUT
+    operation_name = options.get("operation_name")
+    if not timeout or document.get_operation_type(operation_name) != "query":
+        return document.execute(**options)
+
+    cache_key = get_result_cache_key(document, user, options.get("variable_values"), operation_name)
+    if cache_key is None:
+        return document.execute(**options)
+    data = cache.get(cache_key)
+    if data is not None:
+        GRAPHQL_RESULT_CACHE_METRIC.labels(result="hit").inc()
+        return ExecutionResult(data=data)
+
+    GRAPHQL_RESULT_CACHE_METRIC.labels(result="miss").inc()
+    result = document.execute(**options)
+    if not result.errors and not result.invalid:
+        cache.set(cache_key, result.data, timeout)
+    return result
@@ -0,0 +1,190 @@
+"""Static estimation of the cost of GraphQL queries, used to reject overly expensive queries before executing them."""
+
+from django.conf import settings
+from graphql import GraphQLError
+from graphql.language import ast
+from graphql.type.definition import get_named_type, GraphQLList, GraphQLNonNull
+
+# Cost of resolving a field for a single object, unless its resolver declares a `graphql_cost` attribute
+DEFAULT_FIELD_COST = 1
+
+# Costs of resolving known expensive fields for a single object, declared by their generated resolvers
+COMPUTED_FIELD_COST = 5
+CONFIG_CONTEXT_COST = 10
+RELATIONSHIP_COST = 5
+
+# Number of objects assumed to be returned by a list field, unless a `limit` argument is specified
+DEFAULT_LIST_SIZE = 100
+
+
+def get_query_cost(schema, document_ast, variables=None, operation_name=None):
+    """Estimate the cost of executing a GraphQL query, without executing it.
+
+    The cost is the sum of the costs of each field selected in the query, multiplied by the estimated number of
+    objects that it will be resolved for. Each nested list field multiplies the number of objects by its `limit`
+    argument, or by `DEFAULT_LIST_SIZE` if unlimited, so deeply nested lists quickly become expensive.
+
+    Args:
+        schema (GraphQLSchema): Schema the query will be executed against.
+        document_ast (Document): Parsed GraphQL document.
+        variables (dict): Variables the query will be executed with, if any.
+        operation_name (str): Name of the operation to be executed, if the document contains more than one.
+
+    Returns:
+        (int): Estimated cost of the query.
+    """
+    cost = 0
+    for analyzer, root_type, operation in _get_operation_analyzers(schema, document_ast, variables, operation_name):
+        # Only one of the operations will be executed
+        cost = max(cost, analyzer.get_selection_set_cost(root_type, operation.selection_set, 1))
+    return cost
+
+
+def get_query_types(schema, document_ast, variables=None, operation_name=None):
+    """Get the schema types that fields are selected from by a GraphQL query, such as `DeviceType` for `devices { name }`.
+
+    Along with each type, get the names of the arguments given to the fields that select from it, such as `location`
+    for `devices(location: "Location-1") { name }`.
+
+    Returns:
+        (dict): `{type: set(argument_names)}` of GraphQL object types, excluding the root query type.
+    """
+    query_types = {}
+    for analyzer, root_type, operation in _get_operation_analyzers(schema, document_ast, variables, operation_name):
+        analyzer.get_selection_set_cost(root_type, operation.selection_set, 1)
+        for query_type, argument_names in analyzer.visited_types.items():
+            if query_type is not root_type:
+                query_types.setdefault(query_type, set()).update(argument_names)
+    return query_types
+
+
+def _get_operation_analyzers(schema, document_ast, variables, operation_name):
+    """Yield an `(analyzer, root_type, operation)` tuple for each operation of the document that may be executed."""
+    fragments = {}
+    operations = []
+    for definition in document_ast.definitions:
+        if isinstance(definition, ast.FragmentDefinition):
+            fragments[definition.name.value] = definition
+        elif isinstance(definition, ast.OperationDefinition):
+            if operation_name is None or (definition.name and definition.name.value == operation_name):
+                operations.append(definition)
+
+    for operation in operations:
+        if operation.operation == "mutation":
+            root_type = schema.get_mutation_type()
+        elif operation.operation == "subscription":
+            root_type = schema.get_subscription_type()
+        else:
+            root_type = schema.get_query_type()
+        if root_type is None:
+            continue
+
+        operation_variables = {
+            definition.variable.name.value: _get_int_value(definition.default_value, {})
+            for definition in operation.variable_definitions or []
+            if definition.default_value is not None
+        }
+        operation_variables.update(variables or {})
+
+        yield _QueryCostAnalyzer(schema, fragments, operation_variables), root_type, operation
+
+
+def check_query_cost(schema, document_ast, variables=None, operation_name=None):
+    """Check that the estimated cost of a GraphQL query doesn't exceed `settings.GRAPHQL_MAX_QUERY_COST`.
+
+    Returns:
+        (int): Estimated cost of the query (see `get_query_cost()`).
+
+    Raises:
+        GraphQLError: if the query is too expensive to be executed.
+    """
+    cost = get_query_cost(schema, document_ast, variables=variables, operation_name=operation_name)
+    max_cost = settings.GRAPHQL_MAX_QUERY_COST
+    if max_cost and cost > max_cost:
+        raise GraphQLError(
+            f"Query cost of {cost} exceeds the maximum allowed cost of {max_cost}. "
+            "Reduce the number of nested lists or fields selected, or specify a lower `limit` on list fields."
+        )
+    return cost
+
+
+def _get_int_value(value_ast, variables):
+    """Get the value of an integer argument, whether it is given literally or as a variable."""
+    if isinstance(value_ast, ast.IntValue):
+        return int(value_ast.value)
+    if isinstance(value_ast, ast.Variable):
+        value = variables.get(value_ast.name.value)
+        if isinstance(value, int):
+            return value
+    return None
+
+
+class _QueryCostAnalyzer:
+    """Walk the selection sets of a query along with the schema types they are selected from."""
+
+    def __init__(self, schema, fragments, variables):
+        self.schema = schema
+        self.fragments = fragments
+        self.variables = variables
+        self.visited_fragments = set()
+        # {type: set(argument_names)} of the types visited, and the arguments of the fields they were selected by
+        self.visited_types = {}
+
+    def get_selection_set_cost(self, parent_type, selection_set, multiplier):
+        if selection_set is None:
+            return 0
+
+        self.visited_types.setdefault(parent_type, set())
+
+        cost = 0
+        for selection in selection_set.selections:
+            if isinstance(selection, ast.Field):
+                cost += self.get_field_cost(parent_type, selection, multiplier)
+            elif isinstance(selection, ast.InlineFragment):
+                fragment_type = parent_type
+                if selection.type_condition is not None:
+                    fragment_type = self.schema.get_type(selection.type_condition.name.value) or parent_type
+                cost += self.get_selection_set_cost(fragment_type, selection.selection_set, multiplier)
+            elif isinstance(selection, ast.FragmentSpread):
+                name = selection.name.value
+                # Fragment cycles are invalid, and will be reported as such when the query is validated
+                if name not in self.fragments or name in self.visited_fragments:
+                    continue
+                fragment = self.fragments[name]
+                fragment_type = self.schema.get_type(fragment.type_condition.name.value) or parent_type
+                self.visited_fragments.add(name)
+                cost += self.get_selection_set_cost(fragment_type, fragment.selection_set, multiplier)
+                self.visited_fragments.discard(name)
+        return cost
+
+    def get_field_cost(self, parent_type, field_ast, multiplier):
+        name = field_ast.name.value
+        field = getattr(parent_type, "fields", {}).get(name)
+        if field is None:
+            # Introspection fields, or unknown fields that will be reported when the query is validated
+            return multiplier * DEFAULT_FIELD_COST
+
+        # Generated resolvers of known expensive fields declare their cost
+        resolver = getattr(getattr(parent_type, "graphene_type", None), f"resolve_{name}", None)
+        cost = multiplier * getattr(resolver, "graphql_cost", DEFAULT_FIELD_COST)
+
+        if field_ast.selection_set is not None:
+            field_type = field.type
+            if isinstance(field_type, GraphQLNonNull):
+                field_type = field_type.of_type
+            if isinstance(field_type, GraphQLList):
+                multiplier *= self.get_list_size(field_ast)
+            named_type = get_named_type(field_type)
+            self.visited_types.setdefault(named_type, set()).update(
+                argument.name.value for argument in field_ast.arguments or []
+            )
+            cost += self.get_selection_set_cost(named_type, field_ast.selection_set, multiplier)
+        return cost
+
+    def get_list_size(self, field_ast):
+        for argument in field_ast.arguments or []:
+            if argument.name.value == "limit":
+                limit = _get_int_value(argument.value, self.variables)
+                if limit:
+                    return limit
+        return DEFAULT_LIST_SIZE
@@ -1,16 +1,19 @@
 """Library of generators for GraphQL."""
 
+from collections import defaultdict
 import logging
 
+from django.db.models import Prefetch, prefetch_related_objects, Q
 import graphene
 import graphene_django_optimizer as gql_optimizer
 from graphql import GraphQLError
 
+from nautobot.core.graphql.cost import COMPUTED_FIELD_COST, RELATIONSHIP_COST
 from nautobot.core.graphql.types import OptimizedNautobotObjectType
-from nautobot.core.graphql.utils import get_filtering_args_from_filterset, str_to_var_name
+from nautobot.core.graphql.utils import get_dataloader, get_filtering_args_from_filterset, str_to_var_name
 from nautobot.core.utils.lookup import get_filterset_for_model
 from nautobot.extras.choices import RelationshipSideChoices
-from nautobot.extras.models import RelationshipAssociation
+from nautobot.extras.models import ComputedField, RelationshipAssociation
 
 logger = logging.getLogger(__name__)
 RESOLVER_PREFIX = "resolve_"
@@ -57,36 +60,61 @@ def generate_filter_resolver(schema_type, resolver_name, field_name):
     """
     Generate function to resolve filtering of ManyToOne and ManyToMany related objects.
 
+    Unless they were already prefetched along with the parent objects, the related objects of all parent objects in a
+    list are retrieved at once, with a single query.
+
     Args:
         schema_type (DjangoObjectType): DjangoObjectType for a given model
         resolver_name (str): name of the resolver
         field_name (str): name of ManyToOneField, ManyToManyRel, or ManyToOneRel field to filter
     """
     filterset_class = schema_type._meta.filterset_class
+    model = schema_type._meta.model
+    to_attr = f"_graphql_{field_name}"
 
-    def resolve_filter(self, info, **kwargs):
-        if not filterset_class or not kwargs:
-            return getattr(self, field_name).all()
+    def get_queryset(info, kwargs):
+        queryset = model._default_manager.all()
+        if filterset_class and kwargs:
+            # Inverse of substitution logic from get_filtering_args_from_filterset() - transform "_type" back to "type"
+            if "_type" in kwargs:
+                kwargs["type"] = kwargs.pop("_type")
+
+            resolved_obj = filterset_class(kwargs, queryset)
+
+            # Check result filter for errors.
+            if resolved_obj.errors:
+                errors = {}
+
+                # Build error message from results
+                # Error messages are collected from each filter object
+                for key in resolved_obj.errors:
+                    errors[key] = resolved_obj.errors[key]
+
+                # Raising this exception will send the error message in the response of the GraphQL request
+                raise GraphQLError(errors)
 
-        # Inverse of substitution logic from get_filtering_args_from_filterset() - transform "_type" back to "type"
-        if "_type" in kwargs:
-            kwargs["type"] = kwargs.pop("_type")
+            queryset = resolved_obj.qs.all()
 
-        resolved_obj = filterset_class(kwargs, getattr(self, field_name).all())
+        queryset = gql_optimizer.query(queryset, info)
+        # The optimizer may defer fields that aren't selected in the query, but Django needs the related fields in order
+        # to match up the prefetched objects with their parent objects.
+        queryset.query.clear_deferred_loading()
+        return queryset
+
+    def resolve_filter(self, info, **kwargs):
+        if not kwargs and field_name in getattr(self, "_prefetched_objects_cache", {}):
+            return getattr(self, field_name).all()
 
-        # Check result filter for errors.
-        if not resolved_obj.errors:
-            return resolved_obj.qs.all()
+        def make_batch_load_fn():
+            queryset = get_queryset(info, dict(kwargs))
 
-        errors = {}
+            def load_related_objects(parents):
+                prefetch_related_objects(parents, Prefetch(field_name, queryset=queryset, to_attr=to_attr))
+                return [parent.__dict__.pop(to_attr) for parent in parents]
 
-        # Build error message from results
-        # Error messages are collected from each filter object
-        for key in resolved_obj.errors:
-            errors[key] = resolved_obj.errors[key]
+            return load_related_objects
 
-        # Raising this exception will send the error message in the response of the GraphQL request
-        raise GraphQLError(errors)
+        return get_dataloader(info, resolve_filter, make_batch_load_fn).load(self)
 
     resolve_filter.__name__ = resolver_name
     return resolve_filter
@@ -110,21 +138,42 @@ def generate_custom_field_resolver(key, resolver_name):
 def generate_computed_field_resolver(name, resolver_name):
     """Generate an instance method for resolving an individual computed field within a given DjangoObjectType.
 
+    The computed field is looked up once for all objects in a list, rather than once per object.
+
     Args:
         name (str): name of the computed field to resolve
         resolver_name (str): name of the resolver as declare in DjangoObjectType
     """
 
     def resolve_computed_field(self, info, **kwargs):
-        return self.get_computed_field(key=name)
+        def make_batch_load_fn():
+            computed_field = None
+            for candidate in ComputedField.objects.get_for_model(type(self)):
+                if candidate.key == name:
+                    computed_field = candidate
+                    break
+            else:
+                logger.warning("Computed Field with key %s does not exist for model %s", name, self._meta.verbose_name)
+
+            def render_computed_field(objs):
+                if computed_field is None:
+                    return [None] * len(objs)
+                return [computed_field.render(context={"obj": obj}) for obj in objs]
+
+            return render_computed_field
+
+        return get_dataloader(info, resolve_computed_field, make_batch_load_fn).load(self)
 
     resolve_computed_field.__name__ = resolver_name
+    resolve_computed_field.graphql_cost = COMPUTED_FIELD_COST
     return resolve_computed_field
 
 
 def generate_relationship_resolver(name, resolver_name, relationship, side, peer_model):
     """Generate function to resolve each custom relationship within each DjangoObjectType.
 
+    The associations and peer objects of all objects in a list are retrieved at once, with one query each.
+
     Args:
         name (str): name of the custom field to resolve
         resolver_name (str): name of the resolver as declare in DjangoObjectType
@@ -132,76 +181,58 @@ def generate_relationship_resolver(name, resolver_name, relationship, side, peer
         side (str): side of the relationship to use for the resolver
         peer_model (Model): Django Model of the peer of this relationship
     """
+    peer_side = RelationshipSideChoices.OPPOSITE[side]
 
-    def resolve_relationship(self, info, **kwargs):
-        """Return a queryset or an object depending on the type of the relationship."""
-        peer_side = RelationshipSideChoices.OPPOSITE[side]
-        query_params = {"relationship": relationship}
-        # https://github.com/nautobot/nautobot/issues/1228
-        # If querying for **only** the ID of the related object, for example:
-        # { device(id:"...") { ... rel_my_relationship { id } } }
-        # we will get this exception:
-        # TypeError: Cannot call select_related() after .values() or .values_list()
-        # This appears to be a bug in graphene_django_optimizer but I haven't found a known issue on GitHub.
-        # For now we just work around it by catching the exception and retrying without optimization, below...
+    def get_peer_ids(pks):
+        """Get the IDs of the peers of each of the given objects, as a `{pk: [peer_id, ...]}` dict."""
+        peer_ids = defaultdict(list)
+        associations = RelationshipAssociation.objects.filter(relationship=relationship)
         if not relationship.symmetric:
             # Get the objects on the other side of this relationship
-            query_params[f"{side}_id"] = self.pk
-
-            try:
-                queryset_ids = gql_optimizer.query(
-                    RelationshipAssociation.objects.filter(**query_params).values_list(f"{peer_side}_id", flat=True),
-                    info,
-                )
-            except TypeError:
-                logger.debug("Caught TypeError in graphene_django_optimizer, falling back to un-optimized query")
-                queryset_ids = RelationshipAssociation.objects.filter(**query_params).values_list(
-                    f"{peer_side}_id", flat=True
-                )
+            associations = associations.filter(**{f"{side}_id__in": pks}).values_list(f"{side}_id", f"{peer_side}_id")
+            for pk, peer_id in associations:
+                peer_ids[pk].append(peer_id)
         else:
             # Get objects that are peers for this relationship, regardless of side
-            try:
-                queryset_ids = list(
-                    gql_optimizer.query(
-                        RelationshipAssociation.objects.filter(source_id=self.pk, **query_params).values_list(
-                            "destination_id", flat=True
-                        ),
-                        info,
-                    )
-                )
-                queryset_ids += list(
-                    gql_optimizer.query(
-                        RelationshipAssociation.objects.filter(destination_id=self.pk, **query_params).values_list(
-                            "source_id", flat=True
-                        ),
-                        info,
-                    )
-                )
-            except TypeError:
-                logger.debug("Caught TypeError in graphene_django_optimizer, falling back to un-optimized query")
-                queryset_ids = list(
-                    RelationshipAssociation.objects.filter(source_id=self.pk, **query_params).values_list(
-                        "destination_id", flat=True
-                    ),
-                )
-                queryset_ids += list(
-                    RelationshipAssociation.objects.filter(destination_id=self.pk, **query_params).values_list(
-                        "source_id", flat=True
-                    ),
-                )
-
-        if relationship.has_many(peer_side):
-            return gql_optimizer.query(peer_model.objects.filter(id__in=queryset_ids), info)
-
-        # Also apparently a graphene_django_optimizer bug - in the same query case as described above, here we may see:
-        # AttributeError: object has no attribute "only"
-        try:
-            return gql_optimizer.query(peer_model.objects.filter(id__in=queryset_ids).first(), info)
-        except AttributeError:
-            logger.debug("Caught AttributeError in graphene_django_optimizer, falling back to un-optimized query")
-            return peer_model.objects.filter(id__in=queryset_ids).first()
+            associations = associations.filter(Q(source_id__in=pks) | Q(destination_id__in=pks)).values_list(
+                "source_id", "destination_id"
+            )
+            for source_id, destination_id in associations:
+                if source_id in pks:
+                    peer_ids[source_id].append(destination_id)
+                if destination_id in pks:
+                    peer_ids[destination_id].append(source_id)
+        return peer_ids
+
+    def resolve_relationship(self, info, **kwargs):
+        """Return a list or an object depending on the type of the relationship."""
+
+        def make_batch_load_fn():
+            def load_peers(objs):
+                peer_ids = get_peer_ids({obj.pk for obj in objs})
+                all_peer_ids = {peer_id for ids in peer_ids.values() for peer_id in ids}
+                # Note that the peers are optimized as a queryset; optimizing the associations query or an individual
+                # peer object runs into bugs in graphene_django_optimizer (https://github.com/nautobot/nautobot/issues/1228)
+                peers = list(gql_optimizer.query(peer_model.objects.filter(id__in=all_peer_ids), info))
+                # Preserve the ordering of the peer model for each object's peers
+                positions = {peer.pk: position for position, peer in enumerate(peers)}
+
+                results = []
+                for obj in objs:
+                    obj_positions = {positions[peer_id] for peer_id in peer_ids.get(obj.pk, ()) if peer_id in positions}
+                    obj_peers = [peers[position] for position in sorted(obj_positions)]
+                    if relationship.has_many(peer_side):
+                        results.append(obj_peers)
+                    else:
+                        results.append(obj_peers[0] if obj_peers else None)
+                return results
+
+            return load_peers
+
+        return get_dataloader(info, resolve_relationship, make_batch_load_fn).load(self)
 
     resolve_relationship.__name__ = resolver_name
+    resolve_relationship.graphql_cost = RELATIONSHIP_COST
     return resolve_relationship
 
 
@@ -324,6 +355,10 @@ def generate_list_resolver(schema_type, resolver_name):
         else:
             qs = model.objects.restrict(info.context.user, "view").all()
 
+        # Give the schema type the opportunity to annotate the queryset with data needed by its selected fields
+        if hasattr(schema_type, "annotate_queryset"):
+            qs = schema_type.annotate_queryset(qs, info)
+
         if offset:
             qs = qs[offset:]
 
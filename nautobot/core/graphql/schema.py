@@ -7,12 +7,14 @@ from django.conf import settings
 from django.contrib.contenttypes.fields import GenericRelation
 from django.contrib.contenttypes.models import ContentType
 from django.core.validators import ValidationError
-from django.db.models import ManyToManyField
+from django.db.models import ManyToManyField, Prefetch
 from django.db.models.fields.reverse_related import ManyToManyRel, ManyToOneRel, OneToOneRel
 import graphene
 from graphene.types import generic
+import graphene_django_optimizer as gql_optimizer
 
 from nautobot.circuits.graphql.types import CircuitTerminationType
+from nautobot.core.graphql.cost import CONFIG_CONTEXT_COST
 from nautobot.core.graphql.generators import (
     generate_attrs_for_schema_type,
     generate_computed_field_resolver,
@@ -44,7 +46,7 @@ from nautobot.dcim.graphql.types import (
 )
 from nautobot.extras.choices import CustomFieldTypeChoices, RelationshipSideChoices
 from nautobot.extras.graphql.types import ContactAssociationType, DynamicGroupType, TagType
-from nautobot.extras.models import ComputedField, CustomField, Relationship
+from nautobot.extras.models import ComputedField, CustomField, Relationship, StaticGroupAssociation
 from nautobot.extras.registry import registry
 from nautobot.extras.utils import check_if_key_is_graphql_safe
 from nautobot.ipam.graphql.types import IPAddressType, PrefixType, VLANType
@@ -366,6 +368,8 @@ def extend_schema_type_config_context(schema_type, model):
     def resolve_config_context(self, args):
         return self.get_config_context()
 
+    resolve_config_context.graphql_cost = CONFIG_CONTEXT_COST
+
     schema_type._meta.fields["config_context"] = graphene.Field.mounted(generic.GenericScalar())
     setattr(schema_type, "resolve_config_context", resolve_config_context)
 
@@ -380,8 +384,23 @@ def extend_schema_type_global_features(schema_type, model):
     if getattr(model, "is_dynamic_group_associable_model", False):
 
         def resolve_dynamic_groups(self, args):
+            if hasattr(self, "_prefetched_static_group_associations"):
+                self._prefetched_dynamic_groups = sorted(
+                    (association.dynamic_group for association in self._prefetched_static_group_associations),
+                    key=lambda group: group.name,
+                )
             return self.dynamic_groups
 
+        if hasattr(model, "static_group_association_set"):
+            # Look up the Dynamic Groups for all objects in a list query at once, rather than once per object
+            resolve_dynamic_groups = gql_optimizer.resolver_hints(
+                prefetch_related=lambda info: Prefetch(
+                    "static_group_association_set",
+                    queryset=StaticGroupAssociation.all_objects.select_related("dynamic_group"),
+                    to_attr="_prefetched_static_group_associations",
+                ),
+            )(resolve_dynamic_groups)
+
         setattr(schema_type, "resolve_dynamic_groups", resolve_dynamic_groups)
         schema_type._meta.fields["dynamic_groups"] = graphene.Field.mounted(graphene.List(DynamicGroupType))
 
@@ -2,6 +2,9 @@ import logging
 
 from django_filters.filters import BooleanFilter, MultipleChoiceFilter, NumberFilter
 import graphene
+from graphql.language import ast
+from promise import Promise
+from promise.dataloader import DataLoader
 
 from nautobot.core.filters import (
     MultiValueBigNumberFilter,
@@ -93,6 +96,67 @@ def get_filtering_args_from_filterset(filterset_class):
     return args
 
 
+def get_selected_field_names(info):
+    """Get the names of the fields selected (directly or via fragments) within the field currently being resolved.
+
+    Args:
+        info (ResolveInfo): GraphQL resolver info for the field being resolved.
+
+    Returns:
+        (set): Names of the selected sub-fields.
+    """
+    field_names = set()
+
+    def collect(selection_set):
+        if selection_set is None:
+            return
+        for selection in selection_set.selections:
+            if isinstance(selection, ast.FragmentSpread):
+                collect(info.fragments[selection.name.value].selection_set)
+            elif isinstance(selection, ast.InlineFragment):
+                collect(selection.selection_set)
+            else:
+                field_names.add(selection.name.value)
+
+    for field_ast in info.field_asts:
+        collect(field_ast.selection_set)
+    return field_names
+
+
+def get_dataloader(info, resolver, make_batch_load_fn):
+    """Get the DataLoader batching calls to the given resolver at this point of the query, creating it if needed.
+
+    The resolvers of a field are called once per parent object; by returning `loader.load(parent)` rather than a value,
+    a resolver defers its lookup so that it can be done once for all of the sibling parent objects in a list.
+    The loader is specific to the current field of the query (as the selected sub-fields and arguments are the same
+    for all of its parent objects) and to the current execution of the query, so results are never shared between
+    queries that happen to be executed with the same request.
+
+    Args:
+        info (ResolveInfo): GraphQL resolver info for the field being resolved.
+        resolver (func): Resolver function that is using the DataLoader.
+        make_batch_load_fn (func): Called when creating the DataLoader, to get the function it should call with a list
+            of parent objects and that should return the list of corresponding values.
+
+    Returns:
+        (DataLoader): DataLoader whose keys are the parent objects, cached by primary key.
+    """
+    execution, loaders = getattr(info.context, "_graphql_dataloaders", (None, None))
+    # A new `variable_values` dict is constructed for each execution of a query
+    if execution is not info.variable_values:
+        loaders = {}
+        info.context._graphql_dataloaders = (info.variable_values, loaders)
+
+    key = (resolver, tuple(id(field_ast) for field_ast in info.field_asts))
+    if key not in loaders:
+        batch_load_fn = make_batch_load_fn()
+        loaders[key] = DataLoader(
+            lambda parents: Promise.resolve(batch_load_fn(parents)),
+            get_cache_key=lambda parent: parent.pk,
+        )
+    return loaders[key]
+
+
 def construct_resolver(model_name, resolver_type):
     """Constructs a resolve_[cable_peer|connected_endpoint]_<endpoint> function for a given model type.
 
@@ -1,6 +1,7 @@
 import codecs
 import contextlib
 from io import BytesIO
+import tempfile
 
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
@@ -12,13 +13,15 @@ from rest_framework import exceptions as drf_exceptions
 from nautobot.core.api.exceptions import SerializerNotFound
 from nautobot.core.api.parsers import NautobotCSVParser
 from nautobot.core.api.renderers import NautobotCSVRenderer
-from nautobot.core.api.utils import get_serializer_for_model
+from nautobot.core.api.utils import bulk_lookup_related_objects, get_serializer_for_model
 from nautobot.core.celery import app, register_jobs
 from nautobot.core.exceptions import AbortTransaction
 from nautobot.core.jobs.cleanup import LogsCleanup
 from nautobot.core.jobs.groups import RefreshDynamicGroupCaches
 from nautobot.core.utils.lookup import get_filterset_for_model
 from nautobot.core.utils.requests import get_filterable_params_from_filter_params
+from nautobot.extras.choices import JobResultStatusChoices, LogLevelChoices
+from nautobot.extras.context_managers import deferred_change_logging_for_bulk_operation
 from nautobot.extras.datasources import (
     ensure_git_repository,
     git_repository_dry_run,
@@ -26,7 +29,13 @@ from nautobot.extras.datasources import (
     refresh_job_code_from_repository,
 )
 from nautobot.extras.jobs import BooleanVar, ChoiceVar, FileVar, Job, ObjectVar, RunJobTaskFailed, StringVar, TextVar
-from nautobot.extras.models import ExportTemplate, GitRepository
+from nautobot.extras.models import ExportTemplate, GitRepository, JobResult
+
+# Number of objects to retrieve and serialize at a time when exporting objects to CSV or YAML
+EXPORT_CHUNK_SIZE = 1000
+
+# Number of rows of data to import at a time, in a single transaction, when importing objects from CSV
+IMPORT_BATCH_SIZE = 1000
 
 name = "System Jobs"
 
@@ -41,18 +50,31 @@ class GitRepositorySync(Job):
         label="Git Repository",
         model=GitRepository,
     )
+    full_resync = BooleanVar(
+        default=False,
+        description="Refresh data from all files in the repository, not just from the files changed since the last sync",
+        label="Full resync",
+    )
 
     class Meta:
         name = "Git Repository: Sync"
         description = "Clone and/or pull a Git repository, then refresh data sourced from this repository."
         has_sensitive_variables = False
 
-    def run(self, repository):
+    def run(self, repository, full_resync=False):
         job_result = self.job_result
         user = job_result.user
 
         self.logger.info(f'Creating/refreshing local copy of Git repository "{repository.name}"...')
 
+        # Only the files changed since the most recently synced commit need to be refreshed, unless asked otherwise,
+        # or unless the previous sync failed to import some files, which then need to be retried
+        if not full_resync:
+            if self.previous_sync_logged_errors(repository):
+                self.logger.warning("The previous sync of this repository logged errors; refreshing all files")
+            else:
+                repository.previous_head = repository.current_head
+
         try:
             with transaction.atomic():
                 ensure_git_repository(repository, logger=self.logger)
@@ -73,6 +95,24 @@ class GitRepositorySync(Job):
                 refresh_job_code_from_repository(repository.slug, ignore_import_errors=True)
             raise
 
+    def previous_sync_logged_errors(self, repository):
+        """Check whether the previous sync of the given repository logged any errors, or can't be found."""
+        previous_sync = (
+            JobResult.objects.filter(
+                task_name=self.class_path,
+                task_kwargs__repository=repository.pk,
+                status__in=JobResultStatusChoices.READY_STATES,
+            )
+            .exclude(pk=self.job_result.pk)
+            .order_by("-date_created")
+            .first()
+        )
+        if previous_sync is None:
+            return True
+        return previous_sync.job_log_entries.filter(
+            log_level__in=[LogLevelChoices.LOG_ERROR, LogLevelChoices.LOG_CRITICAL]
+        ).exists()
+
 
 class GitRepositoryDryRun(Job):
     """System Job to perform a dry run on a Git repository."""
@@ -205,8 +245,12 @@ class ExportObjectList(Job):
                 self.logger.error("Model %s doesn't support YAML export", content_type.model)
                 raise ValueError("YAML export not supported for this content-type")
             self.logger.info("Exporting %d objects to YAML. This may take some time.", object_count)
-            yaml_data = [obj.to_yaml() for obj in queryset]
-            self.create_file(filename + ".yaml", "---\n".join(yaml_data))
+            with tempfile.TemporaryFile() as output:
+                for i, obj in enumerate(queryset.iterator(chunk_size=EXPORT_CHUNK_SIZE)):
+                    if i:
+                        output.write(b"---\n")
+                    output.write(obj.to_yaml().encode("utf-8"))
+                self.create_file(filename + ".yaml", output)
 
         else:
             # Generic CSV export
@@ -214,11 +258,17 @@ class ExportObjectList(Job):
             self.logger.debug("Found serializer class: `%s`", serializer_class.__name__)
             renderer = NautobotCSVRenderer()
             self.logger.info("Exporting %d objects to CSV. This may take some time.", object_count)
-            # The force_csv=True attribute is a hack, but much easier than trying to construct a valid HttpRequest
-            # object from scratch that passes all implicit and explicit assumptions in Django and DRF.
-            serializer = serializer_class(queryset, many=True, context={"request": None}, force_csv=True)
-            csv_data = renderer.render(serializer.data)
-            self.create_file(filename + ".csv", csv_data)
+            # Write the CSV data to a temporary file as it's rendered, one chunk of objects at a time, rather than
+            # building the entire export in memory.
+            # The serializer's force_csv=True attribute (applied by render_queryset()) is a hack, but much easier than
+            # trying to construct a valid HttpRequest object from scratch that passes all implicit and explicit
+            # assumptions in Django and DRF.
+            with tempfile.TemporaryFile() as output:
+                for csv_chunk in renderer.render_queryset(
+                    queryset, serializer_class, context={"request": None}, chunk_size=EXPORT_CHUNK_SIZE
+                ):
+                    output.write(csv_chunk.encode("utf-8"))
+                self.create_file(filename + ".csv", output)
 
 
 class ImportObjects(Job):
@@ -263,8 +313,61 @@ class ImportObjects(Job):
     def _perform_operation(self, data, serializer_class, queryset):
         new_objs = []
         validation_failed = False
-        for row, entry in enumerate(data, start=1):
-            serializer = serializer_class(data=entry, context={"request": None})
+        rows = list(enumerate(data, start=1))
+        for start in range(0, len(rows), IMPORT_BATCH_SIZE):
+            batch = rows[start : start + IMPORT_BATCH_SIZE]
+            context = {"request": None}
+            context["related_objects"] = bulk_lookup_related_objects(
+                serializer_class(context=context), [entry for _, entry in batch]
+            )
+            try:
+                batch_objs, batch_failed = self._perform_batch_operation(batch, serializer_class, queryset, context)
+            except Exception:
+                # Import the rows of this batch one by one instead, to determine which of them can't be imported
+                batch_objs, batch_failed = self._perform_row_operations(batch, serializer_class, queryset, context)
+            new_objs += batch_objs
+            validation_failed = validation_failed or batch_failed
+        return new_objs, validation_failed
+
+    def _perform_batch_operation(self, batch, serializer_class, queryset, context):
+        """
+        Import a batch of rows of data in a single transaction, with deferred change logging and a single permission
+        check for all the new objects.
+
+        Raises an exception, and rolls back the entire batch, if any object can't be saved or isn't permitted.
+        """
+        new_objs = []
+        validation_failed = False
+        # Results of each row, only logged once the whole batch has been imported
+        results = []
+        with deferred_change_logging_for_bulk_operation():
+            for row, entry in batch:
+                serializer = serializer_class(data=entry, context=context)
+                if serializer.is_valid():
+                    new_obj = serializer.save()
+                    new_objs.append(new_obj)
+                    results.append((row, new_obj, None))
+                else:
+                    validation_failed = True
+                    results.append((row, None, serializer.errors))
+            _, denied = queryset.check_perms_bulk(self.user, [new_obj.pk for new_obj in new_objs], action="add")
+            if denied:
+                raise AbortTransaction()
+
+        for row, new_obj, errors in results:
+            if new_obj is not None:
+                self.logger.info('Row %d: Created record "%s"', row, new_obj, extra={"object": new_obj})
+            else:
+                for field, err in errors.items():
+                    self.logger.error("Row %d: `%s`: `%s`", row, field, err[0])
+        return new_objs, validation_failed
+
+    def _perform_row_operations(self, batch, serializer_class, queryset, context):
+        """Import a batch of rows of data one at a time, each in its own transaction."""
+        new_objs = []
+        validation_failed = False
+        for row, entry in batch:
+            serializer = serializer_class(data=entry, context=context)
             if serializer.is_valid():
                 try:
                     with transaction.atomic():
@@ -1,5 +1,6 @@
 from nautobot.extras.choices import DynamicGroupTypeChoices
-from nautobot.extras.jobs import Job, ObjectVar
+from nautobot.extras.dynamic_groups import refresh_dynamic_group_member_caches
+from nautobot.extras.jobs import BooleanVar, IntegerVar, Job, ObjectVar
 from nautobot.extras.models import DynamicGroup
 
 name = "System Jobs"
@@ -18,21 +19,41 @@ class RefreshDynamicGroupCaches(Job):
         },
         required=False,
     )
+    workers = IntegerVar(
+        description="Maximum number of independent groups to refresh concurrently",
+        default=1,
+        min_value=1,
+        required=False,
+    )
+    skip_unchanged = BooleanVar(
+        description="Skip groups whose definition and candidate member objects have not changed since their last refresh",
+        default=False,
+    )
 
     class Meta:
         name = "Refresh Dynamic Group Caches"
         description = "Re-calculate and re-cache the membership lists of Dynamic Groups."
         has_sensitive_variables = False
 
-    def run(self, single_group=None):
+    def run(self, single_group=None, workers=1, skip_unchanged=False):
         groups = DynamicGroup.objects.restrict(self.user, "view").exclude(
             group_type=DynamicGroupTypeChoices.TYPE_STATIC
         )
         if single_group is not None:
             groups = groups.filter(pk=single_group.pk)
 
-        for group in groups:
-            group.update_cached_members()
-            self.logger.info("Cache refreshed successfully, now with %d members", group.count, extra={"object": group})
+        for result in refresh_dynamic_group_member_caches(groups, workers=workers or 1, skip_unchanged=skip_unchanged):
+            if result.error is not None:
+                self.logger.error("Cache refresh failed: %s", result.error, extra={"object": result.group})
+            elif result.skipped:
+                self.logger.info("Cache unchanged since last refresh, skipped", extra={"object": result.group})
+            else:
+                self.logger.info(
+                    "Cache refreshed successfully in %.3f seconds, now with %d members (%+d)",
+                    result.duration,
+                    result.members_after,
+                    result.members_after - result.members_before,
+                    extra={"object": result.group},
+                )
 
         self.logger.info("Cache(s) refreshed")
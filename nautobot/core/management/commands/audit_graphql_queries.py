@@ -1,11 +1,19 @@
+from django.conf import settings
 from django.core.management.base import BaseCommand
+from graphene_django.settings import graphene_settings
+from graphql import parse
+from graphql.error import GraphQLSyntaxError
 
 from nautobot.core.graphql import execute_query
+from nautobot.core.graphql.cost import get_query_cost
 from nautobot.users.models import User
 
 
 class Command(BaseCommand):
-    help = "Audit all existing GraphQLQuery instances in the database and output invalid query data"
+    help = (
+        "Audit all existing GraphQLQuery instances in the database and output invalid query data, "
+        "as well as the estimated cost of each query"
+    )
 
     def handle(self, *args, **options):
         from nautobot.extras.models import GraphQLQuery
@@ -16,12 +24,17 @@ class Command(BaseCommand):
         user, _ = User.objects.get_or_create(username="GraphQL Test User")
         is_valid = True
         error_dict = {}
+        cost_dict = {}
         for graph_ql_query in graph_ql_querys:
             result = execute_query(graph_ql_query.query, user=user).to_dict()
             if result.get("errors"):
                 errors = result.get("errors")
                 error_dict[graph_ql_query.name] = errors
                 is_valid = False
+            try:
+                cost_dict[graph_ql_query.name] = get_query_cost(graphene_settings.SCHEMA, parse(graph_ql_query.query))
+            except GraphQLSyntaxError:
+                pass
         if is_valid:
             self.stdout.write("\n>>> All GraphQLQuery query data are validated successfully!")
         else:
@@ -35,3 +48,15 @@ class Command(BaseCommand):
                 "\n>>> Please fix the outdated query data stated above according to the documentation available at:\n"
                 "https://docs.nautobot.com/projects/core/en/stable/user-guide/administration/upgrading/from-v1/upgrading-from-nautobot-v1/#ui-graphql-and-rest-api-filter-changes\n"
             )
+
+        if cost_dict:
+            max_cost = settings.GRAPHQL_MAX_QUERY_COST
+            self.stdout.write("\n>>> Estimated cost of GraphQLQuery instances, from most to least expensive:\n")
+            for name, cost in sorted(cost_dict.items(), key=lambda item: item[1], reverse=True):
+                if max_cost and cost > max_cost:
+                    self.stderr.write(
+                        f"    GraphQLQuery instance with name `{name}` has an estimated cost of {cost}, "
+                        f"which exceeds GRAPHQL_MAX_QUERY_COST ({max_cost})\n"
+                    )
+                else:
+                    self.stdout.write(f"    GraphQLQuery instance with name `{name}` has an estimated cost of {cost}\n")
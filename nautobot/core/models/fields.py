@@ -1,3 +1,4 @@
+from collections import OrderedDict
 import json
 import re
 
@@ -384,6 +385,46 @@ class JSONArrayField(models.JSONField):
         )
 
 
+class OrderedJSONField(models.TextField):
+    """
+    JSON storage that preserves the order of object keys.
+
+    Unlike `models.JSONField`, whose PostgreSQL JSONB storage re-sorts the keys of objects, values are stored as JSON
+    text, and objects are loaded as `OrderedDict`s in their original key order. The stored data can't be queried by key.
+    """
+
+    def __init__(self, *args, encoder=None, **kwargs):
+        self.encoder = encoder
+        super().__init__(*args, **kwargs)
+
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        if self.encoder is not None:
+            kwargs["encoder"] = self.encoder
+        return name, path, args, kwargs
+
+    def from_db_value(self, value, expression, connection):
+        if value is None:
+            return value
+        return json.loads(value, object_pairs_hook=OrderedDict)
+
+    def to_python(self, value):
+        if isinstance(value, str):
+            try:
+                return json.loads(value, object_pairs_hook=OrderedDict)
+            except json.JSONDecodeError as e:
+                raise exceptions.ValidationError(e)
+        return value
+
+    def get_prep_value(self, value):
+        if value is None:
+            return value
+        return json.dumps(value, cls=self.encoder)
+
+    def value_to_string(self, obj):
+        return self.get_prep_value(self.value_from_object(obj))
+
+
 class LaxURLField(models.URLField):
     """Like models.URLField, but using validators.EnhancedURLValidator and forms.LaxURLField."""
 
@@ -1,3 +1,8 @@
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
 from django.db.models import Count, OuterRef, Q, QuerySet, Subquery
 from django.db.models.functions import Coalesce
 
@@ -33,6 +38,74 @@ def count_related(model, field, *, filter_dict=None, manager_name="objects", dis
     return Coalesce(subquery, 0)
 
 
+def get_count(queryset):
+    """
+    Count the objects in the given queryset, using the configured count strategy.
+
+    - If `settings.APPROXIMATE_COUNT_THRESHOLD` is set, and the queryset is unfiltered, and the PostgreSQL query
+      planner's estimate of the number of rows in the model's table is at least that many, the estimate is returned.
+    - Otherwise, if `settings.COUNT_CACHE_TIMEOUT` is set, an exact count is cached for that many seconds, keyed by the
+      queryset's SQL, and a cached count is returned if available.
+    - Otherwise, an exact count is performed.
+
+    Returns:
+        (tuple): `(count, approximate)`, where `approximate` is True if the count is a planner estimate or was cached
+            (and so may be out of date).
+    """
+    threshold = getattr(settings, "APPROXIMATE_COUNT_THRESHOLD", 0)
+    if threshold and _is_unfiltered(queryset):
+        estimate = _get_table_row_estimate(queryset)
+        if estimate is not None and estimate >= threshold:
+            return estimate, True
+
+    timeout = getattr(settings, "COUNT_CACHE_TIMEOUT", 0)
+    if not timeout:
+        return queryset.count(), False
+
+    sql, params = queryset.query.sql_with_params()
+    query_hash = hashlib.sha256(repr((queryset.db, sql, params)).encode("utf-8")).hexdigest()
+    cache_key = f"{get_count.cache_key_prefix}.{query_hash}"
+    count = cache.get(cache_key)
+    if count is not None:
+        return count, True
+    count = queryset.count()
+    cache.set(cache_key, count, timeout)
+    return count, False
+
+
+get_count.cache_key_prefix = "nautobot.core.models.querysets.get_count"
+
+
+def _is_unfiltered(queryset):
+    """Whether the given queryset selects all rows of its model's table."""
+    query = queryset.query
+    return (
+        not query.where
+        and not query.distinct
+        and not query.combinator
+        and query.low_mark == 0
+        and query.high_mark is None
+        and query.model._meta.proxy is False
+    )
+
+
+def _get_table_row_estimate(queryset):
+    """Get the PostgreSQL query planner's estimate of the number of rows in the queryset model's table, if any."""
+    connection = connections[queryset.db]
+    if connection.vendor != "postgresql":
+        return None
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT reltuples FROM pg_class WHERE oid = to_regclass(%s)",
+            [connection.ops.quote_name(queryset.model._meta.db_table)],
+        )
+        row = cursor.fetchone()
+    # reltuples is -1 for a table that hasn't yet been vacuumed or analyzed
+    if row is None or row[0] is None or row[0] < 0:
+        return None
+    return int(row[0])
+
+
 class CompositeKeyQuerySetMixin:
     """
     Mixin to extend a base queryset class with support for filtering by `composite_key=...` as a virtual parameter.
@@ -166,6 +239,29 @@ class RestrictedQuerySet(CompositeKeyQuerySetMixin, QuerySet):
 
         return self.restrict(user, action).filter(pk=pk).exists()
 
+    def check_perms_bulk(self, user, pks, action="view"):
+        """
+        Check whether the given user can perform the given action with regard to each of the given instances of this
+        model, with a single database query.
+
+        This is the bulk equivalent of `check_perms()`.
+
+        Args:
+          user (User): User instance
+          pks (iterable): Primary keys of the instances to check
+          action (str): The action which must be permitted (e.g. "view" for "dcim.view_location"); default is 'view'
+
+        Returns:
+            (tuple[set, set]): The primary keys of the `(permitted, denied)` instances. Primary keys that don't
+                correspond to any instance in this queryset are denied.
+        """
+        pk_field = self.model._meta.pk
+        pks = {pk_field.to_python(pk) for pk in pks}
+        if not pks:
+            return set(), set()
+        permitted = set(self.restrict(user, action).filter(pk__in=pks).values_list("pk", flat=True))
+        return permitted, pks - permitted
+
     def distinct_values_list(self, *fields, flat=False, named=False):
         """Wrapper for `QuerySet.values_list()` that adds the `distinct()` query to return a list of unique values.
 
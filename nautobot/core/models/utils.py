@@ -1,3 +1,5 @@
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from itertools import count, groupby
 import json
 import unicodedata
@@ -6,6 +8,7 @@ from urllib.parse import quote_plus, unquote_plus
 from django.apps import apps
 from django.core.exceptions import FieldDoesNotExist
 from django.core.serializers import serialize
+from django.db import close_old_connections, connections, DEFAULT_DB_ALIAS
 from django.utils.tree import Node
 import emoji
 from slugify import slugify
@@ -260,3 +263,36 @@ def construct_natural_slug(values, pk=None):
     # Replace any emojis with their string name, and then slugify that.
     values = (slugify(emoji.replace_emoji(value, unicodedata.name)) for value in values)
     return constants.NATURAL_SLUG_SEPARATOR.join(values)
+
+
+def _call_in_worker_thread(func, *args):
+    """Call `func(*args)` in a worker thread, closing the database connection(s) that the thread opened afterward."""
+    close_old_connections()
+    try:
+        return func(*args)
+    finally:
+        connections.close_all()
+
+
+def map_in_threads(func, *iterables, workers=1, using=DEFAULT_DB_ALIAS):
+    """
+    Like `map()`, but calling `func` concurrently in up to `workers` threads, each with its own database connection.
+
+    The calls are made one after another in the calling thread instead if `workers` is `1` or less, or if the calling
+    thread is inside a transaction, as other threads can't see its uncommitted changes.
+
+    Args:
+        func (callable): Function to call with one item from each of the `iterables` at a time.
+        *iterables (iterable): Arguments to `func`, as with `map()`.
+        workers (int): Maximum number of concurrent calls.
+        using (str): Database alias whose transaction state to check.
+
+    Yields:
+        (Any): The result of each call, in the same order as the `iterables`.
+    """
+    if workers <= 1 or connections[using].in_atomic_block:
+        yield from map(func, *iterables)
+        return
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(partial(_call_in_worker_thread, func), *iterables)
@@ -77,6 +77,9 @@ if "NAUTOBOT_BANNER_LOGIN" in os.environ and os.environ["NAUTOBOT_BANNER_LOGIN"]
 if "NAUTOBOT_BANNER_TOP" in os.environ and os.environ["NAUTOBOT_BANNER_TOP"] != "":
     BANNER_TOP = os.environ["NAUTOBOT_BANNER_TOP"]
 
+# Class used to write deferred (bulk) change logging records to the database.
+CHANGELOG_BULK_WRITER = os.getenv("NAUTOBOT_CHANGELOG_BULK_WRITER", "nautobot.extras.change_logging.ObjectChangeWriter")
+
 # Number of days to retain changelog entries. Set to 0 to retain changes indefinitely. Defaults to 90 if not set here.
 if "NAUTOBOT_CHANGELOG_RETENTION" in os.environ and os.environ["NAUTOBOT_CHANGELOG_RETENTION"] != "":
     CHANGELOG_RETENTION = int(os.environ["NAUTOBOT_CHANGELOG_RETENTION"])
@@ -84,6 +87,9 @@ if "NAUTOBOT_CHANGELOG_RETENTION" in os.environ and os.environ["NAUTOBOT_CHANGEL
 # Disable linking of Config Context objects via Dynamic Groups by default. This could cause performance impacts
 # when a large number of dynamic groups are present
 CONFIG_CONTEXT_DYNAMIC_GROUPS_ENABLED = is_truthy(os.getenv("NAUTOBOT_CONFIG_CONTEXT_DYNAMIC_GROUPS_ENABLED", "False"))
+CONFIG_CONTEXT_MATERIALIZATION_ENABLED = is_truthy(
+    os.getenv("NAUTOBOT_CONFIG_CONTEXT_MATERIALIZATION_ENABLED", "False")
+)
 
 # UUID uniquely but anonymously identifying this Nautobot deployment.
 if "NAUTOBOT_DEPLOYMENT_ID" in os.environ and os.environ["NAUTOBOT_DEPLOYMENT_ID"] != "":
@@ -96,6 +102,11 @@ if "NAUTOBOT_DEPLOYMENT_ID" in os.environ and os.environ["NAUTOBOT_DEPLOYMENT_ID
 if "NAUTOBOT_DEVICE_NAME_AS_NATURAL_KEY" in os.environ and os.environ["NAUTOBOT_DEVICE_NAME_AS_NATURAL_KEY"] != "":
     DEVICE_NAME_AS_NATURAL_KEY = is_truthy(os.environ["NAUTOBOT_DEVICE_NAME_AS_NATURAL_KEY"])
 
+# Incrementally update Dynamic Group member caches when candidate member objects are created or updated.
+DYNAMIC_GROUPS_INCREMENTAL_UPDATES_ENABLED = is_truthy(
+    os.getenv("NAUTOBOT_DYNAMIC_GROUPS_INCREMENTAL_UPDATES_ENABLED", "False")
+)
+
 # Exclude potentially sensitive models from wildcard view exemption. These may still be exempted
 # by specifying the model individually in the EXEMPT_VIEW_PERMISSIONS configuration parameter.
 EXEMPT_EXCLUDE_MODELS = (
@@ -110,6 +121,9 @@ EXEMPT_VIEW_PERMISSIONS = []
 # The file path to a directory where cloned Git repositories will be located
 GIT_ROOT = os.getenv("NAUTOBOT_GIT_ROOT", os.path.join(NAUTOBOT_ROOT, "git").rstrip("/"))
 
+# Maximum number of processes to use when loading the data files of a Git repository, such as config contexts
+GIT_DATA_PARSE_WORKERS = int(os.getenv("NAUTOBOT_GIT_DATA_PARSE_WORKERS", "1"))
+
 # HTTP proxies to use for outbound requests originating from Nautobot (e.g. when sending webhook requests)
 HTTP_PROXIES = None
 
@@ -123,6 +137,12 @@ if "NAUTOBOT_JOB_CREATE_FILE_MAX_SIZE" in os.environ and os.environ["NAUTOBOT_JO
 # The storage backend to use for Job input files and Job output files
 JOB_FILE_IO_STORAGE = os.getenv("NAUTOBOT_JOB_FILE_IO_STORAGE", "db_file_storage.storage.DatabaseFileStorage")
 
+# Number of Job log entries to buffer in memory before saving them to the database in bulk
+JOB_LOG_BUFFER_SIZE = int(os.getenv("NAUTOBOT_JOB_LOG_BUFFER_SIZE", "100"))
+
+# Maximum number of seconds that a buffered Job log entry waits before being saved to the database
+JOB_LOG_FLUSH_INTERVAL = int(os.getenv("NAUTOBOT_JOB_LOG_FLUSH_INTERVAL", "2"))
+
 # The file path to a directory where locally installed Jobs can be discovered
 JOBS_ROOT = os.getenv("NAUTOBOT_JOBS_ROOT", os.path.join(NAUTOBOT_ROOT, "jobs").rstrip("/"))
 
@@ -248,6 +268,9 @@ SANITIZER_PATTERNS = [
     ),
 ]
 
+# Use a dedicated search index for the global search, rather than searching each model's table separately
+SEARCH_INDEX_ENABLED = is_truthy(os.getenv("NAUTOBOT_SEARCH_INDEX_ENABLED", "False"))
+
 # Storage
 STORAGE_BACKEND = None
 STORAGE_CONFIG = {}
@@ -257,6 +280,13 @@ STORAGE_CONFIG = {}
 if "NAUTOBOT_SUPPORT_MESSAGE" in os.environ and os.environ["NAUTOBOT_SUPPORT_MESSAGE"] != "":
     SUPPORT_MESSAGE = os.environ["NAUTOBOT_SUPPORT_MESSAGE"]
 
+# Maximum number of threads to use when rendering the computed fields of a list of objects in the REST API
+COMPUTED_FIELD_RENDER_WORKERS = int(os.getenv("NAUTOBOT_COMPUTED_FIELD_RENDER_WORKERS", "1"))
+
+# Maximum number of compiled Jinja2 templates (computed fields, custom links, export templates, etc.) to cache in
+# each process. Set to 0 to disable the cache.
+JINJA2_TEMPLATE_CACHE_SIZE = int(os.getenv("NAUTOBOT_JINJA2_TEMPLATE_CACHE_SIZE", "1000"))
+
 # Test runner that is aware of our use of "integration" tags and only runs
 # integration tests if explicitly passed in with `nautobot-server test --tag integration`.
 TEST_RUNNER = "nautobot.core.tests.runner.NautobotTestRunner"
@@ -875,6 +905,15 @@ GRAPHQL_CUSTOM_FIELD_PREFIX = "cf"
 GRAPHQL_RELATIONSHIP_PREFIX = "rel"
 GRAPHQL_COMPUTED_FIELD_PREFIX = "cpf"
 
+# Number of parsed and validated GraphQL queries to keep in memory, keyed by a hash of the query; 0 disables the cache
+GRAPHQL_DOCUMENT_CACHE_SIZE = int(os.getenv("NAUTOBOT_GRAPHQL_DOCUMENT_CACHE_SIZE", "1000"))
+
+# Maximum estimated cost of a GraphQL query submitted to the GraphQL API, above which it's rejected; 0 means no limit
+GRAPHQL_MAX_QUERY_COST = int(os.getenv("NAUTOBOT_GRAPHQL_MAX_QUERY_COST", "0"))
+
+# Number of seconds to cache the results of GraphQL API queries for; 0 disables caching of results
+GRAPHQL_RESULT_CACHE_TIMEOUT = int(os.getenv("NAUTOBOT_GRAPHQL_RESULT_CACHE_TIMEOUT", "0"))
+
 
 #
 # Caching
@@ -896,6 +935,19 @@ CACHES = {
     }
 }
 
+# For unfiltered list views and REST API pages of tables with at least this many rows (as estimated by the PostgreSQL
+# query planner), display the estimate rather than counting the rows exactly. Set to 0 to always count exactly.
+APPROXIMATE_COUNT_THRESHOLD = int(os.getenv("NAUTOBOT_APPROXIMATE_COUNT_THRESHOLD", "0"))
+
+# Number of seconds to cache the object counts of list views and REST API pages. Set to 0 to disable caching.
+COUNT_CACHE_TIMEOUT = int(os.getenv("NAUTOBOT_COUNT_CACHE_TIMEOUT", "0"))
+
+# Number of seconds to cache retrieved secret values in the memory of each process. Set to 0 to disable caching.
+SECRETS_CACHE_TTL = int(os.getenv("NAUTOBOT_SECRETS_CACHE_TTL", "0"))
+
+# Number of seconds to cache each user's ObjectPermissions across requests. Set to 0 to disable caching.
+OBJECT_PERMISSION_CACHE_TIMEOUT = int(os.getenv("NAUTOBOT_OBJECT_PERMISSION_CACHE_TIMEOUT", "0"))
+
 # Number of seconds to cache ContentType lookups. Set to 0 to disable caching.
 CONTENT_TYPE_CACHE_TIMEOUT = int(os.getenv("NAUTOBOT_CONTENT_TYPE_CACHE_TIMEOUT", "0"))
 
@@ -302,7 +302,7 @@ class BaseTable(django_tables2.Table):
                         # No error message logged here as the above is *very much* best-effort
                         pass
 
-            self.data.data = queryset
+            self.data.data = self.alter_queryset(queryset)
 
         # TODO: it would be better if we could apply this transformation and the above queryset optimizations
         #       **before** calling super().__init__(), but the current implementation works for now, though inelegant.
@@ -311,6 +311,14 @@ class BaseTable(django_tables2.Table):
             self.data.set_table(self)
             self.rows = BoundRows(data=self.data, table=self, pinned_data=self.pinned_data)
 
+    def alter_queryset(self, queryset):
+        """
+        Hook for subclasses to further optimize the table's QuerySet, for example based on the `visible_columns`.
+
+        Called after the related-field and count optimizations above, but before any `data_transform_callback`.
+        """
+        return queryset
+
     @property
     def configurable_columns(self):
         selected_columns = [
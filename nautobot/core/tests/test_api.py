@@ -1,6 +1,7 @@
 import csv
 from io import BytesIO, StringIO
 import json
+import math
 import os
 from unittest import skip
 import uuid
@@ -186,6 +187,35 @@ class APIPaginationTestCase(testing.APITestCase):
         self.assertHttpStatus(response, 200)
         self.assertEqual(len(response.data["results"]), config.MAX_PAGE_SIZE)
 
+    @override_settings(EXEMPT_VIEW_PERMISSIONS=["*"], PAGINATE_COUNT=3, MAX_PAGE_SIZE=10)
+    def test_cursor_pagination(self):
+        """Walk through all objects using keyset pagination."""
+        expected_pks = [str(pk) for pk in Provider.objects.order_by("pk").values_list("pk", flat=True)]
+        self.assertGreater(len(expected_pks), settings.PAGINATE_COUNT)
+
+        pks = []
+        url = f"{self.url}?cursor="
+        while url:
+            response = self.client.get(url, **self.header)
+            self.assertHttpStatus(response, 200)
+            self.assertIsNone(response.data["count"])
+            self.assertIsNone(response.data["previous"])
+            self.assertLessEqual(len(response.data["results"]), settings.PAGINATE_COUNT)
+            pks.extend(str(result["id"]) for result in response.data["results"])
+            url = response.data["next"]
+        self.assertEqual(pks, expected_pks)
+
+        # The limit is respected, and a page that is exactly full but is the last page has no next link
+        response = self.client.get(f"{self.url}?cursor={expected_pks[-3]}&limit=2", **self.header)
+        self.assertHttpStatus(response, 200)
+        self.assertEqual([str(result["id"]) for result in response.data["results"]], expected_pks[-2:])
+        self.assertIsNone(response.data["next"])
+
+    @override_settings(EXEMPT_VIEW_PERMISSIONS=["*"])
+    def test_cursor_pagination_invalid_cursor(self):
+        response = self.client.get(f"{self.url}?cursor=not-a-uuid", **self.header)
+        self.assertHttpStatus(response, 404)
+
 
 class APIVersioningTestCase(testing.APITestCase):
     """
@@ -515,6 +545,34 @@ class NautobotCSVRendererTest(TestCase):
         self.assertIn("parent__name", read_data)
         self.assertEqual(read_data["parent__name"], location_type.parent.name)
 
+    def test_render_queryset(self):
+        """render_queryset() should incrementally produce the same CSV as rendering all of the data at once."""
+        queryset = dcim_models.LocationType.objects.all()
+        data = dcim_serializers.LocationTypeSerializer(
+            queryset, many=True, context={"request": None}, force_csv=True
+        ).data
+        csv_text = NautobotCSVRenderer().render(data)
+        # Headers determined from the serializer match those determined from the data
+        self.assertEqual(
+            NautobotCSVRenderer.get_headers_from_serializer(data.serializer.child),
+            NautobotCSVRenderer.get_headers(list(data)),
+        )
+
+        csv_chunks = list(
+            NautobotCSVRenderer().render_queryset(
+                queryset, dcim_serializers.LocationTypeSerializer, context={"request": None}, chunk_size=2
+            )
+        )
+        # One chunk for the headers, plus one for each chunk of records
+        self.assertEqual(len(csv_chunks), 1 + math.ceil(queryset.count() / 2))
+        self.assertEqual("".join(csv_chunks), csv_text)
+
+        # Headers are determined from the serializer even if there's no data
+        csv_chunks = list(
+            NautobotCSVRenderer().render_queryset(queryset.none(), dcim_serializers.LocationTypeSerializer)
+        )
+        self.assertEqual(csv_chunks, [csv_text.splitlines(keepends=True)[0]])
+
 
 class BaseModelSerializerTest(TestCase):
     """
@@ -9,6 +9,7 @@ from django.test.utils import override_settings
 from django.urls import reverse
 from netaddr import IPNetwork
 
+from nautobot.core.authentication import ObjectPermissionBackend
 from nautobot.core.settings_funcs import sso_auth_enabled
 from nautobot.core.testing import NautobotTestClient, TestCase
 from nautobot.core.utils import lookup
@@ -236,6 +237,89 @@ class ExternalAuthenticationTestCase(TestCase):
         self.assertFalse(sso_auth_enabled(tuple(TEST_AUTHENTICATION_BACKENDS)))
 
 
+class ObjectPermissionBackendTestCase(TestCase):
+    """Tests for the ObjectPermissionBackend and its cross-request permissions cache."""
+
+    def setUp(self):
+        super().setUp()
+        self.test_user = User.objects.create(username=f"perm-cache-user-{uuid.uuid4()}")
+        self.obj_perm = ObjectPermission.objects.create(
+            name=f"Test permission {uuid.uuid4()}",
+            constraints={"name": "foo"},
+            actions=["view", "change"],
+        )
+        self.obj_perm.object_types.add(ContentType.objects.get_for_model(Location))
+        self.obj_perm.users.add(self.test_user)
+
+    def get_permissions(self):
+        """Get the permissions of a fresh instance of the test user, as would happen in a new request."""
+        return ObjectPermissionBackend().get_all_permissions(User.objects.get(pk=self.test_user.pk))
+
+    def test_constraints_are_simplified(self):
+        duplicate_perm = ObjectPermission.objects.create(
+            name=f"Duplicate {uuid.uuid4()}", constraints=[{"name": "foo"}], actions=["view"]
+        )
+        duplicate_perm.object_types.add(ContentType.objects.get_for_model(Location))
+        duplicate_perm.users.add(self.test_user)
+        unconstrained_perm = ObjectPermission.objects.create(name=f"Unconstrained {uuid.uuid4()}", actions=["change"])
+        unconstrained_perm.object_types.add(ContentType.objects.get_for_model(Location))
+        unconstrained_perm.users.add(self.test_user)
+
+        perms = self.get_permissions()
+        self.assertEqual(perms["dcim.view_location"], [{"name": "foo"}])
+        self.assertEqual(perms["dcim.change_location"], [None])
+
+    @override_settings(OBJECT_PERMISSION_CACHE_TIMEOUT=60)
+    def test_permissions_cache(self):
+        perms = self.get_permissions()
+        self.assertEqual(perms["dcim.view_location"], [{"name": "foo"}])
+
+        # Cached permissions are reused across user instances
+        with self.assertNumQueries(1):  # only the query to retrieve the user
+            self.assertEqual(self.get_permissions(), perms)
+
+        # Changing an ObjectPermission invalidates the cache
+        self.obj_perm.constraints = {"name": "bar"}
+        self.obj_perm.save()
+        self.assertEqual(self.get_permissions()["dcim.view_location"], [{"name": "bar"}])
+
+        # Changing the users or groups of an ObjectPermission invalidates the cache
+        self.obj_perm.users.remove(self.test_user)
+        self.assertNotIn("dcim.view_location", self.get_permissions())
+        group = Group.objects.create(name=f"perm-cache-group-{uuid.uuid4()}")
+        self.obj_perm.groups.add(group)
+        self.assertNotIn("dcim.view_location", self.get_permissions())
+
+        # Changing the user's group memberships invalidates the cache
+        self.test_user.groups.add(group)
+        self.assertIn("dcim.view_location", self.get_permissions())
+
+        # Deleting a group invalidates the cache
+        group.delete()
+        self.assertNotIn("dcim.view_location", self.get_permissions())
+
+    def test_check_perms_bulk(self):
+        locations = list(Location.objects.all()[:3])
+        self.obj_perm.constraints = {"pk__in": [str(locations[0].pk), str(locations[1].pk)]}
+        self.obj_perm.save()
+        user = User.objects.get(pk=self.test_user.pk)
+        nonexistent_pk = uuid.uuid4()
+
+        permitted, denied = Location.objects.check_perms_bulk(
+            user, [locations[0].pk, str(locations[1].pk), locations[2].pk, nonexistent_pk]
+        )
+        self.assertEqual(permitted, {locations[0].pk, locations[1].pk})
+        self.assertEqual(denied, {locations[2].pk, nonexistent_pk})
+        for location in locations:
+            self.assertEqual(Location.objects.check_perms(user, instance=location), location.pk in permitted)
+
+        permitted, denied = Location.objects.check_perms_bulk(user, [locations[0].pk], action="delete")
+        self.assertEqual(permitted, set())
+        self.assertEqual(denied, {locations[0].pk})
+
+        self.assertEqual(Location.objects.check_perms_bulk(user, []), (set(), set()))
+
+
 class ObjectPermissionAPIViewTestCase(TestCase):
     client_class = NautobotTestClient
 
@@ -360,6 +444,37 @@ class ObjectPermissionAPIViewTestCase(TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.data["count"], Prefix.objects.filter(locations__in=[self.locations[0]]).count())
 
+    @override_settings(EXEMPT_VIEW_PERMISSIONS=[])
+    def test_bulk_edit_objects(self):
+        url = reverse("ipam-api:prefix-list")
+
+        # Assign object permission
+        obj_perm = ObjectPermission.objects.create(
+            name="Test permission",
+            constraints={"type": "network"},
+            actions=["change"],
+        )
+        obj_perm.users.add(self.user)
+        obj_perm.object_types.add(ContentType.objects.get_for_model(Prefix))
+
+        # Attempt to edit objects such that they no longer satisfy the permission constraints
+        data = [{"id": str(prefix.pk), "type": "pool"} for prefix in self.prefixes[:3]]
+        response = self.client.patch(url, data, format="json", **self.header)
+        self.assertEqual(response.status_code, 403)
+        for prefix in Prefix.objects.filter(pk__in=[prefix.pk for prefix in self.prefixes[:3]]):
+            self.assertEqual(prefix.type, "network")
+
+        # Edit objects such that they still satisfy the permission constraints
+        data = [{"id": str(prefix.pk), "description": "Bulk edited"} for prefix in self.prefixes[:3]]
+        response = self.client.patch(url, data, format="json", **self.header)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            Prefix.objects.filter(
+                pk__in=[prefix.pk for prefix in self.prefixes[:3]], description="Bulk edited"
+            ).count(),
+            3,
+        )
+
     @override_settings(EXEMPT_VIEW_PERMISSIONS=[])
     def test_create_object(self):
         url = reverse("ipam-api:prefix-list")
@@ -1,8 +1,86 @@
+import logging
 from unittest import TestCase
 
+from django.test import override_settings
+
 from nautobot.core import celery
+from nautobot.core.celery.log import flush_job_logs, NautobotDatabaseHandler
+from nautobot.core.testing import TransactionTestCase
+from nautobot.extras.models import JobLogEntry, JobResult
 
 
 class CeleryTest(TestCase):
     def test__dumps(self):
         self.assertEqual('"I am UTF-8! 😀"', celery._dumps("I am UTF-8! 😀"))
+
+
+class NautobotDatabaseHandlerTest(TransactionTestCase):
+    def make_record(self, task_id, message, level=logging.INFO):
+        record = logging.LogRecord("celery.task", level, __file__, 1, message, None, None, func="run")
+        record.task_id = task_id
+        return record
+
+    @override_settings(JOB_LOG_BUFFER_SIZE=3, JOB_LOG_FLUSH_INTERVAL=3600)
+    def test_log_entries_are_buffered(self):
+        job_result = JobResult.objects.create(name="Test")
+        task_id = str(job_result.id)
+        handler = NautobotDatabaseHandler()
+
+        with self.assertNumQueries(1):  # JobResult lookup only
+            handler.handle(self.make_record(task_id, "first"))
+            handler.handle(self.make_record(task_id, "second"))
+        self.assertFalse(JobLogEntry.objects.filter(job_result=job_result).exists())
+
+        # Reaching the buffer size saves all buffered entries at once
+        handler.handle(self.make_record(task_id, "third"))
+        self.assertQuerysetEqual(
+            JobLogEntry.objects.filter(job_result=job_result).order_by("created").values_list("message", flat=True),
+            ["first", "second", "third"],
+        )
+
+        # The end of the task saves the remaining entries
+        handler.handle(self.make_record(task_id, "fourth"))
+        self.assertEqual(JobLogEntry.objects.filter(job_result=job_result).count(), 3)
+        flush_job_logs(task_id)
+        self.assertEqual(JobLogEntry.objects.filter(job_result=job_result).count(), 4)
+        self.assertNotIn(task_id, handler.job_results)
+
+    @override_settings(JOB_LOG_BUFFER_SIZE=1000, JOB_LOG_FLUSH_INTERVAL=0)
+    def test_log_entries_are_flushed_after_interval(self):
+        job_result = JobResult.objects.create(name="Test")
+        handler = NautobotDatabaseHandler()
+
+        handler.handle(self.make_record(str(job_result.id), "message"))
+        self.assertEqual(JobLogEntry.objects.filter(job_result=job_result).count(), 1)
+
+    @override_settings(JOB_LOG_BUFFER_SIZE=1000, JOB_LOG_FLUSH_INTERVAL=3600)
+    def test_warning_log_entries_are_flushed_immediately(self):
+        job_result = JobResult.objects.create(name="Test")
+        handler = NautobotDatabaseHandler()
+
+        handler.handle(self.make_record(str(job_result.id), "info"))
+        self.assertFalse(JobLogEntry.objects.filter(job_result=job_result).exists())
+        handler.handle(self.make_record(str(job_result.id), "warning", level=logging.WARNING))
+        self.assertEqual(JobLogEntry.objects.filter(job_result=job_result).count(), 2)
+        self.assertIsNone(handler.flush_timer)
+
+    @override_settings(JOB_LOG_BUFFER_SIZE=1000, JOB_LOG_FLUSH_INTERVAL=1)
+    def test_log_entries_are_flushed_by_timer(self):
+        job_result = JobResult.objects.create(name="Test")
+        handler = NautobotDatabaseHandler()
+
+        handler.handle(self.make_record(str(job_result.id), "message"))
+        self.assertFalse(JobLogEntry.objects.filter(job_result=job_result).exists())
+        # The entry is saved once the interval has passed, even though nothing else is logged
+        flush_timer = handler.flush_timer
+        self.assertIsNotNone(flush_timer)
+        flush_timer.join(timeout=10)
+        self.assertEqual(JobLogEntry.objects.filter(job_result=job_result).count(), 1)
+        self.assertIsNone(handler.flush_timer)
+
+    def test_no_job_result(self):
+        handler = NautobotDatabaseHandler()
+
+        handler.handle(self.make_record("???", "message"))
+        self.assertEqual(handler.buffer, [])
+        self.assertIsNone(handler.job_results["???"])
@@ -1,28 +1,43 @@
 import datetime
 import random
 import types
-from unittest import skip, TestCase as UnitTestTestCase
+from unittest import skip, skipIf, TestCase as UnitTestTestCase
+from unittest.mock import patch
 import uuid
 
 from django.apps import apps
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import Group
 from django.contrib.contenttypes.models import ContentType
+from django.db import connection
 from django.db.models import Q
 from django.test import override_settings, TestCase
 from django.test.client import RequestFactory
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 import graphene.types
 from graphene_django.registry import get_global_registry
 from graphene_django.settings import graphene_settings
-from graphql import get_default_backend, GraphQLError
+from graphql import get_default_backend, GraphQLError, parse
 from graphql.error.located_error import GraphQLLocatedError
+from promise import Promise
 from rest_framework import status
 
 from nautobot.circuits.models import CircuitTermination, Provider
 from nautobot.core.graphql import execute_query, execute_saved_query
+from nautobot.core.graphql.caching import (
+    execute_document,
+    get_graphql_backend,
+    get_result_cache_generations,
+    get_result_cache_key,
+    invalidate_graphql_result_cache,
+    PersistedQueryBackend,
+)
+from nautobot.core.graphql.cost import CONFIG_CONTEXT_COST, DEFAULT_LIST_SIZE, get_query_cost
 from nautobot.core.graphql.generators import (
+    generate_computed_field_resolver,
     generate_list_search_parameters,
+    generate_relationship_resolver,
     generate_schema_type,
 )
 from nautobot.core.graphql.schema import (
@@ -64,8 +79,10 @@ from nautobot.dcim.models import (
 from nautobot.extras.choices import CustomFieldTypeChoices
 from nautobot.extras.models import (
     ChangeLoggedModel,
+    ComputedField,
     ConfigContext,
     CustomField,
+    DynamicGroup,
     GraphQLQuery,
     Relationship,
     RelationshipAssociation,
@@ -105,6 +122,8 @@ class GraphQLTestCase(GraphQLTestCaseBase):
         self.user = create_test_user("graphql_testuser")
         GraphQLQuery.objects.create(name="GQL 1", query="{ query: locations {name} }")
         GraphQLQuery.objects.create(name="GQL 2", query="query ($name: [String!]) { locations(name:$name) {name} }")
+        self.request = RequestFactory().post("/graphql/")
+        self.request.user = self.user
         self.location_type = LocationType.objects.get(name="Campus")
         location_status = Status.objects.get_for_model(Location).first()
         self.locations = (
@@ -172,6 +191,77 @@ class GraphQLTestCase(GraphQLTestCaseBase):
         resp = execute_saved_query("GQL 2", user=self.user, variables={"name": "location-1"}).to_dict()
         self.assertFalse(resp["data"].get("error"))
 
+    def test_persisted_query_backend(self):
+        """Test that parsed and validated documents are cached, unless invalid."""
+        backend = PersistedQueryBackend()
+        query = "query { locations { name } }"
+        document = backend.document_from_string(self.SCHEMA, query)
+        self.assertIs(backend.document_from_string(self.SCHEMA, query), document)
+        with override_settings(GRAPHQL_DOCUMENT_CACHE_SIZE=0):
+            self.assertIsNot(backend.document_from_string(self.SCHEMA, query), document)
+
+        invalid_query = "query { locations { not_a_field } }"
+        invalid_document = backend.document_from_string(self.SCHEMA, invalid_query)
+        self.assertIsNot(backend.document_from_string(self.SCHEMA, invalid_query), invalid_document)
+        self.assertTrue(invalid_document.execute(context_value=self.request).errors)
+
+        with override_settings(EXEMPT_VIEW_PERMISSIONS=["*"]):
+            result = document.execute(context_value=self.request)
+        self.assertIsNone(result.errors)
+        self.assertEqual(len(result.data["locations"]), Location.objects.count())
+
+    @override_settings(EXEMPT_VIEW_PERMISSIONS=["*"], GRAPHQL_RESULT_CACHE_TIMEOUT=60)
+    def test_result_cache(self):
+        """Test that query results are cached, and invalidated when the queried objects change."""
+        invalidate_graphql_result_cache()
+        document = get_graphql_backend().document_from_string(self.SCHEMA, "query { locations { name } }")
+        result = execute_document(document, self.user, context_value=self.request)
+        self.assertIn("Location-1", [location["name"] for location in result.data["locations"]])
+        with self.assertNumQueries(0):
+            cached_result = execute_document(document, self.user, context_value=self.request)
+        self.assertEqual(cached_result.data, result.data)
+
+        self.locations[0].name = "Location-1 renamed"
+        self.locations[0].save()
+        result = execute_document(document, self.user, context_value=self.request)
+        location_names = [location["name"] for location in result.data["locations"]]
+        self.assertIn("Location-1 renamed", location_names)
+        self.assertNotIn("Location-1", location_names)
+
+    @override_settings(EXEMPT_VIEW_PERMISSIONS=["*"], GRAPHQL_RESULT_CACHE_TIMEOUT=60)
+    def test_result_cache_filter_models(self):
+        """Test that cached results are invalidated when a model that the query only filters on changes."""
+        invalidate_graphql_result_cache()
+        query = "query ($location_type: [String!]) { locations(location_type: $location_type) { name } }"
+        document = get_graphql_backend().document_from_string(self.SCHEMA, query)
+        variables = {"location_type": [self.location_type.name]}
+        result = execute_document(document, self.user, context_value=self.request, variable_values=variables)
+        self.assertIn("Location-1", [location["name"] for location in result.data["locations"]])
+
+        self.location_type.name = "Campus renamed"
+        self.location_type.save()
+        result = execute_document(document, self.user, context_value=self.request, variable_values=variables)
+        self.assertEqual(result.data["locations"], [])
+
+        # Filters implemented by a method can traverse any model, so their results aren't cached
+        document = get_graphql_backend().document_from_string(
+            self.SCHEMA, "query { devices(has_primary_ip: true) { name } }"
+        )
+        self.assertIsNone(get_result_cache_key(document, self.user))
+
+    @override_settings(GRAPHQL_RESULT_CACHE_TIMEOUT=60)
+    def test_result_cache_through_model_changed(self):
+        """Test that changing an object of an explicit through model invalidates the models on either side of it."""
+        ip_to_interface = IPAddressToInterface.objects.filter(interface__isnull=False).first()
+        if ip_to_interface is None:
+            self.skipTest("No IPAddressToInterface with an Interface found")
+        generations = get_result_cache_generations([IPAddress, Interface])
+        ip_to_interface.save()
+        new_generations = get_result_cache_generations([IPAddress, Interface])
+        for cache_key, generation in generations.items():
+            if cache_key.endswith((".ipaddress", ".interface")):
+                self.assertNotEqual(new_generations[cache_key], generation, cache_key)
+
     def test_graphql_types_registry(self):
         """Ensure models with graphql feature are registered in the graphene_django registry."""
         graphene_django_registry = get_global_registry()
@@ -473,6 +563,34 @@ class GraphQLSearchParameters(GraphQLTestCaseBase):
                 self.assertNotIn(field, params.keys())
 
 
+class GraphQLQueryCostTestCase(GraphQLTestCaseBase):
+    def get_query_cost(self, query, variables=None):
+        return get_query_cost(self.SCHEMA, parse(query), variables=variables)
+
+    def test_list_fan_out(self):
+        self.assertEqual(self.get_query_cost("query { devices { name } }"), 1 + DEFAULT_LIST_SIZE)
+        self.assertEqual(
+            self.get_query_cost("query { devices(limit: 5) { name interfaces { name } } }"),
+            1 + 5 + 5 + 5 * DEFAULT_LIST_SIZE,
+        )
+        self.assertEqual(
+            self.get_query_cost("query ($limit: Int) { devices(limit: $limit) { name } }", variables={"limit": 5}),
+            1 + 5,
+        )
+
+    def test_fragments(self):
+        query = (
+            "query { devices(limit: 5) { ...DeviceFields ... on DeviceType { serial } } } "
+            "fragment DeviceFields on DeviceType { name }"
+        )
+        self.assertEqual(self.get_query_cost(query), 1 + 5 + 5)
+
+    def test_expensive_fields(self):
+        self.assertEqual(
+            self.get_query_cost("query { devices(limit: 5) { config_context } }"), 1 + 5 * CONFIG_CONTEXT_COST
+        )
+
+
 class GraphQLAPIPermissionTest(GraphQLTestCaseBase):
     client_class = NautobotTestClient
 
@@ -699,6 +817,19 @@ class GraphQLAPIPermissionTest(GraphQLTestCaseBase):
         location_list = list(Location.objects.values_list("name", flat=True))
         self.assertEqual(location_names, location_list)
 
+    def test_graphql_query_cost_limit(self):
+        """Validate queries whose estimated cost exceeds GRAPHQL_MAX_QUERY_COST are rejected without being executed."""
+        # 1 for locations, 100 * 2 for their names and racks, and 100 * 100 for the names of their racks
+        with override_settings(GRAPHQL_MAX_QUERY_COST=10000):
+            response = self.clients[2].post(self.api_url, {"query": self.get_locations_racks_query}, format="json")
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+            self.assertNotIn("data", response.data)
+            self.assertIn("exceeds the maximum allowed cost of 10000", response.data["errors"][0]["message"])
+
+            response = self.clients[2].post(self.api_url, {"query": self.get_racks_query}, format="json")
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertIsInstance(response.data["data"]["racks"], list)
+
 
 class GraphQLQueryTest(GraphQLTestCaseBase):
     """Execute various GraphQL queries and verify their correct responses."""
@@ -1598,6 +1729,142 @@ query {
         self.assertTrue(found_valid_prefix)
         self.assertFalse(found_invalid_prefix)
 
+    @skipIf(connection.vendor == "mysql", "Prefix utilization is calculated for each prefix individually on MySQL")
+    @override_settings(EXEMPT_VIEW_PERMISSIONS=["*"])
+    def test_query_prefixes_utilization(self):
+        """Test querying the utilization of a list of prefixes calculates it for all prefixes in a single query."""
+        query = (
+            "query { prefixes { id ...PrefixFields } } "
+            "fragment PrefixFields on PrefixType { utilization { numerator denominator } }"
+        )
+        with CaptureQueriesContext(connection) as captured:
+            result = self.execute_query(query)
+        self.assertIsNone(result.errors)
+        self.assertEqual(len(result.data["prefixes"]), Prefix.objects.count())
+        for prefix_data in result.data["prefixes"]:
+            utilization = Prefix.objects.get(pk=prefix_data["id"]).get_utilization()
+            self.assertEqual(
+                prefix_data["utilization"],
+                {"numerator": utilization.numerator, "denominator": utilization.denominator},
+            )
+        self.assertEqual(
+            len([query for query in captured.captured_queries if "ipam_ipaddress" in query["sql"]]),
+            1,
+        )
+
+    @override_settings(EXEMPT_VIEW_PERMISSIONS=["*"])
+    def test_query_devices_dynamic_groups(self):
+        """Test querying the Dynamic Groups of a list of devices uses a single query for all devices."""
+        device_ct = ContentType.objects.get_for_model(Device)
+        group_1 = DynamicGroup.objects.create(
+            name="Location 1 devices", content_type=device_ct, filter={"location": [self.location1.name]}
+        )
+        group_2 = DynamicGroup.objects.create(
+            name="All devices", content_type=device_ct, filter={"name__ic": ["device"]}
+        )
+        group_1.update_cached_members()
+        group_2.update_cached_members()
+        expected = {
+            device.name: sorted(group.name for group in (group_1, group_2) if group.has_member(device))
+            for device in Device.objects.all()
+        }
+
+        query = "query { devices { name dynamic_groups { name } } }"
+        with CaptureQueriesContext(connection) as captured:
+            result = self.execute_query(query)
+        self.assertIsNone(result.errors)
+        self.assertEqual(
+            {
+                device["name"]: sorted(group["name"] for group in device["dynamic_groups"])
+                for device in result.data["devices"]
+            },
+            expected,
+        )
+        self.assertEqual(
+            len([query for query in captured.captured_queries if "extras_staticgroupassociation" in query["sql"]]),
+            1,
+        )
+
+    @override_settings(EXEMPT_VIEW_PERMISSIONS=["*"])
+    def test_query_devices_related_objects_batched(self):
+        """Test querying the related objects of a list of devices uses a single query per relation for all devices."""
+        for interface_filter in ("", '(name: "Int1")'):
+            with self.subTest(interface_filter=interface_filter):
+                query = (
+                    f"query {{ devices {{ name interfaces{interface_filter} {{ name ip_addresses {{ address }} }} }} }}"
+                )
+                with CaptureQueriesContext(connection) as captured:
+                    result = self.execute_query(query)
+                self.assertIsNone(result.errors)
+                for device_data in result.data["devices"]:
+                    interfaces = Interface.objects.filter(device__name=device_data["name"])
+                    if interface_filter:
+                        interfaces = interfaces.filter(name="Int1")
+                    self.assertEqual(
+                        sorted(interface["name"] for interface in device_data["interfaces"]),
+                        sorted(interfaces.values_list("name", flat=True)),
+                    )
+                    for interface_data in device_data["interfaces"]:
+                        interface = interfaces.get(name=interface_data["name"])
+                        self.assertEqual(
+                            sorted(ip_address["address"] for ip_address in interface_data["ip_addresses"]),
+                            sorted(str(ip_address.address) for ip_address in interface.ip_addresses.all()),
+                        )
+                self.assertEqual(
+                    len([query for query in captured.captured_queries if "dcim_interface" in query["sql"]]),
+                    1,
+                )
+                self.assertEqual(
+                    len([query for query in captured.captured_queries if "ipam_ipaddresstointerface" in query["sql"]]),
+                    1,
+                )
+
+    def _resolve_for_devices(self, resolver, devices):
+        """Call the given field resolver for each of the given devices as part of a single (fake) query execution."""
+        info = types.SimpleNamespace(context=types.SimpleNamespace(), variable_values={}, field_asts=[])
+        # The resolvers' results are batched by the DataLoader until the first of them is waited for
+        return Promise.all([resolver(device, info) for device in devices]).get()
+
+    def test_relationship_resolver_batched(self):
+        """Test resolving a relationship for a list of devices uses a single query for all associations and peers."""
+        devices = [self.device1, self.device2, self.device3]
+        # The peer queryset optimization requires a real ResolveInfo, and doesn't affect the number of queries here
+        with patch("nautobot.core.graphql.generators.gql_optimizer.query", side_effect=lambda queryset, info: queryset):
+            resolver = generate_relationship_resolver(
+                "rel_device_group", "resolve_rel_device_group", self.relationship_m2ms_1, "peer", Device
+            )
+            with self.assertNumQueries(2):
+                results = self._resolve_for_devices(resolver, devices)
+            self.assertEqual(
+                [{peer.pk for peer in peers} for peers in results],
+                [
+                    {self.device2.pk, self.device3.pk},
+                    {self.device1.pk, self.device3.pk},
+                    {self.device1.pk, self.device2.pk},
+                ],
+            )
+
+            resolver = generate_relationship_resolver(
+                "rel_device_to_vm", "resolve_rel_device_to_vm", self.relationship_o2o_1, "source", VirtualMachine
+            )
+            with self.assertNumQueries(2):
+                results = self._resolve_for_devices(resolver, devices)
+            self.assertEqual(results, [self.virtualmachine, None, None])
+
+    def test_computed_field_resolver_batched(self):
+        """Test resolving a computed field for a list of devices only looks up the computed field once."""
+        ComputedField.objects.create(
+            content_type=ContentType.objects.get_for_model(Device),
+            key="device_name_upper",
+            label="Device Name Upper",
+            template="{{ obj.name | upper }}",
+        )
+        devices = [self.device1, self.device2, self.device3]
+        resolver = generate_computed_field_resolver("device_name_upper", "resolve_cpf_device_name_upper")
+        with self.assertNumQueries(1):
+            results = self._resolve_for_devices(resolver, devices)
+        self.assertEqual(results, [device.name.upper() for device in devices])
+
     @override_settings(EXEMPT_VIEW_PERMISSIONS=["*"])
     def test_query_devices_filter(self):
         filterset_class = DeviceFilterSet
@@ -344,6 +344,35 @@ class ImportObjectsTestCase(TransactionTestCase):
             self.assertTrue(Status.objects.filter(name="test_status4").exists())
             self.assertEqual(log_successes[4].message, "Created 4 status object(s) from 5 row(s) of data")
 
+    def test_csv_import_references_to_earlier_rows(self):
+        """Rows may reference objects created by earlier rows of the same data, and all new objects are change-logged."""
+        parent_type = LocationType.objects.create(name="Import Test Parent Type")
+        child_type = LocationType.objects.create(name="Import Test Child Type", parent=parent_type)
+        csv_data = "\n".join(
+            [
+                "location_type__name,name,status__name,parent__name",
+                f"{parent_type.name},Import Test Parent,Active,NoObject",
+                f"{child_type.name},Import Test Child 1,Active,Import Test Parent",
+                f"{child_type.name},Import Test Child 2,Active,Import Test Parent",
+            ]
+        )
+        job_result = create_job_result_and_run_job(
+            "nautobot.core.jobs",
+            "ImportObjects",
+            content_type=ContentType.objects.get_for_model(Location).pk,
+            csv_data=csv_data,
+        )
+        self.assertEqual(job_result.status, JobResultStatusChoices.STATUS_SUCCESS)
+        parent = Location.objects.get(name="Import Test Parent")
+        self.assertEqual(Location.objects.filter(parent=parent).count(), 2)
+        self.assertEqual(
+            ObjectChange.objects.filter(
+                changed_object_type=ContentType.objects.get_for_model(Location),
+                changed_object_id__in=Location.objects.filter(name__startswith="Import Test").values_list("pk"),
+            ).count(),
+            3,
+        )
+
     def test_csv_import_contact_assignment(self):
         location_types_csv = "\n".join(["name", "ContactAssignmentImportTestLocationType"])
         locations_csv = "\n".join(
@@ -1,3 +1,4 @@
+import threading
 import time
 from unittest import skip
 from unittest.mock import patch
@@ -9,7 +10,12 @@ from django.test import override_settings
 from django.test.utils import isolate_apps
 
 from nautobot.core.models import BaseModel
-from nautobot.core.models.utils import construct_composite_key, construct_natural_slug, deconstruct_composite_key
+from nautobot.core.models.utils import (
+    construct_composite_key,
+    construct_natural_slug,
+    deconstruct_composite_key,
+    map_in_threads,
+)
 from nautobot.core.testing import TestCase
 from nautobot.dcim.models import DeviceType, Location, LocationType, Manufacturer
 from nautobot.extras.models import Status
@@ -59,6 +65,16 @@ class ModelUtilsTestCase(TestCase):
                 natural_slug = construct_natural_slug(values, pk=pk)
                 self.assertEqual(natural_slug, expected_natural_slug)
 
+    def test_map_in_threads_inside_transaction(self):
+        """Calls made inside a transaction are made in the calling thread, which can see its uncommitted changes."""
+        Status.objects.create(name="Uncommitted Status")
+
+        def get_status_in_thread(name, suffix):
+            return Status.objects.filter(name=name).exists(), threading.get_ident(), suffix
+
+        results = list(map_in_threads(get_status_in_thread, ["Uncommitted Status"] * 3, ["a", "b", "c"], workers=3))
+        self.assertEqual(results, [(True, threading.get_ident(), suffix) for suffix in ["a", "b", "c"]])
+
 
 class NaturalKeyTestCase(BaseModelTest):
     """Test the various natural-key APIs for a few representative models."""
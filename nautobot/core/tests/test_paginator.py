@@ -1,13 +1,18 @@
 """Test the nautobot.core.utils.paginator module."""
 
+from unittest import skipUnless
+import uuid
+
 from constance.test import override_config
 from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.db import connection
 from django.test import override_settings, RequestFactory
 from django.urls import reverse
 
 from nautobot.circuits import models as circuits_models
 from nautobot.core import testing
+from nautobot.core.models.querysets import get_count
 from nautobot.core.testing.utils import extract_page_body
 from nautobot.core.views import paginator
 from nautobot.dcim import models as dcim_models
@@ -120,3 +125,59 @@ class PaginatorTestCase(testing.TestCase):
             self.assertEqual(len(response.context["table"].page), 20)
             warning_message = "Requested &quot;per_page&quot; is too large."
             self.assertNotIn(warning_message, extract_page_body(response.content.decode(response.charset)))
+
+
+class CountStrategyTestCase(testing.TestCase):
+    """Test the count strategies used by EnhancedPaginator and the REST API pagination."""
+
+    def test_exact_count_by_default(self):
+        queryset = circuits_models.Provider.objects.all()
+        self.assertEqual(get_count(queryset), (queryset.count(), False))
+        self.assertEqual(paginator.EnhancedPaginator(queryset, 5).count, queryset.count())
+
+    @override_settings(COUNT_CACHE_TIMEOUT=60)
+    def test_cached_count(self):
+        prefix = f"count-test-{uuid.uuid4()}"
+        circuits_models.Provider.objects.bulk_create(circuits_models.Provider(name=f"{prefix}-{x}") for x in range(3))
+        queryset = circuits_models.Provider.objects.filter(name__startswith=prefix)
+        self.assertEqual(get_count(queryset), (3, False))
+
+        # The cached count is reused, even though it's now out of date
+        circuits_models.Provider.objects.create(name=f"{prefix}-3")
+        self.assertEqual(get_count(queryset), (3, True))
+        page_paginator = paginator.EnhancedPaginator(queryset, 2)
+        self.assertEqual(page_paginator.count, 3)
+        self.assertTrue(page_paginator.count_is_approximate)
+        # The last page isn't truncated to the approximate count
+        self.assertEqual(len(page_paginator.page(2)), 2)
+        self.assertFalse(page_paginator.page(2).has_next())
+
+        # Pages beyond the approximate count can still be retrieved
+        circuits_models.Provider.objects.create(name=f"{prefix}-4")
+        page_paginator = paginator.EnhancedPaginator(queryset, 2)
+        self.assertEqual(page_paginator.count, 3)
+        page = page_paginator.page(2)
+        self.assertEqual(len(page), 2)
+        self.assertTrue(page.has_next())
+        page = page_paginator.page(3)
+        self.assertEqual([provider.name for provider in page], [f"{prefix}-4"])
+        self.assertFalse(page.has_next())
+        self.assertEqual(page_paginator.num_pages, 3)
+
+        # A different query isn't affected
+        self.assertEqual(get_count(queryset.exclude(name=f"{prefix}-0")), (3, False))
+
+    @skipUnless(connection.vendor == "postgresql", "Table row estimates are only supported on PostgreSQL")
+    @override_settings(APPROXIMATE_COUNT_THRESHOLD=1)
+    def test_approximate_count(self):
+        with connection.cursor() as cursor:
+            cursor.execute(f"ANALYZE {connection.ops.quote_name(circuits_models.Provider._meta.db_table)}")
+        count = circuits_models.Provider.objects.count()
+        self.assertEqual(get_count(circuits_models.Provider.objects.all()), (count, True))
+        # Filtered querysets are always counted exactly
+        queryset = circuits_models.Provider.objects.exclude(name="")
+        self.assertEqual(get_count(queryset), (queryset.count(), False))
+
+        page_paginator = paginator.EnhancedPaginator(circuits_models.Provider.objects.all(), 5)
+        self.assertEqual(page_paginator.count, count)
+        self.assertTrue(page_paginator.count_is_approximate)
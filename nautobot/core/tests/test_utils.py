@@ -7,6 +7,8 @@ from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError
 from django.db.models import Q
 from django.http import QueryDict
+from django.test import override_settings
+from django.utils.safestring import SafeString
 
 from nautobot.circuits import models as circuits_models
 from nautobot.core import exceptions, forms, settings_funcs
@@ -14,9 +16,10 @@ from nautobot.core.api import utils as api_utils
 from nautobot.core.forms.utils import compress_range
 from nautobot.core.models import fields as core_fields, utils as models_utils, validators
 from nautobot.core.testing import TestCase
-from nautobot.core.utils import data as data_utils, filtering, lookup, requests
+from nautobot.core.utils import cache as cache_utils, data as data_utils, filtering, lookup, requests
 from nautobot.core.utils.migrations import update_object_change_ct_for_replaced_models
 from nautobot.dcim import filters as dcim_filters, forms as dcim_forms, models as dcim_models, tables
+from nautobot.dcim.api.serializers import LocationSerializer
 from nautobot.extras import models as extras_models, utils as extras_utils
 from nautobot.extras.choices import ObjectChangeActionChoices, RelationshipTypeChoices
 from nautobot.extras.models import ObjectChange
@@ -55,6 +58,50 @@ class DictToFilterParamsTest(TestCase):
         self.assertNotEqual(api_utils.dict_to_filter_params(input_), output)
 
 
+class BulkLookupRelatedObjectsTest(TestCase):
+    """
+    Validate the operation of bulk_lookup_related_objects().
+    """
+
+    def test_bulk_lookup_related_objects(self):
+        location_type = dcim_models.LocationType.objects.first()
+        status = extras_models.Status.objects.get_for_model(dcim_models.Location).first()
+        data = [
+            {"name": "Location 1", "location_type": {"name": location_type.name}, "status": status.composite_key},
+            {"name": "Location 2", "location_type": {"name": location_type.name}, "status": str(status.pk)},
+            {"name": "Location 3", "location_type": {"name": "No such location type"}, "status": None},
+        ]
+
+        serializer = LocationSerializer(context={"request": None})
+        # Construct the serializer's fields outside of assertNumQueries()
+        self.assertIn("location_type", serializer.fields)
+        # One query to find the IDs of the objects and one to retrieve them, for each type of lookup of each field
+        with self.assertNumQueries(5):
+            related_objects = api_utils.bulk_lookup_related_objects(serializer, data)
+
+        self.assertEqual(data[0]["location_type"], str(location_type.pk))
+        self.assertEqual(data[1]["location_type"], str(location_type.pk))
+        # References that aren't found are left as they are, to be reported by the serializer
+        self.assertEqual(data[2]["location_type"], {"name": "No such location type"})
+        self.assertEqual(data[0]["status"], str(status.pk))
+        self.assertEqual(data[1]["status"], str(status.pk))
+        self.assertIsNone(data[2]["status"])
+        self.assertEqual(
+            related_objects, {"location_type": {location_type.pk: location_type}, "status": {status.pk: status}}
+        )
+
+        # Objects looked up in bulk aren't looked up again by the serializer
+        serializer = LocationSerializer(context={"request": None, "related_objects": related_objects})
+        location_type_field = serializer.fields["location_type"]
+        status_field = serializer.fields["status"]
+        with self.assertNumQueries(0):
+            self.assertIs(
+                location_type_field.to_internal_value(data[0]["location_type"]),
+                related_objects["location_type"][location_type.pk],
+            )
+            self.assertIs(status_field.to_internal_value(data[1]["status"]), related_objects["status"][status.pk])
+
+
 class NormalizeQueryDictTest(TestCase):
     """
     Validate normalize_querydict() utility function.
@@ -67,6 +114,28 @@ class NormalizeQueryDictTest(TestCase):
         )
 
 
+class CacheGenerationsTest(TestCase):
+    """
+    Validate get_cache_generations() and invalidate_cache_generations() utility functions.
+    """
+
+    def test_cache_generations(self):
+        cache_keys = ["nautobot.core.tests.generation.a", "nautobot.core.tests.generation.b"]
+        generations = cache_utils.get_cache_generations(cache_keys)
+        self.assertEqual(set(generations), set(cache_keys))
+        self.assertEqual(cache_utils.get_cache_generations(cache_keys), generations)
+        self.assertEqual(cache_utils.get_cache_generation(cache_keys[0]), generations[cache_keys[0]])
+
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            cache_utils.invalidate_cache_generations(cache_keys[:1])
+            new_generations = cache_utils.get_cache_generations(cache_keys)
+            self.assertNotEqual(new_generations[cache_keys[0]], generations[cache_keys[0]])
+            self.assertEqual(new_generations[cache_keys[1]], generations[cache_keys[1]])
+        # A new generation is started again once the transaction is committed
+        self.assertEqual(len(callbacks), 1)
+        self.assertNotEqual(cache_utils.get_cache_generation(cache_keys[0]), new_generations[cache_keys[0]])
+
+
 class DeepMergeTest(TestCase):
     """
     Validate the behavior of the deepmerge() utility.
@@ -882,6 +951,54 @@ class MergeDictsWithoutCollisionTest(TestCase):
         self.assertEqual(str(err.exception), 'Conflicting values for key "a": (1, 2)')
 
 
+class RenderJinja2Test(TestCase):
+    """Test the render_jinja2() data utility function and its compiled-template cache."""
+
+    def setUp(self):
+        super().setUp()
+        data_utils.clear_jinja2_template_cache()
+
+    def test_render_jinja2(self):
+        rendered = data_utils.render_jinja2("{{ a }}-{{ b | upper }}", {"a": 1, "b": "two"})
+        self.assertEqual(rendered, "1-TWO")
+        # The rendered output must not be implicitly marked as safe
+        self.assertNotIsInstance(rendered, SafeString)
+
+    @override_settings(JINJA2_TEMPLATE_CACHE_SIZE=2)
+    def test_template_cache(self):
+        template = data_utils.get_jinja2_template("{{ a }}")
+        self.assertIs(data_utils.get_jinja2_template("{{ a }}"), template)
+        self.assertEqual(data_utils.render_jinja2("{{ a }}", {"a": "x"}), "x")
+        self.assertEqual(data_utils.render_jinja2("{{ a }}", {"a": "y"}), "y")
+
+        # Least recently used templates are evicted once the cache is full
+        data_utils.get_jinja2_template("{{ b }}")
+        data_utils.get_jinja2_template("{{ a }}")
+        data_utils.get_jinja2_template("{{ c }}")
+        self.assertIs(data_utils.get_jinja2_template("{{ a }}"), template)
+        self.assertEqual(len(data_utils._jinja2_template_cache), 2)
+
+        data_utils.clear_jinja2_template_cache()
+        self.assertIsNot(data_utils.get_jinja2_template("{{ a }}"), template)
+
+    @override_settings(JINJA2_TEMPLATE_CACHE_SIZE=0)
+    def test_template_cache_disabled(self):
+        self.assertIsNot(data_utils.get_jinja2_template("{{ a }}"), data_utils.get_jinja2_template("{{ a }}"))
+        self.assertEqual(len(data_utils._jinja2_template_cache), 0)
+
+    @override_settings(JINJA2_TEMPLATE_CACHE_SIZE=10)
+    def test_template_cache_cleared_on_template_change(self):
+        data_utils.get_jinja2_template("{{ a }}")
+        extras_models.CustomLink.objects.create(
+            content_type=ContentType.objects.get_for_model(dcim_models.Location),
+            name="Test Link",
+            text="{{ obj.name }}",
+            target_url="https://example.com/{{ obj.pk }}",
+            new_window=False,
+        )
+        self.assertEqual(len(data_utils._jinja2_template_cache), 0)
+
+
 class NavigationRelatedUtils(TestCase):
     def get_all_new_ui_ready_route(self):
         ui_ready_routes = [
@@ -1,3 +1,4 @@
+from io import StringIO
 import re
 from unittest import mock, skipIf
 import urllib.parse
@@ -6,6 +7,7 @@ from django.apps import apps
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
 from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
 from django.test import override_settings, RequestFactory
 from django.test.utils import override_script_prefix
 from django.urls import get_script_prefix, reverse
@@ -18,9 +20,11 @@ from nautobot.core.testing.utils import extract_page_body
 from nautobot.core.utils.permissions import get_permission_for_model
 from nautobot.core.views import NautobotMetricsView
 from nautobot.core.views.mixins import GetReturnURLMixin
-from nautobot.dcim.models.locations import Location
+from nautobot.dcim.models import DeviceType
+from nautobot.dcim.models.locations import Location, LocationType
+from nautobot.extras import search_index
 from nautobot.extras.choices import CustomFieldTypeChoices
-from nautobot.extras.models import FileProxy
+from nautobot.extras.models import FileProxy, SearchIndexEntry, Status
 from nautobot.extras.models.customfields import CustomField, CustomFieldChoice
 from nautobot.extras.registry import registry
 from nautobot.users.models import ObjectPermission
@@ -215,6 +219,73 @@ class SearchFieldsTestCase(TestCase):
             html=True,
         )
 
+    @override_settings(SEARCH_INDEX_ENABLED=True)
+    def test_global_search_with_search_index(self):
+        location = Location.objects.first()
+        location_type = ContentType.objects.get_for_model(Location)
+        with self.captureOnCommitCallbacks(execute=True):
+            location.name = "Search Index Test Location"
+            location.save()
+        entry = SearchIndexEntry.objects.get(content_type=location_type, object_id=location.pk)
+        self.assertIn("search index test location", entry.value)
+        # The ID is matched exactly, rather than as part of the indexed text
+        self.assertNotIn(str(location.pk), entry.value)
+
+        # Permissions are applied to the matching objects. The index hasn't been built yet, so this searches without it.
+        self.assertEqual(search_index.get_built_models([Location]), [])
+        response = self.client.get(reverse("search") + "?q=INDEX+test")
+        self.assertHttpStatus(response, 200)
+        self.assertNotIn("Search Index Test Location", extract_page_body(response.content.decode(response.charset)))
+        self.add_permissions("dcim.view_location")
+        response = self.client.get(reverse("search") + "?q=INDEX+test")
+        self.assertBodyContains(response, "Search Index Test Location")
+        response = self.client.get(reverse("search") + "?q=no+such+location")
+        self.assertNotIn("Search Index Test Location", extract_page_body(response.content.decode(response.charset)))
+
+        # The index can be rebuilt from scratch
+        SearchIndexEntry.objects.all().delete()
+        call_command("rebuild_search_index", stdout=StringIO())
+        self.assertTrue(SearchIndexEntry.objects.filter(content_type=location_type, object_id=location.pk).exists())
+        self.assertEqual(search_index.get_built_models([Location]), [Location])
+        response = self.client.get(reverse("search") + "?q=index+test")
+        self.assertBodyContains(response, "Search Index Test Location")
+
+        # IDs and exact-match fields are only matched exactly
+        response = self.client.get(reverse("search") + f"?q={location.pk}")
+        self.assertBodyContains(response, "Search Index Test Location")
+        response = self.client.get(reverse("search") + f"?q={str(location.pk)[:8]}")
+        self.assertNotIn("Search Index Test Location", extract_page_body(response.content.decode(response.charset)))
+        with self.captureOnCommitCallbacks(execute=True):
+            location.asn = 4294967295
+            location.save()
+        self.assertIn(location, Location.objects.filter(search_index.search("4294967295", [Location])[Location]))
+        self.assertNotIn(location, Location.objects.filter(search_index.search("429496729", [Location])[Location]))
+
+        # Deleting an object removes it from the index
+        with self.captureOnCommitCallbacks(execute=True):
+            location = Location.objects.create(
+                name="Search Index Deleted Location",
+                location_type=LocationType.objects.filter(parent__isnull=True).first(),
+                status=Status.objects.get_for_model(Location).first(),
+            )
+        self.assertTrue(SearchIndexEntry.objects.filter(content_type=location_type, object_id=location.pk).exists())
+        location_pk = location.pk
+        with self.captureOnCommitCallbacks(execute=True):
+            location.delete()
+        self.assertFalse(SearchIndexEntry.objects.filter(content_type=location_type, object_id=location_pk).exists())
+
+    @override_settings(SEARCH_INDEX_ENABLED=True)
+    def test_search_index_related_object_changed(self):
+        """Indexed objects are re-indexed when a related object whose field values they include is changed."""
+        device_type = DeviceType.objects.first()
+        device_type_type = ContentType.objects.get_for_model(DeviceType)
+        search_index.rebuild_search_index(DeviceType)
+        with self.captureOnCommitCallbacks(execute=True):
+            device_type.manufacturer.name = "Search Index Test Manufacturer"
+            device_type.manufacturer.save()
+        entry = SearchIndexEntry.objects.get(content_type=device_type_type, object_id=device_type.pk)
+        self.assertIn("search index test manufacturer", entry.value)
+
 
 class FilterFormsTestCase(TestCase):
     def test_support_for_both_default_and_dynamic_filter_form_in_ui(self):
@@ -0,0 +1,56 @@
+"""Shared "generation" tokens for invalidating many cross-process cache entries at once."""
+
+import contextlib
+import uuid
+
+from django.core.cache import cache
+from django.db import transaction
+import redis.exceptions
+
+
+def get_cache_generations(cache_keys):
+    """
+    Get the current generation token stored under each of the given cache keys, starting a generation where needed.
+
+    Cache entries whose own keys include a generation token are all invalidated at once by starting a new generation
+    (see `invalidate_cache_generations()`), as they'll no longer be looked up.
+
+    Args:
+        cache_keys (list): Cache keys of the generation tokens to get.
+
+    Returns:
+        (dict): `{cache_key: generation}` for each of the given cache keys.
+    """
+    generations = cache.get_many(cache_keys)
+    missing = [cache_key for cache_key in cache_keys if cache_key not in generations]
+    if missing:
+        # If another process has concurrently started a generation, use that one
+        for cache_key in missing:
+            cache.add(cache_key, uuid.uuid4().hex, None)
+        generations.update(cache.get_many(missing))
+    return generations
+
+
+def get_cache_generation(cache_key):
+    """Get the current generation token stored under the given cache key, see `get_cache_generations()`."""
+    return get_cache_generations([cache_key])[cache_key]
+
+
+def _start_cache_generations(cache_keys):
+    with contextlib.suppress(redis.exceptions.ConnectionError):
+        cache.set_many({cache_key: uuid.uuid4().hex for cache_key in cache_keys}, None)
+
+
+def invalidate_cache_generations(cache_keys):
+    """
+    Start a new generation under each of the given cache keys, now and again once the current transaction is committed.
+
+    Starting the generation again on commit covers any other process that cached data from before the change while
+    the transaction was in progress. Errors connecting to the cache are ignored.
+
+    Args:
+        cache_keys (list): Cache keys of the generation tokens to replace.
+    """
+    cache_keys = list(cache_keys)
+    _start_cache_generations(cache_keys)
+    transaction.on_commit(lambda: _start_cache_generations(cache_keys))
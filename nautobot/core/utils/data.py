@@ -1,15 +1,29 @@
 from collections import namedtuple, OrderedDict
 from decimal import Decimal
+import hashlib
+import threading
 import uuid
 
+from django.conf import settings
 from django.core import validators
 from django.template import engines
+from prometheus_client import Counter
 
 from nautobot.dcim import choices  # TODO move dcim.choices.CableLengthUnitChoices into core
 
 # Setup UtilizationData named tuple for use by multiple methods
 UtilizationData = namedtuple("UtilizationData", ["numerator", "denominator"])
 
+# Per-process LRU cache of compiled Jinja2 templates, keyed by a hash of their source code
+_jinja2_template_cache = OrderedDict()
+_jinja2_template_cache_lock = threading.Lock()
+
+JINJA2_TEMPLATE_CACHE_METRIC = Counter(
+    "nautobot_jinja2_template_cache_lookups",
+    "Lookups of compiled Jinja2 templates in the template cache, by result",
+    ["result"],
+)
+
 
 def deepmerge(original, new):
     """
@@ -92,12 +106,51 @@ def merge_dicts_without_collision(d1, d2):
     return {**d1, **d2}
 
 
+def get_jinja2_template(template_code):
+    """
+    Get the compiled Jinja2 template for the given template code.
+
+    Compiled templates are kept in a per-process LRU cache of up to `settings.JINJA2_TEMPLATE_CACHE_SIZE` entries,
+    keyed by a hash of the template code, so that repeatedly rendering the same template (for example, a computed field
+    or custom link rendered for each object in a list view) only parses and compiles it once.
+    """
+    max_size = getattr(settings, "JINJA2_TEMPLATE_CACHE_SIZE", 0)
+    if max_size <= 0:
+        return engines["jinja"].from_string(template_code)
+
+    key = hashlib.sha256(template_code.encode("utf-8")).hexdigest()
+    with _jinja2_template_cache_lock:
+        template = _jinja2_template_cache.get(key)
+        if template is not None:
+            _jinja2_template_cache.move_to_end(key)
+    if template is not None:
+        JINJA2_TEMPLATE_CACHE_METRIC.labels(result="hit").inc()
+        return template
+
+    JINJA2_TEMPLATE_CACHE_METRIC.labels(result="miss").inc()
+    # Compile outside of the lock; in the worst case two threads both compile the same template, which is harmless
+    template = engines["jinja"].from_string(template_code)
+    with _jinja2_template_cache_lock:
+        _jinja2_template_cache[key] = template
+        _jinja2_template_cache.move_to_end(key)
+        while len(_jinja2_template_cache) > max_size:
+            _jinja2_template_cache.popitem(last=False)
+    return template
+
+
+def clear_jinja2_template_cache():
+    """Discard all compiled Jinja2 templates from the cache used by `render_jinja2()`."""
+    with _jinja2_template_cache_lock:
+        _jinja2_template_cache.clear()
+
+
 def render_jinja2(template_code, context):
     """
     Render a Jinja2 template with the provided context. Return the rendered content.
+
+    The compiled template is cached, see `get_jinja2_template()`.
     """
-    rendering_engine = engines["jinja"]
-    template = rendering_engine.from_string(template_code)
+    template = get_jinja2_template(template_code)
     # For reasons unknown to me, django-jinja2 `template.render()` implicitly calls `mark_safe()` on the rendered text.
     # This is a security risk in general, especially so in our case because we're often using this function to render
     # a user-provided template and don't want to open ourselves up to script injection or similar issues.
@@ -24,6 +24,9 @@ from django.views.decorators.csrf import requires_csrf_token
 from django.views.defaults import ERROR_500_TEMPLATE_NAME, page_not_found
 from django.views.generic import TemplateView, View
 from graphene_django.views import GraphQLView
+from graphql import GraphQLError, parse
+from graphql.error import GraphQLSyntaxError
+from graphql.execution import ExecutionResult
 from packaging import version
 from prometheus_client import (
     CollectorRegistry,
@@ -44,9 +47,12 @@ from rest_framework.views import APIView
 from nautobot.core.celery import app
 from nautobot.core.constants import SEARCH_MAX_RESULTS
 from nautobot.core.forms import SearchForm
+from nautobot.core.graphql.caching import get_graphql_backend
+from nautobot.core.graphql.cost import check_query_cost
 from nautobot.core.releases import get_latest_release
 from nautobot.core.utils.lookup import get_route_for_model
 from nautobot.core.utils.permissions import get_permission_for_model
+from nautobot.extras import search_index
 from nautobot.extras.forms import GraphQLQueryForm
 from nautobot.extras.models import FileProxy, GraphQLQuery, Status
 from nautobot.extras.registry import registry
@@ -296,9 +302,27 @@ class SearchView(AccessMixin, View):
                 # Searching all object types
                 obj_types = [model_info[1] for model_info in searchable_models]
 
+            # If enabled, find all matching objects of indexed models with a single query of the search index.
+            # Models whose index hasn't been fully built yet are searched as usual.
+            indexed_models = []
+            index_matches = {}
+            if settings.SEARCH_INDEX_ENABLED:
+                indexed_models = search_index.get_built_models(
+                    [
+                        model
+                        for model in (apps.get_model(label, modelname) for label, modelname in searchable_models)
+                        if model._meta.model_name in obj_types and search_index.is_indexed_model(model)
+                    ]
+                )
+                index_matches = search_index.search(form.cleaned_data["q"], indexed_models)
+
             for label, modelname in searchable_models:
                 if modelname not in obj_types:
                     continue
+                model = apps.get_model(label, modelname)
+                if model in indexed_models and model not in index_matches:
+                    # No matching objects of this type, so no need to construct its results table
+                    continue
                 # Based on the label and modelname, reverse-lookup the list URL, then the view or UIViewSet
                 # corresponding to that URL, and finally the queryset, filterset, and table classes needed
                 # to find and display the model search results.
@@ -314,7 +338,10 @@ class SearchView(AccessMixin, View):
                     table = getattr(view_or_viewset, "table_class", getattr(view_or_viewset, "table", None))
 
                     # Construct the results table for this object type
-                    filtered_queryset = filterset({"q": form.cleaned_data["q"]}, queryset=queryset).qs
+                    if model in index_matches:
+                        filtered_queryset = queryset.filter(index_matches[model]).distinct()
+                    else:
+                        filtered_queryset = filterset({"q": form.cleaned_data["q"]}, queryset=queryset).qs
                     table = table(filtered_queryset, hide_hierarchy_ui=True, orderable=False)
                     table.paginate(per_page=SEARCH_MAX_RESULTS)
 
@@ -404,6 +431,21 @@ class CustomGraphQLView(LoginRequiredMixin, GraphQLView):
         data["form"] = GraphQLQueryForm
         return render(request, self.graphiql_template, data)
 
+    def get_backend(self, request):
+        return get_graphql_backend()
+
+    def execute_graphql_request(self, request, data, query, variables, operation_name, show_graphiql=False):
+        # Reject queries that are too expensive before executing them
+        if query:
+            try:
+                check_query_cost(self.schema, parse(query), variables, operation_name)
+            except GraphQLSyntaxError:
+                # Reported as such when the query is parsed for execution
+                pass
+            except GraphQLError as e:
+                return ExecutionResult(errors=[e], invalid=True)
+        return super().execute_graphql_request(request, data, query, variables, operation_name, show_graphiql)
+
 
 class NautobotAppMetricsCollector(Collector):
     """Custom Nautobot metrics collector.
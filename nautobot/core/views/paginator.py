@@ -1,5 +1,8 @@
-from django.core.paginator import Page, Paginator
+from django.core.paginator import EmptyPage, Page, Paginator
+from django.db.models import QuerySet
+from django.utils.functional import cached_property
 
+from nautobot.core.models.querysets import get_count
 from nautobot.core.utils import config
 
 
@@ -17,6 +20,44 @@ class EnhancedPaginator(Paginator):
             per_page = min(per_page, max_page_size)
 
         super().__init__(object_list, per_page, **kwargs)
+        self.count_is_approximate = False
+
+    @cached_property
+    def count(self):
+        """Return the total number of objects, as determined by the configured count strategy (see `get_count()`)."""
+        # When paginating a django-tables2 table, the object_list is its BoundRows, wrapping a TableData, wrapping the
+        # underlying queryset.
+        queryset = getattr(getattr(self.object_list, "data", None), "data", self.object_list)
+        if isinstance(queryset, QuerySet):
+            count, self.count_is_approximate = get_count(queryset)
+            return count
+        return super().count
+
+    def validate_number(self, number):
+        """Validate the given 1-based page number, without an upper bound if the count is approximate."""
+        try:
+            return super().validate_number(number)
+        except EmptyPage:
+            # The approximate count may be lower than the actual number of objects, so later pages may still exist
+            if not self.count_is_approximate or int(number) < 1:
+                raise
+            return int(number)
+
+    def page(self, number):
+        """Return a Page object for the given 1-based page number."""
+        number = self.validate_number(number)
+        if not self.count_is_approximate:
+            return super().page(number)
+        # The approximate count can't be used to determine whether there is a next page, or where the last page ends,
+        # so fetch one more object than needed to find out whether there's a next page
+        bottom = (number - 1) * self.per_page
+        object_list = list(self.object_list[bottom : bottom + self.per_page + 1])
+        if len(object_list) > self.per_page:
+            object_list = object_list[: self.per_page]
+            self.num_pages = max(self.num_pages, number + 1)
+        else:
+            self.num_pages = number
+        return self._get_page(object_list, number, self)
 
     def _get_page(self, *args, **kwargs):
         return EnhancedPage(*args, **kwargs)
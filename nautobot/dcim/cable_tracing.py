@@ -0,0 +1,381 @@
+"""Bulk tracing of CablePaths, using an in-memory copy of the relevant cable and pass-through port topology."""
+
+from collections import defaultdict
+from itertools import islice
+
+from django.contrib.contenttypes.models import ContentType
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.db.models import Case, UUIDField, Value, When
+
+from nautobot.circuits.models import CircuitTermination
+from nautobot.dcim.models import Cable, CablePath, FrontPort, RearPort
+from nautobot.dcim.utils import compile_path_node
+
+# Maximum number of primary keys to include in a single `pk__in` lookup when loading topology
+LOAD_BATCH_SIZE = 10000
+
+
+def _chunks(iterable, size):
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+class _TopologyNotLoaded(Exception):
+    """Raised internally when tracing a path requires an object that hasn't been loaded into memory yet."""
+
+    def __init__(self, kind, pk):
+        super().__init__(kind, pk)
+        self.kind = kind
+        self.pk = pk
+
+
+class CablePathTracer:
+    """
+    Trace the CablePaths originating from many PathEndpoints at once.
+
+    `CablePath.from_origin()` walks a single path, with one or more queries per hop. This class instead traces any
+    number of origins together against an in-memory copy of the Cables, FrontPorts, RearPorts, and
+    CircuitTerminations encountered so far. Whenever some of the paths being traced reach an object that hasn't been
+    loaded yet, the missing objects for *all* such paths are loaded at once, so the number of queries depends on the
+    length of the longest path rather than on the number of origins.
+
+    The loaded topology is never refreshed, so a tracer should only be used for a single set of changes.
+    """
+
+    def __init__(self):
+        self.cable_type_id = ContentType.objects.get_for_model(Cable).pk
+        self.front_port_type_id = ContentType.objects.get_for_model(FrontPort).pk
+        self.rear_port_type_id = ContentType.objects.get_for_model(RearPort).pk
+        self.circuit_termination_type_id = ContentType.objects.get_for_model(CircuitTermination).pk
+        connected_status = Cable.STATUS_CONNECTED
+        self.connected_status_id = connected_status.pk if connected_status is not None else None
+
+        # {pk: (is_connected, (termination_a_type_id, termination_a_id), (termination_b_type_id, termination_b_id))},
+        # or {pk: None} if not found
+        self.cables = {}
+        # {pk: (cable_id, rear_port_id, rear_port_position)}, or {pk: None} if not found
+        self.front_ports = {}
+        # {pk: (cable_id, positions, {position: front_port_id})}, or {pk: None} if not found
+        self.rear_ports = {}
+        # {pk: (cable_id, peer_termination_id)}, or {pk: None} if not found
+        self.circuit_terminations = {}
+
+        self.loaders = {
+            "cables": self.load_cables,
+            "front_ports": self.load_front_ports,
+            "rear_ports": self.load_rear_ports,
+            "circuit_terminations": self.load_circuit_terminations,
+        }
+
+    #
+    # Topology loading
+    #
+
+    def load_cables(self, pks):
+        for pk in pks:
+            self.cables.setdefault(pk, None)
+        for chunk in _chunks(pks, LOAD_BATCH_SIZE):
+            for pk, status_id, a_type_id, a_id, b_type_id, b_id in Cable.objects.filter(pk__in=chunk).values_list(
+                "pk",
+                "status_id",
+                "termination_a_type_id",
+                "termination_a_id",
+                "termination_b_type_id",
+                "termination_b_id",
+            ):
+                self.cables[pk] = (status_id == self.connected_status_id, (a_type_id, a_id), (b_type_id, b_id))
+
+    def load_front_ports(self, pks):
+        for pk in pks:
+            self.front_ports.setdefault(pk, None)
+        rear_port_ids = set()
+        for chunk in _chunks(pks, LOAD_BATCH_SIZE):
+            for pk, cable_id, rear_port_id, rear_port_position in FrontPort.objects.filter(pk__in=chunk).values_list(
+                "pk", "cable_id", "rear_port_id", "rear_port_position"
+            ):
+                self.front_ports[pk] = (cable_id, rear_port_id, rear_port_position)
+                rear_port_ids.add(rear_port_id)
+        # A FrontPort always leads to its RearPort, so load those right away as well
+        self.load_rear_ports(rear_port_ids - self.rear_ports.keys())
+
+    def load_rear_ports(self, pks):
+        """Load the given RearPorts, along with all of their FrontPorts."""
+        for pk in pks:
+            self.rear_ports.setdefault(pk, None)
+        for chunk in _chunks(pks, LOAD_BATCH_SIZE):
+            for pk, cable_id, positions in RearPort.objects.filter(pk__in=chunk).values_list(
+                "pk", "cable_id", "positions"
+            ):
+                self.rear_ports[pk] = (cable_id, positions, {})
+            for pk, cable_id, rear_port_id, rear_port_position in FrontPort.objects.filter(
+                rear_port__in=chunk
+            ).values_list("pk", "cable_id", "rear_port_id", "rear_port_position"):
+                self.front_ports[pk] = (cable_id, rear_port_id, rear_port_position)
+                self.rear_ports[rear_port_id][2][rear_port_position] = pk
+
+    def load_circuit_terminations(self, pks):
+        """Load the given CircuitTerminations, along with the other termination of each of their Circuits."""
+        for pk in pks:
+            self.circuit_terminations.setdefault(pk, None)
+        for chunk in _chunks(pks, LOAD_BATCH_SIZE):
+            terminations = CircuitTermination.objects.filter(
+                circuit__in=CircuitTermination.objects.filter(pk__in=chunk).values("circuit")
+            ).values_list("pk", "cable_id", "circuit_id", "term_side")
+            terminations_by_circuit = defaultdict(dict)
+            for pk, _, circuit_id, term_side in terminations:
+                terminations_by_circuit[circuit_id][term_side] = pk
+            for pk, cable_id, circuit_id, term_side in terminations:
+                peer_side = "Z" if term_side == "A" else "A"
+                self.circuit_terminations[pk] = (cable_id, terminations_by_circuit[circuit_id].get(peer_side))
+
+    def _get(self, kind, pk):
+        loaded = getattr(self, kind)
+        if pk not in loaded:
+            raise _TopologyNotLoaded(kind, pk)
+        return loaded[pk]
+
+    #
+    # Tracing
+    #
+
+    def _trace(self, origin_type_id, origin_id, cable_id):
+        """
+        Trace a single path against the loaded topology, using the same logic as `CablePath.from_origin()`.
+
+        Returns:
+            (tuple): `(path, destination, is_active, is_split)`, where `destination` is a `(type_id, pk)` tuple or None.
+
+        Raises:
+            _TopologyNotLoaded: if the path reaches an object that hasn't been loaded yet.
+        """
+        destination = None
+        path = []
+        position_stack = []
+        is_active = True
+        is_split = False
+
+        node = (origin_type_id, origin_id)
+        visited_nodes = set()
+        while cable_id is not None:
+            if node[1] in visited_nodes:
+                raise ValidationError("a loop is detected in the path")
+            visited_nodes.add(node[1])
+            cable = self._get("cables", cable_id)
+            if cable is None:
+                break
+            is_connected, termination_a, termination_b = cable
+            if not is_connected:
+                is_active = False
+
+            # Follow the cable to its far-end termination
+            path.append(compile_path_node(self.cable_type_id, cable_id))
+            peer_termination = termination_b if termination_a == node else termination_a
+            peer_type_id, peer_id = peer_termination
+
+            # Follow a FrontPort to its corresponding RearPort
+            if peer_type_id == self.front_port_type_id:
+                front_port = self._get("front_ports", peer_id)
+                if front_port is None:
+                    break
+                _, rear_port_id, rear_port_position = front_port
+                path.append(compile_path_node(*peer_termination))
+                cable_id, positions, _ = self._get("rear_ports", rear_port_id)
+                node = (self.rear_port_type_id, rear_port_id)
+                if positions > 1:
+                    position_stack.append(rear_port_position)
+                path.append(compile_path_node(*node))
+
+            # Follow a RearPort to its corresponding FrontPort (if any)
+            elif peer_type_id == self.rear_port_type_id:
+                rear_port = self._get("rear_ports", peer_id)
+                if rear_port is None:
+                    break
+                _, positions, front_port_ids = rear_port
+                path.append(compile_path_node(*peer_termination))
+
+                # Determine the peer FrontPort's position
+                if positions == 1:
+                    position = 1
+                elif position_stack:
+                    position = position_stack.pop()
+                else:
+                    # No position indicated: path has split, so we stop at the RearPort
+                    is_split = True
+                    break
+
+                if position not in front_port_ids:
+                    # No corresponding FrontPort found for the RearPort
+                    break
+                node = (self.front_port_type_id, front_port_ids[position])
+                cable_id = self.front_ports[node[1]][0]
+                path.append(compile_path_node(*node))
+
+            # Follow a Circuit Termination if there is a corresponding Circuit Termination
+            elif peer_type_id == self.circuit_termination_type_id:
+                circuit_termination = self._get("circuit_terminations", peer_id)
+                if circuit_termination is None:
+                    break
+                _, peer_circuit_termination_id = circuit_termination
+                # A Circuit Termination does not require a peer.
+                if peer_circuit_termination_id is None:
+                    destination = peer_termination
+                    break
+                node = (self.circuit_termination_type_id, peer_circuit_termination_id)
+                cable_id = self.circuit_terminations[peer_circuit_termination_id][0]
+                path.append(compile_path_node(*peer_termination))
+                path.append(compile_path_node(*node))
+
+            # Anything else marks the end of the path
+            else:
+                destination = peer_termination
+                break
+
+        if destination is None:
+            is_active = False
+
+        return path, destination, is_active, is_split
+
+    def trace(self, origins):
+        """
+        Trace the paths from the given origins, loading any topology they need along the way.
+
+        Args:
+            origins (iterable): `(origin_type_id, origin_id, cable_id)` tuples; origins without a cable are ignored.
+
+        Returns:
+            (dict): `{(origin_type_id, origin_id): (path, destination, is_active, is_split)}`
+        """
+        results = {}
+        pending = [origin for origin in origins if origin[2] is not None]
+        while pending:
+            missing = defaultdict(set)
+            still_pending = []
+            for origin in pending:
+                try:
+                    results[origin[:2]] = self._trace(*origin)
+                except _TopologyNotLoaded as exc:
+                    missing[exc.kind].add(exc.pk)
+                    still_pending.append(origin)
+            for kind, pks in missing.items():
+                self.loaders[kind](pks)
+            pending = still_pending
+        return results
+
+    #
+    # Saving
+    #
+
+    def save_paths(self, origins, batch_size=1000):
+        """
+        Trace and save the CablePaths originating from each of the given PathEndpoints.
+
+        Existing CablePaths are updated in place, new ones are created with `bulk_create()`, and those for origins
+        that no longer have a cable are deleted.
+
+        Args:
+            origins (QuerySet): PathEndpoints of a single model, such as `Interface.objects.filter(device=device)`.
+            batch_size (int): Number of origins to trace and save at a time.
+
+        Yields:
+            (int): The number of origins processed, after each batch.
+        """
+        model = origins.model
+        origin_type_id = ContentType.objects.get_for_model(model).pk
+        rows = origins.order_by().values_list("pk", "cable_id", "_path_id").iterator(chunk_size=batch_size)
+        for batch in _chunks(rows, batch_size):
+            results = self.trace((origin_type_id, pk, cable_id) for pk, cable_id, _ in batch)
+            existing_paths = {
+                cable_path.origin_id: cable_path
+                for cable_path in CablePath.objects.filter(
+                    origin_type_id=origin_type_id, origin_id__in=[pk for pk, _, _ in batch]
+                )
+            }
+
+            to_create = []
+            to_update = []
+            to_delete = []
+            origin_paths = {}
+            for pk, _, path_id in batch:
+                cable_path = existing_paths.get(pk)
+                if (origin_type_id, pk) not in results:
+                    if cable_path is not None:
+                        to_delete.append(cable_path.pk)
+                    continue
+
+                path, destination, is_active, is_split = results[(origin_type_id, pk)]
+                if cable_path is None:
+                    cable_path = CablePath(origin_type_id=origin_type_id, origin_id=pk)
+                    to_create.append(cable_path)
+                else:
+                    to_update.append(cable_path)
+                cable_path.path = path
+                cable_path.destination_type_id, cable_path.destination_id = destination or (None, None)
+                cable_path.is_active = is_active
+                cable_path.is_split = is_split
+                if path_id != cable_path.pk:
+                    origin_paths[pk] = cable_path.pk
+
+            with transaction.atomic():
+                if to_delete:
+                    CablePath.objects.filter(pk__in=to_delete).delete()
+                if to_update:
+                    CablePath.objects.bulk_update(
+                        to_update,
+                        ["path", "destination_type", "destination_id", "is_active", "is_split"],
+                        batch_size=batch_size,
+                    )
+                if to_create:
+                    CablePath.objects.bulk_create(to_create, batch_size=batch_size)
+                if origin_paths:
+                    # Record a direct reference to each CablePath on its originating object, as CablePath.save() does
+                    model.objects.filter(pk__in=origin_paths.keys()).update(
+                        _path=Case(
+                            *[When(pk=pk, then=Value(path_pk)) for pk, path_pk in origin_paths.items()],
+                            output_field=UUIDField(),
+                        )
+                    )
+
+            yield len(batch)
+
+
+def trace_cable_paths(origins, batch_size=1000):
+    """
+    Trace and save the CablePaths originating from each of the given PathEndpoints, using a `CablePathTracer`.
+
+    Args:
+        origins (QuerySet): PathEndpoints of a single model.
+        batch_size (int): Number of origins to trace and save at a time.
+
+    Returns:
+        (int): The number of origins processed.
+    """
+    return sum(CablePathTracer().save_paths(origins, batch_size=batch_size))
+
+
+def retrace_cable_paths(cable_paths, batch_size=1000):
+    """
+    Retrace the given existing CablePaths from their origins, for example after a Cable in each of them has changed.
+
+    CablePaths whose origin no longer exists or no longer has a cable are deleted.
+
+    Args:
+        cable_paths (QuerySet): CablePaths to retrace.
+        batch_size (int): Number of origins to trace and save at a time.
+    """
+    origin_ids = defaultdict(set)
+    for origin_type_id, origin_id in cable_paths.values_list("origin_type_id", "origin_id"):
+        origin_ids[origin_type_id].add(origin_id)
+
+    tracer = CablePathTracer()
+    for origin_type_id, pks in origin_ids.items():
+        model = ContentType.objects.get_for_id(origin_type_id).model_class()
+        found_pks = set()
+        for chunk in _chunks(pks, LOAD_BATCH_SIZE):
+            origins = model.objects.filter(pk__in=chunk)
+            found_pks.update(origins.values_list("pk", flat=True))
+            for _ in tracer.save_paths(origins, batch_size=batch_size):
+                pass
+        if pks - found_pks:
+            CablePath.objects.filter(origin_type_id=origin_type_id, origin_id__in=pks - found_pks).delete()
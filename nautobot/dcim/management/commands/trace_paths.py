@@ -1,18 +1,21 @@
-from django.core.management.base import BaseCommand
+from django.contrib.contenttypes.models import ContentType
+from django.core.management.base import BaseCommand, CommandError
 from django.core.management.color import no_style
 from django.db import connection
 
 from nautobot.circuits.models import CircuitTermination
+from nautobot.core.utils.data import is_uuid
+from nautobot.dcim.cable_tracing import CablePathTracer
 from nautobot.dcim.models import (
     CablePath,
     ConsolePort,
     ConsoleServerPort,
     Interface,
+    Location,
     PowerFeed,
     PowerOutlet,
     PowerPort,
 )
-from nautobot.dcim.signals import create_cablepath
 
 ENDPOINT_MODELS = (
     CircuitTermination,
@@ -24,6 +27,17 @@ ENDPOINT_MODELS = (
     PowerPort,
 )
 
+# Lookup used to limit each endpoint model to a given set of Locations
+ENDPOINT_LOCATION_LOOKUPS = {
+    CircuitTermination: "location__in",
+    ConsolePort: "device__location__in",
+    ConsoleServerPort: "device__location__in",
+    Interface: "device__location__in",
+    PowerFeed: "power_panel__location__in",
+    PowerOutlet: "device__location__in",
+    PowerPort: "device__location__in",
+}
+
 
 class Command(BaseCommand):
     help = "Generate any missing cable paths among all cable termination objects in Nautobot"
@@ -41,6 +55,18 @@ class Command(BaseCommand):
             dest="no_input",
             help="Do not prompt user for any input/confirmation",
         )
+        parser.add_argument(
+            "--location",
+            dest="location",
+            help="Only trace paths originating within the Location with this name or ID (or any of its descendants)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            dest="batch_size",
+            help="Number of cable paths to trace and save at a time (default: 1000)",
+        )
 
     def draw_progress_bar(self, percentage):
         """
@@ -50,9 +76,27 @@ class Command(BaseCommand):
         self.stdout.write(f"\r  [{'#' * bar_size}{' ' * (20-bar_size)}] {int(percentage)}%", ending="")
 
     def handle(self, *model_names, **options):
+        locations = None
+        if options["location"]:
+            lookup = "pk" if is_uuid(options["location"]) else "name"
+            try:
+                location = Location.objects.get(**{lookup: options["location"]})
+            except Location.DoesNotExist:
+                raise CommandError(f"Location {options['location']!r} not found")
+            except Location.MultipleObjectsReturned:
+                raise CommandError(f"Multiple Locations are named {options['location']!r}; specify its ID instead")
+            locations = location.descendants(include_self=True)
+
         # If --force was passed, first delete all existing CablePaths
         if options["force"]:
             cable_paths = CablePath.objects.all()
+            if locations is not None:
+                cable_paths = CablePath.objects.none()
+                for model, lookup in ENDPOINT_LOCATION_LOOKUPS.items():
+                    cable_paths |= CablePath.objects.filter(
+                        origin_type=ContentType.objects.get_for_model(model),
+                        origin_id__in=model.objects.filter(**{lookup: locations}).values("pk"),
+                    )
             paths_count = cable_paths.count()
 
             # Prompt the user to confirm recalculation of all paths
@@ -68,19 +112,23 @@ class Command(BaseCommand):
 
             # Delete all existing CablePath instances
             self.stdout.write(f"Deleting {paths_count} existing cable paths...")
-            deleted_count, _ = CablePath.objects.all().delete()
+            deleted_count, _ = cable_paths.delete()
             self.stdout.write((self.style.SUCCESS(f"  Deleted {deleted_count} paths")))
 
-            # Reinitialize the model's PK sequence
-            self.stdout.write("Resetting database sequence for CablePath model")
-            sequence_sql = connection.ops.sequence_reset_sql(no_style(), [CablePath])
-            with connection.cursor() as cursor:
-                for sql in sequence_sql:
-                    cursor.execute(sql)
+            if locations is None:
+                # Reinitialize the model's PK sequence
+                self.stdout.write("Resetting database sequence for CablePath model")
+                sequence_sql = connection.ops.sequence_reset_sql(no_style(), [CablePath])
+                with connection.cursor() as cursor:
+                    for sql in sequence_sql:
+                        cursor.execute(sql)
 
-        # Retrace paths
+        # Retrace paths, sharing the loaded cable topology across all endpoint models
+        tracer = CablePathTracer()
         for model in ENDPOINT_MODELS:
             origins = model.objects.filter(cable__isnull=False)
+            if locations is not None:
+                origins = origins.filter(**{ENDPOINT_LOCATION_LOOKUPS[model]: locations})
             if not options["force"]:
                 origins = origins.filter(_path__isnull=True)
             origins_count = origins.count()
@@ -89,10 +137,9 @@ class Command(BaseCommand):
                 continue
             self.stdout.write(f"Retracing {origins_count} cabled {model._meta.verbose_name_plural}...")
             i = 0
-            for i, obj in enumerate(origins, start=1):
-                create_cablepath(obj)
-                if not i % 100:
-                    self.draw_progress_bar(i * 100 / origins_count)
+            for batch_count in tracer.save_paths(origins, batch_size=options["batch_size"]):
+                i += batch_count
+                self.draw_progress_bar(min(i, origins_count) * 100 / origins_count)
             self.draw_progress_bar(100)
             self.stdout.write(self.style.SUCCESS(f"\n  Retraced {i} {model._meta.verbose_name_plural}"))
 
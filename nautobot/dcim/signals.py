@@ -8,6 +8,7 @@ from django.dispatch import receiver
 
 from nautobot.core.signals import disable_for_loaddata
 
+from .cable_tracing import retrace_cable_paths
 from .models import (
     Cable,
     CablePath,
@@ -45,13 +46,8 @@ def rebuild_paths(obj):
     """
     Rebuild all CablePaths which traverse the specified node
     """
-    cable_paths = CablePath.objects.filter(path__contains=obj)
-
     with transaction.atomic():
-        for cp in cable_paths:
-            cp.delete()
-            # Prevent looping back to rebuild_paths during the atomic transaction.
-            create_cablepath(cp.origin, rebuild=False)
+        retrace_cable_paths(CablePath.objects.filter(path__contains=obj))
 
 
 #
@@ -261,18 +257,7 @@ def nullify_connected_endpoints(instance, **kwargs):
         instance.termination_b.save()
 
     # Delete and retrace any dependent cable paths
-    for cablepath in CablePath.objects.filter(path__contains=instance):
-        cp = CablePath.from_origin(cablepath.origin)
-        if cp:
-            CablePath.objects.filter(pk=cablepath.pk).update(
-                path=cp.path,
-                destination_type=ContentType.objects.get_for_model(cp.destination) if cp.destination else None,
-                destination_id=cp.destination.pk if cp.destination else None,
-                is_active=cp.is_active,
-                is_split=cp.is_split,
-            )
-        else:
-            cablepath.delete()
+    retrace_cable_paths(CablePath.objects.filter(path__contains=instance))
 
 
 #
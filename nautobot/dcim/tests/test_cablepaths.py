@@ -1,8 +1,12 @@
+from io import StringIO
+
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError
+from django.core.management import call_command
 from django.test import TestCase
 
 from nautobot.circuits.models import Circuit, CircuitTermination, CircuitType, Provider
+from nautobot.dcim.cable_tracing import trace_cable_paths
 from nautobot.dcim.models import (
     Cable,
     CablePath,
@@ -33,6 +37,7 @@ class CablePathTestCase(TestCase):
         1XX: Test direct connections between different endpoint types
         2XX: Test different cable topologies
         3XX: Test responses to changes in existing objects
+        4XX: Test bulk tracing of paths
     """
 
     @classmethod
@@ -1494,3 +1499,109 @@ class CablePathTestCase(TestCase):
                 rearport1: 2,
             }
         )
+
+    def assertPathMatchesSerialTrace(self, origin):
+        """
+        Assert that the saved CablePath for the given origin matches that traced by `CablePath.from_origin()`.
+        """
+        origin.refresh_from_db()
+        expected = CablePath.from_origin(origin)
+        cablepath = CablePath.objects.get(
+            origin_type=ContentType.objects.get_for_model(origin),
+            origin_id=origin.pk,
+        )
+        self.assertPathIsSet(origin, cablepath)
+        self.assertEqual(cablepath.path, expected.path)
+        self.assertEqual(cablepath.destination, expected.destination)
+        self.assertEqual(cablepath.is_active, expected.is_active)
+        self.assertEqual(cablepath.is_split, expected.is_split)
+
+    def test_401_bulk_trace_matches_serial_trace(self):
+        """
+        [IF1] --C1-- [FP1:1] [RP1] --C3-- [RP2] [FP2:1] --C4-- [IF3]
+        [IF2] --C2-- [FP1:2]                    [FP2:2] --C5-- [CT1] [CT2] --C6-- [IF4]
+        [IF5] --C7-- [RP3]
+        """
+        interfaces = [
+            Interface.objects.create(device=self.device, name=f"Interface {i}", status=self.interface_status)
+            for i in range(1, 6)
+        ]
+        rearport1 = RearPort.objects.create(device=self.device, name="Rear Port 1", positions=4)
+        rearport2 = RearPort.objects.create(device=self.device, name="Rear Port 2", positions=4)
+        rearport3 = RearPort.objects.create(device=self.device, name="Rear Port 3", positions=4)
+        frontport1_1 = FrontPort.objects.create(
+            device=self.device, name="Front Port 1:1", rear_port=rearport1, rear_port_position=1
+        )
+        frontport1_2 = FrontPort.objects.create(
+            device=self.device, name="Front Port 1:2", rear_port=rearport1, rear_port_position=2
+        )
+        frontport2_1 = FrontPort.objects.create(
+            device=self.device, name="Front Port 2:1", rear_port=rearport2, rear_port_position=1
+        )
+        frontport2_2 = FrontPort.objects.create(
+            device=self.device, name="Front Port 2:2", rear_port=rearport2, rear_port_position=2
+        )
+        circuittermination1 = CircuitTermination.objects.create(
+            circuit=self.circuit, location=self.location, term_side="A"
+        )
+        circuittermination2 = CircuitTermination.objects.create(
+            circuit=self.circuit, location=self.location, term_side="Z"
+        )
+        for termination_a, termination_b in (
+            (interfaces[0], frontport1_1),
+            (interfaces[1], frontport1_2),
+            (rearport1, rearport2),
+            (frontport2_1, interfaces[2]),
+            (frontport2_2, circuittermination1),
+            (circuittermination2, interfaces[3]),
+            (interfaces[4], rearport3),
+        ):
+            Cable.objects.create(termination_a=termination_a, termination_b=termination_b, status=self.status)
+        origins = [*interfaces, circuittermination1, circuittermination2]
+        self.assertEqual(CablePath.objects.count(), len(origins))
+
+        # Retrace all paths from scratch in bulk
+        CablePath.objects.all().delete()
+        self.assertEqual(trace_cable_paths(Interface.objects.all()), 5)
+        self.assertEqual(trace_cable_paths(CircuitTermination.objects.filter(circuit=self.circuit)), 2)
+        self.assertEqual(CablePath.objects.count(), len(origins))
+        for origin in origins:
+            self.assertPathMatchesSerialTrace(origin)
+
+        # Retracing in bulk again updates the existing paths in place
+        cablepath_pks = set(CablePath.objects.values_list("pk", flat=True))
+        trace_cable_paths(Interface.objects.all())
+        self.assertEqual(set(CablePath.objects.values_list("pk", flat=True)), cablepath_pks)
+
+        # Deleting a cable in the middle of several paths retraces them all
+        Cable.objects.get(termination_a_id=rearport1.pk).delete()
+        for origin in origins:
+            self.assertPathMatchesSerialTrace(origin)
+
+    def test_402_trace_paths_command(self):
+        """
+        [IF1] --C1-- [IF2]
+        [PP1] --C2-- [PO1]
+        """
+        interface1 = Interface.objects.create(device=self.device, name="Interface 1", status=self.interface_status)
+        interface2 = Interface.objects.create(device=self.device, name="Interface 2", status=self.interface_status)
+        powerport1 = PowerPort.objects.create(device=self.device, name="Power Port 1")
+        poweroutlet1 = PowerOutlet.objects.create(device=self.device, name="Power Outlet 1")
+        Cable.objects.create(termination_a=interface1, termination_b=interface2, status=self.status)
+        Cable.objects.create(termination_a=powerport1, termination_b=poweroutlet1, status=self.status)
+        CablePath.objects.all().delete()
+
+        # Paths outside of the given location aren't traced
+        other_location = Location.objects.filter(children__isnull=True).exclude(pk=self.location.pk).first()
+        call_command("trace_paths", location=str(other_location.pk), stdout=StringIO())
+        self.assertEqual(CablePath.objects.count(), 0)
+
+        call_command("trace_paths", location=str(self.location.pk), batch_size=1, stdout=StringIO())
+        self.assertEqual(CablePath.objects.count(), 4)
+        for origin in (interface1, interface2, powerport1, poweroutlet1):
+            self.assertPathMatchesSerialTrace(origin)
+
+        call_command("trace_paths", force=True, no_input=True, stdout=StringIO())
+        self.assertEqual(CablePath.objects.count(), 4)
+        for origin in (interface1, interface2, powerport1, poweroutlet1):
+            self.assertPathMatchesSerialTrace(origin)
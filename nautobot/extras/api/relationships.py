@@ -1,7 +1,7 @@
 import logging
 
 from django.contrib.contenttypes.models import ContentType
-from django.db.models import Q
+from django.db.models import Q, QuerySet
 from drf_spectacular.utils import extend_schema_field
 from rest_framework.fields import JSONField
 from rest_framework.reverse import reverse
@@ -68,6 +68,7 @@ class RelationshipsDataField(WritableSerializerMixin, JSONField):
     """
 
     queryset = None
+    _relationships_by_pk = None
 
     def to_representation(self, value):
         """
@@ -106,7 +107,7 @@ class RelationshipsDataField(WritableSerializerMixin, JSONField):
                 }`
         """
         data = {}
-        relationships_data = value.get_relationships(include_hidden=True)
+        relationships_data = self._get_relationships(value)
         for this_side, relationships in relationships_data.items():
             for relationship, associations in relationships.items():
                 depth = int(self.context.get("depth", 0))
@@ -135,7 +136,7 @@ class RelationshipsDataField(WritableSerializerMixin, JSONField):
                 other_side_serializer = None
                 other_side_model = other_type.model_class()
 
-                other_objects = [assoc.get_peer(value) for assoc in associations if assoc.get_peer(value) is not None]
+                other_objects = [peer for peer in (assoc.get_peer(value) for assoc in associations) if peer is not None]
                 if other_side_model is not None:
                     try:
                         depth = int(self.context.get("depth", 0))
@@ -166,6 +167,21 @@ class RelationshipsDataField(WritableSerializerMixin, JSONField):
         logger.debug("to_representation(%s) -> %s", value, data)
         return data
 
+    def _get_relationships(self, value):
+        """
+        Get the relationships and associations of the given object, as per its `get_relationships()` method.
+
+        When serializing a list of objects (`many=True`), the parent serializer's `instance` is the entire list; the
+        relationships of all of its objects are looked up in bulk on the first call, and reused for the others.
+        """
+        instance = getattr(self.parent, "instance", None)
+        if isinstance(instance, (list, tuple, QuerySet)):
+            if self._relationships_by_pk is None:
+                self._relationships_by_pk = type(value).get_relationships_for_objects(instance, include_hidden=True)
+            if value.pk in self._relationships_by_pk:
+                return self._relationships_by_pk[value.pk]
+        return value.get_relationships(include_hidden=True)
+
     def build_nested_field(self, field_name, relation_info, nested_depth):
         return nested_serializer_factory(relation_info, nested_depth)
 
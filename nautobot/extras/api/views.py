@@ -7,6 +7,7 @@ from django.shortcuts import get_object_or_404
 from django.utils import timezone
 from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import extend_schema, extend_schema_view, OpenApiParameter
+from graphene_django.settings import graphene_settings
 from graphene_django.views import GraphQLView
 from graphql import GraphQLError
 from rest_framework import mixins, status, viewsets
@@ -28,7 +29,8 @@ from nautobot.core.api.views import (
     ReadOnlyModelViewSet,
 )
 from nautobot.core.exceptions import CeleryWorkerNotRunningException
-from nautobot.core.graphql import execute_saved_query
+from nautobot.core.graphql.caching import execute_document, get_graphql_backend
+from nautobot.core.graphql.cost import check_query_cost
 from nautobot.core.models.querysets import count_related
 from nautobot.extras import filters
 from nautobot.extras.choices import JobExecutionType
@@ -467,7 +469,12 @@ class GraphQLQueryViewSet(NotesViewSetMixin, ModelViewSet):
     def run(self, request, pk):
         try:
             query = get_object_or_404(self.queryset, pk=pk)
-            result = execute_saved_query(query.name, variables=request.data.get("variables"), request=request).to_dict()
+            variables = request.data.get("variables")
+            document = get_graphql_backend().document_from_string(graphene_settings.SCHEMA, query.query)
+            # Reject queries that are too expensive before executing them
+            check_query_cost(graphene_settings.SCHEMA, document.document_ast, variables)
+            result = execute_document(document, request.user, context_value=request, variable_values=variables)
+            result = result.to_dict()
             return Response(result)
         except GraphQLError as error:
             return Response(
@@ -0,0 +1,135 @@
+"""Pluggable writers for bulk-inserting deferred `ObjectChange` records."""
+
+from concurrent.futures import ThreadPoolExecutor
+import io
+from itertools import islice
+import json
+
+from django.conf import settings
+from django.db import connection, models
+from django.utils.module_loading import import_string
+
+from nautobot.extras.models import ObjectChange
+
+# Characters that must be escaped in PostgreSQL's COPY "text" format
+_COPY_TEXT_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+def get_object_change_writer(**kwargs):
+    """Instantiate and return the `ObjectChangeWriter` class specified by `settings.CHANGELOG_BULK_WRITER`."""
+    return import_string(settings.CHANGELOG_BULK_WRITER)(**kwargs)
+
+
+class ObjectChangeWriter:
+    """
+    Default writer for deferred `ObjectChange` records, inserting them in batches with Django's `bulk_create()`.
+
+    Subclasses can override `write()` to implement a different storage strategy.
+    """
+
+    def __init__(self, batch_size=1000):
+        self.batch_size = batch_size
+
+    def batches(self, object_changes):
+        """Yield lists of at most `batch_size` records from the given iterable."""
+        object_changes = iter(object_changes)
+        while batch := list(islice(object_changes, self.batch_size)):
+            yield batch
+
+    def write(self, object_changes):
+        """
+        Save the given unsaved `ObjectChange` instances to the database.
+
+        Args:
+            object_changes (iterable): `ObjectChange` instances, which may be lazily generated.
+
+        Returns:
+            (int): The number of records written.
+        """
+        count = 0
+        for batch in self.batches(object_changes):
+            ObjectChange.objects.bulk_create(batch, batch_size=self.batch_size)
+            count += len(batch)
+        return count
+
+
+class PostgreSQLCopyObjectChangeWriter(ObjectChangeWriter):
+    """
+    Writer for deferred `ObjectChange` records that streams them into the database with PostgreSQL's `COPY` command.
+
+    `COPY` avoids the per-row overhead of a multi-row `INSERT` statement, which is significant for the large
+    `object_data` and `object_data_v2` JSON snapshots. If `background` is True, JSON encoding of each batch is performed
+    in a worker thread, overlapping with the generation of the next batch (which is typically waiting on database
+    queries) in the calling thread; the database writes themselves always happen in the calling thread so as to
+    participate in its transaction.
+
+    On other database backends this falls back to the default `bulk_create()` behavior.
+    """
+
+    def __init__(self, batch_size=1000, background=True):
+        super().__init__(batch_size=batch_size)
+        self.background = background
+        self.fields = ObjectChange._meta.concrete_fields
+        # Table and column names come from the model definition, not from user input
+        self.sql = "COPY {} ({}) FROM STDIN".format(
+            connection.ops.quote_name(ObjectChange._meta.db_table),
+            ", ".join(connection.ops.quote_name(field.column) for field in self.fields),
+        )
+
+    def encode_value(self, field, value):
+        """Encode a single field value as a PostgreSQL COPY "text" format column."""
+        if value is None:
+            return r"\N"
+        if isinstance(field, models.JSONField):
+            value = json.dumps(value, cls=field.encoder)
+        elif isinstance(value, bool):
+            value = "t" if value else "f"
+        else:
+            value = str(value)
+        return value.translate(_COPY_TEXT_ESCAPES)
+
+    def encode(self, batch):
+        """Encode the given `ObjectChange` records as a buffer of COPY "text" format rows."""
+        buffer = io.StringIO()
+        for object_change in batch:
+            buffer.write(
+                "\t".join(
+                    # pre_save() populates fields such as `time` (auto_now_add) just as bulk_create() would
+                    self.encode_value(field, field.pre_save(object_change, add=True))
+                    for field in self.fields
+                )
+            )
+            buffer.write("\n")
+        buffer.seek(0)
+        return buffer
+
+    def copy(self, buffer):
+        with connection.cursor() as cursor:
+            if hasattr(cursor, "copy_expert"):  # psycopg2
+                cursor.copy_expert(self.sql, buffer)
+            else:  # psycopg3
+                with cursor.copy(self.sql) as copy:
+                    copy.write(buffer.getvalue())
+
+    def write(self, object_changes):
+        if connection.vendor != "postgresql":
+            return super().write(object_changes)
+
+        count = 0
+        if not self.background:
+            for batch in self.batches(object_changes):
+                self.copy(self.encode(batch))
+                count += len(batch)
+            return count
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            pending = None
+            for batch in self.batches(object_changes):
+                future = executor.submit(self.encode, batch)
+                if pending is not None:
+                    self.copy(pending.result())
+                pending = future
+                count += len(batch)
+            if pending is not None:
+                self.copy(pending.result())
+        return count
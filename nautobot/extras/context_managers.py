@@ -6,11 +6,12 @@ from django.contrib.auth.models import AnonymousUser
 from django.db import transaction
 from django.test.client import RequestFactory
 
+from nautobot.extras.change_logging import get_object_change_writer
 from nautobot.extras.choices import ObjectChangeEventContextChoices
 from nautobot.extras.constants import CHANGELOG_MAX_CHANGE_CONTEXT_DETAIL
 from nautobot.extras.models import ObjectChange
 from nautobot.extras.signals import change_context_state, get_user_if_authenticated
-from nautobot.extras.webhooks import enqueue_webhooks
+from nautobot.extras.webhooks import batched_webhooks, enqueue_webhooks
 
 
 class ChangeContext:
@@ -68,15 +69,6 @@ class ChangeContext:
         }
         return context
 
-    def _object_change_batch(self, n):
-        # Return first n keys from the self.deferred_object_changes dict
-        keys = []
-        for i, k in enumerate(self.deferred_object_changes.keys()):
-            if i >= n:
-                return keys
-            keys.append(k)
-        return keys
-
     def reset_deferred_object_changes(self):
         self.deferred_object_changes = {}
 
@@ -84,27 +76,37 @@ class ChangeContext:
         if self.defer_object_changes:
             self.create_object_changes(batch_size=batch_size)
 
-    def create_object_changes(self, batch_size=1000):
+    def _generate_object_changes(self):
+        # Consume self.deferred_object_changes, yielding a new (unsaved) ObjectChange for each entry
         while self.deferred_object_changes:
-            create_object_changes = []
-            for key in self._object_change_batch(batch_size):
-                for entry in self.deferred_object_changes[key]:
-                    objectchange = entry["instance"].to_objectchange(entry["action"])
-                    if objectchange is not None:
-                        objectchange.user = entry["user"]
-                        objectchange.user_name = objectchange.user.username
-                        objectchange.request_id = self.change_id
-                        objectchange.change_context = self.context
-                        objectchange.change_context_detail = self.context_detail[:CHANGELOG_MAX_CHANGE_CONTEXT_DETAIL]
-                        if not objectchange.changed_object_id:  # changed_object was deleted
-                            # Clear out the GenericForeignKey to keep Django from complaining about an unsaved object:
-                            objectchange.changed_object = None
-                            # Set the component fields individually:
-                            objectchange.changed_object_id = entry.get("changed_object_id")
-                            objectchange.changed_object_type = entry.get("changed_object_type")
-                        create_object_changes.append(objectchange)
-                self.deferred_object_changes.pop(key, None)
-            ObjectChange.objects.bulk_create(create_object_changes, batch_size=batch_size)
+            key = next(iter(self.deferred_object_changes))
+            for entry in self.deferred_object_changes.pop(key):
+                objectchange = entry["instance"].to_objectchange(entry["action"])
+                if objectchange is not None:
+                    objectchange.user = entry["user"]
+                    objectchange.user_name = objectchange.user.username
+                    objectchange.request_id = self.change_id
+                    objectchange.change_context = self.context
+                    objectchange.change_context_detail = self.context_detail[:CHANGELOG_MAX_CHANGE_CONTEXT_DETAIL]
+                    if not objectchange.changed_object_id:  # changed_object was deleted
+                        # Clear out the GenericForeignKey to keep Django from complaining about an unsaved object:
+                        objectchange.changed_object = None
+                        # Set the component fields individually:
+                        objectchange.changed_object_id = entry.get("changed_object_id")
+                        objectchange.changed_object_type = entry.get("changed_object_type")
+                    yield objectchange
+
+    def create_object_changes(self, batch_size=1000, writer=None):
+        """
+        Create ObjectChange records for all deferred object changes.
+
+        :param batch_size: Maximum number of records to serialize and write to the database at a time
+        :param writer: Optional `ObjectChangeWriter` instance to write the records with. Defaults to an instance of
+            the class specified by `settings.CHANGELOG_BULK_WRITER`.
+        """
+        if writer is None:
+            writer = get_object_change_writer(batch_size=batch_size)
+        return writer.write(self._generate_object_changes())
 
 
 class JobChangeContext(ChangeContext):
@@ -210,28 +212,30 @@ def web_request_context(
         webhook_queryset = None
         last_action = None
         last_content_type = None
-        # enqueue jobhooks and webhooks, use change_context.change_id in case change_id was not supplied
-        for object_change in (
-            ObjectChange.objects.select_related("changed_object_type", "user")
-            .filter(request_id=change_context.change_id)
-            .order_by("time")  # default ordering is -time but we want oldest first not newest first
-            .iterator()
-        ):
-            if object_change.action != last_action or object_change.changed_object_type != last_content_type:
-                jobhook_queryset = None
-                webhook_queryset = None
-
-            if context != ObjectChangeEventContextChoices.CONTEXT_JOB_HOOK:
-                # Make sure JobHooks are up to date (only once) before calling them
-                did_reload_jobs, jobhook_queryset = enqueue_job_hooks(
-                    object_change, may_reload_jobs=(not jobs_reloaded), jobhook_queryset=jobhook_queryset
-                )
-                if did_reload_jobs:
-                    jobs_reloaded = True
-
-            webhook_queryset = enqueue_webhooks(object_change, webhook_queryset=webhook_queryset)
-            last_action = object_change.action
-            last_content_type = object_change.changed_object_type
+        # Send webhooks that have a batch size for many changes at once, rather than one Celery task per change
+        with batched_webhooks():
+            # enqueue jobhooks and webhooks, use change_context.change_id in case change_id was not supplied
+            for object_change in (
+                ObjectChange.objects.select_related("changed_object_type", "user")
+                .filter(request_id=change_context.change_id)
+                .order_by("time")  # default ordering is -time but we want oldest first not newest first
+                .iterator()
+            ):
+                if object_change.action != last_action or object_change.changed_object_type != last_content_type:
+                    jobhook_queryset = None
+                    webhook_queryset = None
+
+                if context != ObjectChangeEventContextChoices.CONTEXT_JOB_HOOK:
+                    # Make sure JobHooks are up to date (only once) before calling them
+                    did_reload_jobs, jobhook_queryset = enqueue_job_hooks(
+                        object_change, may_reload_jobs=(not jobs_reloaded), jobhook_queryset=jobhook_queryset
+                    )
+                    if did_reload_jobs:
+                        jobs_reloaded = True
+
+                webhook_queryset = enqueue_webhooks(object_change, webhook_queryset=webhook_queryset)
+                last_action = object_change.action
+                last_content_type = object_change.changed_object_type
 
 
 @contextmanager
@@ -1,7 +1,7 @@
 """Git data source functionality."""
 
 from collections import defaultdict, namedtuple
-from contextlib import suppress
+from contextlib import nullcontext, suppress
 import logging
 import mimetypes
 import os
@@ -11,10 +11,9 @@ from urllib.parse import quote
 
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
-from django.core.exceptions import MultipleObjectsReturned, ObjectDoesNotExist
+from django.core.exceptions import FieldDoesNotExist, MultipleObjectsReturned, ObjectDoesNotExist
 from django.db import transaction
-from git import InvalidGitRepositoryError, Repo
-import yaml
+from git import GitCommandError, InvalidGitRepositoryError, Repo
 
 from nautobot.core.utils.git import GitRepo
 from nautobot.core.utils.module_loading import import_modules_privately
@@ -40,7 +39,7 @@ from nautobot.extras.utils import refresh_job_model_from_job_class
 from nautobot.tenancy.models import Tenant, TenantGroup
 from nautobot.virtualization.models import Cluster, ClusterGroup, VirtualMachine
 
-from .utils import files_from_contenttype_directories
+from .utils import files_from_contenttype_directories, load_data, load_data_files
 
 logger = logging.getLogger(__name__)
 
@@ -50,6 +49,22 @@ GitJobResult = namedtuple("GitJobResult", ["job_result", "repository_record"])
 # namedtuple takes from_url(remote git repository url), to_path(local path of git repo), from_branch(git branch)
 GitRepoInfo = namedtuple("GitRepoInfo", ["from_url", "to_path", "from_branch"])
 
+# (key, model) of the objects that a config context can be assigned to, keyed in its `_metadata` and in the
+# `config_contexts/<key>/` directory of a repository
+CONFIG_CONTEXT_FILTER_MODELS = (
+    ("locations", Location),
+    ("device_types", DeviceType),
+    ("roles", Role),
+    ("platforms", Platform),
+    ("cluster_groups", ClusterGroup),
+    ("clusters", Cluster),
+    ("tenant_groups", TenantGroup),
+    ("tenants", Tenant),
+    ("tags", Tag),
+    ("dynamic_groups", DynamicGroup),
+    ("device_redundancy_groups", DeviceRedundancyGroup),
+)
+
 
 def enqueue_git_repository_helper(repository, user, job_class, **kwargs):
     """
@@ -57,7 +72,7 @@ def enqueue_git_repository_helper(repository, user, job_class, **kwargs):
     """
     job_model = job_class().job_model
 
-    return JobResult.enqueue_job(job_model, user, repository=repository.pk)
+    return JobResult.enqueue_job(job_model, user, repository=repository.pk, **kwargs)
 
 
 def enqueue_git_repository_diff_origin_and_local(repository, user):
@@ -67,13 +82,13 @@ def enqueue_git_repository_diff_origin_and_local(repository, user):
     return enqueue_git_repository_helper(repository, user, GitRepositoryDryRun)
 
 
-def enqueue_pull_git_repository_and_refresh_data(repository, user):
+def enqueue_pull_git_repository_and_refresh_data(repository, user, full_resync=False):
     """
     Convenience wrapper for JobResult.enqueue_job() to enqueue the pull_git_repository_and_refresh_data job.
     """
     from nautobot.core.jobs import GitRepositorySync
 
-    return enqueue_git_repository_helper(repository, user, GitRepositorySync)
+    return enqueue_git_repository_helper(repository, user, GitRepositorySync, full_resync=full_resync)
 
 
 def get_repo_access_url(repository_record):
@@ -219,6 +234,64 @@ def git_repository_dry_run(repository_record, logger):  # pylint: disable=redefi
     logger.info("Repository dry run successful")
 
 
+def get_changed_file_paths(repository_record, directory, job_result, grouping):
+    """Get the files under the given directory of the repository that changed since its `previous_head` commit.
+
+    Renamed files are reported as both their old and their new path.
+
+    Args:
+        repository_record (GitRepository): Repository whose `current_head` is checked out.
+        directory (str): Directory, relative to the repository root, to limit the changes to.
+        job_result (JobResult): JobResult to log to.
+        grouping (str): Grouping to log with.
+
+    Returns:
+        (set): Paths of the added, modified, and deleted files, relative to the repository root,
+            or None if the previously synced commit is unknown and all files need to be refreshed.
+    """
+    previous_head = repository_record.previous_head
+    if not previous_head:
+        return None
+    if previous_head == repository_record.current_head:
+        return set()
+
+    try:
+        diff = Repo(repository_record.filesystem_path).git.diff(
+            "--name-only", "--no-renames", "-z", previous_head, repository_record.current_head, "--", directory
+        )
+    except (InvalidGitRepositoryError, GitCommandError) as exc:
+        # For example, the previous commit might no longer exist after a force-push
+        msg = f"Unable to determine the files changed since commit {previous_head}; refreshing all files: {exc}"
+        logger.warning(msg)
+        job_result.log(msg, level_choice=LogLevelChoices.LOG_WARNING, grouping=grouping)
+        return None
+
+    return {file_path for file_path in diff.split("\0") if file_path}
+
+
+def load_previous_data_file(repository_record, file_path):
+    """Load a JSON or YAML data file as of the repository's `previous_head` commit, or None if it can't be loaded."""
+    try:
+        content = Repo(repository_record.filesystem_path).git.show(f"{repository_record.previous_head}:{file_path}")
+        return load_data(content)
+    except Exception:
+        # For example, the file didn't exist at the previous commit
+        return None
+
+
+def get_data_names(data):
+    """Get the `_metadata` names of the records defined by a config context or config context schema data file."""
+    if isinstance(data, dict):
+        data = [data]
+    if not isinstance(data, list):
+        return set()
+    return {
+        entry["_metadata"]["name"]
+        for entry in data
+        if isinstance(entry, dict) and isinstance(entry.get("_metadata"), dict) and "name" in entry["_metadata"]
+    }
+
+
 #
 # Config context handling
 #
@@ -233,10 +306,24 @@ def refresh_git_config_contexts(repository_record, job_result, delete=False):
 
 
 def update_git_config_contexts(repository_record, job_result):
-    """Refresh any config contexts provided by this Git repository."""
+    """Refresh any config contexts provided by this Git repository.
+
+    All data files are loaded first (see `load_data_files()`), then the objects that they reference are looked up in
+    bulk (see `ConfigContextImportCache`), and finally the config contexts are created/updated with deferred change
+    logging. Unchanged config contexts are counted rather than logged individually.
+    """
     config_context_path = os.path.join(repository_record.filesystem_path, "config_contexts")
     managed_config_contexts = set()
     managed_local_config_contexts = defaultdict(set)
+    filter_types = tuple(key for key, _ in CONFIG_CONTEXT_FILTER_MODELS)
+    local_types = ("devices", "virtual_machines")
+    # If None, all files need to be refreshed, otherwise only these changed files
+    changed_files = get_changed_file_paths(repository_record, "config_contexts", job_result, "config contexts")
+
+    # (file_path, file_label, filter_type) of each config context file, with a filter_type of None for "flat" files
+    context_files = []
+    # (file_path, file_label, local_type) of each local config context file
+    local_context_files = []
 
     if os.path.isdir(config_context_path):
         # First, handle the "flat file" case - data files in the root config_context_path,
@@ -244,44 +331,12 @@ def update_git_config_contexts(repository_record, job_result):
         for file_name in os.listdir(config_context_path):
             if not os.path.isfile(os.path.join(config_context_path, file_name)):
                 continue
-            msg = f"Loading config context from `{file_name}`"
-            logger.info(msg)
-            job_result.log(msg, grouping="config contexts")
-            try:
-                with open(os.path.join(config_context_path, file_name), "r") as fd:
-                    # The data file can be either JSON or YAML; since YAML is a superset of JSON, we load it regardless
-                    context_data = yaml.safe_load(fd)
-
-                # A file can contain one config context dict or a list thereof
-                if isinstance(context_data, dict):
-                    context_name = import_config_context(context_data, repository_record, job_result)
-                    managed_config_contexts.add(context_name)
-                elif isinstance(context_data, list):
-                    for context_data_entry in context_data:
-                        context_name = import_config_context(context_data_entry, repository_record, job_result)
-                        managed_config_contexts.add(context_name)
-                else:
-                    raise RuntimeError("data must be a dict or list of dicts")
-
-            except Exception as exc:
-                msg = f"Error in loading config context data from `{file_name}`: {exc}"
-                logger.error(msg)
-                job_result.log(msg, level_choice=LogLevelChoices.LOG_ERROR, grouping="config contexts")
+            if changed_files is not None and f"config_contexts/{file_name}" not in changed_files:
+                continue
+            context_files.append((os.path.join(config_context_path, file_name), file_name, None))
 
         # Next, handle the "filter/name" directory structure case - files in <filter_type>/<name>.(json|yaml)
-        for filter_type in (
-            "locations",
-            "device_types",
-            "roles",
-            "platforms",
-            "cluster_groups",
-            "clusters",
-            "tenant_groups",
-            "tenants",
-            "tags",
-            "dynamic_groups",
-            "device_redundancy_groups",
-        ):
+        for filter_type in filter_types:
             if os.path.isdir(os.path.join(repository_record.filesystem_path, filter_type)):
                 msg = (
                     f'Found "{filter_type}" directory in the repository root. If this is meant to contain config contexts, '
@@ -295,35 +350,12 @@ def update_git_config_contexts(repository_record, job_result):
                 continue
 
             for file_name in os.listdir(dir_path):
-                name = os.path.splitext(file_name)[0]
-                msg = (
-                    f'Loading config context, filter `{filter_type} = [name: "{name}"]`, '
-                    f"from `{filter_type}/{file_name}`"
-                )
-                logger.info(msg)
-                job_result.log(msg, grouping="config contexts")
-                try:
-                    with open(os.path.join(dir_path, file_name), "r") as fd:
-                        # Data file can be either JSON or YAML; since YAML is a superset of JSON, we load it regardless
-                        context_data = yaml.safe_load(fd)
-
-                    # Unlike the above case, these files always contain just a single config context record
-
-                    # Add the implied filter to the context metadata
-                    if filter_type == "device_types":
-                        context_data.setdefault("_metadata", {}).setdefault(filter_type, []).append({"model": name})
-                    else:
-                        context_data.setdefault("_metadata", {}).setdefault(filter_type, []).append({"name": name})
-
-                    context_name = import_config_context(context_data, repository_record, job_result)
-                    managed_config_contexts.add(context_name)
-                except Exception as exc:
-                    msg = f"Error in loading config context data from `{file_name}`: {exc}"
-                    logger.error(msg)
-                    job_result.log(msg, level_choice=LogLevelChoices.LOG_ERROR, grouping="config contexts")
+                if changed_files is not None and f"config_contexts/{filter_type}/{file_name}" not in changed_files:
+                    continue
+                context_files.append((os.path.join(dir_path, file_name), file_name, filter_type))
 
         # Finally, handle device- and VM-specific "local" context in (devices|virtual_machines)/<name>.(json|yaml)
-        for local_type in ("devices", "virtual_machines"):
+        for local_type in local_types:
             if os.path.isdir(os.path.join(repository_record.filesystem_path, local_type)):
                 msg = (
                     f'Found "{local_type}" directory in the repository root. If this is meant to contain '
@@ -337,36 +369,255 @@ def update_git_config_contexts(repository_record, job_result):
                 continue
 
             for file_name in os.listdir(dir_path):
-                device_name = os.path.splitext(file_name)[0]
-                msg = f"Loading local config context for `{device_name}` from `{local_type}/{file_name}`"
-                logger.info(msg)
-                job_result.log(msg, grouping="local config contexts")
-                try:
-                    with open(os.path.join(dir_path, file_name), "r") as fd:
-                        context_data = yaml.safe_load(fd)
-
-                    import_local_config_context(
-                        local_type,
-                        device_name,
-                        context_data,
-                        repository_record,
-                    )
-                    managed_local_config_contexts[local_type].add(device_name)
-                except Exception as exc:
-                    msg = f"Error in loading local config context from `{local_type}/{file_name}`: {exc}"
-                    logger.error(msg)
-                    job_result.log(msg, level_choice=LogLevelChoices.LOG_ERROR, grouping="local config contexts")
+                if changed_files is not None and f"config_contexts/{local_type}/{file_name}" not in changed_files:
+                    continue
+                local_context_files.append((os.path.join(dir_path, file_name), f"{local_type}/{file_name}", local_type))
 
-    # Delete any prior contexts that are owned by this repository but were not created/updated above
+    if context_files or local_context_files:
+        msg = (
+            f"Loading config contexts from {len(context_files)} file(s) "
+            f"and local config contexts from {len(local_context_files)} file(s)"
+        )
+        logger.info(msg)
+        job_result.log(msg, grouping="config contexts")
+    file_data = load_data_files(file_path for file_path, _, _ in context_files + local_context_files)
+
+    # (file_label, context_data) of each config context defined by the files
+    contexts = []
+    for file_path, file_label, filter_type in context_files:
+        try:
+            context_data = file_data[file_path]
+            if isinstance(context_data, Exception):
+                raise context_data
+
+            if filter_type is None:
+                # A file can contain one config context dict or a list thereof
+                if isinstance(context_data, dict):
+                    contexts.append((file_label, context_data))
+                elif isinstance(context_data, list):
+                    contexts.extend((file_label, context_data_entry) for context_data_entry in context_data)
+                else:
+                    raise RuntimeError("data must be a dict or list of dicts")
+            else:
+                # Unlike the above case, these files always contain just a single config context record
+                name = os.path.splitext(file_label)[0]
+
+                # Add the implied filter to the context metadata
+                if filter_type == "device_types":
+                    context_data.setdefault("_metadata", {}).setdefault(filter_type, []).append({"model": name})
+                else:
+                    context_data.setdefault("_metadata", {}).setdefault(filter_type, []).append({"name": name})
+
+                contexts.append((file_label, context_data))
+        except Exception as exc:
+            msg = f"Error in loading config context data from `{file_label}`: {exc}"
+            logger.error(msg)
+            job_result.log(msg, level_choice=LogLevelChoices.LOG_ERROR, grouping="config contexts")
+
+    cache = ConfigContextImportCache(
+        repository_record,
+        contexts_data=[context_data for _, context_data in contexts],
+        local_context_names=[
+            (local_type, os.path.splitext(os.path.basename(file_path))[0])
+            for file_path, _, local_type in local_context_files
+        ],
+    )
+
+    with deferred_change_logging():
+        for file_label, context_data in contexts:
+            try:
+                context_name = import_config_context(context_data, repository_record, job_result, cache=cache)
+                managed_config_contexts.add(context_name)
+            except Exception as exc:
+                msg = f"Error in loading config context data from `{file_label}`: {exc}"
+                logger.error(msg)
+                job_result.log(msg, level_choice=LogLevelChoices.LOG_ERROR, grouping="config contexts")
+
+        for file_path, file_label, local_type in local_context_files:
+            device_name = os.path.splitext(os.path.basename(file_path))[0]
+            try:
+                context_data = file_data[file_path]
+                if isinstance(context_data, Exception):
+                    raise context_data
+
+                import_local_config_context(local_type, device_name, context_data, repository_record, cache=cache)
+                managed_local_config_contexts[local_type].add(device_name)
+            except Exception as exc:
+                msg = f"Error in loading local config context from `{file_label}`: {exc}"
+                logger.error(msg)
+                job_result.log(msg, level_choice=LogLevelChoices.LOG_ERROR, grouping="local config contexts")
+
+    for grouping, description in (
+        ("config contexts", "config context(s)"),
+        ("local config contexts", "local config context(s)"),
+    ):
+        if cache.unchanged[grouping]:
+            msg = f"No change to {cache.unchanged[grouping]} {description}"
+            logger.info(msg)
+            job_result.log(msg, level_choice=LogLevelChoices.LOG_INFO, grouping=grouping)
+
+    if changed_files is None:
+        # Delete any prior contexts that are owned by this repository but were not created/updated above
+        delete_git_config_contexts(
+            repository_record,
+            job_result,
+            preserve=managed_config_contexts,
+            preserve_local=managed_local_config_contexts,
+        )
+        return
+
+    # Delete any prior contexts that were defined by the previous version of the changed files,
+    # but were not created/updated above
+    previous_config_contexts = set()
+    previous_local_config_contexts = defaultdict(set)
+    for file_path in changed_files:
+        path_parts = file_path.split("/")
+        if len(path_parts) == 2 or (len(path_parts) == 3 and path_parts[1] in filter_types):
+            previous_config_contexts |= get_data_names(load_previous_data_file(repository_record, file_path))
+        elif len(path_parts) == 3 and path_parts[1] in local_types:
+            previous_local_config_contexts[path_parts[1]].add(os.path.splitext(path_parts[2])[0])
     delete_git_config_contexts(
         repository_record,
         job_result,
         preserve=managed_config_contexts,
         preserve_local=managed_local_config_contexts,
+        candidates=previous_config_contexts,
+        candidates_local=previous_local_config_contexts,
     )
 
 
-def import_config_context(context_data, repository_record, job_result):
+def deferred_change_logging():
+    """Defer change logging until the end of a bulk import, if change logging is enabled at all."""
+    # Avoid circular imports
+    from nautobot.extras.context_managers import deferred_change_logging_for_bulk_operation
+    from nautobot.extras.signals import change_context_state
+
+    if change_context_state.get() is None:
+        return nullcontext()
+    return deferred_change_logging_for_bulk_operation()
+
+
+class ConfigContextImportCache:
+    """
+    Objects looked up in bulk for importing many config contexts from a Git repository, rather than one at a time.
+
+    Only lookups of related objects by a single field value (such as `{"name": "Location A"}`) are done in bulk;
+    any other lookup, or one that doesn't unambiguously match a single object, is done individually as before,
+    so that the results of importing a config context are the same either way.
+    """
+
+    def __init__(self, repository_record, contexts_data=(), local_context_names=()):
+        """
+        Args:
+            repository_record (GitRepository): Repository that the config contexts are imported from.
+            contexts_data (list): Data of the config contexts to be imported, as passed to `import_config_context()`.
+            local_context_names (list): `(local_type, device_name)` of the local config contexts to be imported.
+        """
+        metadata_list = [
+            context_data["_metadata"]
+            for context_data in contexts_data
+            if isinstance(context_data, dict) and isinstance(context_data.get("_metadata"), dict)
+        ]
+
+        git_repository_content_type = ContentType.objects.get_for_model(GitRepository)
+        names = {metadata["name"] for metadata in metadata_list if isinstance(metadata.get("name"), str)}
+        self.config_contexts = {
+            context_record.name: context_record
+            for context_record in ConfigContext.objects.filter(
+                name__in=names,
+                owner_content_type=git_repository_content_type,
+                owner_object_id=repository_record.pk,
+            )
+            .select_related("config_context_schema")
+            .prefetch_related(*(key for key, _ in CONFIG_CONTEXT_FILTER_MODELS))
+        }
+
+        schema_names = set()
+        for metadata in metadata_list:
+            schema_name = metadata.get("config_context_schema", metadata.get("schema"))
+            if isinstance(schema_name, str):
+                schema_names.add(schema_name)
+        self.config_context_schemas = {
+            schema.name: schema for schema in ConfigContextSchema.objects.filter(name__in=schema_names)
+        }
+
+        # {(key, field_name): {value}} of the related objects to look up
+        lookups = defaultdict(set)
+        for metadata in metadata_list:
+            for key, model_class in CONFIG_CONTEXT_FILTER_MODELS:
+                object_data_list = metadata.get(key)
+                if not isinstance(object_data_list, list):
+                    continue
+                for object_data in object_data_list:
+                    if isinstance(object_data, dict) and len(object_data) == 1:
+                        ((field_name, value),) = object_data.items()
+                        if type(value) in (str, int) and self._is_bulk_lookup_field(model_class, field_name):
+                            lookups[(key, field_name)].add(value)
+
+        # {(key, field_name, value): object}
+        self.related_objects = {}
+        for (key, field_name), values in lookups.items():
+            model_class = dict(CONFIG_CONTEXT_FILTER_MODELS)[key]
+            matches = defaultdict(list)
+            for instance in model_class.objects.filter(**{f"{field_name}__in": values}):
+                value = getattr(instance, field_name)
+                # Depending on the database collation, a string lookup may also match values that differ in case
+                matches[value.casefold() if isinstance(value, str) else value].append(instance)
+            for value in values:
+                candidates = matches.get(value.casefold() if isinstance(value, str) else value, [])
+                if len(candidates) == 1 and getattr(candidates[0], field_name) == value:
+                    self.related_objects[(key, field_name, value)] = candidates[0]
+
+        # {(local_type, casefolded device_name): [record]}
+        self.local_config_context_records = defaultdict(list)
+        for local_type, model_class in (("devices", Device), ("virtual_machines", VirtualMachine)):
+            device_names = {
+                device_name for record_type, device_name in local_context_names if record_type == local_type
+            }
+            if device_names:
+                for record in model_class.objects.filter(name__in=device_names):
+                    self.local_config_context_records[(local_type, record.name.casefold())].append(record)
+
+        # {grouping: count} of the config contexts and local config contexts that were left unchanged
+        self.unchanged = defaultdict(int)
+
+    @staticmethod
+    def _is_bulk_lookup_field(model_class, field_name):
+        """Whether related objects can be looked up in bulk by the given field, a concrete non-relational field."""
+        try:
+            field = model_class._meta.get_field(field_name)
+        except FieldDoesNotExist:
+            return False
+        return field.concrete and not field.is_relation
+
+    def get_related_object(self, key, model_class, object_data):
+        """Get the object that a config context's `_metadata[key]` entry refers to, like `model_class.objects.get()`."""
+        if isinstance(object_data, dict) and len(object_data) == 1:
+            ((field_name, value),) = object_data.items()
+            if type(value) in (str, int) and (key, field_name, value) in self.related_objects:
+                return self.related_objects[(key, field_name, value)]
+        return model_class.objects.get(**object_data)
+
+    def get_config_context(self, name):
+        """Get the existing config context with the given name owned by the repository, or None."""
+        return self.config_contexts.get(name) if isinstance(name, str) else None
+
+    def get_config_context_schema(self, name):
+        """Get the config context schema with the given name, like `ConfigContextSchema.objects.get()`."""
+        if isinstance(name, str) and name in self.config_context_schemas:
+            return self.config_context_schemas[name]
+        return ConfigContextSchema.objects.get(name=name)
+
+    def get_local_config_context_record(self, local_type, device_name):
+        """Get the Device or VirtualMachine that a local config context applies to, like `model.objects.get()`."""
+        records = self.local_config_context_records.get((local_type, device_name.casefold()), [])
+        if len(records) == 1 and records[0].name == device_name:
+            return records[0]
+        model_class = Device if local_type == "devices" else VirtualMachine
+        return model_class.objects.get(name=device_name)
+
+
+def import_config_context(context_data, repository_record, job_result, cache=None):
     """
     Parse a given dictionary of data to create/update a ConfigContext record.
 
@@ -376,6 +627,9 @@ def import_config_context(context_data, repository_record, job_result):
     Note that we don't use extras.api.serializers.ConfigContextSerializer, despite superficial similarities;
     the reason is that the serializer only allows us to identify related objects (Locations, Role, etc.)
     by their database primary keys, whereas here we need to be able to look them up by other values such as name.
+
+    If a `ConfigContextImportCache` is given, existing and related objects are looked up in it where possible,
+    and an unchanged config context is counted in it rather than logged.
     """
     git_repository_content_type = ContentType.objects.get_for_model(GitRepository)
 
@@ -403,23 +657,14 @@ def import_config_context(context_data, repository_record, job_result):
 
     # Translate relationship queries/filters to lists of related objects
     relations = {}
-    for key, model_class in [
-        ("locations", Location),
-        ("device_types", DeviceType),
-        ("roles", Role),
-        ("platforms", Platform),
-        ("cluster_groups", ClusterGroup),
-        ("clusters", Cluster),
-        ("tenant_groups", TenantGroup),
-        ("tenants", Tenant),
-        ("tags", Tag),
-        ("dynamic_groups", DynamicGroup),
-        ("device_redundancy_groups", DeviceRedundancyGroup),
-    ]:
+    for key, model_class in CONFIG_CONTEXT_FILTER_MODELS:
         relations[key] = []
         for object_data in context_metadata.get(key, ()):
             try:
-                object_instance = model_class.objects.get(**object_data)
+                if cache is not None:
+                    object_instance = cache.get_related_object(key, model_class, object_data)
+                else:
+                    object_instance = model_class.objects.get(**object_data)
             except model_class.DoesNotExist as exc:
                 raise RuntimeError(
                     f"No matching {model_class.__name__} found for {object_data}; unable to create/update "
@@ -441,12 +686,15 @@ def import_config_context(context_data, repository_record, job_result):
         created = False
         modified = False
         save_needed = False
-        context_record, created = ConfigContext.objects.get_or_create(
-            name=context_metadata.get("name"),
-            owner_content_type=git_repository_content_type,
-            owner_object_id=repository_record.pk,
-            defaults={"data": {}},
-        )
+        if cache is not None and cache.get_config_context(context_metadata.get("name")) is not None:
+            context_record = cache.get_config_context(context_metadata.get("name"))
+        else:
+            context_record, created = ConfigContext.objects.get_or_create(
+                name=context_metadata.get("name"),
+                owner_content_type=git_repository_content_type,
+                owner_object_id=repository_record.pk,
+                defaults={"data": {}},
+            )
 
         for field in ("weight", "description", "is_active"):
             new_value = context_metadata[field]
@@ -461,7 +709,10 @@ def import_config_context(context_data, repository_record, job_result):
         if context_metadata.get("config_context_schema"):
             if getattr(context_record.config_context_schema, "name", None) != context_metadata["config_context_schema"]:
                 try:
-                    schema = ConfigContextSchema.objects.get(name=context_metadata["config_context_schema"])
+                    if cache is not None:
+                        schema = cache.get_config_context_schema(context_metadata["config_context_schema"])
+                    else:
+                        schema = ConfigContextSchema.objects.get(name=context_metadata["config_context_schema"])
                     context_record.config_context_schema = schema
                     modified = True
                 except ConfigContextSchema.DoesNotExist:
@@ -504,6 +755,8 @@ def import_config_context(context_data, repository_record, job_result):
         msg = "Successfully refreshed config context"
         logger.info(msg)
         job_result.log(msg, obj=context_record, level_choice=LogLevelChoices.LOG_INFO, grouping="config contexts")
+    elif cache is not None:
+        cache.unchanged["config contexts"] += 1
     else:
         msg = "No change to config context"
         logger.info(msg)
@@ -512,12 +765,17 @@ def import_config_context(context_data, repository_record, job_result):
     return context_record.name if context_record else None
 
 
-def import_local_config_context(local_type, device_name, context_data, repository_record):
+def import_local_config_context(local_type, device_name, context_data, repository_record, cache=None):
     """
     Create/update the local config context data associated with a Device or VirtualMachine.
+
+    If a `ConfigContextImportCache` is given, the Device or VirtualMachine is looked up in it where possible,
+    and unchanged local config context data is counted in it rather than logged.
     """
     try:
-        if local_type == "devices":
+        if cache is not None and local_type in ("devices", "virtual_machines"):
+            record = cache.get_local_config_context_record(local_type, device_name)
+        elif local_type == "devices":
             record = Device.objects.get(name=device_name)
         elif local_type == "virtual_machines":
             record = VirtualMachine.objects.get(name=device_name)
@@ -530,10 +788,12 @@ def import_local_config_context(local_type, device_name, context_data, repositor
     except ObjectDoesNotExist:
         raise RuntimeError("record not found!")
 
-    if (
-        record.local_config_context_data_owner is not None
-        and record.local_config_context_data_owner != repository_record
-    ):
+    # Compare the owner's identifiers first, to avoid retrieving the owner of each record
+    owned_by_repository = (
+        record.local_config_context_data_owner_content_type_id == ContentType.objects.get_for_model(GitRepository).pk
+        and record.local_config_context_data_owner_object_id == repository_record.pk
+    )
+    if not owned_by_repository and record.local_config_context_data_owner is not None:
         logger.error(
             "DATA CONFLICT: Local context data is owned by another owner, %s",
             record.local_config_context_data_owner,
@@ -541,8 +801,13 @@ def import_local_config_context(local_type, device_name, context_data, repositor
         )
         return
 
-    if record.local_config_context_data == context_data and record.local_config_context_data_owner == repository_record:
-        logger.info("No change to local config context", extra={"object": record, "grouping": "local config contexts"})
+    if record.local_config_context_data == context_data and owned_by_repository:
+        if cache is not None:
+            cache.unchanged["local config contexts"] += 1
+        else:
+            logger.info(
+                "No change to local config context", extra={"object": record, "grouping": "local config contexts"}
+            )
         return
 
     record.local_config_context_data = context_data
@@ -554,16 +819,25 @@ def import_local_config_context(local_type, device_name, context_data, repositor
     )
 
 
-def delete_git_config_contexts(repository_record, job_result, preserve=(), preserve_local=None):
-    """Delete config contexts owned by this Git repository that are not in the preserve list (if any)."""
+def delete_git_config_contexts(
+    repository_record, job_result, preserve=(), preserve_local=None, candidates=None, candidates_local=None
+):
+    """Delete config contexts owned by this Git repository that are not in the preserve list (if any).
+
+    If `candidates` and `candidates_local` are specified, only the config contexts and local config contexts named
+    therein are considered for deletion, rather than all of those owned by this Git repository.
+    """
     if not preserve_local:
         preserve_local = defaultdict(set)
 
     git_repository_content_type = ContentType.objects.get_for_model(GitRepository)
-    for context_record in ConfigContext.objects.filter(
+    context_records = ConfigContext.objects.filter(
         owner_content_type=git_repository_content_type,
         owner_object_id=repository_record.pk,
-    ):
+    )
+    if candidates is not None:
+        context_records = context_records.filter(name__in=candidates)
+    for context_record in context_records:
         if context_record.name not in preserve:
             context_record.delete()
             msg = f"Deleted config context {context_record}"
@@ -574,10 +848,13 @@ def delete_git_config_contexts(repository_record, job_result, preserve=(), prese
         ("devices", Device),
         ("virtual_machines", VirtualMachine),
     ):
-        for record in model.objects.filter(
+        records = model.objects.filter(
             local_config_context_data_owner_content_type=git_repository_content_type,
             local_config_context_data_owner_object_id=repository_record.pk,
-        ):
+        )
+        if candidates_local is not None:
+            records = records.filter(name__in=candidates_local.get(grouping, ()))
+        for record in records:
             if record.name not in preserve_local[grouping]:
                 record.local_config_context_data = None
                 record.local_config_context_data_owner = None
@@ -608,18 +885,24 @@ def update_git_config_context_schemas(repository_record, job_result):
     config_context_schema_path = os.path.join(repository_record.filesystem_path, "config_context_schemas")
 
     managed_config_context_schemas = set()
+    # If None, all files need to be refreshed, otherwise only these changed files
+    changed_files = get_changed_file_paths(
+        repository_record, "config_context_schemas", job_result, "config context schemas"
+    )
 
     if os.path.isdir(config_context_schema_path):
         for file_name in os.listdir(config_context_schema_path):
             if not os.path.isfile(os.path.join(config_context_schema_path, file_name)):
                 continue
+            if changed_files is not None and f"config_context_schemas/{file_name}" not in changed_files:
+                continue
             msg = (f"Loading config context schema from `{file_name}`",)
             logger.info(msg)
             job_result.log(msg, grouping="config context schemas")
             try:
                 with open(os.path.join(config_context_schema_path, file_name), "r") as fd:
                     # The data file can be either JSON or YAML; since YAML is a superset of JSON, we load it regardless
-                    context_schema_data = yaml.safe_load(fd)
+                    context_schema_data = load_data(fd)
 
                 # A file can contain one config context dict or a list thereof
                 if isinstance(context_schema_data, dict):
@@ -639,11 +922,26 @@ def update_git_config_context_schemas(repository_record, job_result):
                 logger.error(msg)
                 job_result.log(msg, level_choice=LogLevelChoices.LOG_ERROR, grouping="config context schemas")
 
-    # Delete any prior contexts that are owned by this repository but were not created/updated above
+    if changed_files is None:
+        # Delete any prior schemas that are owned by this repository but were not created/updated above
+        delete_git_config_context_schemas(
+            repository_record,
+            job_result,
+            preserve=managed_config_context_schemas,
+        )
+        return
+
+    # Delete any prior schemas that were defined by the previous version of the changed files,
+    # but were not created/updated above
+    previous_config_context_schemas = set()
+    for file_path in changed_files:
+        if len(file_path.split("/")) == 2:
+            previous_config_context_schemas |= get_data_names(load_previous_data_file(repository_record, file_path))
     delete_git_config_context_schemas(
         repository_record,
         job_result,
         preserve=managed_config_context_schemas,
+        candidates=previous_config_context_schemas,
     )
 
 
@@ -694,13 +992,19 @@ def import_config_context_schema(context_schema_data, repository_record, job_res
     return schema_record.name if schema_record else None
 
 
-def delete_git_config_context_schemas(repository_record, job_result, preserve=()):
-    """Delete config context schemas owned by this Git repository that are not in the preserve list (if any)."""
+def delete_git_config_context_schemas(repository_record, job_result, preserve=(), candidates=None):
+    """Delete config context schemas owned by this Git repository that are not in the preserve list (if any).
+
+    If `candidates` is specified, only the config context schemas named therein are considered for deletion.
+    """
     git_repository_content_type = ContentType.objects.get_for_model(GitRepository)
-    for schema_record in ConfigContextSchema.objects.filter(
+    schema_records = ConfigContextSchema.objects.filter(
         owner_content_type=git_repository_content_type,
         owner_object_id=repository_record.pk,
-    ):
+    )
+    if candidates is not None:
+        schema_records = schema_records.filter(name__in=candidates)
+    for schema_record in schema_records:
         if schema_record.name not in preserve:
             schema_record.delete()
             msg = f"Deleted config context schema {schema_record}"
@@ -834,6 +1138,8 @@ def update_git_export_templates(repository_record, job_result):
 
     export_template_path = os.path.join(repository_record.filesystem_path, "export_templates")
     managed_export_templates = {}
+    # If None, all files need to be refreshed, otherwise only these changed files
+    changed_files = get_changed_file_paths(repository_record, "export_templates", job_result, "export templates")
 
     git_repository_content_type = ContentType.objects.get_for_model(GitRepository)
 
@@ -843,6 +1149,8 @@ def update_git_export_templates(repository_record, job_result):
         file_name = os.path.basename(file_path)
         app_label = model_content_type.app_label
         modelname = model_content_type.model
+        if changed_files is not None and f"export_templates/{app_label}/{modelname}/{file_name}" not in changed_files:
+            continue
         msg = f"Loading `{app_label}.{modelname}` export template from `{file_name}`"
         logger.info(msg)
         job_result.log(msg, grouping="export templates")
@@ -910,21 +1218,42 @@ def update_git_export_templates(repository_record, job_result):
                 str(exc), obj=template_record, level_choice=LogLevelChoices.LOG_ERROR, grouping="export templates"
             )
 
-    # Delete any prior templates that are owned by this repository but were not discovered above
-    delete_git_export_templates(repository_record, job_result, preserve=managed_export_templates)
+    if changed_files is None:
+        # Delete any prior templates that are owned by this repository but were not discovered above
+        delete_git_export_templates(repository_record, job_result, preserve=managed_export_templates)
+        return
+
+    # Delete any prior templates of the changed files that were not discovered above
+    previous_export_templates = {}
+    for file_path in changed_files:
+        path_parts = file_path.split("/")
+        if len(path_parts) == 4:
+            previous_export_templates.setdefault(f"{path_parts[1]}.{path_parts[2]}", set()).add(path_parts[3])
+    delete_git_export_templates(
+        repository_record, job_result, preserve=managed_export_templates, candidates=previous_export_templates
+    )
+
 
+def delete_git_export_templates(repository_record, job_result, preserve=None, candidates=None):
+    """Delete ExportTemplates owned by the given Git repository that are not in the preserve dict (if any).
 
-def delete_git_export_templates(repository_record, job_result, preserve=None):
-    """Delete ExportTemplates owned by the given Git repository that are not in the preserve dict (if any)."""
+    If `candidates` is specified, only the ExportTemplates named therein (in the same format as `preserve`) are
+    considered for deletion.
+    """
     git_repository_content_type = ContentType.objects.get_for_model(GitRepository)
     if not preserve:
         preserve = {}
 
-    for template_record in ExportTemplate.objects.filter(
+    template_records = ExportTemplate.objects.filter(
         owner_content_type=git_repository_content_type,
         owner_object_id=repository_record.pk,
-    ):
+    )
+    if candidates is not None:
+        template_records = template_records.filter(name__in=set().union(*candidates.values()))
+    for template_record in template_records:
         key = f"{template_record.content_type.app_label}.{template_record.content_type.model}"
+        if candidates is not None and template_record.name not in candidates.get(key, ()):
+            continue
         if template_record.name not in preserve.get(key, ()):
             template_record.delete()
             msg = f"Deleted export template {template_record}"
@@ -1,12 +1,18 @@
+from concurrent.futures import ProcessPoolExecutor
 import logging
 import os
 
+from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
+import yaml
 
 from nautobot.extras.choices import LogLevelChoices
 
 logger = logging.getLogger(__name__)
 
+# The C implementation of the YAML loader (if PyYAML was built with libyaml) is many times faster than the Python one
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 def files_from_contenttype_directories(base_path, job_result, log_grouping):
     """
@@ -38,3 +44,44 @@ def files_from_contenttype_directories(base_path, job_result, log_grouping):
 
             for filename in os.listdir(modelname_path):
                 yield (model_content_type, os.path.join(modelname_path, filename))
+
+
+def load_data(content):
+    """Load JSON or YAML data from a string or file; since YAML is a superset of JSON, it's loaded as YAML regardless."""
+    return yaml.load(content, Loader=YAML_LOADER)  # noqa: S506  # unsafe-yaml-load -- this is a safe loader
+
+
+def _load_data_file(file_path):
+    """Load a JSON or YAML data file, returning a `(data, error message)` tuple for use with a process pool."""
+    try:
+        with open(file_path, "r") as fd:
+            return load_data(fd), None
+    except Exception as exc:
+        return None, str(exc)
+
+
+def load_data_files(file_paths):
+    """
+    Load many JSON or YAML data files, in a pool of up to `settings.GIT_DATA_PARSE_WORKERS` processes.
+
+    If the process pool can't be used, such as in a daemonic Celery worker process, files are loaded one at a time.
+
+    Returns:
+        (dict): `{file_path: data}`, where the data of any file that couldn't be loaded is a `RuntimeError` instead.
+    """
+    file_paths = list(file_paths)
+    workers = min(settings.GIT_DATA_PARSE_WORKERS, len(file_paths))
+    results = None
+    if workers > 1:
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(_load_data_file, file_paths, chunksize=max(1, len(file_paths) // workers)))
+        except Exception as exc:
+            logger.warning("Unable to load data files in a process pool, loading them one at a time instead: %s", exc)
+    if results is None:
+        results = [_load_data_file(file_path) for file_path in file_paths]
+
+    return {
+        file_path: RuntimeError(error) if error is not None else data
+        for file_path, (data, error) in zip(file_paths, results)
+    }
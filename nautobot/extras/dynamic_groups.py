@@ -0,0 +1,141 @@
+"""Dependency-ordered, optionally parallel, refreshing of Dynamic Group member caches."""
+
+from collections import namedtuple
+import contextlib
+import hashlib
+import logging
+import time
+
+from django.core.cache import cache
+from django.db.models import Max
+import redis.exceptions
+
+from nautobot.core.models.utils import map_in_threads
+from nautobot.extras.choices import DynamicGroupTypeChoices
+from nautobot.extras.models import DynamicGroup, DynamicGroupMembership
+
+logger = logging.getLogger(__name__)
+
+DynamicGroupRefreshResult = namedtuple(
+    "DynamicGroupRefreshResult",
+    ["group", "skipped", "duration", "members_before", "members_after", "error"],
+)
+
+
+def get_dynamic_group_refresh_order(groups):
+    """
+    Sort the given Dynamic Groups into "levels" based on the parent/child graph defined by `DynamicGroupMembership`.
+
+    Every group in a given level has all of its (considered) descendants in earlier levels, and no two groups in the
+    same level are ancestor/descendant of one another, so the groups within a single level can safely be refreshed
+    concurrently.
+
+    Args:
+        groups (iterable): `DynamicGroup` instances to sort.
+
+    Returns:
+        (list[list[DynamicGroup]]): Groups, children before parents.
+    """
+    groups_by_pk = {group.pk: group for group in groups}
+    children = {pk: set() for pk in groups_by_pk}
+    for parent_pk, child_pk in DynamicGroupMembership.objects.filter(
+        parent_group__in=groups_by_pk.keys(), group__in=groups_by_pk.keys()
+    ).values_list("parent_group", "group"):
+        children[parent_pk].add(child_pk)
+
+    depths = {}
+
+    def get_depth(pk, path=()):
+        if pk not in depths:
+            if pk in path:
+                raise RuntimeError(f"Dynamic Group {groups_by_pk[pk]} is its own ancestor")
+            depths[pk] = 1 + max((get_depth(child_pk, (*path, pk)) for child_pk in children[pk]), default=-1)
+        return depths[pk]
+
+    levels = []
+    for pk in sorted(groups_by_pk, key=lambda pk: (get_depth(pk), groups_by_pk[pk].name)):
+        if depths[pk] == len(levels):
+            levels.append([])
+        levels[depths[pk]].append(groups_by_pk[pk])
+    return levels
+
+
+def get_dynamic_group_refresh_fingerprint(group):
+    """
+    Calculate a fingerprint of the inputs that the membership of the given group depends on.
+
+    This covers the definition of the group and all of its descendants, as well as the number and most recent
+    `last_updated` timestamp of the candidate member objects. Changes to other objects that a group's filter refers to
+    indirectly (for example, renaming a Location that a group of Devices filters on by name), or changes made in bulk
+    without updating `last_updated`, are *not* reflected in the fingerprint.
+    """
+    fingerprint = hashlib.sha256()
+    member_groups = [group, *group.get_descendants()]
+    for member_group in member_groups:
+        fingerprint.update(f"{member_group.pk}|{member_group.last_updated}|{member_group.filter}|".encode())
+    for membership in DynamicGroupMembership.objects.filter(parent_group__in=member_groups).order_by("pk"):
+        fingerprint.update(f"{membership.pk}|{membership.operator}|{membership.weight}|".encode())
+
+    queryset = group.model.objects.all()
+    fingerprint.update(f"{queryset.count()}|".encode())
+    if any(field.name == "last_updated" for field in group.model._meta.concrete_fields):
+        fingerprint.update(f"{queryset.aggregate(Max('last_updated'))['last_updated__max']}".encode())
+    return fingerprint.hexdigest()
+
+
+def _get_refresh_fingerprint_cache_key(group):
+    return f"nautobot.extras.dynamicgroup.{group.pk}.refresh_fingerprint"
+
+
+def _refresh_dynamic_group(group, skip_unchanged):
+    """Refresh a single group's member cache, returning a `DynamicGroupRefreshResult`."""
+    start_time = time.monotonic()
+    try:
+        fingerprint = None
+        if skip_unchanged:
+            fingerprint = get_dynamic_group_refresh_fingerprint(group)
+            with contextlib.suppress(redis.exceptions.ConnectionError):
+                if cache.get(_get_refresh_fingerprint_cache_key(group)) == fingerprint:
+                    return DynamicGroupRefreshResult(group, True, time.monotonic() - start_time, None, None, None)
+
+        members_before = group.count
+        group.update_cached_members()
+        members_after = group.count
+
+        if fingerprint is not None:
+            with contextlib.suppress(redis.exceptions.ConnectionError):
+                cache.set(_get_refresh_fingerprint_cache_key(group), fingerprint, timeout=None)
+
+        return DynamicGroupRefreshResult(
+            group, False, time.monotonic() - start_time, members_before, members_after, None
+        )
+    except Exception as exc:
+        logger.warning("Unable to refresh the member cache for %s: %s", group, exc)
+        return DynamicGroupRefreshResult(group, False, time.monotonic() - start_time, None, None, exc)
+
+
+def refresh_dynamic_group_member_caches(groups=None, workers=1, skip_unchanged=False):
+    """
+    Refresh the member caches of the given (or all) non-static Dynamic Groups.
+
+    Groups are refreshed in dependency order (child groups before their parents); groups that have no such dependency
+    on one another are refreshed concurrently, using up to `workers` threads, each with its own database connection.
+
+    Args:
+        groups (QuerySet, optional): Dynamic Groups to refresh; defaults to all groups. Static groups are ignored.
+        workers (int): Maximum number of groups to refresh concurrently. If `1`, or if called inside a transaction,
+            refresh in the calling thread.
+        skip_unchanged (bool): Skip groups whose `get_dynamic_group_refresh_fingerprint()` hasn't changed since the
+            last time they were refreshed with this option set.
+
+    Yields:
+        (DynamicGroupRefreshResult): Per-group timing and member-count information, as each group is processed.
+    """
+    if groups is None:
+        groups = DynamicGroup.objects.all()
+    groups = groups.exclude(group_type=DynamicGroupTypeChoices.TYPE_STATIC).select_related("content_type")
+
+    levels = get_dynamic_group_refresh_order(groups)
+
+    for level in levels:
+        yield from map_in_threads(_refresh_dynamic_group, level, [skip_unchanged] * len(level), workers=workers)
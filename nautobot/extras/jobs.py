@@ -19,7 +19,7 @@ from django import forms
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.core.exceptions import ObjectDoesNotExist
-from django.core.files.base import ContentFile
+from django.core.files.base import ContentFile, File
 from django.core.files.uploadedfile import UploadedFile
 from django.core.validators import RegexValidator
 from django.db.models import Model
@@ -29,7 +29,7 @@ from django.utils.functional import classproperty
 import netaddr
 import yaml
 
-from nautobot.core.celery import import_jobs, nautobot_task
+from nautobot.core.celery import flush_job_logs, import_jobs, nautobot_task
 from nautobot.core.forms import (
     DynamicModelChoiceField,
     DynamicModelMultipleChoiceField,
@@ -711,7 +711,8 @@ class BaseJob:
 
         Args:
             filename (str): Name of the file to create, including extension
-            content (str, bytes): Content to populate the created file with.
+            content (str, bytes, file): Content to populate the created file with. For large content, a binary file
+                object (such as a `tempfile.TemporaryFile`) can be provided, to avoid holding it all in memory.
 
         Raises:
             (ValueError): if the provided content exceeds JOB_CREATE_FILE_MAX_SIZE in length
@@ -721,13 +722,18 @@ class BaseJob:
         """
         if isinstance(content, str):
             content = content.encode("utf-8")
+        if isinstance(content, bytes):
+            actual_size = len(content)
+            file = ContentFile(content, name=filename)
+        else:
+            content.seek(0, os.SEEK_END)
+            actual_size = content.tell()
+            content.seek(0)
+            file = File(content, name=filename)
         max_size = get_settings_or_config("JOB_CREATE_FILE_MAX_SIZE")
-        actual_size = len(content)
         if actual_size > max_size:
             raise ValueError(f"Provided {actual_size} bytes of content, but JOB_CREATE_FILE_MAX_SIZE is {max_size}")
-        fp = FileProxy.objects.create(
-            name=filename, job_result=self.job_result, file=ContentFile(content, name=filename)
-        )
+        fp = FileProxy.objects.create(name=filename, job_result=self.job_result, file=file)
         self.logger.info("Created file [%s](%s)", filename, fp.file.url)
         return fp
 
@@ -1144,6 +1150,9 @@ def run_job(self, job_class_path, *args, **kwargs):
         job.on_failure(exc, self.request.id, args, kwargs, einfo)
         job.after_return(JobResultStatusChoices.STATUS_FAILURE, exc, self.request.id, args, kwargs, einfo)
         raise
+    finally:
+        # Make sure all log entries are saved before the task result is
+        flush_job_logs(self.request.id)
 
 
 def enqueue_job_hooks(object_change, may_reload_jobs=True, jobhook_queryset=None):
@@ -0,0 +1,87 @@
+import time
+import uuid
+
+from django.contrib.auth import get_user_model
+from django.contrib.contenttypes.models import ContentType
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from nautobot.extras.change_logging import ObjectChangeWriter, PostgreSQLCopyObjectChangeWriter
+from nautobot.extras.choices import ObjectChangeActionChoices
+from nautobot.extras.context_managers import ORMChangeContext
+from nautobot.extras.models import ObjectChange, Tag
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure the throughput (objects per second) of bulk change logging with each available ObjectChange writer. "
+        "All objects and records created by this command are rolled back afterwards."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--count",
+            type=int,
+            default=10000,
+            help="Number of objects to create and log changes for with each writer (default: 10000)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            dest="batch_size",
+            help="Number of ObjectChange records to write at a time (default: 1000)",
+        )
+        parser.add_argument(
+            "--username",
+            help="User to attribute the changes to (default: the first superuser)",
+        )
+
+    def handle(self, *args, **kwargs):
+        User = get_user_model()
+        if kwargs["username"]:
+            try:
+                user = User.objects.get(username=kwargs["username"])
+            except User.DoesNotExist:
+                raise CommandError(f"User {kwargs['username']} not found")
+        else:
+            user = User.objects.filter(is_superuser=True).first()
+            if user is None:
+                raise CommandError("No superuser found; please specify a --username")
+
+        writers = {
+            "ObjectChangeWriter (bulk_create)": ObjectChangeWriter(batch_size=kwargs["batch_size"]),
+            "PostgreSQLCopyObjectChangeWriter (background=False)": PostgreSQLCopyObjectChangeWriter(
+                batch_size=kwargs["batch_size"], background=False
+            ),
+            "PostgreSQLCopyObjectChangeWriter (background=True)": PostgreSQLCopyObjectChangeWriter(
+                batch_size=kwargs["batch_size"], background=True
+            ),
+        }
+
+        self.stdout.write(self.style.NOTICE(f"Benchmarking change logging for {kwargs['count']} objects..."))
+        for name, writer in writers.items():
+            duration = self.run_benchmark(writer, user, kwargs["count"])
+            self.stdout.write(f"    {name}: {duration:.3f}s ({kwargs['count'] / duration:.1f} objects/second)")
+
+    def run_benchmark(self, writer, user, count):
+        """Time the creation of ObjectChange records for `count` newly created objects, then roll back."""
+        tag_ct = ContentType.objects.get_for_model(Tag)
+        with transaction.atomic():
+            change_context = ORMChangeContext(user=user)
+            prefix = f"benchmark-{uuid.uuid4()}"
+            tags = Tag.objects.bulk_create(Tag(name=f"{prefix}-{i}") for i in range(count))
+            for tag in tags:
+                change_context.deferred_object_changes[f"{tag_ct.pk}__{tag.pk}__{user.pk}"] = [
+                    {"action": ObjectChangeActionChoices.ACTION_CREATE, "instance": tag, "user": user}
+                ]
+
+            start_time = time.monotonic()
+            change_context.create_object_changes(writer=writer)
+            duration = time.monotonic() - start_time
+
+            written = ObjectChange.objects.filter(request_id=change_context.change_id).count()
+            if written != count:
+                raise CommandError(f"Expected {count} ObjectChange records to be written, but found {written}")
+            transaction.set_rollback(True)
+        return duration
@@ -0,0 +1,41 @@
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.core.management.base import BaseCommand
+
+from nautobot.extras import search_index
+from nautobot.extras.models import SearchIndexEntry
+
+
+class Command(BaseCommand):
+    help = "Rebuild the global search index of all searchable objects."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            dest="batch_size",
+            help="Number of objects to index at a time (default: 1000)",
+        )
+
+    def handle(self, *args, **kwargs):
+        if not settings.SEARCH_INDEX_ENABLED:
+            self.stdout.write(
+                self.style.WARNING("SEARCH_INDEX_ENABLED is not set, so the search index will not be used or updated")
+            )
+
+        indexed_models = [
+            model for model in search_index.get_searchable_models() if search_index.is_indexed_model(model)
+        ]
+
+        # Remove entries of any models that are no longer indexed
+        deleted_count, _ = SearchIndexEntry.objects.exclude(
+            content_type__in=ContentType.objects.get_for_models(*indexed_models).values()
+        ).delete()
+        if deleted_count:
+            self.stdout.write(f"Removed {deleted_count} entries of models that are no longer indexed")
+
+        for model in indexed_models:
+            self.stdout.write(self.style.NOTICE(f"Indexing {model._meta.verbose_name_plural}..."))
+            count = search_index.rebuild_search_index(model, batch_size=kwargs["batch_size"])
+            self.stdout.write(f"    Indexed {count} {model._meta.verbose_name_plural}")
@@ -1,17 +1,39 @@
 from django.core.management.base import BaseCommand
 
-from nautobot.extras.models import DynamicGroup
+from nautobot.extras.dynamic_groups import refresh_dynamic_group_member_caches
 
 
 class Command(BaseCommand):
     help = "Update the member caches for all DynamicGroups."
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Maximum number of independent groups to refresh concurrently (default: 1)",
+        )
+        parser.add_argument(
+            "--skip-unchanged",
+            action="store_true",
+            dest="skip_unchanged",
+            help="Skip groups whose definition and candidate member objects have not changed since their last refresh",
+        )
+
     def handle(self, *args, **kwargs):
         """Run through all Dynamic Groups and ensure their member caches are up to date."""
 
         self.stdout.write(self.style.NOTICE("Refreshing DynamicGroup member caches..."))
 
-        dynamic_groups = DynamicGroup.objects.all()
-
-        for dynamic_group in dynamic_groups:
-            dynamic_group.update_cached_members()
+        for result in refresh_dynamic_group_member_caches(
+            workers=kwargs["workers"], skip_unchanged=kwargs["skip_unchanged"]
+        ):
+            if result.error is not None:
+                self.stderr.write(self.style.ERROR(f"    {result.group}: failed: {result.error}"))
+            elif result.skipped:
+                self.stdout.write(f"    {result.group}: unchanged, skipped ({result.duration:.3f}s)")
+            else:
+                self.stdout.write(
+                    f"    {result.group}: {result.members_before} -> {result.members_after} members "
+                    f"({result.members_after - result.members_before:+d}) in {result.duration:.3f}s"
+                )
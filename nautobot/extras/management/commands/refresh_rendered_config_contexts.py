@@ -0,0 +1,71 @@
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.core.management.base import BaseCommand, CommandError
+
+from nautobot.dcim.models import Device
+from nautobot.extras.models import RenderedConfigContext
+from nautobot.virtualization.models import VirtualMachine
+
+
+class Command(BaseCommand):
+    help = "Recompute the stored (materialized) rendered config context of all Devices and Virtual Machines."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Instead of refreshing, report any objects whose stored config context is missing or out of date",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            dest="batch_size",
+            help="Number of objects to refresh at a time (default: 1000)",
+        )
+
+    def handle(self, *args, **kwargs):
+        if not settings.CONFIG_CONTEXT_MATERIALIZATION_ENABLED:
+            self.stdout.write(
+                self.style.WARNING(
+                    "CONFIG_CONTEXT_MATERIALIZATION_ENABLED is not set, so stored config contexts will not be used"
+                )
+            )
+
+        if kwargs["check"]:
+            self.check_rendered_config_contexts()
+            return
+
+        for model in (Device, VirtualMachine):
+            self.stdout.write(
+                self.style.NOTICE(f"Refreshing rendered config contexts for {model._meta.verbose_name_plural}...")
+            )
+            count = model.objects.all().refresh_rendered_config_contexts(batch_size=kwargs["batch_size"])
+            self.stdout.write(f"    Refreshed {count} {model._meta.verbose_name_plural}")
+
+    def check_rendered_config_contexts(self):
+        """Compare the stored config context of each Device and VM against a freshly computed one."""
+        missing = 0
+        mismatched = 0
+        for model in (Device, VirtualMachine):
+            self.stdout.write(
+                self.style.NOTICE(f"Checking rendered config contexts for {model._meta.verbose_name_plural}...")
+            )
+            stored_data = dict(
+                RenderedConfigContext.objects.filter(
+                    assigned_object_type=ContentType.objects.get_for_model(model)
+                ).values_list("assigned_object_id", "data")
+            )
+            for obj in model.objects.iterator():
+                if obj.pk not in stored_data:
+                    missing += 1
+                    self.stdout.write(f"    {obj}: no stored config context")
+                elif stored_data[obj.pk] != obj.render_config_context():
+                    mismatched += 1
+                    self.stderr.write(self.style.ERROR(f"    {obj}: stored config context is out of date"))
+
+        self.stdout.write(f"{missing} missing and {mismatched} out-of-date stored config contexts found")
+        if mismatched:
+            raise CommandError(
+                f"{mismatched} stored config contexts are out of date; run `nautobot-server refresh_rendered_config_contexts`"
+            )
@@ -0,0 +1,20 @@
+# Generated by Django 4.2.16 on 2024-12-05 09:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("extras", "0116_fix_dynamic_group_group_type_data_migration"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="webhook",
+            name="batch_size",
+            field=models.PositiveIntegerField(
+                default=0,
+                help_text="If greater than 0, the changes made in a single request or Job are sent to this webhook in batches of up to this many changes per request. The request body and headers of a batch are rendered with a single context key, <code>events</code>, listing the context data of each change; this format is used for every request sent by this webhook, even if it describes only a single change.",
+            ),
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 4.2.16 on 2024-12-02 15:04
+
+import uuid
+
+import django.core.serializers.json
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("contenttypes", "0002_remove_content_type_name"),
+        ("extras", "0117_webhook_batch_size"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RenderedConfigContext",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True
+                    ),
+                ),
+                ("assigned_object_id", models.UUIDField()),
+                ("data", models.JSONField(encoder=django.core.serializers.json.DjangoJSONEncoder)),
+                ("last_updated", models.DateTimeField(auto_now=True)),
+                (
+                    "assigned_object_type",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="contenttypes.contenttype",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["assigned_object_type", "assigned_object_id"],
+                "unique_together": {("assigned_object_type", "assigned_object_id")},
+            },
+        ),
+    ]
@@ -0,0 +1,69 @@
+# Generated by Django 4.2.16 on 2024-12-03 10:12
+
+import logging
+import uuid
+
+from django.db import migrations, models, transaction
+import django.db.models.deletion
+
+logger = logging.getLogger(__name__)
+
+
+def create_trigram_index(apps, schema_editor):
+    """On PostgreSQL, add a trigram index so that substring searches of the search index don't need a full scan."""
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    table = apps.get_model("extras", "SearchIndexEntry")._meta.db_table
+    try:
+        with transaction.atomic(using=schema_editor.connection.alias):
+            schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+            schema_editor.execute(
+                f"CREATE INDEX extras_searchindexentry_value_trgm ON {table} USING gin (value gin_trgm_ops)"
+            )
+    except Exception as exc:
+        # The global search will still work, just more slowly
+        logger.warning("Unable to create a trigram index for the global search index: %s", exc)
+
+
+def drop_trigram_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("DROP INDEX IF EXISTS extras_searchindexentry_value_trgm")
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("contenttypes", "0002_remove_content_type_name"),
+        ("extras", "0118_renderedconfigcontext"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SearchIndexEntry",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True
+                    ),
+                ),
+                ("object_id", models.UUIDField()),
+                ("value", models.TextField()),
+                ("last_updated", models.DateTimeField(auto_now=True)),
+                (
+                    "content_type",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="contenttypes.contenttype",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name_plural": "search index entries",
+                "ordering": ["content_type", "object_id"],
+                "unique_together": {("content_type", "object_id")},
+            },
+        ),
+        migrations.RunPython(create_trigram_index, drop_trigram_index),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 4.2.16 on 2024-12-09 11:27
+
+import django.core.serializers.json
+from django.db import migrations
+
+import nautobot.core.models.fields
+
+
+def delete_rendered_config_contexts(apps, schema_editor):
+    """Delete the existing materialized config contexts, whose key order may have been lost; they're recomputed on demand."""
+    RenderedConfigContext = apps.get_model("extras", "RenderedConfigContext")
+    RenderedConfigContext.objects.all().delete()
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("extras", "0119_searchindexentry"),
+    ]
+
+    operations = [
+        migrations.RunPython(delete_rendered_config_contexts, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="renderedconfigcontext",
+            name="data",
+            field=nautobot.core.models.fields.OrderedJSONField(encoder=django.core.serializers.json.DjangoJSONEncoder),
+        ),
+    ]
@@ -27,7 +27,9 @@ from .models import (
     HealthCheckTestModel,
     ImageAttachment,
     Note,
+    RenderedConfigContext,
     SavedView,
+    SearchIndexEntry,
     UserSavedViewAssociation,
     Webhook,
 )
@@ -75,12 +77,14 @@ __all__ = (
     "Relationship",
     "RelationshipModel",
     "RelationshipAssociation",
+    "RenderedConfigContext",
     "Role",
     "RoleField",
     "SavedView",
     "SavedViewMixin",
     "ScheduledJob",
     "ScheduledJobs",
+    "SearchIndexEntry",
     "Secret",
     "SecretsGroup",
     "SecretsGroupAssociation",
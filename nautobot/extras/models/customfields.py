@@ -32,6 +32,7 @@ from nautobot.core.forms import (
 from nautobot.core.models import BaseManager, BaseModel
 from nautobot.core.models.fields import AutoSlugField, slugify_dashes_to_underscores
 from nautobot.core.models.querysets import RestrictedQuerySet
+from nautobot.core.models.utils import map_in_threads
 from nautobot.core.models.validators import validate_regex
 from nautobot.core.settings_funcs import is_truthy
 from nautobot.core.templatetags.helpers import render_markdown
@@ -63,6 +64,47 @@ class ComputedFieldManager(BaseManager.from_queryset(RestrictedQuerySet)):
 
     get_for_model.cache_key_prefix = "nautobot.extras.computedfield.get_for_model"
 
+    def render_for_objects(self, objects, label_as_key=False, advanced_ui=None, workers=1):
+        """
+        Render the ComputedFields of each of the given objects.
+
+        This is a more efficient alternative to calling `get_computed_fields()` on each object in turn, as the
+        applicable ComputedFields are only looked up once for all of the objects.
+
+        Args:
+            objects (list, QuerySet): Objects to render the computed fields of, all of the same model.
+            label_as_key (bool): Key each object's rendered values by the ComputedField label rather than its key.
+            advanced_ui (bool): If set, only render ComputedFields with the matching `advanced_ui` value.
+            workers (int): Maximum number of objects to render concurrently. If `1`, or if called inside a transaction,
+                render in the calling thread.
+
+        Returns:
+            (dict): `{pk: {key: rendered_value}}`, for each of the given objects.
+        """
+        objects = list(objects)
+        if not objects:
+            return {}
+        computed_fields = self.get_for_model(type(objects[0]))
+        if advanced_ui is not None:
+            computed_fields = computed_fields.filter(advanced_ui=advanced_ui)
+        computed_fields = list(computed_fields)
+        if not computed_fields:
+            return {obj.pk: {} for obj in objects}
+
+        results = map_in_threads(
+            _render_computed_fields,
+            [computed_fields] * len(objects),
+            objects,
+            [label_as_key] * len(objects),
+            workers=workers,
+        )
+        return {obj.pk: result for obj, result in zip(objects, results)}
+
+
+def _render_computed_fields(computed_fields, obj, label_as_key):
+    """Render the given ComputedFields for a single object."""
+    return {cf.label if label_as_key else cf.key: cf.render(context={"obj": obj}) for cf in computed_fields}
+
 
 @extras_features("graphql")
 class ComputedField(
@@ -354,15 +396,10 @@ class CustomFieldModel(models.Model):
         Return a dictionary of all computed fields and their rendered values for this model.
         Keys are the `key` value of each field. If label_as_key is True, `label` values of each field are used as keys.
         """
-        computed_fields_dict = {}
         computed_fields = ComputedField.objects.get_for_model(self)
         if advanced_ui is not None:
             computed_fields = computed_fields.filter(advanced_ui=advanced_ui)
-        if not computed_fields:
-            return {}
-        for cf in computed_fields:
-            computed_fields_dict[cf.label if label_as_key else cf.key] = cf.render(context={"obj": self})
-        return computed_fields_dict
+        return _render_computed_fields(computed_fields, self, label_as_key)
 
 
 class CustomFieldManager(BaseManager.from_queryset(RestrictedQuerySet)):
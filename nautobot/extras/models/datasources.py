@@ -80,6 +80,10 @@ class GitRepository(PrimaryModel):
         # Store the initial repo slug so we can check for changes on save().
         self.__initial_slug = self.slug
 
+        # Commit whose contents were most recently synced into the database, if known, set by the `GitRepositorySync`
+        # job so that only the files changed since that commit need to be refreshed. Not stored in the database.
+        self.previous_head = None
+
     def __str__(self):
         return self.name
 
@@ -115,10 +119,15 @@ class GitRepository(PrimaryModel):
                     "provides contents overlapping with this repository."
                 )
 
-        # Changing branch or remote_url invalidates current_head
+        # Changing branch, remote_url, or provided_contents invalidates current_head
+        # (the latter so that the next sync refreshes all files, rather than only the files changed since current_head)
         if self.present_in_database:
             past = GitRepository.objects.get(id=self.id)
-            if self.remote_url != past.remote_url or self.branch != past.branch:
+            if (
+                self.remote_url != past.remote_url
+                or self.branch != past.branch
+                or sorted(self.provided_contents) != sorted(past.provided_contents)
+            ):
                 self.current_head = ""
 
     def get_latest_sync(self):
@@ -148,13 +157,14 @@ class GitRepository(PrimaryModel):
     def filesystem_path(self):
         return os.path.join(settings.GIT_ROOT, self.slug)
 
-    def sync(self, user, dry_run=False):
+    def sync(self, user, dry_run=False, full_resync=False):
         """
         Enqueue a Job to pull the Git repository from the remote and return the sync result.
 
         Args:
             user (User): The User that will perform the sync.
             dry_run (bool): If set, dry-run the Git sync.
+            full_resync (bool): If set, refresh data from all files in the repository, not just the changed files.
 
         Returns:
             JobResult
@@ -166,4 +176,4 @@ class GitRepository(PrimaryModel):
 
         if dry_run:
             return enqueue_git_repository_diff_origin_and_local(self, user)
-        return enqueue_pull_git_repository_and_refresh_data(self, user)
+        return enqueue_pull_git_repository_and_refresh_data(self, user, full_resync=full_resync)
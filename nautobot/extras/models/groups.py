@@ -449,6 +449,57 @@ class DynamicGroup(PrimaryModel):
 
         return members
 
+    def update_cached_members_for_objects(self, pks):
+        """
+        Incrementally update the cached members of this group, considering only the objects with the given `pks`.
+
+        Rather than re-evaluating the entire group, this checks only the given objects against the group's filter and
+        adds or removes just their cached associations, using a fixed number of queries regardless of `len(pks)`.
+        Primary keys of objects that no longer exist are simply treated as non-members.
+
+        Args:
+            pks (iterable): Primary keys of objects of this group's `content_type` that may have changed.
+
+        Returns:
+            (tuple[int, int]): The number of member associations added and removed, respectively.
+        """
+        if self.group_type == DynamicGroupTypeChoices.TYPE_STATIC:
+            return (0, 0)  # nothing to do
+        if self.group_type not in (
+            DynamicGroupTypeChoices.TYPE_DYNAMIC_FILTER,
+            DynamicGroupTypeChoices.TYPE_DYNAMIC_SET,
+        ):
+            raise RuntimeError(f"Unknown/invalid group_type {self.group_type}")
+
+        pks = set(pks)
+        if not pks or self.model is None:
+            return (0, 0)
+
+        matching_pks = set(self._get_group_queryset().filter(pk__in=pks).values_list("pk", flat=True))
+        cached_pks = set(
+            self.static_group_associations(manager="all_objects")
+            .filter(associated_object_id__in=pks)
+            .values_list("associated_object_id", flat=True)
+        )
+
+        to_add = matching_pks - cached_pks
+        to_remove = cached_pks - matching_pks
+        if to_remove:
+            self._remove_members(self.model.objects.filter(pk__in=to_remove))
+        if to_add:
+            StaticGroupAssociation.all_objects.bulk_create(
+                [
+                    StaticGroupAssociation(
+                        dynamic_group=self, associated_object_type=self.content_type, associated_object_id=pk
+                    )
+                    for pk in to_add
+                ],
+                batch_size=1000,
+            )
+
+        logger.debug("Incrementally refreshed cache for %s: %d added, %d removed", self, len(to_add), len(to_remove))
+        return (len(to_add), len(to_remove))
+
     def has_member(self, obj, use_cache=False):
         """
         Return True if the given object is a member of this group.
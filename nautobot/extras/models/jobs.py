@@ -761,6 +761,21 @@ class JobResult(BaseModel, CustomFieldModel):
         level_choice (LogLevelChoices): Message severity level
         grouping (str): Grouping to store the log message under
         """
+        log = self.build_log_entry(message, obj=obj, level_choice=level_choice, grouping=grouping)
+        log.save(using=self.log_database)
+
+    def build_log_entry(
+        self,
+        message,
+        obj=None,
+        level_choice=LogLevelChoices.LOG_INFO,
+        grouping="main",
+    ):
+        """
+        Construct, but don't save, a JobLogEntry associated with this JobResult; see `log()` for the arguments.
+
+        Used to save many log entries at once with `JobLogEntry.objects.using(self.log_database).bulk_create()`.
+        """
         if level_choice not in LogLevelChoices.as_dict():
             raise ValueError(f"Unknown logging level: {level_choice}")
 
@@ -788,14 +803,18 @@ class JobResult(BaseModel, CustomFieldModel):
                 log_object=str(obj)[:JOB_LOG_MAX_LOG_OBJECT_LENGTH] if obj else "",
                 absolute_url="",
             )
+        return log
+
+    @property
+    def log_database(self):
+        """Database to save the JobLogEntry records of this JobResult to, or None to use the default database."""
         # If the override is provided, we want to use the default database(pass no using argument)
         # Otherwise we want to use a separate database here so that the logs are created immediately
         # instead of within transaction.atomic(). This allows us to be able to report logs when the jobs
         # are running, and allow us to rollback the database without losing the log entries.
         if not self.use_job_logs_db or not JOB_LOGS:
-            log.save()
-        else:
-            log.save(using=JOB_LOGS)
+            return None
+        return JOB_LOGS
 
 
 #
@@ -51,9 +51,20 @@ class DynamicGroupMixin:
     def dynamic_groups(self):
         """
         Return a queryset of (cached) `DynamicGroup` objects this instance is a member of.
+
+        If `DynamicGroup.objects.prefetch_for_objects()` was previously called for this instance, the returned queryset
+        is pre-populated from that lookup and evaluating it does not require a further database query.
         """
         from nautobot.extras.models.groups import DynamicGroup
 
+        prefetched_dynamic_groups = getattr(self, "_prefetched_dynamic_groups", None)
+        if prefetched_dynamic_groups is not None:
+            queryset = DynamicGroup.objects.filter(pk__in=[group.pk for group in prefetched_dynamic_groups])
+            # Same approach as Django's own prefetch_related() uses to pre-populate a related manager's queryset
+            queryset._result_cache = list(prefetched_dynamic_groups)
+            queryset._prefetch_done = True
+            return queryset
+
         return DynamicGroup.objects.get_for_object(self)
 
     @property
@@ -5,8 +5,9 @@ from db_file_storage.model_utils import delete_file, delete_file_if_needed
 from db_file_storage.storage import DatabaseFileStorage
 from django.conf import settings
 from django.contrib.auth import get_user_model
-from django.contrib.contenttypes.fields import GenericForeignKey
+from django.contrib.contenttypes.fields import GenericForeignKey, GenericRelation
 from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
 from django.core.files.storage import get_storage_class
 from django.core.serializers.json import DjangoJSONEncoder
@@ -23,8 +24,9 @@ from rest_framework.utils.encoders import JSONEncoder
 
 from nautobot.core.constants import CHARFIELD_MAX_LENGTH
 from nautobot.core.models import BaseManager, BaseModel
-from nautobot.core.models.fields import ForeignKeyWithAutoRelatedName, LaxURLField
+from nautobot.core.models.fields import ForeignKeyWithAutoRelatedName, LaxURLField, OrderedJSONField
 from nautobot.core.models.generics import OrganizationalModel, PrimaryModel
+from nautobot.core.models.querysets import RestrictedQuerySet
 from nautobot.core.utils.data import deepmerge, render_jinja2
 from nautobot.extras.choices import (
     ButtonClassChoices,
@@ -190,6 +192,13 @@ class ConfigContextModel(models.Model, ConfigContextSchemaValidationMixin):
         ct_field="local_config_context_data_owner_content_type",
         fk_field="local_config_context_data_owner_object_id",
     )
+    # Reverse relation so that deleting a ConfigContextModel automatically deletes its RenderedConfigContext, if any.
+    rendered_config_contexts = GenericRelation(
+        "extras.RenderedConfigContext",
+        content_type_field="assigned_object_type",
+        object_id_field="assigned_object_id",
+        related_query_name="rendered_config_contexts_%(app_label)s_%(class)s",
+    )
 
     class Meta:
         abstract = True
@@ -202,6 +211,29 @@ class ConfigContextModel(models.Model, ConfigContextSchemaValidationMixin):
     def get_config_context(self):
         """
         Return the rendered configuration context for a device or VM.
+
+        If `settings.CONFIG_CONTEXT_MATERIALIZATION_ENABLED` is set, the previously materialized `RenderedConfigContext`
+        for this object is returned if available, rather than computing it from scratch.
+        """
+        if settings.CONFIG_CONTEXT_MATERIALIZATION_ENABLED:
+            if hasattr(self, "rendered_config_context_data"):
+                rendered_data = self.rendered_config_context_data
+            else:
+                rendered_data = (
+                    RenderedConfigContext.objects.filter(
+                        assigned_object_type=ContentType.objects.get_for_model(self), assigned_object_id=self.pk
+                    )
+                    .values_list("data", flat=True)
+                    .first()
+                )
+            if rendered_data is not None:
+                return rendered_data
+
+        return self.render_config_context()
+
+    def render_config_context(self):
+        """
+        Compute the rendered configuration context for a device or VM from all applicable ConfigContexts.
         """
         if not hasattr(self, "config_context_data"):
             # Annotation not available, so fall back to manually querying for the config context
@@ -240,6 +272,30 @@ class ConfigContextModel(models.Model, ConfigContextSchemaValidationMixin):
         self._validate_with_schema("local_config_context_data", "local_config_context_schema")
 
 
+class RenderedConfigContext(BaseModel):
+    """
+    The materialized (fully merged) config context of a single Device or VirtualMachine.
+
+    This is an implementation detail of `settings.CONFIG_CONTEXT_MATERIALIZATION_ENABLED` and is not change-logged.
+    """
+
+    assigned_object_type = models.ForeignKey(to=ContentType, on_delete=models.CASCADE, related_name="+")
+    assigned_object_id = models.UUIDField()
+    assigned_object = GenericForeignKey(ct_field="assigned_object_type", fk_field="assigned_object_id")
+    # Not a JSONField, as JSONB storage on PostgreSQL would lose the weight-merged order of keys
+    data = OrderedJSONField(encoder=DjangoJSONEncoder)
+    last_updated = models.DateTimeField(auto_now=True)
+
+    is_metadata_associable_model = False
+
+    class Meta:
+        unique_together = [["assigned_object_type", "assigned_object_id"]]
+        ordering = ["assigned_object_type", "assigned_object_id"]
+
+    def __str__(self):
+        return f"Rendered config context for {self.assigned_object}"
+
+
 @extras_features(
     "custom_validators",
     "graphql",
@@ -905,11 +961,59 @@ class UserSavedViewAssociation(BaseModel):
         self.view_name = self.saved_view.view
 
 
+#
+# Search index
+#
+
+
+class SearchIndexEntry(BaseModel):
+    """
+    The searchable text of a single object, as used by the global search when `settings.SEARCH_INDEX_ENABLED` is set.
+
+    This is an implementation detail of the global search and is not change-logged. An entry whose `object_id` is the
+    nil UUID records that the index of its content type has been fully built (see `rebuild_search_index()`).
+    """
+
+    content_type = models.ForeignKey(to=ContentType, on_delete=models.CASCADE, related_name="+")
+    object_id = models.UUIDField()
+    object = GenericForeignKey(ct_field="content_type", fk_field="object_id")
+    # Lower-cased values of the object's substring-searchable fields, one per line
+    value = models.TextField()
+    last_updated = models.DateTimeField(auto_now=True)
+
+    is_metadata_associable_model = False
+
+    class Meta:
+        unique_together = [["content_type", "object_id"]]
+        ordering = ["content_type", "object_id"]
+        verbose_name_plural = "search index entries"
+
+    def __str__(self):
+        return f"Search index entry for {self.object}"
+
+
 #
 # Webhooks
 #
 
 
+class WebhookManager(BaseManager.from_queryset(RestrictedQuerySet)):
+    def get_for_model(self, model):
+        """
+        Return all enabled Webhooks assigned to the given model.
+        """
+        concrete_model = model._meta.concrete_model
+        cache_key = f"{self.get_for_model.cache_key_prefix}.{concrete_model._meta.label_lower}"
+        queryset = cache.get(cache_key)
+        if queryset is None:
+            content_type = ContentType.objects.get_for_model(concrete_model)
+            queryset = self.get_queryset().filter(content_types=content_type, enabled=True)
+            cache.set(cache_key, queryset)
+        return queryset
+
+    get_for_model.cache_key_prefix = "nautobot.extras.webhook.get_for_model"
+
+
 @extras_features("graphql")
 class Webhook(
     ChangeLoggedModel,
@@ -967,6 +1071,13 @@ class Webhook(
         "included. Available context data includes: <code>event</code>, <code>model</code>, "
         "<code>timestamp</code>, <code>username</code>, <code>request_id</code>, and <code>data</code>.",
     )
+    batch_size = models.PositiveIntegerField(
+        default=0,
+        help_text="If greater than 0, the changes made in a single request or Job are sent to this webhook in batches of "
+        "up to this many changes per request. The request body and headers of a batch are rendered with a single "
+        "context key, <code>events</code>, listing the context data of each change; this format is used for every "
+        "request sent by this webhook, even if it describes only a single change.",
+    )
     secret = models.CharField(
         max_length=CHARFIELD_MAX_LENGTH,
         blank=True,
@@ -989,6 +1100,8 @@ class Webhook(
         default="",
     )
 
+    objects = WebhookManager()
+
     class Meta:
         ordering = ("name",)
 
@@ -134,6 +134,115 @@ class RelationshipModel(models.Model):
 
         return resp
 
+    @classmethod
+    def get_relationships_for_objects(cls, objects, include_hidden=False):
+        """
+        Return the relationships and associations of each of the given objects, as a bulk equivalent to calling
+        `get_relationships()` on each object in turn.
+
+        All RelationshipAssociations of the objects are fetched with one query per side, and the objects at the
+        other end of each association are fetched with one query per content type, so that calling `get_source()`,
+        `get_destination()`, or `get_peer()` on the returned associations doesn't require any further queries.
+
+        Args:
+            objects (list, QuerySet): Objects of this model.
+            include_hidden (bool): Whether to include relationships that are hidden on this model's side.
+
+        Returns:
+            (dict): `{pk: relationships}`, where `relationships` is structured like the return value of
+                `get_relationships()`, but with lists of RelationshipAssociations rather than querysets.
+        """
+        objects_by_pk = {obj.pk: obj for obj in objects}
+        resp_by_pk = {
+            pk: {
+                RelationshipSideChoices.SIDE_SOURCE: {},
+                RelationshipSideChoices.SIDE_DESTINATION: {},
+                RelationshipSideChoices.SIDE_PEER: {},
+            }
+            for pk in objects_by_pk
+        }
+        if not objects_by_pk:
+            return resp_by_pk
+
+        src_relationships, dst_relationships = Relationship.objects.get_for_model(cls)
+        content_type = ContentType.objects.get_for_model(cls)
+        sides = {
+            RelationshipSideChoices.SIDE_SOURCE: src_relationships,
+            RelationshipSideChoices.SIDE_DESTINATION: dst_relationships,
+        }
+
+        # Determine which relationships apply to which objects, as per get_relationships()
+        applicable_pks = {}
+        for side, relationships in sides.items():
+            for relationship in relationships:
+                if getattr(relationship, f"{side}_hidden") and not include_hidden:
+                    continue
+                pks = set(objects_by_pk)
+                if getattr(relationship, f"{side}_filter"):
+                    filterset = get_filterset_for_model(cls)
+                    if filterset:
+                        filter_params = getattr(relationship, f"{side}_filter")
+                        queryset = cls.objects.filter(pk__in=pks)
+                        pks = set(filterset(filter_params, queryset).qs.values_list("pk", flat=True))
+                side_key = RelationshipSideChoices.SIDE_PEER if relationship.symmetric else side
+                applicable_pks.setdefault((side_key, relationship), set()).update(pks)
+                for pk in pks:
+                    resp_by_pk[pk][side_key][relationship] = []
+
+        # Fetch the associations of all of the objects, one query per side
+        associations_with_side = []
+        for side in (RelationshipSideChoices.SIDE_SOURCE, RelationshipSideChoices.SIDE_DESTINATION):
+            relationships = [
+                relationship
+                for side_key, relationship in applicable_pks
+                if side_key == side or side_key == RelationshipSideChoices.SIDE_PEER
+            ]
+            if not relationships:
+                continue
+            associations = RelationshipAssociation.objects.filter(
+                relationship__in=relationships,
+                **{f"{side}_type": content_type, f"{side}_id__in": list(objects_by_pk)},
+            ).select_related("relationship")
+            associations_with_side.extend((side, association) for association in associations)
+
+        # Fetch the objects at the other end of the associations, one query per content type
+        other_ids_by_type = {}
+        for side, association in associations_with_side:
+            other_side = RelationshipSideChoices.OPPOSITE[side]
+            other_type_id = getattr(association, f"{other_side}_type_id")
+            other_ids_by_type.setdefault(other_type_id, set()).add(getattr(association, f"{other_side}_id"))
+        other_objects = {}
+        for other_type_id, other_ids in other_ids_by_type.items():
+            other_model = ContentType.objects.get_for_id(other_type_id).model_class()
+            if other_model is None:
+                continue
+            for other_obj in other_model.objects.filter(pk__in=other_ids):
+                other_objects[(other_type_id, other_obj.pk)] = other_obj
+
+        seen_association_pks = set()
+        for side, association in associations_with_side:
+            relationship = association.relationship
+            pk = getattr(association, f"{side}_id")
+            side_key = RelationshipSideChoices.SIDE_PEER if relationship.symmetric else side
+            if pk not in applicable_pks.get((side_key, relationship), ()):
+                continue
+            if relationship.symmetric:
+                # An object associated with itself by a symmetric relationship is found from both sides
+                if (association.pk, pk) in seen_association_pks:
+                    continue
+                seen_association_pks.add((association.pk, pk))
+            # Populate the GenericForeignKey caches of both sides of the association
+            other_side = RelationshipSideChoices.OPPOSITE[side]
+            setattr(association, side, objects_by_pk[pk])
+            other_obj = other_objects.get(
+                (getattr(association, f"{other_side}_type_id"), getattr(association, f"{other_side}_id"))
+            )
+            if other_obj is not None:
+                setattr(association, other_side, other_obj)
+            resp_by_pk[pk][side_key][relationship].append(association)
+
+        return resp_by_pk
+
     def get_relationships_data(self, **kwargs):
         """
         Return a dictionary of relationships with the label and the value or the queryset for each.
@@ -11,6 +11,7 @@ from nautobot.core.models.generics import OrganizationalModel, PrimaryModel
 from nautobot.core.utils.data import render_jinja2
 from nautobot.extras.choices import SecretsGroupAccessTypeChoices, SecretsGroupSecretTypeChoices
 from nautobot.extras.registry import registry
+from nautobot.extras.secrets.cache import get_secret_value
 from nautobot.extras.secrets.exceptions import SecretError, SecretParametersError, SecretProviderError
 from nautobot.extras.utils import extras_features
 
@@ -56,7 +57,8 @@ class Secret(PrimaryModel):
     def get_value(self, obj=None):
         """Retrieve the secret value that this Secret is a representation of.
 
-        May raise a SecretError on failure.
+        May raise a SecretError on failure. If `settings.SECRETS_CACHE_TTL` is set, the value may be retrieved from the
+        secrets cache of the current process rather than from the provider (see `nautobot.extras.secrets.cache`).
 
         Args:
             obj (object): Object (Django model or similar) that may provide additional context for this secret.
@@ -66,7 +68,7 @@ class Secret(PrimaryModel):
             raise SecretProviderError(self, self.provider, f'No registered provider "{self.provider}" is available')
 
         try:
-            return provider.get_value_for_secret(self, obj=obj)
+            return get_secret_value(self, provider, obj=obj)
         except SecretError:
             raise
         except Exception as exc:
@@ -1,6 +1,7 @@
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
-from django.db.models import F, Model, OuterRef, ProtectedError, Q, Subquery
+from django.db import transaction
+from django.db.models import F, Model, OuterRef, ProtectedError, Q, QuerySet, Subquery
 from django.db.models.functions import JSONObject
 
 from nautobot.core.models.query_functions import EmptyGroupByJSONBAgg
@@ -83,11 +84,80 @@ class ConfigContextModelQuerySet(RestrictedQuerySet):
         """
         Attach the subquery annotation to the base queryset.
 
+        If `settings.CONFIG_CONTEXT_MATERIALIZATION_ENABLED` is set, this annotates each object with its materialized
+        `RenderedConfigContext` data instead, which is far less expensive than aggregating all applicable ConfigContexts.
+
+        Do not use this method by itself, use get_config_context() method directly on ConfigContextModel instead.
+        """
+        if settings.CONFIG_CONTEXT_MATERIALIZATION_ENABLED:
+            return self.annotate_rendered_config_context_data()
+        return self._annotate_config_context_data()
+
+    def annotate_rendered_config_context_data(self):
+        """
+        Attach the materialized `RenderedConfigContext` data (if any) of each object as `rendered_config_context_data`.
+        """
+        from nautobot.extras.models import RenderedConfigContext
+
+        return self.annotate(
+            rendered_config_context_data=Subquery(
+                RenderedConfigContext.objects.filter(
+                    assigned_object_type=ContentType.objects.get_for_model(self.model),
+                    assigned_object_id=OuterRef("pk"),
+                ).values("data")[:1]
+            )
+        )
+
+    def refresh_rendered_config_contexts(self, batch_size=1000):
+        """
+        Compute and store the `RenderedConfigContext` of each object in this queryset.
+
+        Returns:
+            (int): The number of objects refreshed.
+        """
+        from nautobot.extras.models import RenderedConfigContext
+
+        content_type = ContentType.objects.get_for_model(self.model)
+        pks = list(self.values_list("pk", flat=True))
+        for i in range(0, len(pks), batch_size):
+            batch_pks = pks[i : i + batch_size]
+            objects = self.model.objects.filter(pk__in=batch_pks)
+            if settings.CONFIG_CONTEXT_DYNAMIC_GROUPS_ENABLED:
+                # The aggregated annotation doesn't account for Dynamic Groups, so each object queries for its own
+                objects = objects.select_related("tenant__tenant_group", "cluster__cluster_group")
+            else:
+                objects = objects._annotate_config_context_data()
+            rendered_config_contexts = [
+                RenderedConfigContext(
+                    assigned_object_type=content_type, assigned_object_id=obj.pk, data=obj.render_config_context()
+                )
+                for obj in objects
+            ]
+            with transaction.atomic():
+                RenderedConfigContext.objects.filter(
+                    assigned_object_type=content_type, assigned_object_id__in=batch_pks
+                ).delete()
+                RenderedConfigContext.objects.bulk_create(rendered_config_contexts, batch_size=batch_size)
+        return len(pks)
+
+    def invalidate_rendered_config_contexts(self):
+        """
+        Delete the `RenderedConfigContext` of each object in this queryset, so that it's computed afresh when needed.
+        """
+        from nautobot.extras.models import RenderedConfigContext
+
+        RenderedConfigContext.objects.filter(
+            assigned_object_type=ContentType.objects.get_for_model(self.model),
+            assigned_object_id__in=self.values("pk"),
+        ).delete()
+
+    def _annotate_config_context_data(self):
+        """
+        Attach the subquery annotation aggregating all applicable ConfigContexts to the base queryset.
+
         Note that the underlying function of our JSONBAgg in MySQL, `JSONARRAY_AGG`, does not support an `ordering`,
         unlike PostgreSQL's implementation. This is why we include "weight" and "name" into the result so that we can
         sort it within Python to ensure correctness.
-
-        Do not use this method by itself, use get_config_context() method directly on ConfigContextModel instead.
         """
         from nautobot.extras.models import ConfigContext
 
@@ -199,6 +269,70 @@ class DynamicGroupQuerySet(RestrictedQuerySet):
             static_group_associations__associated_object_id=obj.id,
         )
 
+    def get_for_objects(self, objects):
+        """
+        Return a dict mapping the primary key of each of the given objects to the list of (cached) `DynamicGroup`s
+        that it belongs to.
+
+        Unlike calling `get_for_object()` once per object, this requires only a single database query regardless of
+        the number of objects. Objects that don't belong to any `DynamicGroup` are omitted from the returned dict.
+
+        Args:
+            objects (QuerySet, list): Model instances (all of the same model) to look up group memberships for.
+        """
+        from nautobot.extras.models import StaticGroupAssociation
+
+        if isinstance(objects, QuerySet):
+            model = objects.model
+            if objects.query.is_sliced:
+                # MySQL doesn't support LIMIT in an "IN" subquery
+                pks = list(objects.values_list("pk", flat=True))
+            else:
+                pks = objects.values("pk")
+        else:
+            objects = list(objects)
+            if not objects:
+                return {}
+            model = type(objects[0])
+            pks = [obj.pk for obj in objects]
+        if not issubclass(model, Model):
+            raise TypeError(f"{model} is not a Django Model class")
+
+        associations = (
+            StaticGroupAssociation.all_objects.filter(
+                dynamic_group__in=self,
+                associated_object_type=ContentType.objects.get_for_model(model._meta.concrete_model),
+                associated_object_id__in=pks,
+            )
+            .select_related("dynamic_group")
+            .order_by("dynamic_group__name")
+        )
+
+        groups_by_pk = {}
+        groups_by_object_pk = {}
+        for association in associations:
+            # Share a single instance of each group across all of its members
+            group = groups_by_pk.setdefault(association.dynamic_group_id, association.dynamic_group)
+            groups_by_object_pk.setdefault(association.associated_object_id, []).append(group)
+        return groups_by_object_pk
+
+    def prefetch_for_objects(self, objects):
+        """
+        Look up the (cached) `DynamicGroup`s for all of the given objects with a single query and cache them on each
+        object, so that subsequently accessing `obj.dynamic_groups` doesn't need to query the database again.
+
+        Args:
+            objects (QuerySet, list): Model instances (all of the same model) to look up group memberships for.
+
+        Returns:
+            (list): The given objects.
+        """
+        objects = list(objects)
+        groups_by_object_pk = self.get_for_objects(objects)
+        for obj in objects:
+            obj._prefetched_dynamic_groups = groups_by_object_pk.get(obj.pk, [])
+        return objects
+
     def get_by_natural_key(self, slug):
         return self.get(slug=slug)
 
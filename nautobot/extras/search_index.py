@@ -0,0 +1,324 @@
+"""Maintenance and querying of the global search index (`SearchIndexEntry`)."""
+
+from collections import defaultdict
+import contextlib
+import copy
+import functools
+import itertools
+import uuid
+
+from django.apps import apps
+from django.contrib.contenttypes.models import ContentType
+from django.core.exceptions import FieldDoesNotExist, FieldError
+from django.db import transaction
+from django.db.models import Q
+
+from nautobot.core.filters import SearchFilter
+from nautobot.core.utils.lookup import get_filterset_for_model
+from nautobot.extras.models import SearchIndexEntry
+
+# `object_id` of the entry recording that the index of a model has been fully built by `rebuild_search_index()`
+INDEX_BUILT_MARKER = uuid.UUID(int=0)
+
+# Lookups of a model's `q` filter that are answered from the search index. All other lookups (such as the exact match
+# of a Location's `asn`) are still applied to the model's own table, so that they keep their semantics.
+INDEXED_LOOKUPS = ("icontains",)
+
+
+@functools.lru_cache(maxsize=None)
+def get_searchable_models():
+    """Get the models included in the global search, based on the `searchable_models` of each app."""
+    searchable_models = []
+    for app_config in apps.get_app_configs():
+        for modelname in getattr(app_config, "searchable_models", []):
+            searchable_models.append(app_config.get_model(modelname))
+    return tuple(searchable_models)
+
+
+def _get_search_filter(model):
+    """Get the `q` filter of the given model's FilterSet, if it is a `SearchFilter`."""
+    filterset = get_filterset_for_model(model)
+    search_filter = filterset.base_filters.get("q") if filterset is not None else None
+    return search_filter if isinstance(search_filter, SearchFilter) else None
+
+
+def _get_lookup_expr(lookup_info):
+    """Get the lookup expression of a `SearchFilter` predicate, which may be given as a string or as a dict."""
+    return lookup_info.get("lookup_expr") if isinstance(lookup_info, dict) else lookup_info
+
+
+@functools.lru_cache(maxsize=None)
+def get_search_fields(model):
+    """
+    Get the field paths of the given model whose values are stored in the search index.
+
+    These are derived from the `filter_predicates` of the `q` filter of the model's FilterSet, so the index covers the
+    same fields as the model's list view search. Only predicates with an `INDEXED_LOOKUPS` lookup are stored; the
+    primary key is matched by the `object_id` of each entry instead. Models whose `q` filter isn't a `SearchFilter`
+    (such as Prefix and IPAddress, which have network-aware search logic) can't be indexed, and `None` is returned for
+    them.
+
+    Returns:
+        (tuple): `(single_valued_paths, multi_valued_paths)`, or None if the model can't be indexed.
+    """
+    search_filter = _get_search_filter(model)
+    if search_filter is None:
+        return None
+
+    single_valued_paths = []
+    multi_valued_paths = []
+    for path, lookup_info in search_filter.filter_predicates.items():
+        if path in ("id", "pk") or _get_lookup_expr(lookup_info) not in INDEXED_LOOKUPS:
+            continue
+        try:
+            model.objects.values_list(path)
+        except FieldError:
+            continue
+        # Field paths that traverse a many-to-many or one-to-many relation are queried separately, to avoid
+        # multiplying the number of rows returned for each object
+        opts = model._meta
+        multi_valued = False
+        for part in path.split("__"):
+            try:
+                field = opts.get_field(part)
+            except FieldDoesNotExist:
+                break
+            if not field.is_relation or field.related_model is None:
+                break
+            multi_valued = multi_valued or field.many_to_many or field.one_to_many
+            opts = field.related_model._meta
+        if multi_valued:
+            multi_valued_paths.append(path)
+        else:
+            single_valued_paths.append(path)
+
+    return tuple(single_valued_paths), tuple(multi_valued_paths)
+
+
+def is_indexed_model(model):
+    """Whether the given model is included in the global search and can be indexed."""
+    return model in get_searchable_models() and get_search_fields(model) is not None
+
+
+def get_unindexed_query(model, value):
+    """
+    Get the query for the predicates of the given model's `q` filter that aren't answered from the search index.
+
+    Returns:
+        (Q): Query to apply to the model's own table, which is empty if there are no such predicates for this value.
+    """
+    search_filter = _get_search_filter(model)
+    predicates = {
+        path: lookup_info
+        for path, lookup_info in search_filter.filter_predicates.items()
+        if path not in ("id", "pk") and _get_lookup_expr(lookup_info) not in INDEXED_LOOKUPS
+    }
+    if not predicates:
+        return Q()
+    unindexed_filter = copy.copy(search_filter)
+    unindexed_filter.filter_predicates = predicates
+    return unindexed_filter.generate_query(value)
+
+
+def _get_through_lookup(field, lookup_prefix):
+    """
+    Get the explicit through model of a many-to-many relation, and the lookup from the indexed model to it.
+
+    Rows of an explicit through model (such as `IPAddressToInterface`) may be created and deleted directly, without
+    sending `m2m_changed`, so the objects on either side of the relation need to be re-indexed when they change.
+
+    Returns:
+        (tuple): `(through_model, lookup)`, or `(None, None)` if the relation doesn't have an explicit through model.
+    """
+    if not field.many_to_many:
+        return None, None
+    try:
+        if field.concrete:  # ManyToManyField
+            through, fk_name = field.remote_field.through, field.m2m_field_name()
+        else:  # ManyToManyRel, traversing the relation from its target model
+            through, fk_name = field.through, field.remote_field.m2m_reverse_field_name()
+        related_query_name = through._meta.get_field(fk_name).related_query_name()
+    except (AttributeError, FieldDoesNotExist):
+        return None, None
+    if through._meta.auto_created or related_query_name.endswith("+"):
+        return None, None
+    return through, "__".join([*lookup_prefix, related_query_name])
+
+
+@functools.lru_cache(maxsize=None)
+def get_dependent_lookups():
+    """
+    Get how to find the indexed objects whose entries include the field values of other (related) objects.
+
+    For example, a Device's entry includes the name of its Rack (`rack__name`), so the Device must be re-indexed when
+    its Rack is renamed; this is recorded as `{Rack: ((Device, "rack"),)}`.
+
+    Returns:
+        (dict): `{related_model: ((indexed_model, lookup), ...)}`, where filtering `indexed_model` by `{lookup}__in`
+            the primary keys of changed `related_model` objects finds the indexed objects to re-index.
+    """
+    dependent_lookups = defaultdict(set)
+    for model in get_searchable_models():
+        search_fields = get_search_fields(model)
+        if search_fields is None:
+            continue
+        for path in itertools.chain(*search_fields):
+            opts = model._meta
+            parts = path.split("__")
+            # The last part is the field whose value is indexed; any parts before it traverse relations
+            for i, part in enumerate(parts[:-1]):
+                try:
+                    field = opts.get_field(part)
+                except FieldDoesNotExist:
+                    break
+                if not field.is_relation or field.related_model is None:
+                    break
+                related_model = field.related_model._meta.concrete_model
+                dependent_lookups[related_model].add((model, "__".join(parts[: i + 1])))
+                through, through_lookup = _get_through_lookup(field, parts[:i])
+                if through is not None:
+                    dependent_lookups[through._meta.concrete_model].add((model, through_lookup))
+                opts = related_model._meta
+    return {related_model: tuple(lookups) for related_model, lookups in dependent_lookups.items()}
+
+
+def get_dependent_objects(model, pks):
+    """
+    Get the indexed objects whose entries include field values of the given objects, as per `get_dependent_lookups()`.
+
+    Returns:
+        (dict): `{indexed_model: set(pks)}`
+    """
+    dependent_objects = {}
+    for indexed_model, lookup in get_dependent_lookups().get(model._meta.concrete_model, ()):
+        dependent_pks = set(
+            indexed_model.objects.filter(**{f"{lookup}__in": pks}).order_by().values_list("pk", flat=True)
+        )
+        if dependent_pks:
+            dependent_objects.setdefault(indexed_model, set()).update(dependent_pks)
+    return dependent_objects
+
+
+def update_search_index(model, pks):
+    """
+    Create, update, or delete the search index entries of the given objects, as appropriate.
+
+    Args:
+        model (Model): An indexed model, as per `is_indexed_model()`.
+        pks (list): Primary keys of the objects whose entries should be refreshed. Entries of objects that no longer
+            exist are deleted.
+
+    Returns:
+        (int): The number of entries created or updated.
+    """
+    single_valued_paths, multi_valued_paths = get_search_fields(model)
+    queryset = model.objects.filter(pk__in=pks).order_by()
+    values = defaultdict(list)
+    for pk, *row in queryset.values_list("pk", *single_valued_paths):
+        values[pk].extend(row)
+    for path in multi_valued_paths:
+        for pk, value in queryset.values_list("pk", path):
+            values[pk].append(value)
+
+    content_type = ContentType.objects.get_for_model(model)
+    entries = [
+        SearchIndexEntry(
+            content_type=content_type,
+            object_id=pk,
+            value="\n".join(str(value) for value in row if value not in (None, "")).lower(),
+        )
+        for pk, row in values.items()
+    ]
+    with transaction.atomic():
+        SearchIndexEntry.objects.filter(content_type=content_type, object_id__in=pks).delete()
+        SearchIndexEntry.objects.bulk_create(entries)
+    return len(entries)
+
+
+def rebuild_search_index(model, batch_size=1000):
+    """
+    Rebuild the search index entries of all objects of the given model.
+
+    Args:
+        model (Model): An indexed model, as per `is_indexed_model()`.
+        batch_size (int): Number of objects to index at a time.
+
+    Returns:
+        (int): The number of objects indexed.
+    """
+    content_type = ContentType.objects.get_for_model(model)
+    count = 0
+    batch = []
+    for pk in model.objects.order_by().values_list("pk", flat=True).iterator(chunk_size=batch_size):
+        batch.append(pk)
+        if len(batch) >= batch_size:
+            count += update_search_index(model, batch)
+            batch = []
+    if batch:
+        count += update_search_index(model, batch)
+
+    # Remove entries of any objects that were deleted without the index being updated
+    SearchIndexEntry.objects.filter(content_type=content_type).exclude(object_id=INDEX_BUILT_MARKER).exclude(
+        object_id__in=model.objects.values("pk")
+    ).delete()
+    # Record that the index of this model is complete, so that the global search can start using it
+    SearchIndexEntry.objects.update_or_create(
+        content_type=content_type, object_id=INDEX_BUILT_MARKER, defaults={"value": ""}
+    )
+    return count
+
+
+def get_built_models(models):
+    """
+    Get those of the given indexed models whose index has been fully built by `rebuild_search_index()`.
+
+    Until then, the index of a model only contains the objects changed since `SEARCH_INDEX_ENABLED` was set, so the
+    model must still be searched without the index.
+    """
+    content_types = ContentType.objects.get_for_models(*models)
+    built_content_type_ids = set(
+        SearchIndexEntry.objects.filter(
+            content_type__in=content_types.values(), object_id=INDEX_BUILT_MARKER
+        ).values_list("content_type", flat=True)
+    )
+    return [model for model in models if content_types[model].pk in built_content_type_ids]
+
+
+def search(value, models):
+    """
+    Find the objects of the given models that match the given value, as per the `q` filter of each model.
+
+    Predicates with an `INDEXED_LOOKUPS` lookup, and an exact match of the primary key, are answered for all models
+    with a single query of the search index. Any other predicates (see `get_unindexed_query()`) are included in the
+    returned query of each model, to be applied to the model's own table.
+
+    This doesn't apply any permissions; callers should apply the returned queries to querysets restricted to the
+    objects that the user is permitted to view.
+
+    Args:
+        value (str): The text to search for.
+        models (list): Indexed models to search, whose index has been built (see `get_built_models()`).
+
+    Returns:
+        (dict): `{model: Q}` of the query matching the objects of each model, for the models that may have matches.
+    """
+    index_query = Q(value__contains=value.lower())
+    with contextlib.suppress(ValueError):
+        index_query |= Q(object_id=uuid.UUID(value.strip()))
+
+    content_types = ContentType.objects.get_for_models(*models)
+    entries = (
+        SearchIndexEntry.objects.filter(index_query, content_type__in=content_types.values())
+        .exclude(object_id=INDEX_BUILT_MARKER)
+        .order_by()
+    )
+    matching_content_type_ids = set(entries.values_list("content_type", flat=True).distinct())
+
+    queries = {}
+    for model, content_type in content_types.items():
+        query = get_unindexed_query(model, value)
+        if content_type.pk in matching_content_type_ids:
+            query |= Q(pk__in=entries.filter(content_type=content_type).values("object_id"))
+        if query:
+            queries[model] = query
+    return queries
@@ -8,6 +8,11 @@ from .exceptions import SecretError, SecretParametersError, SecretProviderError,
 class SecretsProvider(ABC):
     """Abstract base class for concrete providers of secret retrieval features."""
 
+    # Whether the values retrieved by this provider may be cached when `settings.SECRETS_CACHE_TTL` is set. Providers
+    # whose values depend on more than the rendered parameters of the Secret (such as on other attributes of `obj`)
+    # should set this to False.
+    is_cacheable = True
+
     def __repr__(self):
         return f"<{self.name}>"
 
@@ -0,0 +1,129 @@
+"""Per-process caching of the values retrieved by secrets providers, see `settings.SECRETS_CACHE_TTL`."""
+
+import hashlib
+import json
+import logging
+import threading
+import time
+
+from django.conf import settings
+from prometheus_client import Counter, Histogram
+import redis.exceptions
+
+from nautobot.core.utils.cache import get_cache_generation, invalidate_cache_generations
+
+logger = logging.getLogger(__name__)
+
+SECRETS_CACHE_KEY_PREFIX = "nautobot.extras.secrets.cache"
+
+SECRETS_CACHE_METRIC = Counter(
+    "nautobot_secrets_cache_lookups",
+    "Lookups of secret values in the secrets cache, by provider and result",
+    ["provider", "result"],
+)
+
+SECRETS_PROVIDER_LATENCY_METRIC = Histogram(
+    "nautobot_secrets_provider_retrieval_seconds",
+    "Time taken by secrets providers to retrieve secret values, by provider",
+    ["provider"],
+)
+
+
+class _CachedSecretValue:
+    """A cached secret value, whose repr doesn't reveal the value in logs or tracebacks."""
+
+    __slots__ = ("expires", "generation", "value")
+
+    def __init__(self, value, generation, expires):
+        self.value = value
+        self.generation = generation
+        self.expires = expires
+
+    def __repr__(self):
+        return "<_CachedSecretValue: (redacted)>"
+
+
+# {key: _CachedSecretValue}, only ever held in the memory of the current process
+_secret_values = {}
+_secret_values_lock = threading.Lock()
+_next_purge = 0.0
+
+
+def get_secret_cache_generation(secret):
+    """
+    Get the current generation of the cached values of the given Secret.
+
+    The generation is shared between all Nautobot processes, so starting a new generation (see
+    `invalidate_secret_cache()`) invalidates the values cached by every process at once.
+    """
+    return get_cache_generation(f"{SECRETS_CACHE_KEY_PREFIX}.generation.{secret.pk}")
+
+
+def invalidate_secret_cache(secret):
+    """Invalidate the cached values of the given Secret in all processes, by starting a new generation."""
+    invalidate_cache_generations([f"{SECRETS_CACHE_KEY_PREFIX}.generation.{secret.pk}"])
+    with _secret_values_lock:
+        for cached_key in [cached_key for cached_key in _secret_values if cached_key[0] == str(secret.pk)]:
+            del _secret_values[cached_key]
+
+
+def clear_secret_cache():
+    """Discard all secret values cached by the current process."""
+    with _secret_values_lock:
+        _secret_values.clear()
+
+
+def _retrieve_secret_value(secret, provider, obj=None):
+    """Retrieve the value of a Secret from its provider, recording the latency of the provider."""
+    with SECRETS_PROVIDER_LATENCY_METRIC.labels(provider=provider.slug).time():
+        return provider.get_value_for_secret(secret, obj=obj)
+
+
+def get_secret_value(secret, provider, obj=None):
+    """
+    Retrieve the value of a Secret from its provider, using the secrets cache if `settings.SECRETS_CACHE_TTL` is set.
+
+    Values are cached in the memory of the current process only, never in the shared Django cache, for up to
+    `settings.SECRETS_CACHE_TTL` seconds. They are keyed by the Secret and its rendered parameters, so that a templated
+    Secret caches a separate value for each distinct set of parameters that `obj` renders it to. Values of providers
+    whose `is_cacheable` attribute is `False` are never cached, and errors raised by providers are never cached. If the
+    Django cache (which holds the generation of each Secret's cached values) is unavailable, the value is retrieved from
+    the provider without caching it.
+
+    Args:
+        secret (nautobot.extras.models.Secret): Secret to retrieve the value of.
+        provider (SecretsProvider): Provider of the Secret.
+        obj (object): Object (Django model or similar) that may provide additional context for this secret.
+    """
+    global _next_purge
+
+    ttl = settings.SECRETS_CACHE_TTL
+    if ttl <= 0 or not getattr(provider, "is_cacheable", True):
+        return _retrieve_secret_value(secret, provider, obj=obj)
+
+    parameters = json.dumps(secret.rendered_parameters(obj=obj), sort_keys=True, default=str)
+    key = (str(secret.pk), provider.slug, hashlib.sha256(parameters.encode("utf-8")).hexdigest())
+    try:
+        generation = get_secret_cache_generation(secret)
+    except redis.exceptions.ConnectionError as exc:
+        # Without the current generation, a cached value might have been invalidated by another process
+        logger.warning("Unable to check the secrets cache, retrieving the value of %s directly: %s", secret, exc)
+        return _retrieve_secret_value(secret, provider, obj=obj)
+    now = time.monotonic()
+    with _secret_values_lock:
+        entry = _secret_values.get(key)
+    if entry is not None and entry.generation == generation and entry.expires > now:
+        SECRETS_CACHE_METRIC.labels(provider=provider.slug, result="hit").inc()
+        return entry.value
+
+    SECRETS_CACHE_METRIC.labels(provider=provider.slug, result="miss").inc()
+    value = _retrieve_secret_value(secret, provider, obj=obj)
+    now = time.monotonic()
+    with _secret_values_lock:
+        _secret_values[key] = _CachedSecretValue(value, generation, now + ttl)
+        # Periodically discard expired values, so that templated Secrets don't accumulate them indefinitely
+        if now >= _next_purge:
+            for expired_key in [cached_key for cached_key, cached in _secret_values.items() if cached.expires <= now]:
+                del _secret_values[expired_key]
+            _next_purge = now + ttl
+    return value
@@ -8,6 +8,8 @@ import traceback
 from db_file_storage.model_utils import delete_file
 from db_file_storage.storage import DatabaseFileStorage
 from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
 from django.contrib.contenttypes.models import ContentType
 from django.core.cache import cache
 from django.core.exceptions import ValidationError
@@ -19,32 +21,99 @@ from django.utils import timezone
 from django_prometheus.models import model_deletes, model_inserts, model_updates
 import redis.exceptions
 
+from nautobot.core.authentication import invalidate_object_permissions_cache
 from nautobot.core.celery import app, import_jobs
+from nautobot.core.graphql.caching import get_through_related_models, invalidate_graphql_result_cache
 from nautobot.core.models import BaseModel
+from nautobot.core.utils.data import clear_jinja2_template_cache
 from nautobot.core.utils.logging import sanitize
-from nautobot.extras.choices import JobResultStatusChoices, ObjectChangeActionChoices
+from nautobot.extras import search_index
+from nautobot.extras.choices import DynamicGroupTypeChoices, JobResultStatusChoices, ObjectChangeActionChoices
 from nautobot.extras.constants import CHANGELOG_MAX_CHANGE_CONTEXT_DETAIL
 from nautobot.extras.models import (
     ComputedField,
+    ConfigContext,
+    ConfigContextModel,
+    ConfigContextSchema,
     ContactAssociation,
     CustomField,
+    CustomLink,
     DynamicGroup,
     DynamicGroupMembership,
+    ExportTemplate,
     GitRepository,
+    JobButton,
     JobResult,
     MetadataType,
     ObjectChange,
     Relationship,
+    RelationshipAssociation,
+    Secret,
+    StaticGroupAssociation,
+    TaggedItem,
+    Webhook,
 )
 from nautobot.extras.querysets import NotesQuerySet
-from nautobot.extras.tasks import delete_custom_field_data, provision_field
+from nautobot.extras.secrets.cache import invalidate_secret_cache
+from nautobot.extras.tasks import delete_custom_field_data, provision_field, refresh_rendered_config_contexts
 from nautobot.extras.utils import refresh_job_model_from_job_class
+from nautobot.users.models import AdminGroup, ObjectPermission
 
 # thread safe change context state variable
 change_context_state = contextvars.ContextVar("change_context_state", default=None)
 logger = logging.getLogger(__name__)
 
 
+class _PendingObjectUpdates(dict):
+    """
+    Mapping of `{model: set(pks)}` of objects that need some processing once the current transaction commits.
+
+    An instance is registered as a `transaction.on_commit()` callback, so that all changes made within a single
+    transaction are processed together, using set-based queries rather than a few queries per object. Subclasses must
+    define a `state` ContextVar (with a default of `None`) and implement `process()`.
+    """
+
+    state = None
+
+    def __call__(self):
+        if self.state.get() is self:
+            self.state.set(None)
+
+        for model, pks in self.items():
+            self.process(model, pks)
+
+    def process(self, model, pks):
+        raise NotImplementedError
+
+    @classmethod
+    def add(cls, model, pks):
+        """Schedule the given objects to be processed when the current transaction (if any) commits."""
+        connection = transaction.get_connection()
+        if not connection.in_atomic_block:
+            # Autocommit mode, so there's nothing to batch this change together with; process it right away
+            cls({model: set(pks)})()
+            return
+
+        pending = cls.state.get()
+        # If the transaction that `pending` was registered against was rolled back, its callback was discarded too.
+        if pending is None or not any(callback[1] is pending for callback in connection.run_on_commit):
+            pending = cls()
+            cls.state.set(pending)
+            transaction.on_commit(pending)
+        pending.setdefault(model, set()).update(pks)
+
+
+def _get_changed_objects(sender, instance, **kwargs):
+    """Get the `(model, pks)` of the object(s) changed by a `post_save` or `m2m_changed` signal, if any."""
+    if "action" in kwargs:  # m2m_changed, such as when adding or removing tags
+        if kwargs["action"] not in ("post_add", "post_remove", "post_clear"):
+            return None, ()
+        if kwargs["reverse"]:
+            return kwargs["model"], kwargs["pk_set"] or ()
+        return type(instance), (instance.pk,)
+    return sender, (instance.pk,)
+
+
 #
 # Change logging
 #
@@ -69,22 +138,27 @@ def get_user_if_authenticated(user, instance):
 @receiver(post_save, sender=CustomField.content_types.through)
 @receiver(post_save, sender=MetadataType)
 @receiver(post_save, sender=MetadataType.content_types.through)
+@receiver(post_save, sender=Webhook)
 @receiver(m2m_changed, sender=ComputedField)
 @receiver(m2m_changed, sender=CustomField)
 @receiver(m2m_changed, sender=CustomField.content_types.through)
 @receiver(m2m_changed, sender=MetadataType)
 @receiver(m2m_changed, sender=MetadataType.content_types.through)
+@receiver(m2m_changed, sender=Webhook.content_types.through)
 @receiver(post_delete, sender=ComputedField)
 @receiver(post_delete, sender=CustomField)
 @receiver(post_delete, sender=CustomField.content_types.through)
 @receiver(post_delete, sender=MetadataType)
 @receiver(post_delete, sender=MetadataType.content_types.through)
+@receiver(post_delete, sender=Webhook)
 def invalidate_models_cache(sender, **kwargs):
-    """Invalidate the related-models cache for ComputedFields and CustomFields."""
+    """Invalidate the related-models cache for ComputedFields, CustomFields, MetadataTypes, and Webhooks."""
     if sender is CustomField.content_types.through:
         manager = CustomField.objects
     elif sender is MetadataType.content_types.through:
         manager = MetadataType.objects
+    elif sender is Webhook.content_types.through:
+        manager = Webhook.objects
     else:
         manager = sender.objects
 
@@ -109,6 +183,46 @@ def invalidate_relationship_models_cache(sender, **kwargs):
             cache.delete_pattern(f"{method.cache_key_prefix}.*")
 
 
+@receiver(post_save, sender=ObjectPermission)
+@receiver(post_delete, sender=ObjectPermission)
+@receiver(m2m_changed, sender=ObjectPermission.object_types.through)
+@receiver(m2m_changed, sender=ObjectPermission.groups.through)
+@receiver(m2m_changed, sender=ObjectPermission.users.through)
+@receiver(m2m_changed, sender=get_user_model().groups.through)
+@receiver(post_delete, sender=Group)
+@receiver(post_delete, sender=AdminGroup)
+def invalidate_object_permissions(sender, action=None, **kwargs):
+    """Invalidate the cached ObjectPermissions of all users when permissions or group memberships change."""
+    if action is not None and not action.startswith("post_"):
+        return
+    invalidate_object_permissions_cache()
+
+
+@receiver(post_save, sender=Secret)
+@receiver(post_delete, sender=Secret)
+def invalidate_secret_values(sender, instance, **kwargs):
+    """Invalidate the cached values of a Secret in all processes when it is changed or deleted."""
+    invalidate_secret_cache(instance)
+
+
+@receiver(post_save, sender=ComputedField)
+@receiver(post_save, sender=CustomLink)
+@receiver(post_save, sender=ExportTemplate)
+@receiver(post_save, sender=JobButton)
+@receiver(post_delete, sender=ComputedField)
+@receiver(post_delete, sender=CustomLink)
+@receiver(post_delete, sender=ExportTemplate)
+@receiver(post_delete, sender=JobButton)
+def invalidate_jinja2_template_cache(sender, **kwargs):
+    """
+    Discard the compiled Jinja2 templates cached by `render_jinja2()` when a template-bearing object changes.
+
+    Cached templates are keyed by their source code and so can't become stale, but this releases the memory held by
+    templates that are no longer in use.
+    """
+    clear_jinja2_template_cache()
+
+
 @receiver(post_save)
 @receiver(m2m_changed)
 def _handle_changed_object(sender, instance, raw=False, **kwargs):
@@ -291,6 +405,168 @@ def _handle_deleted_object(sender, instance, **kwargs):
     model_deletes.labels(instance._meta.model_name).inc()
 
 
+#
+# Config contexts
+#
+
+# Maximum number of objects to refresh the rendered config context of within the request that changed them;
+# refreshing any more objects than this is deferred to a background task.
+RENDERED_CONFIG_CONTEXT_SYNC_REFRESH_LIMIT = 1000
+
+
+class _PendingRenderedConfigContextRefreshes(_PendingObjectUpdates):
+    """Devices and/or VirtualMachines whose `RenderedConfigContext` needs refreshing."""
+
+    state = contextvars.ContextVar("pending_rendered_config_context_refreshes", default=None)
+
+    def process(self, model, pks):
+        queryset = model.objects.filter(pk__in=pks)
+        try:
+            if len(pks) <= RENDERED_CONFIG_CONTEXT_SYNC_REFRESH_LIMIT:
+                queryset.refresh_rendered_config_contexts()
+            else:
+                # Until the background task completes, these objects' config contexts will be computed as needed
+                queryset.invalidate_rendered_config_contexts()
+                refresh_rendered_config_contexts.delay(model._meta.label_lower, list(pks))
+        except Exception as exc:
+            # Don't fail the (already committed) transaction; the consistency check will detect any remaining issue.
+            logger.warning("Unable to refresh the rendered config context of %d %s: %s", len(pks), model, exc)
+
+
+def _get_config_context_model_querysets():
+    """Get a queryset of all objects of each model that supports config contexts (Device and VirtualMachine)."""
+    from nautobot.dcim.models import Device
+    from nautobot.virtualization.models import VirtualMachine
+
+    return [Device.objects.all(), VirtualMachine.objects.all()]
+
+
+def _get_config_context_dependents(instance):
+    """Get querysets of the Devices and VirtualMachines whose config context may depend on the given object."""
+    from nautobot.dcim.models import Device, DeviceRedundancyGroup, Location, Platform
+    from nautobot.tenancy.models import Tenant, TenantGroup
+    from nautobot.virtualization.models import Cluster, VirtualMachine
+
+    if isinstance(instance, ConfigContext):
+        return _get_config_context_model_querysets()
+    if isinstance(instance, Location):
+        locations = instance.descendants(include_self=True)
+        return [
+            Device.objects.filter(location__in=locations),
+            VirtualMachine.objects.filter(cluster__location__in=locations),
+        ]
+    if isinstance(instance, TenantGroup):
+        tenant_groups = instance.descendants(include_self=True)
+        return [
+            Device.objects.filter(tenant__tenant_group__in=tenant_groups),
+            VirtualMachine.objects.filter(tenant__tenant_group__in=tenant_groups),
+        ]
+    if isinstance(instance, Tenant):
+        return [Device.objects.filter(tenant=instance), VirtualMachine.objects.filter(tenant=instance)]
+    if isinstance(instance, Cluster):
+        return [Device.objects.filter(cluster=instance), VirtualMachine.objects.filter(cluster=instance)]
+    if isinstance(instance, Platform):
+        return [Device.objects.filter(platform=instance), VirtualMachine.objects.filter(platform=instance)]
+    if isinstance(instance, DeviceRedundancyGroup):
+        return [Device.objects.filter(device_redundancy_group=instance)]
+    return []
+
+
+def config_context_model_changed(sender, instance, raw=False, **kwargs):
+    """
+    When `CONFIG_CONTEXT_MATERIALIZATION_ENABLED` is set, refresh the `RenderedConfigContext` of a changed Device or VM.
+
+    Deletions are already handled by cascade-deletion of the object's `rendered_config_contexts`.
+    """
+    if raw or not settings.CONFIG_CONTEXT_MATERIALIZATION_ENABLED:
+        return
+
+    model, pks = _get_changed_objects(sender, instance, **kwargs)
+    if not pks or model is None or not issubclass(model, ConfigContextModel):
+        return
+
+    _PendingRenderedConfigContextRefreshes.add(model._meta.concrete_model, pks)
+
+
+def config_context_dependency_changed(sender, instance, raw=False, **kwargs):
+    """
+    When `CONFIG_CONTEXT_MATERIALIZATION_ENABLED` is set, refresh the `RenderedConfigContext` of every Device or VM
+    that may be affected by a change to a ConfigContext (or its assignments), or to a related object such as a Location.
+
+    Deletions are handled on `pre_delete`, as the affected objects can no longer be identified afterwards.
+    """
+    if raw or not settings.CONFIG_CONTEXT_MATERIALIZATION_ENABLED:
+        return
+    if kwargs.get("action", "post_add") not in ("post_add", "post_remove", "post_clear"):
+        return
+
+    if kwargs.get("reverse"):
+        # A ConfigContext assignment was changed from the other side, such as `tag.configcontext_set.add(...)`
+        querysets = _get_config_context_model_querysets()
+    else:
+        querysets = _get_config_context_dependents(instance)
+    for queryset in querysets:
+        pks = list(queryset.values_list("pk", flat=True))
+        if pks:
+            _PendingRenderedConfigContextRefreshes.add(queryset.model, pks)
+
+
+def _config_context_dynamic_groups_materialized():
+    """Check whether materialized config contexts depend on Dynamic Group membership."""
+    return settings.CONFIG_CONTEXT_MATERIALIZATION_ENABLED and settings.CONFIG_CONTEXT_DYNAMIC_GROUPS_ENABLED
+
+
+def _refresh_dynamic_group_member_config_contexts(group, pks):
+    """
+    Refresh the `RenderedConfigContext` of the given objects that joined or left a Dynamic Group, if any ConfigContext
+    is assigned to the group and `CONFIG_CONTEXT_DYNAMIC_GROUPS_ENABLED` and `CONFIG_CONTEXT_MATERIALIZATION_ENABLED`
+    are both set.
+    """
+    if not pks or not _config_context_dynamic_groups_materialized():
+        return
+    model = group.model
+    if model is None or not issubclass(model, ConfigContextModel):
+        return
+    if not ConfigContext.objects.filter(dynamic_groups=group).exists():
+        return
+    _PendingRenderedConfigContextRefreshes.add(model._meta.concrete_model, pks)
+
+
+def config_context_static_group_association_changed(sender, instance, raw=False, **kwargs):
+    """
+    When an object is added to or removed from a static group (or a Dynamic Group's member cache), refresh its
+    `RenderedConfigContext` if any ConfigContext is assigned to the group, as per
+    `_refresh_dynamic_group_member_config_contexts()`.
+    """
+    if raw or not _config_context_dynamic_groups_materialized():
+        return
+    _refresh_dynamic_group_member_config_contexts(instance.dynamic_group, [instance.associated_object_id])
+
+
+# Only changes to a Device or VM itself, or to its tags, can affect its own config context
+post_save.connect(config_context_model_changed, sender="dcim.Device")
+post_save.connect(config_context_model_changed, sender="virtualization.VirtualMachine")
+m2m_changed.connect(config_context_model_changed, sender=TaggedItem)
+
+post_save.connect(config_context_static_group_association_changed, sender=StaticGroupAssociation)
+post_delete.connect(config_context_static_group_association_changed, sender=StaticGroupAssociation)
+
+post_save.connect(config_context_dependency_changed, sender=ConfigContext)
+pre_delete.connect(config_context_dependency_changed, sender=ConfigContext)
+for _field in ConfigContext._meta.many_to_many:
+    m2m_changed.connect(config_context_dependency_changed, sender=_field.remote_field.through)
+for _model_label in [
+    "dcim.DeviceRedundancyGroup",
+    "dcim.Location",
+    "dcim.Platform",
+    "tenancy.Tenant",
+    "tenancy.TenantGroup",
+    "virtualization.Cluster",
+]:
+    post_save.connect(config_context_dependency_changed, sender=_model_label)
+    pre_delete.connect(config_context_dependency_changed, sender=_model_label)
+
+
 #
 # Content types
 #
@@ -432,15 +708,184 @@ def dynamic_group_update_cached_members(sender, instance, **kwargs):
     else:
         group = instance
 
-    group.update_cached_members()
-    for ancestor in group.get_ancestors():
-        ancestor.update_cached_members()
+    # Objects that join or leave a group may need their materialized config context refreshing
+    track_members = _config_context_dynamic_groups_materialized()
+    for changed_group in [group, *group.get_ancestors()]:
+        if track_members:
+            old_member_pks = _get_cached_member_pks(changed_group)
+        changed_group.update_cached_members()
+        if track_members:
+            _refresh_dynamic_group_member_config_contexts(
+                changed_group, old_member_pks ^ _get_cached_member_pks(changed_group)
+            )
+
+
+def _get_cached_member_pks(group):
+    """Get the primary keys of the cached members of the given Dynamic Group."""
+    return set(group.static_group_associations(manager="all_objects").values_list("associated_object_id", flat=True))
 
 
 post_save.connect(dynamic_group_update_cached_members, sender=DynamicGroup)
 post_save.connect(dynamic_group_update_cached_members, sender=DynamicGroupMembership)
 
 
+class _PendingDynamicGroupMemberUpdates(_PendingObjectUpdates):
+    """Objects whose Dynamic Group membership needs re-checking."""
+
+    state = contextvars.ContextVar("dynamic_group_pending_member_updates", default=None)
+
+    def process(self, model, pks):
+        for group in DynamicGroup.objects.get_for_model(model).exclude(group_type=DynamicGroupTypeChoices.TYPE_STATIC):
+            try:
+                added, removed = group.update_cached_members_for_objects(pks)
+            except Exception as exc:
+                # Don't fail the (already committed) transaction; the next full refresh will correct the cache.
+                logger.warning("Unable to incrementally update the member cache for %s: %s", group, exc)
+                continue
+            if added or removed:
+                _refresh_dynamic_group_member_config_contexts(group, pks)
+
+
+def dynamic_group_eligible_object_changed(sender, instance, raw=False, **kwargs):
+    """
+    When `DYNAMIC_GROUPS_INCREMENTAL_UPDATES_ENABLED` is set, incrementally update Dynamic Group member caches.
+
+    Only the changed object(s) are re-checked against the Dynamic Groups of the relevant content-type, once the
+    current transaction commits. Deletions are already handled by cascade-deletion of the object's
+    `static_group_association_set`.
+    """
+    if raw or not settings.DYNAMIC_GROUPS_INCREMENTAL_UPDATES_ENABLED:
+        return
+
+    model, pks = _get_changed_objects(sender, instance, **kwargs)
+    if not pks or not getattr(model, "is_dynamic_group_associable_model", False):
+        return
+
+    _PendingDynamicGroupMemberUpdates.add(model._meta.concrete_model, pks)
+
+
+post_save.connect(dynamic_group_eligible_object_changed)
+m2m_changed.connect(dynamic_group_eligible_object_changed)
+
+
+#
+# Global search index
+#
+
+
+class _PendingSearchIndexUpdates(_PendingObjectUpdates):
+    """Objects whose global search index entries, or those of the indexed objects that depend on them, need refreshing."""
+
+    state = contextvars.ContextVar("pending_search_index_updates", default=None)
+
+    def process(self, model, pks):
+        try:
+            if search_index.is_indexed_model(model):
+                search_index.update_search_index(model, list(pks))
+            # Indexed objects whose entries include field values of these objects, such as the Devices in a Rack
+            for dependent_model, dependent_pks in search_index.get_dependent_objects(model, list(pks)).items():
+                search_index.update_search_index(dependent_model, list(dependent_pks))
+        except Exception as exc:
+            # Don't fail the (already committed) transaction; `nautobot-server rebuild_search_index` will correct it.
+            logger.warning("Unable to update the search index entries of %d %s: %s", len(pks), model, exc)
+
+
+def _is_search_index_relevant_model(model):
+    """Whether changes to objects of the given (concrete) model may require updates to the global search index."""
+    return search_index.is_indexed_model(model) or model in search_index.get_dependent_lookups()
+
+
+def search_index_object_changing(sender, instance, raw=False, **kwargs):
+    """
+    Before an object that indexed objects depend on is updated or deleted, note which indexed objects currently do so.
+
+    The object may be moved away from (or deleted from) these indexed objects, such as an InventoryItem being moved to
+    a different Device, after which they can no longer be found from the object, but still need to be re-indexed.
+    """
+    if raw or not settings.SEARCH_INDEX_ENABLED or instance._state.adding:
+        return
+    model = sender._meta.concrete_model
+    if model not in search_index.get_dependent_lookups():
+        return
+    instance._search_index_dependent_objects = search_index.get_dependent_objects(model, [instance.pk])
+
+
+def search_index_object_changed(sender, instance, raw=False, **kwargs):
+    """
+    When `SEARCH_INDEX_ENABLED` is set, keep the global search index up to date as searchable objects change.
+
+    The changed object(s), and any indexed objects whose entries include their field values, are re-indexed (or, if
+    deleted, removed from the index) once the current transaction commits.
+    """
+    if raw or not settings.SEARCH_INDEX_ENABLED:
+        return
+
+    # Indexed objects that depended on this object before it was changed, see `search_index_object_changing()`
+    for dependent_model, dependent_pks in getattr(instance, "_search_index_dependent_objects", {}).items():
+        _PendingSearchIndexUpdates.add(dependent_model, dependent_pks)
+    instance.__dict__.pop("_search_index_dependent_objects", None)
+
+    if "action" in kwargs or "created" in kwargs:
+        model, pks = _get_changed_objects(sender, instance, **kwargs)
+    else:  # post_delete
+        model, pks = sender, (instance.pk,)
+    if not pks or model is None or not _is_search_index_relevant_model(model._meta.concrete_model):
+        return
+
+    _PendingSearchIndexUpdates.add(model._meta.concrete_model, pks)
+
+
+pre_save.connect(search_index_object_changing)
+pre_delete.connect(search_index_object_changing)
+post_save.connect(search_index_object_changed)
+m2m_changed.connect(search_index_object_changed)
+post_delete.connect(search_index_object_changed)
+
+
+#
+# GraphQL result cache
+#
+
+# Models whose changes may affect the GraphQL results of any other models, such as their computed fields
+_GRAPHQL_RESULT_CACHE_GLOBAL_MODELS = (ComputedField, ConfigContext, ConfigContextSchema, CustomField, Relationship)
+
+
+def graphql_result_cache_object_changed(sender, instance, **kwargs):
+    """
+    When `GRAPHQL_RESULT_CACHE_TIMEOUT` is set, invalidate the cached results of GraphQL queries involving changed objects.
+
+    Relationship associations and objects of explicit many-to-many through models (such as `IPAddressToInterface`) also
+    invalidate results involving the models on either side of the relation, and changes to objects that can affect the
+    results of any model (such as computed fields) invalidate all results.
+    """
+    if not settings.GRAPHQL_RESULT_CACHE_TIMEOUT:
+        return
+
+    if "action" in kwargs:  # m2m_changed, such as when adding or removing tags
+        if kwargs["action"] not in ("post_add", "post_remove", "post_clear"):
+            return
+        models = {type(instance), kwargs["model"]}
+    else:
+        models = {sender}
+    if isinstance(instance, RelationshipAssociation):
+        models.update(
+            model
+            for model in (instance.source_type.model_class(), instance.destination_type.model_class())
+            if model is not None
+        )
+    for model in list(models):
+        models.update(get_through_related_models(model))
+    if any(issubclass(model, _GRAPHQL_RESULT_CACHE_GLOBAL_MODELS) for model in models):
+        models = set()
+
+    invalidate_graphql_result_cache(*models)
+
+
+post_save.connect(graphql_result_cache_object_changed)
+m2m_changed.connect(graphql_result_cache_object_changed)
+post_delete.connect(graphql_result_cache_object_changed)
+
+
 #
 # Jobs
 #
@@ -1349,6 +1349,7 @@ class WebhookTable(BaseTable):
             "type_create",
             "type_update",
             "type_delete",
+            "batch_size",
             "ssl_verification",
             "ca_file_path",
         )
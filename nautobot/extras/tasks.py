@@ -1,5 +1,6 @@
 from logging import getLogger
 
+from django.apps import apps
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
 from jinja2.exceptions import TemplateError
@@ -172,16 +173,29 @@ def provision_field(field_id, content_type_pk_set, change_context=None):
     return True
 
 
-@nautobot_task
-def process_webhook(webhook_pk, data, model_name, event, timestamp, username, request_id, snapshots):
+@nautobot_task(soft_time_limit=1800, time_limit=2000)
+def refresh_rendered_config_contexts(model_label, pks=None):
     """
-    Make a POST request to the defined Webhook
+    Recompute the materialized `RenderedConfigContext` of the given (or all) objects of a `ConfigContextModel`.
+
+    Args:
+        model_label (str): Model label of the `ConfigContextModel`, such as `"dcim.device"`
+        pks (list): Optional list of PKs of objects to refresh; if unspecified, all objects of this model are refreshed.
     """
-    from nautobot.extras.models import Webhook  # avoiding circular import
+    task_logger = getLogger("celery.task.refresh_rendered_config_contexts")
 
-    webhook = Webhook.objects.get(pk=webhook_pk)
+    model = apps.get_model(model_label)
+    queryset = model.objects.all()
+    if pks is not None:
+        queryset = queryset.filter(pk__in=pks)
+    count = queryset.refresh_rendered_config_contexts()
+    task_logger.info("Refreshed rendered config context data for %d %s records.", count, model._meta.verbose_name)
 
-    context = {
+    return count
+
+
+def _get_webhook_context(data, model_name, event, timestamp, username, request_id, snapshots):
+    return {
         "event": dict(ObjectChangeActionChoices)[event].lower(),
         "timestamp": timestamp,
         "model": model_name,
@@ -191,6 +205,9 @@ def process_webhook(webhook_pk, data, model_name, event, timestamp, username, re
         "snapshots": snapshots,
     }
 
+
+def _send_webhook(webhook, context, description):
+    """Render and send the HTTP request for the given Webhook and context."""
     # Build the headers for the HTTP request
     headers = {
         "Content-Type": webhook.http_content_type,
@@ -215,7 +232,7 @@ def process_webhook(webhook_pk, data, model_name, event, timestamp, username, re
         "headers": headers,
         "data": body.encode("utf8"),
     }
-    logger.info("Sending %s request to %s (%s %s)", params["method"], params["url"], context["model"], context["event"])
+    logger.info("Sending %s request to %s (%s)", params["method"], params["url"], description)
     logger.debug("%s", params)
     try:
         prepared_request = requests.Request(**params).prepare()
@@ -242,3 +259,31 @@ def process_webhook(webhook_pk, data, model_name, event, timestamp, username, re
         raise requests.exceptions.RequestException(
             f"Status {response.status_code} returned with content '{response.content}', webhook FAILED to process."
         )
+
+
+@nautobot_task
+def process_webhook(webhook_pk, data, model_name, event, timestamp, username, request_id, snapshots):
+    """
+    Make a POST request to the defined Webhook
+    """
+    from nautobot.extras.models import Webhook  # avoiding circular import
+
+    webhook = Webhook.objects.get(pk=webhook_pk)
+    context = _get_webhook_context(data, model_name, event, timestamp, username, request_id, snapshots)
+    return _send_webhook(webhook, context, f"{context['model']} {context['event']}")
+
+
+@nautobot_task
+def process_webhook_batch(webhook_pk, events):
+    """
+    Make a single POST request to the defined Webhook describing multiple object changes.
+
+    Each entry in `events` is a list of the arguments (other than `webhook_pk`) that `process_webhook` would accept for
+    a single object change. The request body template (or default JSON body) is rendered with the context
+    `{"events": [...]}`, where each item in the list is the context that would be used for a single change.
+    """
+    from nautobot.extras.models import Webhook  # avoiding circular import
+
+    webhook = Webhook.objects.get(pk=webhook_pk)
+    context = {"events": [_get_webhook_context(*event) for event in events]}
+    return _send_webhook(webhook, context, f"batch of {len(events)} events")
@@ -74,10 +74,12 @@ CONFIRM_MODAL = """
 SAFE_EMPTY_STR = mark_safe("")  # noqa: S308  # suspicious-mark-safe-usage -- this one is safe
 
 
-def _render_job_button_for_obj(job_button, obj, context, content_type):
+def _render_job_button_for_obj(job_button, obj, context, content_type, has_run_perm):
     """
     Helper method for job_buttons templatetag to reduce repetition of code.
 
+    `has_run_perm` indicates whether the user has permission to run the button's Job.
+
     Returns:
        (str, str): (button_html, form_html)
     """
@@ -105,8 +107,6 @@ def _render_job_button_for_obj(job_button, obj, context, content_type):
     if not text_rendered:
         return (SAFE_EMPTY_STR, SAFE_EMPTY_STR)
 
-    # Disable buttons if the user doesn't have permission to run the underlying Job.
-    has_run_perm = Job.objects.check_perms(context["user"], instance=job_button.job, action="run")
     try:
         _task_queue = job_button.job.task_queues[0]
     except IndexError:
@@ -149,10 +149,13 @@ def job_buttons(context, obj):
     """
     content_type = ContentType.objects.get_for_model(obj)
     # We will enforce "run" permission later in deciding which buttons to show as disabled.
-    buttons = JobButton.objects.filter(content_types=content_type, enabled=True)
+    buttons = JobButton.objects.filter(content_types=content_type, enabled=True).select_related("job")
     if not buttons:
         return SAFE_EMPTY_STR
 
+    # Buttons are disabled if the user doesn't have permission to run the underlying Job.
+    runnable_job_pks, _ = Job.objects.check_perms_bulk(context["user"], {jb.job_id for jb in buttons}, action="run")
+
     buttons_html = forms_html = SAFE_EMPTY_STR
     group_names = OrderedDict()
 
@@ -163,7 +166,9 @@ def job_buttons(context, obj):
 
         # Render and add non-grouped buttons
         else:
-            button_html, form_html = _render_job_button_for_obj(jb, obj, context, content_type)
+            button_html, form_html = _render_job_button_for_obj(
+                jb, obj, context, content_type, jb.job_id in runnable_job_pks
+            )
             buttons_html += button_html
             forms_html += form_html
 
@@ -175,7 +180,9 @@ def job_buttons(context, obj):
 
         for jb in buttons:
             # Render grouped buttons as list items
-            button_html, form_html = _render_job_button_for_obj(jb, obj, context, content_type)
+            button_html, form_html = _render_job_button_for_obj(
+                jb, obj, context, content_type, jb.job_id in runnable_job_pks
+            )
             buttons_rendered += format_html("<li>{}</li>", button_html)
             forms_html += form_html
 
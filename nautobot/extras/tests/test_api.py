@@ -193,6 +193,20 @@ class ComputedFieldTest(APIViewTestCases.APIViewTestCase):
         response = self.client.get(url, data=params, **self.header)
         self.assertIn("computed_fields", response.json())
 
+    def test_computed_field_include_list(self):
+        """Test that the computed fields of a list of objects are rendered correctly for each object."""
+        self.add_permissions("dcim.view_location")
+        url = reverse("dcim-api:location-list")
+
+        response = self.client.get(url, data={"include": "computed_fields", "limit": 10}, **self.header)
+        self.assertHttpStatus(response, 200)
+        results = response.json()["results"]
+        self.assertGreater(len(results), 1)
+        for result in results:
+            self.assertEqual(
+                result["computed_fields"], {"cf1": result["name"], "cf2": result["name"], "cf3": result["name"]}
+            )
+
 
 class ConfigContextTest(APIViewTestCases.APIViewTestCase):
     model = ConfigContext
@@ -3522,6 +3536,36 @@ class RelationshipAssociationTest(APIViewTestCases.APIViewTestCase):
                 self.devices[i].name,
             )
 
+    def test_get_association_data_on_location_list(self):
+        """
+        Check that `include=relationships` on a list endpoint gives the same relationships data as the detail endpoint.
+        """
+        self.add_permissions("dcim.view_location")
+        for depth in (0, 1):
+            with self.subTest(depth=depth):
+                response = self.client.get(
+                    reverse("dcim-api:location-list"),
+                    data={"include": "relationships", "depth": depth, "id": [loc.pk for loc in self.locations]},
+                    **self.header,
+                )
+                self.assertHttpStatus(response, status.HTTP_200_OK)
+                self.assertEqual(len(response.data["results"]), len(self.locations))
+                for result in response.data["results"]:
+                    detail_response = self.client.get(
+                        reverse("dcim-api:location-detail", kwargs={"pk": result["id"]}),
+                        data={"include": "relationships", "depth": depth},
+                        **self.header,
+                    )
+                    expected = detail_response.data["relationships"]
+                    actual = result["relationships"]
+                    self.assertEqual(set(actual), set(expected))
+                    for key, relationship_data in expected.items():
+                        for side in ("source", "destination", "peer"):
+                            if side in relationship_data:
+                                relationship_data[side]["objects"].sort(key=lambda v: str(v["id"]))
+                                actual[key][side]["objects"].sort(key=lambda v: str(v["id"]))
+                    self.assertEqual(actual, expected)
+
     def test_update_association_data_on_location(self):
         """
         Check that relationship-associations can be updated via the 'relationships' field.
@@ -2,7 +2,7 @@ from unittest import mock
 
 from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.models import ContentType
-from django.test import TestCase
+from django.test import override_settings, TestCase
 
 from nautobot.core.celery import app
 from nautobot.core.testing import get_job_class_and_model, TransactionTestCase
@@ -22,7 +22,7 @@ from nautobot.extras.context_managers import (
     deferred_change_logging_for_bulk_operation,
     web_request_context,
 )
-from nautobot.extras.models import JobHook, Status, Webhook
+from nautobot.extras.models import JobHook, ObjectChange, Status, Webhook
 from nautobot.extras.utils import bulk_delete_with_bulk_change_logging
 
 # Use the proper swappable User model
@@ -380,3 +380,39 @@ class BulkEditDeleteChangeLogging(TestCase):
             self.assertEqual(oc_list[0].change_context, ObjectChangeEventContextChoices.CONTEXT_ORM)
         with self.subTest():
             self.assertEqual(oc_list[0].change_context_detail, "test_change_log_context")
+
+    def test_change_log_writers(self):
+        """Test that each of the provided `ObjectChangeWriter` classes produces the same records."""
+        location_type = LocationType.objects.get(name="Campus")
+        location_status = Status.objects.get_for_model(Location).first()
+        for writer in [
+            "nautobot.extras.change_logging.ObjectChangeWriter",
+            "nautobot.extras.change_logging.PostgreSQLCopyObjectChangeWriter",
+        ]:
+            with self.subTest(writer=writer), override_settings(CHANGELOG_BULK_WRITER=writer):
+                with web_request_context(self.user, context_detail=writer):
+                    with deferred_change_logging_for_bulk_operation():
+                        locations = [
+                            Location.objects.create(
+                                name=f"{writer} {i}",
+                                # Exercise the escaping of special characters
+                                description="Tab\there\nNewline\\Backslash 'quotes' \"double\" ümlaut",
+                                location_type=location_type,
+                                status=location_status,
+                            )
+                            for i in range(3)
+                        ]
+
+                oc_list = ObjectChange.objects.filter(change_context_detail=writer)
+                self.assertEqual(oc_list.count(), len(locations))
+                for location in locations:
+                    object_change = oc_list.get(changed_object_id=location.pk)
+                    expected = location.to_objectchange(ObjectChangeActionChoices.ACTION_CREATE)
+                    self.assertEqual(object_change.action, ObjectChangeActionChoices.ACTION_CREATE)
+                    self.assertEqual(object_change.changed_object, location)
+                    self.assertEqual(object_change.user, self.user)
+                    self.assertEqual(object_change.user_name, self.user.username)
+                    self.assertEqual(object_change.object_repr, expected.object_repr)
+                    self.assertEqual(object_change.object_data["description"], location.description)
+                    self.assertEqual(object_change.object_data_v2["description"], location.description)
+                    self.assertIsNotNone(object_change.time)
@@ -1423,6 +1423,21 @@ class CustomFieldModelTest(TestCase):
     def test_get_computed_fields_only_returns_fields_for_content_type(self):
         self.assertTrue(self.non_location_computed_field.key not in self.location1.get_computed_fields())
 
+    def test_render_for_objects(self):
+        locations = list(Location.objects.all()[:5])
+        renderings = ComputedField.objects.render_for_objects(locations)
+        self.assertEqual(set(renderings), {location.pk for location in locations})
+        for location in locations:
+            self.assertDictEqual(renderings[location.pk], location.get_computed_fields())
+
+        renderings = ComputedField.objects.render_for_objects(locations, label_as_key=True, advanced_ui=False)
+        for location in locations:
+            self.assertDictEqual(
+                renderings[location.pk], location.get_computed_fields(label_as_key=True, advanced_ui=False)
+            )
+
+        self.assertEqual(ComputedField.objects.render_for_objects([]), {})
+
     def test_check_if_key_is_graphql_safe(self):
         """
         Check the GraphQL validation method on CustomField Key Attribute.
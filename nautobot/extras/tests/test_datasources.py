@@ -15,6 +15,7 @@ from nautobot.core.jobs import GitRepositoryDryRun, GitRepositorySync
 from nautobot.core.testing import (
     create_job_result_and_run_job,
     run_job_for_testing,
+    TestCase,
     TransactionTestCase,
 )
 from nautobot.dcim.models import Device, DeviceType, Location, LocationType, Manufacturer
@@ -25,6 +26,7 @@ from nautobot.extras.choices import (
     SecretsGroupSecretTypeChoices,
 )
 from nautobot.extras.datasources.registry import get_datasource_contents
+from nautobot.extras.datasources.utils import load_data_files
 from nautobot.extras.models import (
     ConfigContext,
     ConfigContextSchema,
@@ -679,6 +681,90 @@ class GitTest(TransactionTestCase):
                     print(job_result.traceback)
                     raise
 
+    def test_git_repository_sync_incremental(self):
+        """
+        A resync should only refresh data from the files changed since the previously synced commit, unless requested.
+        """
+        with tempfile.TemporaryDirectory() as tempdir:
+            with self.settings(GIT_ROOT=tempdir):
+                job_model = GitRepositorySync().job_model
+                job_result = run_job_for_testing(job=job_model, repository=self.repo.pk)
+                job_result.refresh_from_db()
+                self.assertEqual(job_result.status, JobResultStatusChoices.STATUS_SUCCESS, job_result.traceback)
+                self.repo.refresh_from_db()
+                empty_repo_head = self.repo.current_head
+
+                # Files added since the previously synced commit are imported
+                self.repo.branch = "valid-files"  # actually a tag
+                self.repo.save()
+                job_result = run_job_for_testing(job=job_model, repository=self.repo.pk)
+                job_result.refresh_from_db()
+                self.assertEqual(
+                    job_result.status,
+                    JobResultStatusChoices.STATUS_SUCCESS,
+                    (job_result.traceback, list(job_result.job_log_entries.values_list("message", flat=True))),
+                )
+                self.repo.refresh_from_db()
+                self.assertNotEqual(self.repo.current_head, empty_repo_head)
+                self.assert_explicit_config_context_exists("Frobozz 1000 NTP servers")
+                self.assert_implicit_config_context_exists("Location context")
+                self.assert_config_context_schema_record_exists("Config Context Schema 1")
+                self.assert_device_exists(self.device.name)
+                self.assert_export_template_device("template.j2")
+                self.assert_export_template_html_exist("template2.html")
+                self.assert_export_template_vlan_exists("template.j2")
+
+                # Unchanged files aren't reimported
+                ConfigContext.objects.filter(name="Location context").update(description="Changed outside of Git")
+                job_result = run_job_for_testing(job=job_model, repository=self.repo.pk)
+                job_result.refresh_from_db()
+                self.assertEqual(job_result.status, JobResultStatusChoices.STATUS_SUCCESS, job_result.traceback)
+                self.assertEqual(
+                    ConfigContext.objects.get(name="Location context").description, "Changed outside of Git"
+                )
+
+                # ...unless the previous sync logged errors, so that any files that failed to import are retried
+                JobLogEntry.objects.create(
+                    job_result=job_result, log_level=LogLevelChoices.LOG_ERROR, message="Failed to import a file"
+                )
+                job_result = run_job_for_testing(job=job_model, repository=self.repo.pk)
+                job_result.refresh_from_db()
+                self.assertEqual(job_result.status, JobResultStatusChoices.STATUS_SUCCESS, job_result.traceback)
+                self.assertNotEqual(
+                    ConfigContext.objects.get(name="Location context").description, "Changed outside of Git"
+                )
+                job_result.job_log_entries.get(
+                    log_level=LogLevelChoices.LOG_WARNING,
+                    message="The previous sync of this repository logged errors; refreshing all files",
+                )
+
+                # ...or a full resync is requested
+                job_result = run_job_for_testing(job=job_model, repository=self.repo.pk, full_resync=True)
+                job_result.refresh_from_db()
+                self.assertEqual(job_result.status, JobResultStatusChoices.STATUS_SUCCESS, job_result.traceback)
+                self.assert_implicit_config_context_exists("Location context")
+                # Unchanged config contexts are logged in aggregate
+                log_entries = job_result.job_log_entries.filter(log_level=LogLevelChoices.LOG_INFO)
+                log_entries.get(grouping="config contexts", message="No change to 1 config context(s)")
+                log_entries.get(grouping="local config contexts", message="No change to 1 local config context(s)")
+
+                # Data from files deleted since the previously synced commit is deleted
+                self.repo.branch = "empty-repo"
+                self.repo.save()
+                job_result = run_job_for_testing(job=job_model, repository=self.repo.pk)
+                job_result.refresh_from_db()
+                self.assertEqual(job_result.status, JobResultStatusChoices.STATUS_SUCCESS, job_result.traceback)
+                git_repository_content_type = ContentType.objects.get_for_model(GitRepository)
+                for model in (ConfigContext, ConfigContextSchema, ExportTemplate):
+                    self.assertFalse(
+                        model.objects.filter(
+                            owner_content_type=git_repository_content_type, owner_object_id=self.repo.pk
+                        ).exists()
+                    )
+                device = Device.objects.get(name=self.device.name)
+                self.assertIsNone(device.local_config_context_data)
+                self.assertIsNone(device.local_config_context_data_owner)
+
     def test_git_dry_run(self):
         with tempfile.TemporaryDirectory() as tempdir:
             with self.settings(GIT_ROOT=tempdir):
@@ -770,3 +856,27 @@ class GitTest(TransactionTestCase):
             "provides contents overlapping with this repository.",
             str(cm.exception),
         )
+
+
+class LoadDataFilesTest(TestCase):
+    """Tests for the `load_data_files()` function."""
+
+    def test_load_data_files(self):
+        with tempfile.TemporaryDirectory() as tempdir:
+            file_paths = []
+            for file_name, content in (
+                ("context.yaml", "---\n_metadata:\n  name: YAML context\nfoo: bar\n"),
+                ("context.json", '{"_metadata": {"name": "JSON context"}, "foo": [1, 2]}'),
+                ("bad.json", '{"data":\n'),
+            ):
+                file_paths.append(os.path.join(tempdir, file_name))
+                with open(file_paths[-1], "w") as fd:
+                    fd.write(content)
+
+            for workers in (1, 2):
+                with self.subTest(workers=workers), self.settings(GIT_DATA_PARSE_WORKERS=workers):
+                    file_data = load_data_files(file_paths)
+                    self.assertEqual(list(file_data), file_paths)
+                    self.assertEqual(file_data[file_paths[0]], {"_metadata": {"name": "YAML context"}, "foo": "bar"})
+                    self.assertEqual(file_data[file_paths[1]], {"_metadata": {"name": "JSON context"}, "foo": [1, 2]})
+                    self.assertIsInstance(file_data[file_paths[2]], RuntimeError)
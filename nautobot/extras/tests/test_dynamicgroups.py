@@ -4,6 +4,7 @@ from django.apps import apps
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError
 from django.db.models import ProtectedError, QuerySet
+from django.test import override_settings
 from django.urls import reverse
 
 from nautobot.core.forms.fields import MultiMatchModelMultipleChoiceField, MultiValueCharField
@@ -30,6 +31,7 @@ from nautobot.extras.choices import (
     DynamicGroupTypeChoices,
     RelationshipTypeChoices,
 )
+from nautobot.extras.dynamic_groups import get_dynamic_group_refresh_order, refresh_dynamic_group_member_caches
 from nautobot.extras.filters import DynamicGroupFilterSet, DynamicGroupMembershipFilterSet
 from nautobot.extras.models import (
     CustomField,
@@ -280,6 +282,39 @@ class DynamicGroupModelTest(DynamicGroupTestBase):  # TODO: BaseModelTestCase mi
         self.assertEqual(list(device4_groups), [])
         self.assertQuerysetEqual(device4.dynamic_groups, [])
 
+    def test_get_for_objects(self):
+        """Test `DynamicGroup.objects.get_for_objects()`."""
+        devices = Device.objects.filter(pk__in=[device.pk for device in self.devices]).order_by("name")
+        expected = {}
+        for device in devices:
+            groups = list(DynamicGroup.objects.get_for_object(device).order_by("name"))
+            if groups:
+                expected[device.pk] = groups
+        self.assertNotEqual(expected, {})
+
+        ContentType.objects.clear_cache()
+        with self.assertNumQueries(2):  # one for the (uncached) ContentType, one for the memberships
+            self.assertEqual(DynamicGroup.objects.get_for_objects(devices), expected)
+        self.assertEqual(DynamicGroup.objects.get_for_objects(list(devices)), expected)
+        first_two = {device.pk for device in devices[:2]}
+        self.assertEqual(
+            DynamicGroup.objects.get_for_objects(devices[:2]),
+            {pk: groups for pk, groups in expected.items() if pk in first_two},
+        )
+        self.assertEqual(DynamicGroup.objects.get_for_objects([]), {})
+        # Restricting the queryset of candidate groups restricts the results
+        self.assertEqual(DynamicGroup.objects.none().get_for_objects(devices), {})
+
+    def test_prefetch_for_objects(self):
+        """Test `DynamicGroup.objects.prefetch_for_objects()`."""
+        devices = Device.objects.filter(pk__in=[device.pk for device in self.devices])
+        expected = {device.pk: list(DynamicGroup.objects.get_for_object(device)) for device in devices}
+
+        devices = DynamicGroup.objects.prefetch_for_objects(devices)
+        with self.assertNumQueries(0):
+            for device in devices:
+                self.assertEqual(sorted(device.dynamic_groups, key=str), sorted(expected[device.pk], key=str))
+
     def test_members(self):
         """Test `DynamicGroup.members`."""
         group = self.first_child
@@ -1062,6 +1097,121 @@ class DynamicGroupModelTest(DynamicGroupTestBase):  # TODO: BaseModelTestCase mi
         self.assertEqual(sorted(list(group.members)), sorted(list(updated_members)))
         self.assertEqual(sorted(list(group.members)), sorted(list(group.members_cached)))
 
+    def test_update_cached_members_for_objects(self):
+        """Test `DynamicGroup.update_cached_members_for_objects()`."""
+        group = self.first_child
+        group.update_cached_members()
+        device1 = self.devices[0]  # device-location-1
+        device4 = self.devices[-1]  # device-location-4
+        self.assertIn(device1, group.members)
+        self.assertNotIn(device4, group.members)
+
+        # Queryset update() doesn't send signals, so the cache is now stale
+        Device.objects.filter(pk=device1.pk).update(location=self.locations[1])
+        Device.objects.filter(pk=device4.pk).update(location=self.locations[0])
+        self.assertIn(device1, group.members)
+        self.assertNotIn(device4, group.members)
+
+        self.assertEqual(group.update_cached_members_for_objects([device1.pk, device4.pk]), (1, 1))
+        self.assertNotIn(device1, group.members)
+        self.assertIn(device4, group.members)
+        self.assertQuerysetEqual(group.members, group._get_group_queryset(), ordered=False)
+
+        # Nothing further to do
+        self.assertEqual(group.update_cached_members_for_objects([device1.pk, device4.pk]), (0, 0))
+        self.assertEqual(group.update_cached_members_for_objects([]), (0, 0))
+
+    def test_incremental_member_updates(self):
+        """Test that `DYNAMIC_GROUPS_INCREMENTAL_UPDATES_ENABLED` updates member caches on commit of object changes."""
+        group = self.first_child
+        group.update_cached_members()
+        device4 = self.devices[-1]  # device-location-4
+
+        with override_settings(DYNAMIC_GROUPS_INCREMENTAL_UPDATES_ENABLED=False):
+            with self.captureOnCommitCallbacks(execute=True):
+                device4.location = self.locations[0]
+                device4.save()
+            self.assertNotIn(device4, group.members)
+
+        with override_settings(DYNAMIC_GROUPS_INCREMENTAL_UPDATES_ENABLED=True):
+            with self.captureOnCommitCallbacks(execute=True) as callbacks:
+                device4.save()
+                # Batched together into a single callback
+                self.devices[1].save()
+                self.devices[2].save()
+            self.assertEqual(len(callbacks), 1)
+            self.assertIn(device4, group.members)
+
+            with self.captureOnCommitCallbacks(execute=True):
+                device4.location = self.locations[3]
+                device4.save()
+            self.assertNotIn(device4, group.members)
+
+            # Adding/removing tags is also detected
+            tag = Tag.objects.get_for_model(Device).first()
+            tag_group = DynamicGroup.objects.create(
+                name="Tagged Devices",
+                filter={"tags": [tag.name]},
+                content_type=self.device_ct,
+            )
+            self.assertNotIn(device4, tag_group.members)
+            with self.captureOnCommitCallbacks(execute=True):
+                device4.tags.add(tag)
+            self.assertIn(device4, tag_group.members)
+            with self.captureOnCommitCallbacks(execute=True):
+                device4.tags.remove(tag)
+            self.assertNotIn(device4, tag_group.members)
+
+
+class DynamicGroupRefreshTest(DynamicGroupTestBase):
+    """Tests for the `nautobot.extras.dynamic_groups` refresh engine."""
+
+    def test_get_dynamic_group_refresh_order(self):
+        groups = DynamicGroup.objects.exclude(group_type=DynamicGroupTypeChoices.TYPE_STATIC)
+        levels = get_dynamic_group_refresh_order(groups)
+
+        self.assertEqual(sum(len(level) for level in levels), groups.count())
+        level_by_group = {group: index for index, level in enumerate(levels) for group in level}
+        for group in groups:
+            for child in group.children.all():
+                with self.subTest(parent=group.name, child=child.name):
+                    self.assertLess(level_by_group[child], level_by_group[group])
+        self.assertEqual(level_by_group[self.nested_child], 0)
+        self.assertEqual(level_by_group[self.third_child], 1)
+        self.assertEqual(level_by_group[self.parent], 2)
+
+    def test_refresh_dynamic_group_member_caches(self):
+        device4 = self.devices[-1]  # device-location-4
+        self.first_child.update_cached_members()
+        Device.objects.filter(pk=device4.pk).update(location=self.locations[0])
+        self.assertNotIn(device4, self.first_child.members)
+
+        results = list(refresh_dynamic_group_member_caches())
+        self.assertEqual(
+            {result.group for result in results},
+            set(DynamicGroup.objects.exclude(group_type=DynamicGroupTypeChoices.TYPE_STATIC)),
+        )
+        self.assertIn(device4, self.first_child.members)
+        result = next(result for result in results if result.group == self.first_child)
+        self.assertFalse(result.skipped)
+        self.assertIsNone(result.error)
+        self.assertEqual(result.members_after - result.members_before, 1)
+
+    def test_refresh_dynamic_group_member_caches_skip_unchanged(self):
+        groups = DynamicGroup.objects.filter(pk=self.first_child.pk)
+        (result,) = refresh_dynamic_group_member_caches(groups, skip_unchanged=True)
+        self.assertFalse(result.skipped)
+        (result,) = refresh_dynamic_group_member_caches(groups, skip_unchanged=True)
+        self.assertTrue(result.skipped)
+        (result,) = refresh_dynamic_group_member_caches(groups, skip_unchanged=False)
+        self.assertFalse(result.skipped)
+
+        self.devices[-1].location = self.locations[0]
+        self.devices[-1].save()
+        (result,) = refresh_dynamic_group_member_caches(groups, skip_unchanged=True)
+        self.assertFalse(result.skipped)
+        self.assertIn(self.devices[-1], self.first_child.members)
+
 
 class DynamicGroupMembershipModelTest(DynamicGroupTestBase):  # TODO: BaseModelTestCase mixin?
     """DynamicGroupMembership model tests."""
@@ -1,4 +1,5 @@
 from datetime import datetime, timedelta, timezone
+from io import StringIO
 import os
 import tempfile
 from unittest import expectedFailure, mock
@@ -10,6 +11,8 @@ from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError
 from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.core.management.base import CommandError
 from django.db.models import ProtectedError
 from django.db.utils import IntegrityError
 from django.test import override_settings
@@ -17,6 +20,7 @@ from django.test.utils import isolate_apps
 from django.utils.timezone import get_default_timezone, now
 from django_celery_beat.tzcrontab import TzAwareCrontab
 from jinja2.exceptions import TemplateAssertionError, TemplateSyntaxError
+import redis.exceptions
 import time_machine
 
 try:
@@ -37,6 +41,7 @@ from nautobot.dcim.models import (
     Platform,
 )
 from nautobot.extras.choices import (
+    DynamicGroupTypeChoices,
     JobExecutionType,
     JobResultStatusChoices,
     LogLevelChoices,
@@ -71,6 +76,7 @@ from nautobot.extras.models import (
     MetadataType,
     ObjectChange,
     ObjectMetadata,
+    RenderedConfigContext,
     Role,
     SavedView,
     ScheduledJob,
@@ -85,7 +91,9 @@ from nautobot.extras.models import (
 )
 from nautobot.extras.models.statuses import StatusModel
 from nautobot.extras.registry import registry
+from nautobot.extras.secrets.cache import clear_secret_cache
 from nautobot.extras.secrets.exceptions import SecretParametersError, SecretProviderError, SecretValueNotFoundError
+from nautobot.extras.secrets.providers import EnvironmentVariableSecretsProvider
 from nautobot.ipam.models import IPAddress
 from nautobot.tenancy.models import Tenant
 from nautobot.virtualization.models import (
@@ -616,6 +624,122 @@ class ConfigContextTest(ModelTestCases.BaseModelTestCase):
         self.assertIn("dynamic context 2", device2.get_config_context().values())
         self.assertNotIn("dynamic context 1", device2.get_config_context().values())
 
+    @override_settings(CONFIG_CONTEXT_MATERIALIZATION_ENABLED=True)
+    def test_rendered_config_context(self):
+        """Verify that the materialized config context is used and kept up to date."""
+        expected_data = {"a": 123, "b": 456, "c": 777}
+        # Not materialized yet, so computed on demand
+        self.assertFalse(RenderedConfigContext.objects.filter(assigned_object_id=self.device.pk).exists())
+        self.assertEqual(self.device.get_config_context(), expected_data)
+
+        self.assertEqual(Device.objects.filter(pk=self.device.pk).refresh_rendered_config_contexts(), 1)
+        rendered_config_context = RenderedConfigContext.objects.get(assigned_object_id=self.device.pk)
+        self.assertEqual(rendered_config_context.assigned_object, self.device)
+        self.assertEqual(rendered_config_context.data, expected_data)
+        with self.assertNumQueries(1):
+            device = Device.objects.filter(pk=self.device.pk).annotate_config_context_data().get()
+            self.assertEqual(device.get_config_context(), expected_data)
+
+        # Changes to ConfigContexts refresh the materialized data
+        with self.captureOnCommitCallbacks(execute=True):
+            context = ConfigContext.objects.create(name="context 2", weight=200, data={"c": 789})
+        rendered_config_context.refresh_from_db()
+        self.assertEqual(rendered_config_context.data, {"a": 123, "b": 456, "c": 789})
+
+        with self.captureOnCommitCallbacks(execute=True):
+            context.tenants.add(self.tenant)
+        rendered_config_context.refresh_from_db()
+        self.assertEqual(rendered_config_context.data, expected_data)
+
+        # Changes to the Device itself refresh the materialized data
+        with self.captureOnCommitCallbacks(execute=True):
+            self.device.tenant = self.tenant
+            self.device.local_config_context_data = {"d": 1}
+            self.device.save()
+        rendered_config_context.refresh_from_db()
+        self.assertEqual(rendered_config_context.data, {"a": 123, "b": 456, "c": 789, "d": 1})
+
+        with self.captureOnCommitCallbacks(execute=True):
+            context.delete()
+        rendered_config_context.refresh_from_db()
+        self.assertEqual(rendered_config_context.data, {**expected_data, "d": 1})
+
+        # Deleting the Device deletes its materialized data
+        self.device.delete()
+        self.assertFalse(RenderedConfigContext.objects.filter(pk=rendered_config_context.pk).exists())
+
+    @override_settings(CONFIG_CONTEXT_MATERIALIZATION_ENABLED=True, CONFIG_CONTEXT_DYNAMIC_GROUPS_ENABLED=True)
+    def test_rendered_config_context_dynamic_group_membership(self):
+        """Verify that the materialized config context is refreshed when objects join or leave a Dynamic Group."""
+        Device.objects.filter(pk=self.device.pk).refresh_rendered_config_contexts()
+        rendered_config_context = RenderedConfigContext.objects.get(assigned_object_id=self.device.pk)
+        with self.captureOnCommitCallbacks(execute=True):
+            context = ConfigContext.objects.create(name="dynamic context", weight=200, data={"c": 1})
+            context.dynamic_groups.add(self.dynamic_groups)
+        rendered_config_context.refresh_from_db()
+        self.assertEqual(rendered_config_context.data, {"a": 123, "b": 456, "c": 777})
+
+        # The Device joins the group when its member cache is refreshed
+        with self.captureOnCommitCallbacks(execute=True):
+            self.dynamic_groups.save()
+        rendered_config_context.refresh_from_db()
+        self.assertEqual(rendered_config_context.data, {"a": 123, "b": 456, "c": 1})
+
+        # The Device leaves the group when its filter changes
+        with self.captureOnCommitCallbacks(execute=True):
+            self.dynamic_groups.filter = {"name": ["Device 2"]}
+            self.dynamic_groups.save()
+        rendered_config_context.refresh_from_db()
+        self.assertEqual(rendered_config_context.data, {"a": 123, "b": 456, "c": 777})
+
+        # The Device joins and leaves a static group
+        static_group = DynamicGroup.objects.create(
+            name="Static Group",
+            content_type=ContentType.objects.get_for_model(Device),
+            group_type=DynamicGroupTypeChoices.TYPE_STATIC,
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            context.dynamic_groups.add(static_group)
+            static_group.add_members([self.device])
+        rendered_config_context.refresh_from_db()
+        self.assertEqual(rendered_config_context.data, {"a": 123, "b": 456, "c": 1})
+        with self.captureOnCommitCallbacks(execute=True):
+            static_group.remove_members([self.device])
+        rendered_config_context.refresh_from_db()
+        self.assertEqual(rendered_config_context.data, {"a": 123, "b": 456, "c": 777})
+
+    @override_settings(CONFIG_CONTEXT_MATERIALIZATION_ENABLED=True)
+    def test_rendered_config_context_key_order(self):
+        """Verify that the materialized config context keeps the key order of the weight-merged config context."""
+        ConfigContext.objects.create(name="context 0", weight=50, data={"zz": {"y": 1, "x": 2}})
+        expected_data = self.device.render_config_context()
+        self.assertEqual(list(expected_data), ["zz", "a", "b", "c"])
+
+        Device.objects.filter(pk=self.device.pk).refresh_rendered_config_contexts()
+        self.assertTrue(RenderedConfigContext.objects.filter(assigned_object_id=self.device.pk).exists())
+        config_context = self.device.get_config_context()
+        self.assertEqual(list(config_context), list(expected_data))
+        self.assertEqual(list(config_context["zz"]), list(expected_data["zz"]))
+        device = Device.objects.filter(pk=self.device.pk).annotate_config_context_data().get()
+        self.assertEqual(list(device.get_config_context()), list(expected_data))
+
+    @override_settings(CONFIG_CONTEXT_MATERIALIZATION_ENABLED=True)
+    def test_refresh_rendered_config_contexts_command(self):
+        call_command("refresh_rendered_config_contexts", stdout=StringIO())
+        rendered_config_context = RenderedConfigContext.objects.get(assigned_object_id=self.device.pk)
+        self.assertEqual(rendered_config_context.data, {"a": 123, "b": 456, "c": 777})
+        call_command("refresh_rendered_config_contexts", "--check", stdout=StringIO())
+
+        # Simulate a change that bypassed signals
+        RenderedConfigContext.objects.filter(pk=rendered_config_context.pk).update(data={"a": 1})
+        with self.assertRaises(CommandError):
+            call_command("refresh_rendered_config_contexts", "--check", stdout=StringIO(), stderr=StringIO())
+        self.assertEqual(self.device.get_config_context(), {"a": 1})
+
+        call_command("refresh_rendered_config_contexts", stdout=StringIO())
+        call_command("refresh_rendered_config_contexts", "--check", stdout=StringIO())
+        self.assertEqual(self.device.get_config_context(), {"a": 123, "b": 456, "c": 777})
+
 
 class ConfigContextSchemaTestCase(ModelTestCases.BaseModelTestCase):
     """
@@ -2407,6 +2531,51 @@ class SecretTest(ModelTestCases.BaseModelTestCase):
             'No registered provider "it-is-a-mystery" is available',
         )
 
+    @override_settings(SECRETS_CACHE_TTL=60)
+    def test_cached_value(self):
+        """Secret values are cached when enabled, and invalidated when the Secret is saved."""
+        self.addCleanup(clear_secret_cache)
+        with mock.patch.dict(os.environ, {"NAUTOBOT_TEST_ENVIRONMENT_VARIABLE": "supersecretvalue"}):
+            self.assertEqual(self.environment_secret.get_value(), "supersecretvalue")
+        with mock.patch.dict(os.environ, {"NAUTOBOT_TEST_ENVIRONMENT_VARIABLE": "newsecretvalue"}):
+            self.assertEqual(self.environment_secret.get_value(), "supersecretvalue")
+            self.environment_secret.save()
+            self.assertEqual(self.environment_secret.get_value(), "newsecretvalue")
+
+    @override_settings(SECRETS_CACHE_TTL=60)
+    @mock.patch.dict(os.environ, {"NAUTOBOT_TEST_NYC": "nycsecretvalue", "NAUTOBOT_TEST_LAX": "laxsecretvalue"})
+    def test_cached_templated_value(self):
+        """A separate value is cached for each set of rendered parameters of a templated Secret."""
+        self.addCleanup(clear_secret_cache)
+        other_location = Location.objects.exclude(pk=self.location.pk).first()
+        other_location.name = "lax"
+        other_location.save()
+        self.assertEqual(self.environment_secret_templated.get_value(obj=self.location), "nycsecretvalue")
+        self.assertEqual(self.environment_secret_templated.get_value(obj=other_location), "laxsecretvalue")
+        self.assertEqual(self.environment_secret_templated.get_value(obj=self.location), "nycsecretvalue")
+
+    @override_settings(SECRETS_CACHE_TTL=60)
+    def test_cached_value_cache_unavailable(self):
+        """Values are retrieved from the provider, without caching them, if the Django cache is unavailable."""
+        self.addCleanup(clear_secret_cache)
+        with mock.patch(
+            "nautobot.core.utils.cache.cache.get_many", side_effect=redis.exceptions.ConnectionError("unavailable")
+        ):
+            with mock.patch.dict(os.environ, {"NAUTOBOT_TEST_ENVIRONMENT_VARIABLE": "supersecretvalue"}):
+                self.assertEqual(self.environment_secret.get_value(), "supersecretvalue")
+            with mock.patch.dict(os.environ, {"NAUTOBOT_TEST_ENVIRONMENT_VARIABLE": "newsecretvalue"}):
+                self.assertEqual(self.environment_secret.get_value(), "newsecretvalue")
+
+    @override_settings(SECRETS_CACHE_TTL=60)
+    def test_cached_value_not_cacheable_provider(self):
+        """Values of providers that opt out of caching are retrieved every time."""
+        self.addCleanup(clear_secret_cache)
+        with mock.patch.object(EnvironmentVariableSecretsProvider, "is_cacheable", False):
+            with mock.patch.dict(os.environ, {"NAUTOBOT_TEST_ENVIRONMENT_VARIABLE": "supersecretvalue"}):
+                self.assertEqual(self.environment_secret.get_value(), "supersecretvalue")
+            with mock.patch.dict(os.environ, {"NAUTOBOT_TEST_ENVIRONMENT_VARIABLE": "newsecretvalue"}):
+                self.assertEqual(self.environment_secret.get_value(), "newsecretvalue")
+
 
 class SecretsGroupTest(ModelTestCases.BaseModelTestCase):
     """
@@ -1095,6 +1095,46 @@ class RelationshipAssociationTest(RelationshipBaseTest, ModelTestCases.BaseModel
             },
         )
 
+    def test_get_relationships_for_objects(self):
+        associations = [
+            RelationshipAssociation(relationship=self.o2m_1, source=self.locations[1], destination=self.vlans[0]),
+            RelationshipAssociation(relationship=self.o2o_1, source=self.racks[0], destination=self.locations[1]),
+            RelationshipAssociation(relationship=self.o2o_2, source=self.locations[0], destination=self.locations[1]),
+            RelationshipAssociation(relationship=self.m2ms_1, source=self.locations[0], destination=self.locations[2]),
+            RelationshipAssociation(relationship=self.m2ms_1, source=self.locations[1], destination=self.locations[0]),
+            RelationshipAssociation(relationship=self.m2m_1, source=self.racks[0], destination=self.vlans[0]),
+            RelationshipAssociation(relationship=self.m2m_1, source=self.racks[0], destination=self.vlans[1]),
+            RelationshipAssociation(relationship=self.o2os_1, source=self.racks[1], destination=self.racks[2]),
+        ]
+        for association in associations:
+            association.validated_save()
+
+        for model, objects in ((Location, list(self.locations)), (Rack, self.racks), (VLAN, self.vlans)):
+            for include_hidden in (False, True):
+                with self.subTest(model=model, include_hidden=include_hidden):
+                    bulk_data = model.get_relationships_for_objects(objects, include_hidden=include_hidden)
+                    self.assertEqual(set(bulk_data), {obj.pk for obj in objects})
+                    for obj in objects:
+                        expected = obj.get_relationships(include_hidden=include_hidden)
+                        actual = bulk_data[obj.pk]
+                        self.assertEqual(set(actual), set(expected))
+                        for side, relationships in expected.items():
+                            self.assertEqual(set(actual[side]), set(relationships))
+                            for relationship, queryset in relationships.items():
+                                self.assertEqual(
+                                    sorted(assoc.pk for assoc in actual[side][relationship]),
+                                    sorted(queryset.values_list("pk", flat=True)),
+                                )
+                                if self.invalid_ct in (relationship.source_type, relationship.destination_type):
+                                    continue
+                                # Peer objects are already loaded
+                                with self.assertNumQueries(0):
+                                    peers = [assoc.get_peer(obj) for assoc in actual[side][relationship]]
+                                self.assertEqual(
+                                    sorted(peer.pk for peer in peers),
+                                    sorted(assoc.get_peer(obj).pk for assoc in queryset),
+                                )
+
     def test_delete_cascade(self):
         """Verify that a RelationshipAssociation is deleted if either of the associated records is deleted."""
         initial_count = RelationshipAssociation.objects.count()
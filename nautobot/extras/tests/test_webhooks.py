@@ -20,7 +20,7 @@ from nautobot.extras.context_managers import web_request_context
 from nautobot.extras.models import Tag, Webhook
 from nautobot.extras.models.statuses import Status
 from nautobot.extras.registry import registry
-from nautobot.extras.tasks import process_webhook
+from nautobot.extras.tasks import process_webhook, process_webhook_batch
 from nautobot.extras.utils import generate_signature
 
 User = get_user_model()
@@ -330,6 +330,85 @@ class WebhookTest(APITestCase):
         self.assertEqual(args[6], request_id)
         self.assertNotEqual(args[7], {})
 
+    @patch("nautobot.extras.tasks.process_webhook_batch.apply_async")
+    @patch("nautobot.extras.tasks.process_webhook.apply_async")
+    def test_enqueue_webhooks_batched(self, mock_async, mock_batch_async):
+        """Multiple changes are sent to a Webhook with a `batch_size` as a single task, always in the batch format."""
+        request_id = uuid.uuid4()
+        location_type = LocationType.objects.get(name="Campus")
+        webhook = Webhook.objects.get(type_create=True)
+        webhook.batch_size = 2
+        webhook.save()
+
+        with web_request_context(self.user, change_id=request_id):
+            locations = [
+                Location.objects.create(name=f"Location {i}", location_type=location_type, status=self.statuses[0])
+                for i in range(3)
+            ]
+        with web_request_context(self.user):
+            locations[0].description = "Updated"
+            locations[0].save()
+
+        self.assertEqual(mock_batch_async.call_count, 2)
+        webhook_pk, events = mock_batch_async.call_args_list[0][1]["args"]
+        self.assertEqual(webhook_pk, webhook.pk)
+        self.assertEqual([event[0]["name"] for event in events], ["Location 0", "Location 1"])
+        self.assertEqual(events[0][2], ObjectChangeActionChoices.ACTION_CREATE)
+        self.assertEqual(events[0][5], request_id)
+        # The remaining single change is still sent in the batch format
+        webhook_pk, events = mock_batch_async.call_args_list[1][1]["args"]
+        self.assertEqual(webhook_pk, webhook.pk)
+        self.assertEqual([event[0]["name"] for event in events], ["Location 2"])
+        # Webhooks without a batch size are sent once per change, as before
+        mock_async.assert_called_once()
+        args = mock_async.call_args[1]["args"]
+        self.assertEqual(args[0], Webhook.objects.get(type_update=True).pk)
+        self.assertEqual(args[1]["name"], "Location 0")
+
+    def test_process_webhook_batch(self):
+        """Test that `process_webhook_batch()` sends a single request containing all of the events."""
+        webhook = Webhook.objects.get(type_create=True)
+        request_id = uuid.uuid4()
+        timestamp = str(timezone.now())
+
+        def mock_send(_, request, **kwargs):
+            self.assertEqual(request.headers["X-Foo"], "Bar")
+            self.assertEqual(request.headers["X-Hook-Signature"], generate_signature(request.body, webhook.secret))
+            body = json.loads(request.body)
+            self.assertEqual([event["data"]["name"] for event in body["events"]], ["Location 1", "Location 2"])
+            self.assertEqual(body["events"][0]["event"], "created")
+            self.assertEqual(body["events"][0]["model"], "location")
+            self.assertEqual(body["events"][0]["request_id"], str(request_id))
+
+            class FakeResponse:
+                ok = True
+                status_code = 200
+
+            return FakeResponse()
+
+        events = [
+            [{"name": name}, "location", ObjectChangeActionChoices.ACTION_CREATE, timestamp, "user", request_id, {}]
+            for name in ["Location 1", "Location 2"]
+        ]
+        with patch.object(Session, "send", mock_send):
+            process_webhook_batch(webhook.pk, events)
+
+    def test_get_for_model(self):
+        """Test that `Webhook.objects.get_for_model()` is cached and invalidated when Webhooks change."""
+        self.assertEqual(len(Webhook.objects.get_for_model(Location)), 2)
+        with self.assertNumQueries(0):
+            self.assertEqual(len(Webhook.objects.get_for_model(Location)), 2)
+
+        webhook = Webhook.objects.get(type_create=True)
+        webhook.enabled = False
+        webhook.save()
+        self.assertEqual(list(Webhook.objects.get_for_model(Location)), [Webhook.objects.get(type_update=True)])
+
+        webhook.enabled = True
+        webhook.save()
+        webhook.content_types.clear()
+        self.assertEqual(list(Webhook.objects.get_for_model(Location)), [Webhook.objects.get(type_update=True)])
+
     @patch("nautobot.extras.context_managers.enqueue_webhooks")
     def test_enqueue_webhooks_create_update(self, mock_enqueue_webhooks):
         """
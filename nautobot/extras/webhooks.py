@@ -1,9 +1,55 @@
+from contextlib import contextmanager
+import contextvars
+
 from django.utils import timezone
 
 from nautobot.extras.choices import ObjectChangeActionChoices
 from nautobot.extras.models import Webhook
 from nautobot.extras.registry import registry
-from nautobot.extras.tasks import process_webhook
+from nautobot.extras.tasks import process_webhook, process_webhook_batch
+
+# Pending WebhookBatch, if webhooks are currently being batched
+_webhook_batch_state = contextvars.ContextVar("webhook_batch_state", default=None)
+
+
+class WebhookBatch:
+    """
+    Collects the payloads for Webhooks triggered by many object changes, so that they can be sent as a single
+    `process_webhook_batch` task (and HTTP request) per Webhook per `Webhook.batch_size` changes.
+    """
+
+    def __init__(self):
+        self.pending = {}
+
+    def add(self, webhook, args):
+        """Add the `process_webhook` arguments (excluding `webhook_pk`) for a single change to the batch."""
+        events = self.pending.setdefault(webhook.pk, [])
+        events.append(args)
+        if len(events) >= webhook.batch_size:
+            self.flush(webhook.pk)
+
+    def flush(self, webhook_pk=None):
+        """Enqueue the pending changes for the given Webhook, or for all Webhooks if not specified."""
+        webhook_pks = [webhook_pk] if webhook_pk is not None else list(self.pending)
+        for pk in webhook_pks:
+            events = self.pending.pop(pk, [])
+            if events:
+                process_webhook_batch.apply_async(args=[pk, events])
+
+
+@contextmanager
+def batched_webhooks():
+    """
+    Within this context, Webhooks with a `batch_size` that are triggered by `enqueue_webhooks()` are batched together,
+    with up to `batch_size` object changes per Celery task and HTTP request. Any incomplete batches are enqueued on exit.
+    """
+    webhook_batch = WebhookBatch()
+    token = _webhook_batch_state.set(webhook_batch)
+    try:
+        yield webhook_batch
+        webhook_batch.flush()
+    finally:
+        _webhook_batch_state.reset(token)
 
 
 def enqueue_webhooks(object_change, webhook_queryset=None):
@@ -12,10 +58,10 @@ def enqueue_webhooks(object_change, webhook_queryset=None):
 
     Args:
         object_change (ObjectChange): The change that may trigger Webhooks to be sent.
-        webhook_queryset (QuerySet): Previously retrieved set of Webhooks to potentially send.
+        webhook_queryset (list): Previously retrieved set of Webhooks to potentially send.
 
     Returns:
-        webhook_queryset (QuerySet): for reuse when processing multiple ObjectChange with the same content-type+action.
+        webhook_queryset (list): for reuse when processing multiple ObjectChange with the same content-type+action.
     """
     # Determine whether this type of object supports webhooks
     app_label = object_change.changed_object_type.app_label
@@ -24,33 +70,46 @@ def enqueue_webhooks(object_change, webhook_queryset=None):
         return webhook_queryset
 
     # Retrieve any applicable Webhooks
-    content_type = object_change.changed_object_type
     action_flag = {
         ObjectChangeActionChoices.ACTION_CREATE: "type_create",
         ObjectChangeActionChoices.ACTION_UPDATE: "type_update",
         ObjectChangeActionChoices.ACTION_DELETE: "type_delete",
     }[object_change.action]
     if webhook_queryset is None:
-        webhook_queryset = Webhook.objects.filter(content_types=content_type, enabled=True, **{action_flag: True})
+        model = object_change.changed_object_type.model_class()
+        if model is None:
+            return webhook_queryset
+        webhook_queryset = [
+            webhook for webhook in Webhook.objects.get_for_model(model) if getattr(webhook, action_flag)
+        ]
 
-    if webhook_queryset:  # not .exists() as we *want* to populate the queryset cache
+    if webhook_queryset:
         # fall back to object_data if object_data_v2 is not available
         serialized_data = object_change.object_data_v2
         if serialized_data is None:
             serialized_data = object_change.object_data
 
+        snapshots = object_change.get_snapshots()
+        timestamp = str(timezone.now())
+        webhook_batch = _webhook_batch_state.get()
+
         # Enqueue the webhooks
         for webhook in webhook_queryset:
             args = [
-                webhook.pk,
                 serialized_data,
                 model_name,
                 object_change.action,
-                str(timezone.now()),
+                timestamp,
                 object_change.user_name,
                 object_change.request_id,
-                object_change.get_snapshots(),
+                snapshots,
             ]
-            process_webhook.apply_async(args=args)
+            if not webhook.batch_size:
+                process_webhook.apply_async(args=[webhook.pk, *args])
+            elif webhook_batch is not None:
+                webhook_batch.add(webhook, args)
+            else:
+                # Batching Webhooks always send the batch format, even outside of `batched_webhooks()`
+                process_webhook_batch.apply_async(args=[webhook.pk, [args]])
 
     return webhook_queryset
@@ -216,9 +216,17 @@ class VLANLocationAssignmentSerializer(ValidatedModelSerializer):
 #
 
 
+class PrefixUtilizationSerializer(serializers.Serializer):
+    """Representation of the `UtilizationData` of a Prefix."""
+
+    numerator = serializers.IntegerField(read_only=True)
+    denominator = serializers.IntegerField(read_only=True)
+
+
 class PrefixSerializer(NautobotModelSerializer, TaggedModelSerializerMixin):
     prefix = IPFieldSerializer()
     type = ChoiceField(choices=PrefixTypeChoices, default=PrefixTypeChoices.TYPE_NETWORK)
+    utilization = PrefixUtilizationSerializer(source="get_utilization", read_only=True)
     # for backward compatibility with 2.0-2.1 where a Prefix had only a single Location
     location = NautobotHyperlinkedRelatedField(
         allow_null=True,
@@ -276,6 +284,15 @@ class PrefixSerializer(NautobotModelSerializer, TaggedModelSerializerMixin):
             ],
         }
 
+    def get_field_names(self, declared_fields, info):
+        """Utilization is expensive to compute and so it's opt-in only, and never included in nested serializers."""
+        fields = list(super().get_field_names(declared_fields, info))
+        if not self.is_nested:
+            self.extend_field_names(fields, "utilization", opt_in_only=True)
+        elif "utilization" in fields:
+            fields.remove("utilization")
+        return fields
+
 
 class PrefixLegacySerializer(PrefixSerializer):
     """Serializer for API versions 2.0-2.1 where a Prefix only had a single Location."""
@@ -11,6 +11,7 @@ from rest_framework.serializers import IntegerField, ListSerializer
 from nautobot.core.api.authentication import TokenPermissions
 from nautobot.core.models.querysets import count_related
 from nautobot.core.utils.config import get_settings_or_config
+from nautobot.core.utils.requests import normalize_querydict
 from nautobot.dcim.models import Location
 from nautobot.extras.api.views import NautobotModelViewSet
 from nautobot.ipam import filters
@@ -121,6 +122,14 @@ class PrefixViewSet(NautobotModelViewSet):
     serializer_class = serializers.PrefixSerializer
     filterset_class = filters.PrefixFilterSet
 
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        # Same logic as OptInFieldsMixin uses to decide whether to include the field
+        if "utilization" in normalize_querydict(self.request.query_params).get("include", []):
+            # Calculate the opt-in `utilization` field for all requested prefixes in the same query
+            queryset = queryset.annotate_utilization()
+        return queryset
+
     def get_serializer_class(self):
         if (
             not getattr(self, "swagger_fake_view", False)
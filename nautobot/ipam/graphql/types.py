@@ -1,6 +1,8 @@
 import graphene
 
+from nautobot.core.graphql import BigInteger
 from nautobot.core.graphql.types import OptimizedNautobotObjectType
+from nautobot.core.graphql.utils import get_selected_field_names
 from nautobot.extras.models import DynamicGroup
 from nautobot.ipam import filters, models
 
@@ -20,6 +22,13 @@ class IPAddressType(OptimizedNautobotObjectType):
         return DynamicGroup.objects.get_for_object(self)
 
 
+class PrefixUtilizationType(graphene.ObjectType):
+    """Graphql Type Object for the utilization of a Prefix."""
+
+    numerator = BigInteger()
+    denominator = BigInteger()
+
+
 class PrefixType(OptimizedNautobotObjectType):
     """Graphql Type Object for Prefix model."""
 
@@ -27,14 +36,25 @@ class PrefixType(OptimizedNautobotObjectType):
     ip_version = graphene.Int()
     dynamic_groups = graphene.List("nautobot.extras.graphql.types.DynamicGroupType")
     location = graphene.Field("nautobot.dcim.graphql.types.LocationType")
+    utilization = graphene.Field(PrefixUtilizationType)
 
     class Meta:
         model = models.Prefix
         filterset_class = filters.PrefixFilterSet
 
+    @classmethod
+    def annotate_queryset(cls, queryset, info):
+        """If `utilization` is selected, calculate it for all prefixes in the list as part of the same query."""
+        if "utilization" in get_selected_field_names(info):
+            queryset = queryset.annotate_utilization()
+        return queryset
+
     def resolve_dynamic_groups(self, args):
         return DynamicGroup.objects.get_for_object(self)
 
+    def resolve_utilization(self, args):
+        return self.get_utilization()
+
 
 class VLANType(OptimizedNautobotObjectType):
     """Graphql Type Object for VLAN model."""
@@ -1005,26 +1005,38 @@ class Prefix(PrimaryModel):
         For prefixes containing IP addresses and/or pools, pools are considered fully utilized while
         only IP addresses that are not contained within pools are added to the utilization.
 
+        If this Prefix was retrieved with `Prefix.objects.annotate_utilization()`, the utilization is calculated from
+        those annotations rather than by querying the database.
+
         Returns:
             UtilizationData (namedtuple): (numerator, denominator)
         """
         denominator = self.prefix.size
-        child_ips = netaddr.IPSet()
-        child_prefixes = netaddr.IPSet()
-
-        # 3.0 TODO: In the long term, TYPE_POOL prefixes will be disallowed from directly containing IPAddresses,
-        # and the addresses will instead be parented to the containing TYPE_NETWORK prefix. It should be possible to
-        # change this when that is the case, see #3873 for historical context.
-        if self.type != choices.PrefixTypeChoices.TYPE_CONTAINER:
-            pool_ips = IPAddress.objects.filter(
-                parent__namespace=self.namespace, host__gte=self.network, host__lte=self.broadcast
-            ).values_list("host", flat=True)
-            child_ips = netaddr.IPSet(pool_ips)
 
-        if self.type != choices.PrefixTypeChoices.TYPE_POOL:
-            child_prefixes = netaddr.IPSet(p.prefix for p in self.children.only("network", "prefix_length").iterator())
+        if hasattr(self, "utilization_numerator"):
+            numerator = int(self.utilization_numerator)
+            boundaries_used = self.utilization_boundaries_used
+        else:
+            child_ips = netaddr.IPSet()
+            child_prefixes = netaddr.IPSet()
+
+            # 3.0 TODO: In the long term, TYPE_POOL prefixes will be disallowed from directly containing IPAddresses,
+            # and the addresses will instead be parented to the containing TYPE_NETWORK prefix. It should be possible
+            # to change this when that is the case, see #3873 for historical context.
+            if self.type != choices.PrefixTypeChoices.TYPE_CONTAINER:
+                pool_ips = IPAddress.objects.filter(
+                    parent__namespace=self.namespace, host__gte=self.network, host__lte=self.broadcast
+                ).values_list("host", flat=True)
+                child_ips = netaddr.IPSet(pool_ips)
+
+            if self.type != choices.PrefixTypeChoices.TYPE_POOL:
+                child_prefixes = netaddr.IPSet(
+                    p.prefix for p in self.children.only("network", "prefix_length").iterator()
+                )
 
-        numerator_set = child_ips | child_prefixes
+            numerator_set = child_ips | child_prefixes
+            numerator = numerator_set.size
+            boundaries_used = self.network in numerator_set or self.broadcast in numerator_set
 
         # Exclude network and broadcast address from the denominator unless they've been assigned to an IPAddress or child pool.
         # Only applies to IPv4 network prefixes with a prefix length of /30 or shorter
@@ -1035,10 +1047,10 @@ class Prefix(PrimaryModel):
                 self.ip_version == 4,
             ]
         ):
-            if not any([self.network in numerator_set, self.broadcast in numerator_set]):
+            if not boundaries_used:
                 denominator -= 2
 
-        return UtilizationData(numerator=numerator_set.size, denominator=denominator)
+        return UtilizationData(numerator=numerator, denominator=denominator)
 
 
 @extras_features("graphql")
@@ -2,11 +2,28 @@ import re
 
 from django.core.exceptions import ValidationError
 from django.core.validators import validate_ipv46_address
-from django.db.models import ProtectedError, Q
+from django.db import connections
+from django.db.models import (
+    BooleanField,
+    Case,
+    DecimalField,
+    Exists,
+    F,
+    Func,
+    OuterRef,
+    ProtectedError,
+    Q,
+    Subquery,
+    Sum,
+    Value,
+    When,
+)
+from django.db.models.functions import Cast, Coalesce, Power
 import netaddr
 
 from nautobot.core.models.querysets import RestrictedQuerySet
 from nautobot.core.utils.data import merge_dicts_without_collision
+from nautobot.ipam.choices import PrefixTypeChoices
 from nautobot.ipam.mixins import LocationToLocationsQuerySetMixin
 
 
@@ -17,6 +34,11 @@ class RIRQuerySet(RestrictedQuerySet):
         return self.get(name=name)
 
 
+def _count_subquery(queryset):
+    """Return a Subquery expression for the number of records in the given (typically `OuterRef`-filtered) queryset."""
+    return Coalesce(Subquery(queryset.annotate(count=Func(F("pk"), function="COUNT")).values("count")), Value(0))
+
+
 class BaseNetworkQuerySet(RestrictedQuerySet):
     """Base class for network-related querysets."""
 
@@ -234,6 +256,86 @@ class PrefixQuerySet(LocationToLocationsQuerySetMixin, BaseNetworkQuerySet):
             query |= Q(prefix_length__lte=prefix.prefixlen, network__lte=prefix.network, broadcast__gte=last_ip)
         return self.filter(query) if query else self.none()
 
+    def annotate_utilization(self):
+        """
+        Annotate each Prefix with the data needed by `Prefix.get_utilization()`.
+
+        This allows the utilization of many prefixes to be calculated by the database as part of a single query,
+        rather than with two additional queries (and `netaddr.IPSet` calculations) per prefix. The annotations are:
+
+        - `utilization_numerator`: the number of addresses within the prefix that are used by its direct child
+          prefixes (unless it's a pool) and/or by IP addresses (unless it's a container).
+        - `utilization_boundaries_used`: whether the network or broadcast address of an IPv4 network prefix is used.
+
+        On MySQL, `POWER()` always returns a `DOUBLE`, which can't exactly represent the address space of large IPv6
+        prefixes, so no annotations are added and `get_utilization()` calculates the utilization of each prefix itself.
+        """
+        from nautobot.ipam.models import IPAddress
+
+        if connections[self.db].vendor == "mysql":
+            return self.all()
+
+        child_prefixes = self.model.objects.filter(parent=OuterRef("pk")).order_by()
+        child_prefix_size = Coalesce(
+            Subquery(
+                child_prefixes.values("parent")
+                .annotate(
+                    size=Sum(
+                        Power(
+                            Cast(Value(2), output_field=DecimalField(max_digits=39, decimal_places=0)),
+                            Case(When(ip_version=4, then=Value(32)), default=Value(128)) - F("prefix_length"),
+                        )
+                    )
+                )
+                .values("size")
+            ),
+            Value(0),
+            output_field=DecimalField(max_digits=39, decimal_places=0),
+        )
+
+        ip_addresses = IPAddress.objects.filter(
+            parent__namespace=OuterRef("namespace"), host__gte=OuterRef("network"), host__lte=OuterRef("broadcast")
+        ).order_by()
+        ip_count = _count_subquery(ip_addresses)
+        # Addresses within a child prefix are already accounted for by `child_prefix_size`
+        ip_count_outside_child_prefixes = _count_subquery(
+            ip_addresses.exclude(
+                Exists(
+                    self.model.objects.filter(
+                        parent=OuterRef(OuterRef("pk")),
+                        network__lte=OuterRef("host"),
+                        broadcast__gte=OuterRef("host"),
+                    )
+                )
+            )
+        )
+
+        # 3.0 TODO: see the corresponding comment in `Prefix.get_utilization()`
+        utilization_numerator = Case(
+            When(type=PrefixTypeChoices.TYPE_CONTAINER, then=child_prefix_size),
+            When(type=PrefixTypeChoices.TYPE_POOL, then=ip_count),
+            default=child_prefix_size + ip_count_outside_child_prefixes,
+            output_field=DecimalField(max_digits=39, decimal_places=0),
+        )
+        # Only IPv4 network prefixes need to know whether their network or broadcast address is in use
+        utilization_boundaries_used = Case(
+            When(
+                Q(type=PrefixTypeChoices.TYPE_NETWORK, ip_version=4)
+                & (
+                    Exists(ip_addresses.filter(Q(host=OuterRef("network")) | Q(host=OuterRef("broadcast"))))
+                    | Exists(child_prefixes.filter(Q(network=OuterRef("network")) | Q(broadcast=OuterRef("broadcast"))))
+                ),
+                then=Value(True),
+            ),
+            default=Value(False),
+            output_field=BooleanField(),
+        )
+
+        return self.annotate(
+            utilization_numerator=utilization_numerator,
+            utilization_boundaries_used=utilization_boundaries_used,
+        )
+
     def get(self, *args, **kwargs):
         """
         Provide a convenience for `.get(prefix=<prefix>)`
@@ -429,6 +429,13 @@ class PrefixDetailTable(PrefixTable):
             "description",
         )
 
+    def alter_queryset(self, queryset):
+        queryset = super().alter_queryset(queryset)
+        # Calculate the utilization of all displayed prefixes in the same query, but only if it's actually displayed
+        if "utilization" in self.visible_columns:
+            queryset = queryset.annotate_utilization()
+        return queryset
+
 
 #
 # IPAddresses
@@ -460,6 +460,25 @@ class PrefixTest(APIViewTestCases.APIViewTestCase):
         for p in response.data["results"]:
             self.assertEqual(p["display"], f'{p["prefix"]}: {p["namespace"]["name"]}')
 
+    def test_prefix_utilization(self):
+        """
+        Test that the opt-in `utilization` field is correctly populated.
+        """
+        url = reverse("ipam-api:prefix-list")
+        self.add_permissions("ipam.view_prefix")
+
+        response = self.client.get(url, **self.header)
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        self.assertNotIn("utilization", response.data["results"][0])
+
+        response = self.client.get(f"{url}?include=utilization&limit=50", **self.header)
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        for p in response.data["results"]:
+            utilization = Prefix.objects.get(pk=p["id"]).get_utilization()
+            self.assertEqual(
+                p["utilization"], {"numerator": utilization.numerator, "denominator": utilization.denominator}
+            )
+
     def test_create_single_available_prefix(self):
         """
         Test retrieval of the first available prefix within a parent prefix.
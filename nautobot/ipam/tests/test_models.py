@@ -962,6 +962,34 @@ class TestPrefix(ModelTestCases.BaseModelTestCase):
         Prefix.objects.create(prefix="ab80::/9", status=self.status, namespace=self.namespace)
         self.assertEqual(large_prefix_v6.get_utilization(), (2**120, 2**120))
 
+        # Utilization calculated in bulk via annotate_utilization() matches that calculated for each prefix individually
+        annotated_utilization = {
+            prefix.pk: prefix.get_utilization()
+            for prefix in Prefix.objects.filter(namespace=self.namespace).annotate_utilization()
+        }
+        self.assertEqual(annotated_utilization[large_prefix_v6.pk], (2**120, 2**120))
+        for prefix in Prefix.objects.filter(namespace=self.namespace):
+            with self.subTest(prefix=str(prefix)):
+                self.assertEqual(annotated_utilization[prefix.pk], prefix.get_utilization())
+
+    def test_get_utilization_annotated_large_ipv6(self):
+        """Utilization of a large IPv6 prefix calculated in bulk isn't subject to floating-point rounding."""
+        parent = Prefix.objects.create(prefix="2001:db8::/32", status=self.status, namespace=self.namespace)
+        Prefix.objects.create(prefix="2001:db8::/33", status=self.status, namespace=self.namespace)
+        IPAddress.objects.create(address="2001:db8:8000::1/128", status=self.status, namespace=self.namespace)
+        self.assertEqual(parent.get_utilization(), (2**95 + 1, 2**96))
+        self.assertEqual(Prefix.objects.annotate_utilization().get(pk=parent.pk).get_utilization(), (2**95 + 1, 2**96))
+
+    @skipIf(connection.vendor == "mysql", "Prefix utilization is calculated for each prefix individually on MySQL")
+    def test_annotate_utilization_single_query(self):
+        """Utilization of many prefixes is calculated in a single query with annotate_utilization()."""
+        Prefix.objects.create(prefix="22.0.0.0/8", status=self.status, namespace=self.namespace)
+        Prefix.objects.create(prefix="22.0.0.0/12", status=self.status, namespace=self.namespace)
+        IPAddress.objects.create(address="22.16.0.1/32", status=self.status, namespace=self.namespace)
+        with self.assertNumQueries(1):
+            for prefix in Prefix.objects.filter(namespace=self.namespace).annotate_utilization():
+                prefix.get_utilization()
+
     #
     # Uniqueness enforcement tests
     #
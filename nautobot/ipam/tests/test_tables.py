@@ -1,9 +1,12 @@
+from unittest import skipIf
+
+from django.db import connection
 from django.test import TestCase
 
 from nautobot.core.models.querysets import count_related
 from nautobot.dcim.models.locations import Location
 from nautobot.ipam.models import Prefix
-from nautobot.ipam.tables import PrefixTable
+from nautobot.ipam.tables import PrefixDetailTable, PrefixTable
 
 
 class PrefixTableTestCase(TestCase):
@@ -40,3 +43,12 @@ class PrefixTableTestCase(TestCase):
         location_count_queryset = queryset.annotate(location_count=count_related(Location, "prefixes")).all()
         self._validate_sorted_queryset_same_with_table_queryset(location_count_queryset, PrefixTable, "location_count")
         self._validate_sorted_queryset_same_with_table_queryset(location_count_queryset, PrefixTable, "-location_count")
+
+    @skipIf(connection.vendor == "mysql", "Prefix utilization is not annotated on MySQL")
+    def test_prefix_detail_table_utilization(self):
+        """Assert the utilization of prefixes is only annotated when the column is displayed."""
+        table = PrefixDetailTable(Prefix.objects.all())
+        self.assertIn("utilization_numerator", table.data.data.query.annotations)
+
+        table = PrefixDetailTable(Prefix.objects.all(), exclude=["utilization"])
+        self.assertNotIn("utilization_numerator", table.data.data.query.annotations)